@@ -16,10 +16,14 @@ from __future__ import annotations
 
 import argparse
 import json
+import multiprocessing
+import os
 import sys
 import time
-from concurrent.futures import ProcessPoolExecutor, as_completed
-from dataclasses import dataclass
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Callable
@@ -38,26 +42,289 @@ class ProcessResult:
     duration_seconds: float
     node_count: int
     relationship_count: int
+    setup_seconds: float = 0.0  # Imports and parser loading charged to this repo
+    memory_exceeded: bool = False  # Worker hit its memory limit on this repo
+    isolated_retry: bool = False  # Result comes from a single-repo retry process
+    node_labels: dict[str, int] = field(default_factory=dict)
+    relationship_types: dict[str, int] = field(default_factory=dict)
+
+
+@dataclass
+class RepoCost:
+    """Quick estimate of indexing cost from supported source files."""
+    files: int = 0
+    bytes: int = 0
+    by_extension: dict[str, list[int]] = field(default_factory=dict)  # ext -> [files, bytes]
+
+    @property
+    def score(self) -> int:
+        return self.bytes + self.files * PER_FILE_COST_BYTES
 
 
 # Callback type for progress updates
 ProcessCallback = Callable[[ProcessResult], None] | None
+StartCallback = Callable[[Path], None] | None
+
+# Workers are recycled after this many repos to bound memory growth
+DEFAULT_MAX_TASKS_PER_CHILD = 100
+
+# Fixed per-file parse overhead, expressed in bytes of source, for cost ordering
+PER_FILE_COST_BYTES = 2048
+
+# Cache limits for the single-repo process that retries a repo after a memory failure
+ISOLATED_CACHE_MAX_ENTRIES = 100
+ISOLATED_CACHE_MAX_MEMORY_MB = 64
+
+WORKER_DIED = "Worker process died (likely out of memory)"
+
+# Per-process state, filled once by init_worker and reused by every task
+_worker_parsers: tuple | None = None
+_pending_setup_seconds = 0.0
+
+
+def limit_worker_memory(limit_mb: int) -> bool:
+    """
+    Cap this process's address space.
+
+    Allocations past the limit raise MemoryError inside the worker, so a
+    pathological repo fails on its own instead of the kernel OOM killer
+    taking down the whole pool. Returns False where rlimits are unavailable.
+    """
+    try:
+        import resource
+    except ImportError:
+        return False
+
+    limit = limit_mb * 1024 * 1024
+    _, hard = resource.getrlimit(resource.RLIMIT_AS)
+    if hard != resource.RLIM_INFINITY:
+        limit = min(limit, hard)
+    resource.setrlimit(resource.RLIMIT_AS, (limit, hard))
+    return True
+
+
+def init_worker(memory_limit_mb: int | None = None, low_memory: bool = False) -> None:
+    """Process pool initializer: silence logging, import codebase_rag and load parsers once."""
+    global _worker_parsers, _pending_setup_seconds
+    start_time = time.time()
+
+    if memory_limit_mb:
+        limit_worker_memory(memory_limit_mb)
+
+    # Suppress logging in subprocess to avoid interfering with Rich UI
+    import logging
+    from loguru import logger
+    logger.remove()  # Remove default handler
+    logger.add(lambda msg: None, level="ERROR")  # Only show errors
+    logging.getLogger().setLevel(logging.ERROR)
+
+    import codebase_rag.graph_updater  # noqa: F401
+    import codebase_rag.services  # noqa: F401
+    from codebase_rag.config import settings
+    from codebase_rag.parser_loader import load_parsers
+
+    if low_memory:
+        settings.CACHE_MAX_ENTRIES = ISOLATED_CACHE_MAX_ENTRIES
+        settings.CACHE_MAX_MEMORY_MB = ISOLATED_CACHE_MAX_MEMORY_MB
+
+    _worker_parsers = load_parsers()
+    # The first task in this worker reports the setup cost
+    _pending_setup_seconds += time.time() - start_time
+
+
+def get_worker_parsers() -> tuple:
+    """Parsers and queries for this process, initializing them if no initializer ran."""
+    if _worker_parsers is None:
+        init_worker()
+    return _worker_parsers
+
+
+def _take_setup_seconds() -> float:
+    global _pending_setup_seconds
+    setup_seconds, _pending_setup_seconds = _pending_setup_seconds, 0.0
+    return setup_seconds
+
+
+def create_worker_pool(
+    workers: int,
+    max_tasks_per_child: int | None = DEFAULT_MAX_TASKS_PER_CHILD,
+    memory_limit_mb: int | None = None,
+    low_memory: bool = False,
+) -> ProcessPoolExecutor:
+    """
+    Process pool of warm indexing workers.
+
+    Each worker loads parsers once in init_worker and reuses them for every
+    repo it indexes. With max_tasks_per_child set, workers are replaced after
+    that many repos. Workers are always spawned, never forked: the streaming
+    pipeline creates this pool while clone threads are running.
+    """
+    return ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=init_worker,
+        initargs=(memory_limit_mb, low_memory),
+        max_tasks_per_child=max_tasks_per_child,
+    )
+
+
+def estimate_repo_cost(repo_path: Path) -> RepoCost:
+    """Count files and bytes per supported extension, skipping ignored directories."""
+    from codebase_rag.constants import IGNORE_PATTERNS
+    from codebase_rag.language_spec import get_language_spec
+
+    cost = RepoCost()
+    for root, dirs, files in os.walk(repo_path):
+        dirs[:] = [d for d in dirs if d not in IGNORE_PATTERNS]
+        for name in files:
+            ext = os.path.splitext(name)[1]
+            if not ext or get_language_spec(ext) is None:
+                continue
+            try:
+                size = os.stat(os.path.join(root, name)).st_size
+            except OSError:
+                continue
+            counts = cost.by_extension.setdefault(ext, [0, 0])
+            counts[0] += 1
+            counts[1] += size
+            cost.files += 1
+            cost.bytes += size
+    return cost
+
+
+def order_by_cost(repo_paths: list[Path]) -> list[Path]:
+    """Largest repos first, so the slowest ones never start at the end of a run."""
+    costs = {path: estimate_repo_cost(path).score for path in repo_paths}
+    return sorted(repo_paths, key=lambda path: costs[path], reverse=True)
+
+
+def failed_result(
+    repo_path: Path,
+    error: str,
+    memory_exceeded: bool = False,
+) -> ProcessResult:
+    return ProcessResult(
+        repo_path=str(repo_path),
+        output_path=None,
+        success=False,
+        error=error,
+        duration_seconds=0,
+        node_count=0,
+        relationship_count=0,
+        memory_exceeded=memory_exceeded,
+    )
+
+
+def needs_isolated_retry(result: ProcessResult | None) -> bool:
+    """A repo whose worker ran out of memory or died is retried on its own."""
+    return result is None or result.memory_exceeded
+
+
+def process_repo_isolated(
+    repo_path: Path,
+    output_dir: Path,
+    memory_limit_mb: int | None = None,
+) -> ProcessResult:
+    """Retry one repo in a fresh single-repo process with reduced cache limits."""
+    with create_worker_pool(1, max_tasks_per_child=1, memory_limit_mb=memory_limit_mb, low_memory=True) as pool:
+        try:
+            result = pool.submit(process_single_repo, (repo_path, output_dir)).result()
+        except BrokenProcessPool:
+            result = failed_result(repo_path, WORKER_DIED, memory_exceeded=True)
+    result.isolated_retry = True
+    return result
+
+
+def schedule_repos(
+    repo_paths: list[Path],
+    output_dir: Path,
+    workers: int,
+    max_tasks_per_child: int | None = DEFAULT_MAX_TASKS_PER_CHILD,
+    memory_limit_mb: int | None = None,
+    on_start: StartCallback = None,
+    on_complete: ProcessCallback = None,
+) -> list[ProcessResult]:
+    """
+    Index repos largest-first on a warm worker pool.
+
+    At most `workers` repos are in flight, so when a worker dies and breaks
+    the pool only those repos are affected: the pool is replaced and they
+    are retried one at a time in isolated processes with lower cache limits
+    after the main run, along with any repo that hit its memory limit.
+    """
+    queue = deque(order_by_cost(repo_paths))
+    retries: list[Path] = []
+    results: list[ProcessResult] = []
+    in_flight: dict[Future, Path] = {}
+
+    def new_pool() -> ProcessPoolExecutor:
+        return create_worker_pool(workers, max_tasks_per_child, memory_limit_mb)
+
+    pool = new_pool()
+    try:
+        while queue or in_flight:
+            while queue and len(in_flight) < workers:
+                repo_path = queue.popleft()
+                in_flight[pool.submit(process_single_repo, (repo_path, output_dir))] = repo_path
+                if on_start:
+                    on_start(repo_path)
+
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            pool_broken = False
+            for future in done:
+                repo_path = in_flight.pop(future)
+                try:
+                    result = future.result()
+                except BrokenProcessPool:
+                    result = None
+                    pool_broken = True
+                except Exception as e:
+                    result = failed_result(repo_path, str(e))
+
+                if needs_isolated_retry(result):
+                    retries.append(repo_path)
+                    continue
+                results.append(result)
+                if on_complete:
+                    on_complete(result)
+
+            if pool_broken:
+                # Every other in-flight repo died with the pool
+                retries.extend(in_flight.values())
+                in_flight.clear()
+                pool.shutdown(wait=False, cancel_futures=True)
+                pool = new_pool()
+    finally:
+        pool.shutdown()
+
+    for repo_path in retries:
+        if on_start:
+            on_start(repo_path)
+        result = process_repo_isolated(repo_path, output_dir, memory_limit_mb)
+        results.append(result)
+        if on_complete:
+            on_complete(result)
+
+    return results
+
+
+def overhead_per_repo(results: list[ProcessResult]) -> float:
+    """Worker setup time amortized over every processed repo."""
+    if not results:
+        return 0.0
+    return sum(r.setup_seconds for r in results) / len(results)
 
 
 def process_single_repo(args: tuple[Path, Path]) -> ProcessResult:
     repo_path, output_dir = args
     start_time = time.time()
+    setup_seconds = 0.0
 
     try:
-        # Suppress logging in subprocess to avoid interfering with Rich UI
-        import logging
-        from loguru import logger
-        logger.remove()  # Remove default handler
-        logger.add(lambda msg: None, level="ERROR")  # Only show errors
-        logging.getLogger().setLevel(logging.ERROR)
+        parsers, queries = get_worker_parsers()
+        setup_seconds = _take_setup_seconds()
 
         from codebase_rag.graph_updater import GraphUpdater
-        from codebase_rag.parser_loader import load_parsers
         from codebase_rag.services import JsonFileIngestor
 
         # Use owner__repo pattern for unique filenames
@@ -67,12 +334,10 @@ def process_single_repo(args: tuple[Path, Path]) -> ProcessResult:
         output_file = output_dir / f"{owner}__{repo_name}.json"
 
         ingestor = JsonFileIngestor(str(output_file))
-        parsers, queries = load_parsers()
         updater = GraphUpdater(ingestor, repo_path, parsers, queries)
         updater.run()
-
-        with open(output_file) as f:
-            data = json.load(f)
+        # Counts come from the ingestor; the written graph is never re-read
+        counts = ingestor.summary()
 
         duration = time.time() - start_time
         return ProcessResult(
@@ -81,8 +346,24 @@ def process_single_repo(args: tuple[Path, Path]) -> ProcessResult:
             success=True,
             error=None,
             duration_seconds=duration,
-            node_count=data["metadata"]["total_nodes"],
-            relationship_count=data["metadata"]["total_relationships"],
+            node_count=counts["total_nodes"],
+            relationship_count=counts["total_relationships"],
+            setup_seconds=setup_seconds,
+            node_labels=counts["node_labels"],
+            relationship_types=counts["relationship_types"],
+        )
+
+    except MemoryError:
+        return ProcessResult(
+            repo_path=str(repo_path),
+            output_path=None,
+            success=False,
+            error="Memory limit exceeded",
+            duration_seconds=time.time() - start_time,
+            node_count=0,
+            relationship_count=0,
+            setup_seconds=setup_seconds,
+            memory_exceeded=True,
         )
 
     except Exception as e:
@@ -95,6 +376,7 @@ def process_single_repo(args: tuple[Path, Path]) -> ProcessResult:
             duration_seconds=duration,
             node_count=0,
             relationship_count=0,
+            setup_seconds=setup_seconds,
         )
 
 
@@ -105,6 +387,8 @@ def batch_process(
     limit: int | None = None,
     upload_to: str | None = None,
     on_complete: ProcessCallback = None,
+    max_tasks_per_child: int | None = DEFAULT_MAX_TASKS_PER_CHILD,
+    memory_limit_mb: int | None = None,
 ) -> list[ProcessResult]:
     repos = []
     for line in repo_list_file.read_text().splitlines():
@@ -125,33 +409,35 @@ def batch_process(
     print(f"Output directory: {output_dir}")
     print("-" * 60)
 
-    results: list[ProcessResult] = []
-    args_list = [(repo, output_dir) for repo in repos]
-
     start_time = time.time()
+    completed = 0
 
-    with ProcessPoolExecutor(max_workers=workers) as executor:
-        futures = {
-            executor.submit(process_single_repo, args): args[0] for args in args_list
-        }
+    def report(result: ProcessResult) -> None:
+        nonlocal completed
+        completed += 1
 
-        for i, future in enumerate(as_completed(futures), 1):
-            repo_path = futures[future]
-            result = future.result()
-            results.append(result)
+        # Invoke callback if provided
+        if on_complete:
+            on_complete(result)
 
-            # Invoke callback if provided
-            if on_complete:
-                on_complete(result)
+        status = "OK" if result.success else "FAILED"
+        retry_tag = " [isolated retry]" if result.isolated_retry else ""
+        print(
+            f"[{completed}/{len(repos)}] {status}: {Path(result.repo_path).name} "
+            f"({result.duration_seconds:.1f}s){retry_tag}"
+        )
 
-            status = "OK" if result.success else "FAILED"
-            print(
-                f"[{i}/{len(repos)}] {status}: {repo_path.name} "
-                f"({result.duration_seconds:.1f}s)"
-            )
+        if not result.success:
+            print(f"         Error: {result.error}")
 
-            if not result.success:
-                print(f"         Error: {result.error}")
+    results = schedule_repos(
+        repos,
+        output_dir,
+        workers,
+        max_tasks_per_child=max_tasks_per_child,
+        memory_limit_mb=memory_limit_mb,
+        on_complete=report,
+    )
 
     total_time = time.time() - start_time
 
@@ -168,6 +454,7 @@ def batch_process(
     print(f"Total time:        {total_time:.1f}s")
     if results:
         print(f"Avg time per repo: {total_time / len(results):.1f}s")
+        print(f"Setup per repo:    {overhead_per_repo(results):.3f}s")
 
     if successful:
         total_nodes = sum(r.node_count for r in successful)
@@ -183,6 +470,11 @@ def batch_process(
         "failed": len(failed),
         "total_time_seconds": total_time,
         "workers": workers,
+        "max_tasks_per_child": max_tasks_per_child,
+        "memory_limit_mb": memory_limit_mb,
+        "isolated_retries": sum(1 for r in results if r.isolated_retry),
+        "worker_setup_seconds": sum(r.setup_seconds for r in results),
+        "overhead_per_repo_seconds": overhead_per_repo(results),
         "results": [
             {
                 "repo": r.repo_path,
@@ -192,6 +484,11 @@ def batch_process(
                 "duration_seconds": r.duration_seconds,
                 "nodes": r.node_count,
                 "relationships": r.relationship_count,
+                "node_labels": r.node_labels,
+                "relationship_types": r.relationship_types,
+                "setup_seconds": r.setup_seconds,
+                "memory_exceeded": r.memory_exceeded,
+                "isolated_retry": r.isolated_retry,
             }
             for r in results
         ],
@@ -257,6 +554,19 @@ def main() -> None:
         default=None,
         help="Upload JSON files to GCS (gs://bucket/prefix) or local path",
     )
+    parser.add_argument(
+        "--max-tasks-per-child",
+        type=int,
+        default=DEFAULT_MAX_TASKS_PER_CHILD,
+        help=f"Repos each worker indexes before it is replaced; 0 keeps workers for the whole run (default: {DEFAULT_MAX_TASKS_PER_CHILD})",
+    )
+
+    parser.add_argument(
+        "--memory-limit-mb",
+        type=int,
+        default=None,
+        help="Address-space limit per worker; repos that exceed it are retried in an isolated process (default: no limit)",
+    )
 
     args = parser.parse_args()
 
@@ -270,6 +580,8 @@ def main() -> None:
         workers=args.workers,
         limit=args.limit,
         upload_to=args.upload_to,
+        max_tasks_per_child=args.max_tasks_per_child or None,
+        memory_limit_mb=args.memory_limit_mb,
     )
 
 
@@ -39,8 +39,9 @@ from generate_diverse_questions import (
 )
 from question_debug_stats import QuestionDebugStats
 from question_generator import get_all_candidate_seeds, get_sparse_candidate_seeds
+from question_store import STORE_FILENAME, QuestionStore
 
-from codebase_rag.graph_loader import GraphLoader
+from codebase_rag.graph_loader import GraphLoader, load_graph
 
 if TYPE_CHECKING:
     from batch.questions_rich_ui import QuestionsProgressUI
@@ -51,6 +52,7 @@ def count_candidate_seeds(
     min_connections: int = 1,
     debug: bool = False,
     sparse_mode: bool = False,
+    graph: GraphLoader | None = None,
 ) -> int | tuple[int, QuestionDebugStats | None]:
     """Count candidate seed nodes in a graph without full generation.
 
@@ -59,21 +61,22 @@ def count_candidate_seeds(
         min_connections: Minimum connections required
         debug: If True, return (count, debug_stats) tuple
         sparse_mode: If True, use sparse candidate selection (more relationship types)
+        graph: Already-loaded graph for graph_path (loaded here if omitted)
 
     Returns:
         int if debug=False, tuple[int, QuestionDebugStats] if debug=True
     """
     try:
-        graph = GraphLoader(str(graph_path))
-        graph.load()
+        if graph is None:
+            graph = load_graph(str(graph_path))
 
         debug_stats = None
         if debug:
             debug_stats = QuestionDebugStats()
             # Populate graph stats from summary
             summary = graph.summary()
-            debug_stats.node_counts = dict(summary.node_labels)
-            debug_stats.relationship_counts = dict(summary.relationship_types)
+            debug_stats.node_counts = dict(summary["node_labels"])
+            debug_stats.relationship_counts = dict(summary["relationship_types"])
 
         if sparse_mode:
             candidates = get_sparse_candidate_seeds(
@@ -142,6 +145,11 @@ def get_repo_path_for_graph(graph_path: Path, clones_dir: Path) -> Path | None:
     return None
 
 
+def repo_key(repo_path: Path) -> str:
+    """owner/repo name identifying a repo's questions and its store partition."""
+    return f"{repo_path.parent.name}/{repo_path.name}"
+
+
 def generate_questions_for_repo(
     graph_path: Path,
     repo_path: Path,
@@ -154,6 +162,7 @@ def generate_questions_for_repo(
     debug: bool = False,
     sparse_fallback: bool = True,
     max_attempts: int | None = None,
+    prompt_workers: int = 1,
 ) -> dict:
     """
     Generate questions for a single repo.
@@ -170,22 +179,35 @@ def generate_questions_for_repo(
         debug: Show detailed debug statistics
         sparse_fallback: Try sparse mode if regular mode has too few candidates
         max_attempts: Maximum attempts before giving up (default: 5x target)
+        prompt_workers: Worker processes splitting this repo's prompts
 
     Returns summary dict with stats.
     """
     # Use owner/repo format for unique repo identification
-    owner = repo_path.parent.name
-    repo_name = f"{owner}/{repo_path.name}"
+    repo_name = repo_key(repo_path)
     sparse_mode_used = False
 
+    # Load the graph once; counting, sparse fallback and generation share it
+    try:
+        graph = load_graph(str(graph_path))
+    except Exception as e:
+        return {
+            "repo": repo_name,
+            "graph": str(graph_path),
+            "candidates": 0,
+            "generated": 0,
+            "skipped": True,
+            "reason": f"Could not load graph: {e}",
+        }
+
     # Count candidates first (with debug stats if requested)
     if debug:
-        num_candidates, debug_stats = count_candidate_seeds(graph_path, debug=True)
+        num_candidates, debug_stats = count_candidate_seeds(graph_path, debug=True, graph=graph)
         if debug_stats and not quiet:
             print(f"\n=== DEBUG: {repo_name} ===")
             print(debug_stats.format_summary(verbose=False))
     else:
-        num_candidates = count_candidate_seeds(graph_path)
+        num_candidates = count_candidate_seeds(graph_path, graph=graph)
 
     max_questions = compute_max_questions(num_candidates, target_questions, min_questions)
 
@@ -193,14 +215,14 @@ def generate_questions_for_repo(
     if max_questions == 0 and sparse_fallback:
         if debug:
             sparse_candidates, sparse_stats = count_candidate_seeds(
-                graph_path, min_connections=1, debug=True, sparse_mode=True
+                graph_path, min_connections=1, debug=True, sparse_mode=True, graph=graph
             )
             if sparse_stats and not quiet:
                 print(f"\n=== DEBUG (sparse mode): {repo_name} ===")
                 print(sparse_stats.format_summary(verbose=False))
         else:
             sparse_candidates = count_candidate_seeds(
-                graph_path, min_connections=1, sparse_mode=True
+                graph_path, min_connections=1, sparse_mode=True, graph=graph
             )
 
         sparse_max = compute_max_questions(sparse_candidates, target_questions, min_questions)
@@ -234,6 +256,8 @@ def generate_questions_for_repo(
             quiet=quiet,
             prompt_timeout=prompt_timeout,
             max_attempts=max_attempts,
+            graph=graph,
+            workers=prompt_workers,
         )
 
         output_path.parent.mkdir(parents=True, exist_ok=True)
@@ -274,7 +298,8 @@ def generate_questions_worker(args: tuple) -> dict:
     logger.add(lambda msg: None, level="ERROR")
     logging.getLogger().setLevel(logging.ERROR)
 
-    graph_path, repo_path, output_path, target_questions, min_questions, prompt_timeout, sparse_fallback, max_attempts = args
+    (graph_path, repo_path, output_path, target_questions, min_questions,
+     prompt_timeout, sparse_fallback, max_attempts, prompt_workers) = args
     return generate_questions_for_repo(
         graph_path=graph_path,
         repo_path=repo_path,
@@ -285,12 +310,55 @@ def generate_questions_worker(args: tuple) -> dict:
         prompt_timeout=prompt_timeout,
         sparse_fallback=sparse_fallback,
         max_attempts=max_attempts,
+        prompt_workers=prompt_workers,
     )
 
 
 QuestionCallback = Callable[[dict], None] | None
 
 
+def build_question_args(
+    graph_path: Path,
+    repo_path: Path,
+    questions_dir: Path,
+    target_per_repo: int,
+    min_questions: int,
+    prompt_timeout: int,
+    sparse_fallback: bool,
+    max_attempts: int | None,
+    prompt_workers: int = 1,
+) -> tuple:
+    """Build the argument tuple consumed by generate_questions_worker."""
+    output_path = questions_dir / f"{graph_path.stem}_questions.jsonl"
+    return (graph_path, repo_path, output_path, target_per_repo, min_questions, prompt_timeout, sparse_fallback, max_attempts, prompt_workers)
+
+
+def write_questions_summary(
+    questions_dir: Path,
+    store: QuestionStore,
+    combined_path: Path,
+    combined_count: int,
+    target_per_repo: int,
+    sparse_fallback: bool,
+    workers: int,
+) -> Path:
+    """Write _questions_summary.json for a finished run from the question store."""
+    summary_path = questions_dir / "_questions_summary.json"
+    summary = {
+        **store.summary(),
+        "store": str(store.path),
+        "combined_file": str(combined_path),
+        "combined_count": combined_count,
+        "target_per_repo": target_per_repo,
+        "sparse_fallback": sparse_fallback,
+        "workers": workers,
+        "results": store.results(),
+    }
+    with open(summary_path, "w") as f:
+        json.dump(summary, f, indent=2)
+    return summary_path
+
+
 def get_optimal_workers() -> int:
     """Get optimal worker count (cpu_count - 2 for headroom)."""
     cpu_count = os.cpu_count() or 4
@@ -316,6 +384,8 @@ def batch_generate_questions(
     max_attempts: int | None = None,
     repo_timeout: int = DEFAULT_REPO_TIMEOUT,
     ui: QuestionsProgressUI | None = None,
+    prompt_workers: int = 1,
+    resume: bool = False,
 ) -> list[dict]:
     """
     Generate questions for all graphs in a directory using parallel processing.
@@ -336,9 +406,12 @@ def batch_generate_questions(
         max_attempts: Maximum attempts per repo before giving up (default: 5x target)
         repo_timeout: Hard time limit per repo in seconds (default: 600)
         ui: Optional Rich UI for progress display (None for text output)
+        prompt_workers: Worker processes per repo, for repos too large for one core
+        resume: Keep the question store from earlier runs and skip repos it
+            already holds (otherwise the store is cleared first)
 
     Returns:
-        List of result dicts with stats per repo
+        List of result dicts with stats per repo processed in this run
     """
     from batch.questions_rich_ui import GenerationStats
 
@@ -366,16 +439,25 @@ def batch_generate_questions(
         print(f"Debug mode: {debug}")
         print(f"Verbose mode: {verbose}")
         print(f"Workers: {workers}")
+        print(f"Prompt workers per repo: {prompt_workers}")
         print("-" * 60)
 
     questions_dir.mkdir(parents=True, exist_ok=True)
 
+    # Every result goes to the store as it arrives; a repo is only marked
+    # complete together with its questions, so an interrupted run resumes cleanly
+    store = QuestionStore(questions_dir / STORE_FILENAME)
+    if not resume:
+        store.clear()
+    completed_repos = store.completed_repos() if resume else set()
+
     # Build args list for all repos, tracking skipped ones
     args_list = []
     skipped_results: list[dict] = []
+    resumed = 0
 
     for graph_path in graph_files:
-        repo_name = graph_path.stem
+        repo_name = graph_path.stem.replace("__", "/", 1)
         repo_path = get_repo_path_for_graph(graph_path, clones_dir)
 
         if repo_path is None:
@@ -388,40 +470,35 @@ def batch_generate_questions(
             })
             continue
 
-        output_path = questions_dir / f"{repo_name}_questions.jsonl"
-        args_list.append((graph_path, repo_path, output_path, target_per_repo, min_questions, prompt_timeout, sparse_fallback, max_attempts))
+        if repo_key(repo_path) in completed_repos:
+            resumed += 1
+            continue
+
+        args_list.append(build_question_args(
+            graph_path, repo_path, questions_dir, target_per_repo, min_questions,
+            prompt_timeout, sparse_fallback, max_attempts, prompt_workers,
+        ))
 
     if not ui:
         print(f"Processing {len(args_list)} repos ({len(skipped_results)} skipped - repo not found)")
+        if resumed:
+            print(f"Resuming: {resumed} repos already in {store.path}")
 
     results: list[dict] = list(skipped_results)  # Start with skipped results
     total_generated = 0
     completed = 0
     total_to_process = len(args_list)
 
-    # Create/truncate the combined questions file for incremental writes
     all_questions_path = questions_dir / "all_questions.jsonl"
-    all_questions_file = open(all_questions_path, "w")
-    combined_count = 0
-
-    def append_to_combined(result: dict) -> int:
-        """Append a repo's questions to the combined file. Returns count added."""
-        nonlocal combined_count
-        output_file = result.get("output")
-        if output_file and Path(output_file).exists():
-            with open(output_file) as in_f:
-                for line in in_f:
-                    all_questions_file.write(line)
-                    combined_count += 1
-            all_questions_file.flush()
-        return combined_count
+    for result in skipped_results:
+        store.add_repo(result)
 
     try:
         if verbose:
             # Sequential processing with full output
             for args in args_list:
-                graph_path, repo_path, output_path, target_q, min_q, timeout, sparse_fb, max_att = args
-                repo_name = graph_path.stem
+                graph_path, repo_path, output_path, target_q, min_q, timeout, sparse_fb, max_att, prompt_w = args
+                repo_name = repo_key(repo_path)
                 completed += 1
 
                 print(f"\n{'='*60}")
@@ -440,6 +517,7 @@ def batch_generate_questions(
                         debug=debug,
                         sparse_fallback=sparse_fb,
                         max_attempts=max_att,
+                        prompt_workers=prompt_w,
                     )
                 except Exception as e:
                     result = {
@@ -453,8 +531,7 @@ def batch_generate_questions(
                 results.append(result)
                 total_generated += result.get("generated", 0)
 
-                if not result.get("skipped"):
-                    append_to_combined(result)
+                store.add_repo(result)
 
                 if on_complete:
                     on_complete(result)
@@ -473,7 +550,7 @@ def batch_generate_questions(
 
                 for future in as_completed(futures):
                     args = futures[future]
-                    repo_name = args[0].stem
+                    repo_name = repo_key(args[1])
                     completed += 1
 
                     try:
@@ -498,8 +575,7 @@ def batch_generate_questions(
                     results.append(result)
                     total_generated += result.get("generated", 0)
 
-                    if not result.get("skipped"):
-                        append_to_combined(result)
+                    store.add_repo(result)
 
                     gen_stats = None
                     gen_stats_dict = result.get("gen_stats")
@@ -528,8 +604,16 @@ def batch_generate_questions(
 
                     if on_complete:
                         on_complete(result)
+
+        # The combined file is a snapshot of the store, including resumed repos
+        combined_count = store.export_jsonl(all_questions_path)
+        summary_path = write_questions_summary(
+            questions_dir, store, all_questions_path, combined_count,
+            target_per_repo, sparse_fallback, workers,
+        )
+        duplicates = store.summary()["duplicates_dropped"]
     finally:
-        all_questions_file.close()
+        store.close()
 
     successful = [r for r in results if not r.get("skipped")]
     skipped = [r for r in results if r.get("skipped")]
@@ -548,25 +632,9 @@ def batch_generate_questions(
         if successful:
             avg = total_generated / len(successful)
             print(f"Avg per repo:     {avg:,.0f}")
+        print(f"Duplicates:       {duplicates:,} dropped")
         print(f"\nCombined file:    {all_questions_path} ({combined_count:,} questions)")
 
-    summary_path = questions_dir / "_questions_summary.json"
-    summary = {
-        "total_repos": len(results),
-        "successful": len(successful),
-        "sparse_mode_used": len(sparse_used),
-        "skipped": len(skipped),
-        "total_questions": total_generated,
-        "combined_file": str(all_questions_path),
-        "combined_count": combined_count,
-        "target_per_repo": target_per_repo,
-        "sparse_fallback": sparse_fallback,
-        "workers": workers,
-        "results": results,
-    }
-    with open(summary_path, "w") as f:
-        json.dump(summary, f, indent=2)
-
     if not ui:
         print(f"\nSummary written to: {summary_path}")
 
@@ -652,6 +720,17 @@ def main() -> None:
         default=DEFAULT_REPO_TIMEOUT,
         help=f"Hard time limit per repo in seconds (default: {DEFAULT_REPO_TIMEOUT})",
     )
+    parser.add_argument(
+        "--prompt-workers",
+        type=int,
+        default=1,
+        help="Worker processes splitting each repo's prompts (default: 1)",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help=f"Skip repos already in {STORE_FILENAME} from an earlier run",
+    )
 
     args = parser.parse_args()
 
@@ -677,6 +756,8 @@ def main() -> None:
         verbose=args.verbose,
         max_attempts=args.max_attempts,
         repo_timeout=args.repo_timeout,
+        prompt_workers=args.prompt_workers,
+        resume=args.resume,
     )
 
 
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Benchmark Per-Prompt Context Latency
+
+Builds a synthetic repo with hub functions and one very large module (the
+graph shapes that produce slow seeds), then times expand_with_strategy +
+build_context for every seed and strategy, with the default context budgets
+and with the budgets effectively disabled.
+
+Usage:
+    python benchmark_prompt_latency.py --modules 40 --functions 300
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from codebase_rag.graph_loader import GraphLoader, load_graph
+from codebase_rag.node_text_extractor import NodeTextExtractor
+
+from generate_diverse_questions import expand_with_strategy
+from question_generator import (
+    EXPANSION_STRATEGIES,
+    MAX_GRAPH_CONTEXT_CHARS,
+    build_context,
+)
+
+UNBOUNDED = 10**9
+
+
+def make_repo(
+    root: Path, modules: int, functions: int, hubs: int, seed: int
+) -> tuple[Path, Path]:
+    """Write a synthetic repo and its graph; module 0 holds a third of all functions."""
+    rng = random.Random(seed)
+    repo = root / "repo"
+    repo.mkdir()
+    nodes: list[dict] = []
+    rels: list[dict] = []
+    per_module = [functions // 3] + [
+        max(1, (functions - functions // 3) // max(modules - 1, 1))
+    ] * (modules - 1)
+
+    next_id = 0
+    function_ids: list[int] = []
+    for m, count in enumerate(per_module):
+        module_id = next_id
+        next_id += 1
+        path = f"mod_{m}.py"
+        nodes.append(
+            {
+                "node_id": module_id,
+                "labels": ["Module"],
+                "properties": {"name": f"mod_{m}", "path": path},
+            }
+        )
+        lines = []
+        for f in range(count):
+            name = f"f_{m}_{f}"
+            start = len(lines) + 1
+            lines += [f"def {name}(value):", f"    return value + {f}", ""]
+            nodes.append(
+                {
+                    "node_id": next_id,
+                    "labels": ["Function"],
+                    "properties": {
+                        "name": name,
+                        "qualified_name": f"mod_{m}.{name}",
+                        "path": path,
+                        "start_line": start,
+                        "end_line": start + 1,
+                    },
+                }
+            )
+            rels.append(
+                {
+                    "from_id": module_id,
+                    "to_id": next_id,
+                    "type": "DEFINES",
+                    "properties": {},
+                }
+            )
+            function_ids.append(next_id)
+            next_id += 1
+        (repo / path).write_text("\n".join(lines))
+
+    hub_ids = function_ids[:hubs]
+    for fid in function_ids:
+        for target in {
+            *rng.sample(hub_ids, min(2, len(hub_ids))),
+            rng.choice(function_ids),
+        }:
+            if target != fid:
+                rels.append(
+                    {"from_id": fid, "to_id": target, "type": "CALLS", "properties": {}}
+                )
+
+    graph_file = root / "graph.json"
+    graph_file.write_text(
+        json.dumps({"nodes": nodes, "relationships": rels, "metadata": {}})
+    )
+    return graph_file, repo
+
+
+def percentile(samples: list[float], fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def measure(
+    graph: GraphLoader,
+    extractor: NodeTextExtractor,
+    seeds: list[int],
+    max_nodes: int,
+    max_graph_chars: int,
+) -> tuple[list[float], list[int]]:
+    """Time context construction for every (seed, strategy); also return context sizes."""
+    latencies: list[float] = []
+    sizes: list[int] = []
+    for seed_id in seeds:
+        for strategy in EXPANSION_STRATEGIES:
+            start = time.perf_counter()
+            node_ids = expand_with_strategy(
+                graph, seed_id, strategy, max_nodes=max_nodes
+            )
+            graph_ctx, source_ctx = build_context(
+                graph, extractor, node_ids, seed_id, max_graph_chars=max_graph_chars
+            )
+            latencies.append(time.perf_counter() - start)
+            sizes.append(len(graph_ctx) + len(source_ctx))
+    return latencies, sizes
+
+
+def report(label: str, latencies: list[float], sizes: list[int]) -> None:
+    print(
+        f"{label:<10} n={len(latencies)} "
+        f"p50={percentile(latencies, 0.5) * 1000:.1f}ms "
+        f"p99={percentile(latencies, 0.99) * 1000:.1f}ms "
+        f"max={max(latencies) * 1000:.1f}ms "
+        f"max_context={max(sizes)} chars"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark per-prompt context latency")
+    parser.add_argument("--modules", type=int, default=40)
+    parser.add_argument("--functions", type=int, default=300)
+    parser.add_argument("--hubs", type=int, default=3)
+    parser.add_argument(
+        "--seeds", type=int, default=50, help="Seeds to time (hubs are always included)"
+    )
+    parser.add_argument("--random-seed", type=int, default=0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        graph_file, repo = make_repo(
+            Path(tmp), args.modules, args.functions, args.hubs, args.random_seed
+        )
+        graph = load_graph(str(graph_file))
+        extractor = NodeTextExtractor(str(graph_file), str(repo), graph_loader=graph)
+
+        function_ids = [n.node_id for n in graph.find_nodes_by_label("Function")]
+        rng = random.Random(args.random_seed)
+        seeds = function_ids[: args.hubs] + rng.sample(
+            function_ids, min(args.seeds, len(function_ids))
+        )
+
+        print(
+            f"Graph: {len(graph.nodes)} nodes, {len(graph.relationships)} relationships, {len(seeds)} seeds"
+        )
+        random.seed(args.random_seed)
+        report(
+            "budgeted", *measure(graph, extractor, seeds, 30, MAX_GRAPH_CONTEXT_CHARS)
+        )
+        random.seed(args.random_seed)
+        report("unbounded", *measure(graph, extractor, seeds, UNBOUNDED, UNBOUNDED))
+
+
+if __name__ == "__main__":
+    main()
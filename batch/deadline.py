@@ -0,0 +1,55 @@
+"""
+Cooperative Deadlines for Prompt Generation
+
+A Deadline is checked by long-running loops (context expansion, context
+building) at points where stopping is safe. Unlike signal.alarm it works on
+any thread, under asyncio and on every platform, and it never interrupts code
+half-way through a step.
+
+Usage:
+    deadline = Deadline.after(30)
+    try:
+        for node_id in nodes:
+            deadline.check()
+            ...
+    except DeadlineExceeded:
+        ...
+"""
+
+from __future__ import annotations
+
+import time
+
+
+class DeadlineExceeded(Exception):
+    """Raised by Deadline.check once the deadline has passed."""
+
+
+class Deadline:
+    """A point in time (monotonic clock) after which work should stop."""
+
+    def __init__(self, expires_at: float | None):
+        self.expires_at = expires_at  # None: never expires
+
+    @classmethod
+    def after(cls, seconds: float) -> Deadline:
+        """Deadline `seconds` from now; zero or negative means no deadline."""
+        if seconds <= 0:
+            return NO_DEADLINE
+        return cls(time.monotonic() + seconds)
+
+    def remaining(self) -> float:
+        if self.expires_at is None:
+            return float("inf")
+        return self.expires_at - time.monotonic()
+
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+
+    def check(self) -> None:
+        """Raise DeadlineExceeded if the deadline has passed."""
+        if self.expires_at is not None and time.monotonic() >= self.expires_at:
+            raise DeadlineExceeded(f"Deadline exceeded by {-self.remaining():.2f}s")
+
+
+NO_DEADLINE = Deadline(None)
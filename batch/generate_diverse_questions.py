@@ -35,18 +35,28 @@ Usage:
         --repo-name "pallets-click" \
         --num-prompts 100 \
         --output prompts.jsonl
+
+    # Split one large repo across 8 worker processes
+    uv run python batch/generate_diverse_questions.py \
+        --graph batch/test_output/click.json \
+        --repo batch/test_repos/click \
+        --num-prompts 10000 \
+        --workers 8 \
+        --random-seed 1
 """
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
+import multiprocessing
 import random
-import signal
 import sys
 import time
 from collections import Counter
-from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import asdict, dataclass
+from itertools import zip_longest
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -57,14 +67,16 @@ BATCH_DIR = Path(__file__).parent
 PROJECT_ROOT = BATCH_DIR.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
-from codebase_rag.graph_loader import GraphLoader
+from codebase_rag.graph_loader import GraphLoader, load_graph
 from codebase_rag.node_text_extractor import NodeTextExtractor
 
+from deadline import NO_DEADLINE, Deadline, DeadlineExceeded
 from evaluation_prompt_builder import detect_primary_language
 from question_generator import (
     EXPANSION_STRATEGIES,
     META_PROMPT,
     build_context,
+    cap_nodes,
     collect_files_from_nodes,
     expand_callee_tree,
     expand_caller_tree,
@@ -74,6 +86,7 @@ from question_generator import (
     get_all_candidate_seeds,
     sample_seed_node,
 )
+from seed_sampler import WeightedSampler
 
 
 @dataclass
@@ -92,35 +105,6 @@ class DiversePromptRecord:
     prompt_text: str
 
 
-class GenerationTimeout(Exception):
-    """Raised when a single prompt generation exceeds the timeout."""
-
-    pass
-
-
-@contextmanager
-def timeout_context(seconds: int):
-    """Context manager for timing out slow operations.
-
-    Uses signal.alarm on Unix systems. On Windows or when signals
-    aren't available, the timeout is a no-op.
-    """
-    if seconds <= 0 or not hasattr(signal, "SIGALRM"):
-        yield
-        return
-
-    def handler(signum, frame):
-        raise GenerationTimeout(f"Operation timed out after {seconds}s")
-
-    old_handler = signal.signal(signal.SIGALRM, handler)
-    signal.alarm(seconds)
-    try:
-        yield
-    finally:
-        signal.alarm(0)
-        signal.signal(signal.SIGALRM, old_handler)
-
-
 # Default timeout per prompt generation (seconds)
 DEFAULT_PROMPT_TIMEOUT = 30
 
@@ -160,25 +144,42 @@ def build_strategy_queue(weights: dict[str, int]) -> list[str]:
 
 
 def expand_with_strategy(
-    graph: GraphLoader, seed_id: int, strategy: str, max_nodes: int = 30
+    graph: GraphLoader,
+    seed_id: int,
+    strategy: str,
+    max_nodes: int = 30,
+    deadline: Deadline = NO_DEADLINE,
 ) -> set[int]:
-    """Expand context using the specified strategy."""
+    """Expand context using the specified strategy, never beyond max_nodes."""
     if strategy == "bfs":
-        return expand_context(graph, seed_id, max_hops=2, max_nodes=max_nodes)
+        nodes = expand_context(graph, seed_id, max_hops=2, max_nodes=max_nodes, deadline=deadline)
     elif strategy == "chain":
-        return expand_chain_with_siblings(graph, seed_id)
+        nodes = expand_chain_with_siblings(graph, seed_id, deadline=deadline)
     elif strategy == "callers":
-        return expand_caller_tree(graph, seed_id, max_nodes=max_nodes)
+        nodes = expand_caller_tree(graph, seed_id, max_nodes=max_nodes, deadline=deadline)
     elif strategy == "callees":
-        return expand_callee_tree(graph, seed_id, max_nodes=max_nodes)
+        nodes = expand_callee_tree(graph, seed_id, max_nodes=max_nodes, deadline=deadline)
     elif strategy == "file":
-        return expand_file_centric(graph, seed_id)
+        nodes = expand_file_centric(graph, seed_id, max_nodes=max_nodes, deadline=deadline)
     else:
-        return expand_context(graph, seed_id, max_hops=2, max_nodes=max_nodes)
+        nodes = expand_context(graph, seed_id, max_hops=2, max_nodes=max_nodes, deadline=deadline)
+    return cap_nodes(nodes, seed_id, max_nodes)
 
 
 DEFAULT_MAX_ATTEMPTS_MULTIPLIER = 5
 
+# Per-process state of a shard worker, filled once by init_shard_worker
+_worker_graph: GraphLoader | None = None
+
+
+def derive_repo_name(repo_path: Path) -> str:
+    """owner/repo for clone_dir/owner/repo layouts, else the directory name."""
+    # Use owner/repo format for unique prompt IDs
+    owner = repo_path.parent.name
+    if owner and owner not in (".", "", "test_repos", "clones"):
+        return f"{owner}/{repo_path.name}"
+    return repo_path.name
+
 
 def generate_diverse_prompts(
     graph_path: Path,
@@ -191,6 +192,9 @@ def generate_diverse_prompts(
     quiet: bool = False,
     prompt_timeout: int = DEFAULT_PROMPT_TIMEOUT,
     max_attempts: int | None = None,
+    graph: GraphLoader | None = None,
+    workers: int = 1,
+    shard: tuple[int, int] | None = None,
 ) -> tuple[list[DiversePromptRecord], GenerationStats]:
     """Generate prompts with strategy rotation for diversity.
 
@@ -205,12 +209,30 @@ def generate_diverse_prompts(
         quiet: Suppress verbose output (for parallel workers)
         prompt_timeout: Timeout in seconds per prompt generation (default: 30)
         max_attempts: Maximum total attempts before giving up (default: 5x num_prompts)
+        graph: Already-loaded graph for graph_path (loaded here if omitted)
+        workers: Worker processes generating shards of this repo in parallel
+        shard: (index, count) to draw only from every count-th candidate seed
 
     Returns tuple of (prompts, generation_stats) where prompts is list of
     DiversePromptRecord objects and generation_stats contains aggregate metrics.
     """
     from batch.questions_rich_ui import GenerationStats
 
+    if workers > 1 and num_prompts > 1:
+        return generate_prompts_parallel(
+            graph_path=graph_path,
+            repo_path=repo_path,
+            num_prompts=num_prompts,
+            workers=workers,
+            repo_name=repo_name,
+            weights=weights,
+            max_tokens=max_tokens,
+            random_seed=random_seed,
+            prompt_timeout=prompt_timeout,
+            max_attempts=max_attempts,
+            graph=graph,
+        )
+
     start_time = time.time()
     if max_attempts is None:
         max_attempts = num_prompts * DEFAULT_MAX_ATTEMPTS_MULTIPLIER
@@ -224,13 +246,7 @@ def generate_diverse_prompts(
 
     # Derive repo_name and detect language once at start
     if repo_name is None:
-        # Try to extract owner from repo_path structure (clone_dir/owner/repo)
-        # Use owner/repo format for unique prompt IDs
-        owner = repo_path.parent.name
-        if owner and owner not in (".", "", "test_repos", "clones"):
-            repo_name = f"{owner}/{repo_path.name}"
-        else:
-            repo_name = repo_path.name
+        repo_name = derive_repo_name(repo_path)
     primary_language = detect_primary_language(repo_path)
 
     if not quiet:
@@ -244,12 +260,17 @@ def generate_diverse_prompts(
         print(f"Total weight sum: {sum(weights.values())}", file=sys.stderr)
         print(file=sys.stderr)
 
-    graph = GraphLoader(str(graph_path))
-    graph.load()
+    if graph is None:
+        graph = load_graph(str(graph_path))
 
     all_candidates = get_all_candidate_seeds(graph)
     # Build a dict for O(1) lookup of available candidates
     candidate_dict = {node.node_id: (node, count) for node, count in all_candidates}
+    if shard is not None:
+        # Candidates are sorted by score, so striping keeps shards equally weighted
+        index, count = shard
+        candidate_dict = dict(list(candidate_dict.items())[index::count])
+    seed_nodes = [node for node, _ in candidate_dict.values()]
 
     if not quiet:
         print(f"Found {len(all_candidates)} candidate seed nodes", file=sys.stderr)
@@ -260,7 +281,7 @@ def generate_diverse_prompts(
             file=sys.stderr,
         )
 
-    extractor = NodeTextExtractor(graph_path, repo_path)
+    extractor = NodeTextExtractor(graph_path, repo_path, graph_loader=graph)
 
     prompts: list[DiversePromptRecord] = []
     # Track (seed_id, strategy) combo usage counts - allows repeats up to MAX_REPEATS_PER_COMBO
@@ -272,6 +293,11 @@ def generate_diverse_prompts(
     attempt_count = 0
     unique_strategies = set(weights.keys())
     max_total_combos = len(candidate_dict) * len(unique_strategies) * MAX_REPEATS_PER_COMBO
+    total_used = 0
+    # One sampler per strategy; a seed leaves a strategy's sampler once its
+    # (seed, strategy) combo reaches MAX_REPEATS_PER_COMBO
+    seed_scores = [count for _, count in candidate_dict.values()]
+    samplers = {s: WeightedSampler(seed_scores) for s in unique_strategies}
 
     if not quiet:
         print(file=sys.stderr)
@@ -292,13 +318,9 @@ def generate_diverse_prompts(
         strategy_idx += 1
 
         # Sample from candidates that haven't hit max repeats for this strategy
-        available = [
-            (n, c) for nid, (n, c) in candidate_dict.items()
-            if combo_counts.get((nid, strategy), 0) < MAX_REPEATS_PER_COMBO
-        ]
-        if not available:
+        sampler = samplers[strategy]
+        if sampler.total <= 0:
             # Check if we've exhausted all combinations at max repeats
-            total_used = sum(combo_counts.values())
             if total_used >= max_total_combos:
                 if not quiet:
                     print(f"\nExhausted all combinations at max repeats ({len(prompts)} prompts)", file=sys.stderr)
@@ -308,11 +330,14 @@ def generate_diverse_prompts(
             continue
 
         # Weighted random selection
-        weights_list = [c for _, c in available]
-        seed = random.choices(available, weights=weights_list, k=1)[0][0]
+        seed_index = sampler.sample()
+        seed = seed_nodes[seed_index]
 
         combo_key = (seed.node_id, strategy)
         combo_counts[combo_key] = combo_counts.get(combo_key, 0) + 1
+        total_used += 1
+        if combo_counts[combo_key] >= MAX_REPEATS_PER_COMBO:
+            sampler.remove(seed_index)
         seed_name = seed.properties.get("name", f"node_{seed.node_id}")
         seed_qualified_name = seed.properties.get("qualified_name", "")
 
@@ -323,27 +348,27 @@ def generate_diverse_prompts(
                 file=sys.stderr,
             )
 
-        # Wrap slow operations in timeout context
+        # Slow steps check the deadline and stop cooperatively
+        deadline = Deadline.after(prompt_timeout)
         try:
-            with timeout_context(prompt_timeout):
-                context_nodes = expand_with_strategy(graph, seed.node_id, strategy)
-                graph_context, source_context = build_context(
-                    graph, extractor, context_nodes, seed.node_id, max_tokens
-                )
+            context_nodes = expand_with_strategy(graph, seed.node_id, strategy, deadline=deadline)
+            graph_context, source_context = build_context(
+                graph, extractor, context_nodes, seed.node_id, max_tokens, deadline=deadline
+            )
 
-                if not source_context.strip():
-                    if not quiet:
-                        print("  -> Skipped (no source)", file=sys.stderr)
-                    continue
+            if not source_context.strip():
+                if not quiet:
+                    print("  -> Skipped (no source)", file=sys.stderr)
+                continue
 
-                prompt_text = META_PROMPT.format(
-                    graph_context=graph_context, source_context=source_context
-                )
+            prompt_text = META_PROMPT.format(
+                graph_context=graph_context, source_context=source_context
+            )
 
-                # Collect file paths from context nodes
-                file_paths = sorted(collect_files_from_nodes(graph, context_nodes))
+            # Collect file paths from context nodes
+            file_paths = sorted(collect_files_from_nodes(graph, context_nodes))
 
-        except GenerationTimeout:
+        except DeadlineExceeded:
             timeout_count += 1
             if not quiet:
                 print(f"  -> Timeout ({prompt_timeout}s), skipping seed", file=sys.stderr)
@@ -408,6 +433,145 @@ def generate_diverse_prompts(
     return prompts, gen_stats
 
 
+def split_evenly(total: int, parts: int) -> list[int]:
+    """Split total into parts that differ by at most one, largest first."""
+    base, extra = divmod(total, parts)
+    return [base + (1 if i < extra else 0) for i in range(parts)]
+
+
+def shard_random_seeds(random_seed: int | None, shards: int) -> list[int | None]:
+    """Per-shard seeds derived from random_seed, so parallel runs are reproducible."""
+    if random_seed is None:
+        return [None] * shards
+    rng = random.Random(random_seed)
+    return [rng.randrange(2**32) for _ in range(shards)]
+
+
+def prompt_key(record: DiversePromptRecord) -> tuple[int, str, str]:
+    """Identity of a prompt: seed, strategy and a hash of its context nodes."""
+    context = ",".join(map(str, record.context_node_ids)).encode()
+    return record.seed_node_id, record.expansion_strategy, hashlib.sha1(context).hexdigest()
+
+
+def merge_shard_prompts(
+    shard_prompts: list[list[DiversePromptRecord]],
+    repo_name: str,
+) -> list[DiversePromptRecord]:
+    """Interleave shard outputs, drop duplicates and renumber prompt IDs."""
+    seen: set[tuple[int, str, str]] = set()
+    merged: list[DiversePromptRecord] = []
+    for round_records in zip_longest(*shard_prompts):
+        for record in round_records:
+            if record is None:
+                continue
+            key = prompt_key(record)
+            if key in seen:
+                continue
+            seen.add(key)
+            merged.append(record)
+    for i, record in enumerate(merged, start=1):
+        record.prompt_id = f"{repo_name}_{i:04d}"
+    return merged
+
+
+def shard_context() -> multiprocessing.context.BaseContext:
+    """Start shard workers without forking this process.
+
+    Forking a process that runs other threads (clone pools, introspection
+    readers, or a pool manager thread still exiting) can deadlock the child
+    on a lock one of them held. Workers come from the single-threaded fork
+    server where there is one and get the graph pickled once each.
+    """
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context("spawn")
+
+
+def init_shard_worker(graph: GraphLoader) -> None:
+    """Process pool initializer: keep the graph every shard of this repo reads."""
+    global _worker_graph
+    _worker_graph = graph
+
+
+def _generate_shard(kwargs: dict) -> tuple[list[DiversePromptRecord], GenerationStats]:
+    return generate_diverse_prompts(graph=_worker_graph, **kwargs)
+
+
+def generate_prompts_parallel(
+    graph_path: Path,
+    repo_path: Path,
+    num_prompts: int,
+    workers: int,
+    repo_name: str | None = None,
+    weights: dict[str, int] | None = None,
+    max_tokens: int = 8000,
+    random_seed: int | None = None,
+    prompt_timeout: int = DEFAULT_PROMPT_TIMEOUT,
+    max_attempts: int | None = None,
+    graph: GraphLoader | None = None,
+) -> tuple[list[DiversePromptRecord], GenerationStats]:
+    """Generate one repo's prompts in worker-process shards and merge them.
+
+    Candidate seeds are striped across shards, so every (seed, strategy)
+    combo belongs to exactly one shard and MAX_REPEATS_PER_COMBO still holds
+    after merging. The prompt target and attempt budget are split evenly, and
+    each shard's random seed is derived from random_seed, so a seeded run is
+    reproducible for a given worker count.
+    """
+    from batch.questions_rich_ui import GenerationStats
+
+    start_time = time.time()
+    workers = min(workers, num_prompts)
+    if repo_name is None:
+        repo_name = derive_repo_name(repo_path)
+    if max_attempts is None:
+        max_attempts = num_prompts * DEFAULT_MAX_ATTEMPTS_MULTIPLIER
+
+    shard_kwargs = [
+        {
+            "graph_path": graph_path,
+            "repo_path": repo_path,
+            "num_prompts": shard_prompts,
+            "repo_name": repo_name,
+            "weights": weights,
+            "max_tokens": max_tokens,
+            "random_seed": shard_seed,
+            "quiet": True,
+            "prompt_timeout": prompt_timeout,
+            "max_attempts": shard_attempts,
+            "shard": (index, workers),
+        }
+        for index, (shard_prompts, shard_attempts, shard_seed) in enumerate(
+            zip(
+                split_evenly(num_prompts, workers),
+                split_evenly(max_attempts, workers),
+                shard_random_seeds(random_seed, workers),
+                strict=True,
+            )
+        )
+    ]
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=shard_context(),
+        initializer=init_shard_worker,
+        initargs=(graph or load_graph(str(graph_path)),),
+    ) as executor:
+        shard_results = list(executor.map(_generate_shard, shard_kwargs))
+
+    prompts = merge_shard_prompts([p for p, _ in shard_results], repo_name)
+    shard_stats = [stats for _, stats in shard_results]
+    gen_stats = GenerationStats(
+        timeout_count=sum(s.timeout_count for s in shard_stats),
+        strategy_counts=dict(Counter(p.expansion_strategy for p in prompts)),
+        attempt_count=sum(s.attempt_count for s in shard_stats),
+        unique_seeds_used=sum(s.unique_seeds_used for s in shard_stats),
+        unique_combos_used=sum(s.unique_combos_used for s in shard_stats),
+        duration_seconds=time.time() - start_time,
+    )
+    return prompts, gen_stats
+
+
 def write_prompts_to_jsonl(prompts: list[DiversePromptRecord], output_path: Path) -> None:
     """Write prompt records to a JSONL file."""
     lines = []
@@ -469,6 +633,12 @@ def main() -> None:
         default=DEFAULT_PROMPT_TIMEOUT,
         help=f"Timeout in seconds per prompt generation (default: {DEFAULT_PROMPT_TIMEOUT})",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes sharing this repo's prompts (default: 1)",
+    )
 
     args = parser.parse_args()
 
@@ -499,6 +669,7 @@ def main() -> None:
         max_tokens=args.max_tokens,
         random_seed=args.random_seed,
         prompt_timeout=args.timeout,
+        workers=args.workers,
     )
 
     if args.output:
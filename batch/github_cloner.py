@@ -8,17 +8,28 @@ Usage:
 
     cloner = GitHubCloner(clone_dir=Path("./clones"))
     result = cloner.clone_repo("https://github.com/facebook/react")
+
+    # Many repos: 8 at a time, at most 4 per host, fetching only source files
+    cloner = GitHubCloner(clone_dir=Path("./clones"), max_per_host=4, sparse=True)
+    results = cloner.clone_repos(urls, workers=8)
 """
 from __future__ import annotations
 
 import json
+import os
 import shutil
 import subprocess
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Callable
+from urllib.parse import urlparse
+
+CLONE_TIMEOUT = 300  # 5 minutes per git command
+DEFAULT_STATE_SAVE_INTERVAL = 5.0
 
 
 @dataclass
@@ -50,7 +61,7 @@ class CloneState:
     last_updated: str = field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
     completed: list[str] = field(default_factory=list)  # URLs successfully cloned
     failed: dict[str, int] = field(default_factory=dict)  # URL -> retry count
-    in_progress: str | None = None  # Currently cloning
+    in_progress: list[str] = field(default_factory=list)  # Currently cloning
 
     def to_dict(self) -> dict:
         return {
@@ -70,10 +81,53 @@ class CloneState:
             last_updated=data.get("last_updated", datetime.now(timezone.utc).isoformat()),
             completed=data.get("completed", []),
             failed=data.get("failed", {}),
-            in_progress=data.get("in_progress"),
+            in_progress=in_progress_list(data.get("in_progress")),
         )
 
 
+def in_progress_list(value: str | list[str] | None) -> list[str]:
+    """State files written before parallel cloning hold a single URL or None."""
+    if value is None:
+        return []
+    return [value] if isinstance(value, str) else list(value)
+
+
+def sparse_checkout_patterns() -> list[str]:
+    """Non-cone sparse-checkout patterns for every file the indexer reads.
+
+    Source files of every language in LANGUAGE_SPECS, plus the dependency and
+    package manifests it inspects.
+    """
+    from codebase_rag.constants import (
+        CSPROJ_SUFFIX,
+        DEPENDENCY_FILES,
+        PKG_CMAKE_LISTS,
+        PKG_CONANFILE,
+        PKG_MAKEFILE,
+        PKG_VCXPROJ_GLOB,
+    )
+    from codebase_rag.language_spec import LANGUAGE_SPECS
+
+    extensions = {ext for spec in LANGUAGE_SPECS.values() for ext in spec.file_extensions}
+    # The indexer matches DEPENDENCY_FILES case-insensitively (e.g. Gemfile)
+    manifests = {case_insensitive_glob(name) for name in DEPENDENCY_FILES}
+    manifests |= {PKG_CMAKE_LISTS, PKG_CONANFILE, PKG_MAKEFILE}
+    return sorted(
+        {f"*{ext}" for ext in extensions}
+        | manifests
+        | {PKG_VCXPROJ_GLOB, f"*{CSPROJ_SUFFIX}"}
+    )
+
+
+def case_insensitive_glob(name: str) -> str:
+    return "".join(f"[{c.lower()}{c.upper()}]" if c.isalpha() else c for c in name)
+
+
+def url_host(github_url: str) -> str:
+    """Host a URL clones from; local (file://) sources share one pseudo-host."""
+    return urlparse(github_url).netloc or "local"
+
+
 # Callback type for progress updates
 CloneCallback = Callable[[CloneResult], None] | None
 
@@ -84,8 +138,13 @@ class GitHubCloner:
 
     Features:
     - Shallow clones (--depth 1) for speed
+    - Concurrent cloning with a per-host limit
+    - Optional sparse checkout of source files only, from a blob-less
+      partial clone, so other blobs are never downloaded
+    - Optional shared object store (git clone --reference-if-able)
     - Exponential backoff on failures
-    - State persistence for resume
+    - State persistence for resume, batched to at most one write per
+      state_save_interval seconds
     - Rate limit detection and handling
     """
 
@@ -96,6 +155,10 @@ class GitHubCloner:
         base_retry_delay: float = 5.0,
         shallow: bool = True,
         state_file: Path | None = None,
+        max_per_host: int | None = None,
+        sparse: bool = False,
+        reference: Path | None = None,
+        state_save_interval: float = DEFAULT_STATE_SAVE_INTERVAL,
     ):
         self.clone_dir = clone_dir
         self.max_retries = max_retries
@@ -103,6 +166,17 @@ class GitHubCloner:
         self.shallow = shallow
         self.state_file = state_file or (clone_dir / ".clone_state.json")
         self.state = CloneState()
+        self.max_per_host = max_per_host
+        self.sparse = sparse
+        # Clones borrow objects from the reference via alternates, so it must outlive them
+        self.reference = reference
+        self.state_save_interval = state_save_interval
+        # Guards state mutation and the state file when clones run on threads
+        self._state_lock = threading.RLock()
+        self._state_dirty = False
+        self._last_state_save = 0.0
+        self._host_slots: dict[str, threading.BoundedSemaphore] = {}
+        self._sparse_patterns = sparse_checkout_patterns() if sparse else []
 
         # Ensure clone directory exists
         self.clone_dir.mkdir(parents=True, exist_ok=True)
@@ -120,9 +194,70 @@ class GitHubCloner:
 
     def save_state(self) -> None:
         """Save state to disk."""
-        self.state.last_updated = datetime.now(timezone.utc).isoformat()
-        with open(self.state_file, "w") as f:
-            json.dump(self.state.to_dict(), f, indent=2)
+        with self._state_lock:
+            self.state.last_updated = datetime.now(timezone.utc).isoformat()
+            # Write-then-rename so an interrupted save never leaves a torn file
+            tmp = self.state_file.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp, "w") as f:
+                json.dump(self.state.to_dict(), f, indent=2)
+            tmp.replace(self.state_file)
+            self._state_dirty = False
+            self._last_state_save = time.monotonic()
+
+    def _state_changed(self) -> None:
+        """Record a state change, saving only if the last save is old enough."""
+        with self._state_lock:
+            self._state_dirty = True
+            if time.monotonic() - self._last_state_save >= self.state_save_interval:
+                self.save_state()
+
+    def flush_state(self) -> None:
+        """Save any state changes not yet on disk."""
+        with self._state_lock:
+            if self._state_dirty:
+                self.save_state()
+
+    def _host_slot(self, github_url: str) -> threading.BoundedSemaphore | None:
+        if self.max_per_host is None:
+            return None
+        host = url_host(github_url)
+        with self._state_lock:
+            if host not in self._host_slots:
+                self._host_slots[host] = threading.BoundedSemaphore(self.max_per_host)
+            return self._host_slots[host]
+
+    def _clone_command(self, github_url: str, local_path: Path) -> list[str]:
+        cmd = ["git", "clone"]
+        if self.shallow:
+            cmd.extend(["--depth", "1", "--single-branch"])
+        if self.sparse:
+            cmd.extend(["--filter=blob:none", "--no-checkout", "--sparse"])
+        if self.reference is not None:
+            cmd.extend(["--reference-if-able", str(self.reference)])
+        cmd.extend([github_url, str(local_path)])
+        return cmd
+
+    def _run_git(self, cmd: list[str]) -> subprocess.CompletedProcess:
+        return subprocess.run(cmd, capture_output=True, text=True, timeout=CLONE_TIMEOUT)
+
+    def _run_clone(self, github_url: str, local_path: Path) -> subprocess.CompletedProcess:
+        """Clone (and for sparse clones, check out source files); returns the last git result."""
+        slot = self._host_slot(github_url)
+        if slot is not None:
+            slot.acquire()
+        try:
+            result = self._run_git(self._clone_command(github_url, local_path))
+            if result.returncode != 0 or not self.sparse:
+                return result
+            git = ["git", "-C", str(local_path)]
+            result = self._run_git([*git, "sparse-checkout", "set", "--no-cone", *self._sparse_patterns])
+            if result.returncode != 0:
+                return result
+            # Checkout fetches exactly the blobs the sparse patterns select
+            return self._run_git([*git, "checkout"])
+        finally:
+            if slot is not None:
+                slot.release()
 
     def get_local_path(self, github_url: str) -> Path:
         """Get local path for a GitHub URL."""
@@ -184,14 +319,9 @@ class GitHubCloner:
             return result
 
         # Mark as in progress
-        self.state.in_progress = github_url
-        self.save_state()
-
-        # Build clone command
-        cmd = ["git", "clone"]
-        if self.shallow:
-            cmd.extend(["--depth", "1", "--single-branch"])
-        cmd.extend([github_url, str(local_path)])
+        with self._state_lock:
+            self.state.in_progress.append(github_url)
+            self._state_changed()
 
         # Retry loop
         last_error: str | None = None
@@ -205,21 +335,16 @@ class GitHubCloner:
                 local_path.parent.mkdir(parents=True, exist_ok=True)
 
                 # Run clone
-                result = subprocess.run(
-                    cmd,
-                    capture_output=True,
-                    text=True,
-                    timeout=300,  # 5 minute timeout
-                )
+                result = self._run_clone(github_url, local_path)
 
                 if result.returncode == 0:
                     # Success
                     duration = time.time() - start_time
-                    self.state.completed.append(github_url)
-                    self.state.in_progress = None
-                    if github_url in self.state.failed:
-                        del self.state.failed[github_url]
-                    self.save_state()
+                    with self._state_lock:
+                        self.state.completed.append(github_url)
+                        self._finish_in_progress(github_url)
+                        self.state.failed.pop(github_url, None)
+                        self._state_changed()
 
                     clone_result = CloneResult(
                         github_url=github_url,
@@ -271,9 +396,10 @@ class GitHubCloner:
 
         # Failed after all retries
         duration = time.time() - start_time
-        self.state.failed[github_url] = retry_count
-        self.state.in_progress = None
-        self.save_state()
+        with self._state_lock:
+            self.state.failed[github_url] = retry_count
+            self._finish_in_progress(github_url)
+            self._state_changed()
 
         clone_result = CloneResult(
             github_url=github_url,
@@ -287,24 +413,32 @@ class GitHubCloner:
             on_complete(clone_result)
         return clone_result
 
+    def _finish_in_progress(self, github_url: str) -> None:
+        if github_url in self.state.in_progress:
+            self.state.in_progress.remove(github_url)
+
     def clone_repos(
         self,
         github_urls: list[str],
         on_complete: CloneCallback = None,
         skip_completed: bool = True,
+        workers: int = 1,
     ) -> list[CloneResult]:
         """
-        Clone multiple repositories sequentially.
+        Clone multiple repositories, `workers` at a time.
 
         Args:
             github_urls: List of GitHub URLs to clone
-            on_complete: Callback for each completed clone
+            on_complete: Callback for each completed clone, always invoked
+                on the calling thread
             skip_completed: Skip repos already in completed state
+            workers: Concurrent clones (max_per_host still applies)
 
         Returns:
-            List of CloneResult objects
+            List of CloneResult objects, in input order
         """
         results: list[CloneResult] = []
+        pending: list[str] = []
 
         for url in github_urls:
             if skip_completed and url in self.state.completed and self.is_cloned(url):
@@ -321,11 +455,26 @@ class GitHubCloner:
                 if on_complete:
                     on_complete(result)
                 continue
-
-            result = self.clone_repo(url, on_complete=on_complete)
-            results.append(result)
-
-        return results
+            pending.append(url)
+
+        try:
+            if workers <= 1:
+                results.extend(self.clone_repo(url, on_complete=on_complete) for url in pending)
+            else:
+                by_url: dict[str, CloneResult] = {}
+                with ThreadPoolExecutor(max_workers=workers) as pool:
+                    futures = {pool.submit(self.clone_repo, url): url for url in pending}
+                    for future in as_completed(futures):
+                        result = future.result()
+                        by_url[futures[future]] = result
+                        if on_complete:
+                            on_complete(result)
+                results.extend(by_url[url] for url in pending)
+        finally:
+            self.flush_state()
+
+        order = {url: i for i, url in enumerate(github_urls)}
+        return sorted(results, key=lambda r: order[r.github_url])
 
     def get_pending_urls(self, github_urls: list[str]) -> list[str]:
         """Get URLs that haven't been successfully cloned yet."""
@@ -2,6 +2,8 @@
 Large Scale Batch Processor for Code Graph RAG
 
 Orchestrates the full pipeline: clone -> process -> upload with rich UI.
+By default cloning, processing and question generation run as overlapping
+streaming stages; --sequential runs them as separate phases.
 
 Usage:
     uv run python batch/large_scale_processor.py \
@@ -17,7 +19,7 @@ import json
 import os
 import sys
 import time
-from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures import Executor
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
@@ -26,8 +28,21 @@ BATCH_DIR = Path(__file__).parent
 PROJECT_ROOT = BATCH_DIR.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
-from batch.batch_processor import ProcessResult, process_single_repo
+from batch.batch_processor import (
+    DEFAULT_MAX_TASKS_PER_CHILD,
+    ProcessResult,
+    create_worker_pool,
+    overhead_per_repo,
+    process_repo_isolated,
+    schedule_repos,
+)
 from batch.github_cloner import CloneResult, GitHubCloner
+from batch.pipeline import (
+    PipelineCallbacks,
+    PipelineResult,
+    StageLimits,
+    StreamingPipeline,
+)
 from batch.repo_discovery import RepoEntry, RepoList
 from batch.rich_ui import BatchProgressUI
 
@@ -59,9 +74,19 @@ class LargeScaleConfig:
     min_questions: int = 10
     questions_only: bool = False  # Skip clone/process, only generate questions
     question_workers: int | None = None  # Workers for question generation (default: auto)
+    prompt_workers: int = 1  # Worker processes splitting one repo's prompts
     questions_debug: bool = False  # Show debug stats during question generation
     sparse_fallback: bool = True  # Try sparse mode if regular mode has too few candidates
     questions_verbose: bool = False  # Run question gen sequentially with full output
+    # Streaming pipeline
+    sequential: bool = False  # Run clone, process and questions as separate phases
+    clone_workers: int = 4  # Concurrent git clones
+    max_clones_per_host: int | None = None  # Concurrent clones against one host (None: no limit)
+    sparse_checkout: bool = False  # Fetch and check out only files the indexer reads
+    clone_reference: Path | None = None  # Local repo whose objects clones may borrow
+    queue_depth: int | None = None  # Items allowed to wait between stages (default: 2x workers)
+    max_tasks_per_child: int | None = DEFAULT_MAX_TASKS_PER_CHILD  # Recycle indexing workers (None: never)
+    memory_limit_mb: int | None = None  # Address-space limit per indexing worker
 
 
 @dataclass
@@ -78,6 +103,8 @@ class BatchSummary:
     total_time_seconds: float
     workers: int
     config: dict
+    worker_setup_seconds: float = 0.0
+    overhead_per_repo_seconds: float = 0.0
 
     def to_dict(self) -> dict:
         return {
@@ -91,6 +118,8 @@ class BatchSummary:
             "total_relationships": self.total_relationships,
             "total_time_seconds": self.total_time_seconds,
             "workers": self.workers,
+            "worker_setup_seconds": self.worker_setup_seconds,
+            "overhead_per_repo_seconds": self.overhead_per_repo_seconds,
             "config": self.config,
         }
 
@@ -139,17 +168,23 @@ class LargeScaleBatchProcessor:
         self.repos = repos
         return repos
 
-    def clone_phase(self) -> list[CloneResult]:
-        """Clone all repos (sequential with state persistence)."""
-        if not self.repos:
-            return []
-
-        self.cloner = GitHubCloner(
+    def create_cloner(self) -> GitHubCloner:
+        return GitHubCloner(
             clone_dir=self.config.clone_dir,
             max_retries=self.config.max_retries,
             shallow=self.config.shallow_clone,
+            max_per_host=self.config.max_clones_per_host,
+            sparse=self.config.sparse_checkout,
+            reference=self.config.clone_reference,
         )
 
+    def clone_phase(self) -> list[CloneResult]:
+        """Clone all repos concurrently, with state persistence."""
+        if not self.repos:
+            return []
+
+        self.cloner = self.create_cloner()
+
         # Load existing state for resume
         if self.config.resume:
             self.cloner.load_state()
@@ -188,6 +223,7 @@ class LargeScaleBatchProcessor:
             pending,
             on_complete=on_clone_complete,
             skip_completed=self.config.resume,
+            workers=self.config.clone_workers,
         )
 
         return results
@@ -213,56 +249,144 @@ class LargeScaleBatchProcessor:
         # Prepare output directory
         self.config.output_dir.mkdir(parents=True, exist_ok=True)
 
-        # Build args list for process pool
-        args_list = [(repo_path, self.config.output_dir) for repo_path in cloned_paths]
-
-        results: list[ProcessResult] = []
-
-        with ProcessPoolExecutor(max_workers=self.config.workers) as executor:
-            futures = {}
-            # Submit all tasks and mark initial batch as in-progress
-            for args in args_list:
-                future = executor.submit(process_single_repo, args)
-                futures[future] = args[0]
-                # Mark first N repos as in-progress (up to worker count)
-                if self.ui and len(futures) <= self.config.workers:
-                    self.ui.mark_repo_started(str(args[0]))
-
-            for future in as_completed(futures):
-                repo_path = futures[future]
-                try:
-                    result = future.result()
-                except Exception as e:
-                    result = ProcessResult(
-                        repo_path=str(repo_path),
-                        output_path=None,
-                        success=False,
-                        error=str(e),
-                        duration_seconds=0,
-                        node_count=0,
-                        relationship_count=0,
-                    )
-
-                results.append(result)
-
-                # Update UI - this removes from in-progress
-                if self.ui:
-                    self.ui.update_process_progress(result)
-
-                    # Find a pending repo to mark as in-progress
-                    # (a worker just freed up)
-                    completed_paths = {Path(r.repo_path) for r in results}
-                    in_progress_names = set(self.ui.stats.in_progress_repos)
-                    for args in args_list:
-                        if args[0] not in completed_paths:
-                            repo_name = args[0].name
-                            if repo_name not in in_progress_names:
-                                self.ui.mark_repo_started(str(args[0]))
-                                break
+        # Largest repos are dispatched first; memory failures get an isolated retry
+        results = schedule_repos(
+            cloned_paths,
+            self.config.output_dir,
+            self.config.workers,
+            max_tasks_per_child=self.config.max_tasks_per_child,
+            memory_limit_mb=self.config.memory_limit_mb,
+            on_start=(lambda path: self.ui.mark_repo_started(str(path))) if self.ui else None,
+            on_complete=self.ui.update_process_progress if self.ui else None,
+        )
 
         self.process_results = results
         return results
 
+    def pipeline_phase(self) -> PipelineResult:
+        """Clone, process and generate questions as overlapping stages."""
+        self.cloner = self.create_cloner()
+        if self.config.resume:
+            self.cloner.load_state()
+
+        github_urls: list[str] = []
+        cloned_paths: list[Path] = []
+        if self.config.skip_clone:
+            for repo in self.repos:
+                local_path = self.cloner.get_local_path(repo.github_url)
+                if (local_path / ".git").exists():
+                    cloned_paths.append(local_path)
+        else:
+            github_urls = [r.github_url for r in self.repos]
+            if self.config.resume:
+                pending = self.cloner.get_pending_urls(github_urls)
+                print(f"Resuming: {len(github_urls) - len(pending)} already cloned, {len(pending)} remaining")
+
+        question_workers = self.config.question_workers or max(1, self.config.workers // 2)
+        limits = StageLimits(
+            clone_workers=self.config.clone_workers,
+            index_workers=self.config.workers,
+            question_workers=question_workers,
+            queue_depth=self.config.queue_depth or 2 * self.config.workers,
+        )
+
+        def index_pool(workers: int) -> Executor:
+            return create_worker_pool(
+                workers, self.config.max_tasks_per_child, self.config.memory_limit_mb
+            )
+
+        def retry_isolated(repo_path: Path, output_dir: Path) -> ProcessResult:
+            return process_repo_isolated(repo_path, output_dir, self.config.memory_limit_mb)
+
+        def on_index_start(repo_path: Path) -> None:
+            if self.ui:
+                self.ui.mark_repo_started(str(repo_path))
+
+        callbacks = PipelineCallbacks(
+            on_clone=self.ui.update_clone_progress if self.ui else None,
+            on_index_start=on_index_start,
+            on_index=self.ui.update_process_progress if self.ui else None,
+        )
+
+        if not self.config.generate_questions:
+            pipeline = StreamingPipeline(
+                self.cloner,
+                self.config.output_dir,
+                limits,
+                callbacks,
+                index_executor_factory=index_pool,
+                retry_fn=retry_isolated,
+            )
+            result = pipeline.run(github_urls, cloned_paths)
+            self.process_results = result.process_results
+            return result
+
+        from batch.batch_question_generator import (
+            DEFAULT_PROMPT_TIMEOUT,
+            build_question_args,
+            repo_key,
+            write_questions_summary,
+        )
+        from batch.question_store import STORE_FILENAME, QuestionStore
+
+        questions_dir = self.config.questions_dir or (self.config.output_dir.parent / "questions")
+        questions_dir.mkdir(parents=True, exist_ok=True)
+
+        store = QuestionStore(questions_dir / STORE_FILENAME)
+        if not self.config.resume:
+            store.clear()
+
+        def question_task(process_result: ProcessResult) -> tuple | None:
+            if not process_result.output_path:
+                return None
+            repo_path = Path(process_result.repo_path)
+            if self.config.resume and store.is_complete(repo_key(repo_path)):
+                return None
+            return build_question_args(
+                Path(process_result.output_path),
+                repo_path,
+                questions_dir,
+                self.config.target_questions_per_repo,
+                self.config.min_questions,
+                DEFAULT_PROMPT_TIMEOUT,
+                self.config.sparse_fallback,
+                None,
+                self.config.prompt_workers,
+            )
+
+        def on_question(question_result: dict) -> None:
+            store.add_repo(question_result)
+            if self.ui:
+                self.ui.update_question_progress(question_result)
+
+        callbacks.on_question = on_question
+        pipeline = StreamingPipeline(
+            self.cloner,
+            self.config.output_dir,
+            limits,
+            callbacks,
+            question_task=question_task,
+            index_executor_factory=index_pool,
+            retry_fn=retry_isolated,
+        )
+        try:
+            result = pipeline.run(github_urls, cloned_paths)
+
+            combined_path = questions_dir / "all_questions.jsonl"
+            write_questions_summary(
+                questions_dir,
+                store,
+                combined_path,
+                store.export_jsonl(combined_path),
+                self.config.target_questions_per_repo,
+                self.config.sparse_fallback,
+                question_workers,
+            )
+        finally:
+            store.close()
+        self.process_results = result.process_results
+        return result
+
     def questions_phase(self) -> list[dict]:
         """Generate questions for all processed repos in parallel."""
         from batch.batch_question_generator import batch_generate_questions
@@ -283,6 +407,7 @@ class LargeScaleBatchProcessor:
             "target_per_repo": self.config.target_questions_per_repo,
             "min_questions": self.config.min_questions,
             "workers": self.config.question_workers or "auto",
+            "prompt_workers": self.config.prompt_workers,
             "sparse_fallback": self.config.sparse_fallback,
             "debug": self.config.questions_debug,
         }
@@ -305,6 +430,8 @@ class LargeScaleBatchProcessor:
                 sparse_fallback=self.config.sparse_fallback,
                 verbose=True,
                 ui=None,
+                prompt_workers=self.config.prompt_workers,
+                resume=self.config.resume,
             )
             log_exporter.close()
         else:
@@ -326,6 +453,8 @@ class LargeScaleBatchProcessor:
                     sparse_fallback=self.config.sparse_fallback,
                     verbose=False,
                     ui=questions_ui,
+                    prompt_workers=self.config.prompt_workers,
+                    resume=self.config.resume,
                 )
                 questions_ui.finish()
 
@@ -399,12 +528,17 @@ class LargeScaleBatchProcessor:
             total_relationships=sum(r.relationship_count for r in successful),
             total_time_seconds=time.time() - start_time,
             workers=self.config.workers,
+            worker_setup_seconds=sum(r.setup_seconds for r in self.process_results),
+            overhead_per_repo_seconds=overhead_per_repo(self.process_results),
             config={
                 "repo_list": str(self.config.repo_list_json),
                 "clone_dir": str(self.config.clone_dir),
                 "output_dir": str(self.config.output_dir),
                 "languages": self.config.languages,
                 "limit": self.config.limit,
+                "max_tasks_per_child": self.config.max_tasks_per_child,
+                "memory_limit_mb": self.config.memory_limit_mb,
+                "isolated_retries": sum(1 for r in self.process_results if r.isolated_retry),
             },
         )
 
@@ -412,6 +546,7 @@ class LargeScaleBatchProcessor:
         with open(summary_file, "w") as f:
             json.dump(summary.to_dict(), f, indent=2)
         print(f"Summary written to: {summary_file}")
+        print(f"Worker setup: {summary.worker_setup_seconds:.1f}s total, {summary.overhead_per_repo_seconds:.3f}s per repo")
 
         return summary
 
@@ -457,21 +592,31 @@ class LargeScaleBatchProcessor:
             )
 
         # Initialize UI
+        # Verbose question output needs the question phase to run on its own
+        pipelined = not self.config.sequential and not (
+            self.config.generate_questions and self.config.questions_verbose
+        )
         self.ui = BatchProgressUI(
             total_repos=len(self.repos),
             skip_clone=self.config.skip_clone,
+            track_questions=pipelined and self.config.generate_questions,
         )
         self.ui.start()
 
         with self.ui.live_context():
-            # Clone phase
-            if not self.config.skip_clone:
-                self.ui.set_phase("cloning")
-                self.clone_phase()
-
-            # Process phase
-            self.ui.set_phase("processing")
-            self.process_phase()
+            if pipelined:
+                # Clone, process and question stages overlap
+                self.ui.set_phase("streaming")
+                self.pipeline_phase()
+            else:
+                # Clone phase
+                if not self.config.skip_clone:
+                    self.ui.set_phase("cloning")
+                    self.clone_phase()
+
+                # Process phase
+                self.ui.set_phase("processing")
+                self.process_phase()
 
             # Upload phase
             if self.config.upload_to:
@@ -480,7 +625,7 @@ class LargeScaleBatchProcessor:
             self.ui.finish()
 
         # Question generation phase (outside live UI context for cleaner output)
-        if self.config.generate_questions:
+        if self.config.generate_questions and not pipelined:
             self.questions_phase()
 
         # Write summary
@@ -560,6 +705,52 @@ def main() -> None:
         default=True,
         help="Use shallow clones (default: True)",
     )
+    parser.add_argument(
+        "--sequential",
+        action="store_true",
+        help="Run clone, process and question generation as separate phases instead of a streaming pipeline",
+    )
+    parser.add_argument(
+        "--clone-workers",
+        type=int,
+        default=4,
+        help="Concurrent clones (default: 4)",
+    )
+    parser.add_argument(
+        "--max-clones-per-host",
+        type=int,
+        default=None,
+        help="Concurrent clones against any one git host (default: no limit)",
+    )
+    parser.add_argument(
+        "--sparse-checkout",
+        action="store_true",
+        help="Partial clone that downloads and checks out only source files and manifests the indexer reads",
+    )
+    parser.add_argument(
+        "--clone-reference",
+        type=Path,
+        default=None,
+        help="Local repo (e.g. a bare mirror) whose objects clones borrow instead of downloading; must outlive the clones",
+    )
+    parser.add_argument(
+        "--queue-depth",
+        type=int,
+        default=None,
+        help="Repos allowed to wait between pipeline stages before the upstream stage pauses (default: 2x workers)",
+    )
+    parser.add_argument(
+        "--max-tasks-per-child",
+        type=int,
+        default=DEFAULT_MAX_TASKS_PER_CHILD,
+        help=f"Repos each indexing worker handles before it is replaced; 0 keeps workers for the whole run (default: {DEFAULT_MAX_TASKS_PER_CHILD})",
+    )
+    parser.add_argument(
+        "--memory-limit-mb",
+        type=int,
+        default=None,
+        help="Address-space limit per indexing worker; repos that exceed it are retried in an isolated process (default: no limit)",
+    )
     parser.add_argument(
         "--max-retries",
         type=int,
@@ -601,6 +792,12 @@ def main() -> None:
         default=None,
         help=f"Workers for question generation (default: cpu_count - 2 = {get_optimal_workers()})",
     )
+    parser.add_argument(
+        "--prompt-workers",
+        type=int,
+        default=1,
+        help="Worker processes splitting each repo's prompts, for very large repos (default: 1)",
+    )
     parser.add_argument(
         "--questions-debug",
         action="store_true",
@@ -658,9 +855,18 @@ def main() -> None:
         min_questions=args.min_questions,
         questions_only=args.questions_only,
         question_workers=args.question_workers,
+        prompt_workers=args.prompt_workers,
         questions_debug=args.questions_debug,
         sparse_fallback=not args.no_sparse_fallback,
         questions_verbose=args.questions_verbose,
+        sequential=args.sequential,
+        clone_workers=args.clone_workers,
+        max_clones_per_host=args.max_clones_per_host,
+        sparse_checkout=args.sparse_checkout,
+        clone_reference=args.clone_reference,
+        queue_depth=args.queue_depth,
+        max_tasks_per_child=args.max_tasks_per_child or None,
+        memory_limit_mb=args.memory_limit_mb,
     )
 
     print("=" * 60)
@@ -674,6 +880,7 @@ def main() -> None:
     print(f"Output dir:  {config.output_dir}")
     if not config.questions_only:
         print(f"Workers:     {config.workers}")
+        print(f"Pipeline:    {'sequential' if config.sequential else f'streaming ({config.clone_workers} clone workers)'}")
         print(f"Resume:      {config.resume}")
         print(f"Skip clone:  {config.skip_clone}")
     if config.languages:
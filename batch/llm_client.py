@@ -0,0 +1,282 @@
+"""
+Async LLM Client for Question Generation
+
+One AsyncOpenAI client (and so one pooled HTTP connection set) is shared by
+every request. Requests run concurrently up to a fixed limit, are paced by
+token buckets for requests/min and tokens/min, retry transient failures with
+jittered exponential backoff and, when a cache directory is given, are
+cached by prompt hash so re-runs do not pay for the same completion twice.
+
+Usage:
+    config = LLMConfig.from_env()
+    async with AsyncLLMClient(config) as client:
+        responses = await client.complete_many(prompts)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import os
+import random
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from types import TracebackType
+
+CHARS_PER_TOKEN_ESTIMATE = 4
+
+
+@dataclass
+class LLMConfig:
+    """Connection, pacing and caching settings for AsyncLLMClient."""
+
+    base_url: str
+    api_key: str
+    model: str = "gpt-4o"
+    temperature: float = 0.7
+    max_concurrency: int = 16
+    requests_per_minute: int = 500  # 0 disables the limit
+    tokens_per_minute: int = 200_000  # 0 disables the limit
+    expected_completion_tokens: int = 1000  # reserved per request until usage is known
+    max_retries: int = 5
+    base_retry_delay: float = 1.0
+    max_retry_delay: float = 60.0
+    timeout: float = 120.0
+    cache_dir: Path | None = None  # None disables response caching
+
+    @classmethod
+    def from_env(cls) -> LLMConfig:
+        """Read QUESTION_GEN_BASE_URL, QUESTION_GEN_API_KEY and QUESTION_GEN_MODEL."""
+        base_url = os.getenv("QUESTION_GEN_BASE_URL")
+        api_key = os.getenv("QUESTION_GEN_API_KEY")
+        if not base_url or not api_key:
+            raise ValueError(
+                "QUESTION_GEN_BASE_URL and QUESTION_GEN_API_KEY environment variables required"
+            )
+        return cls(
+            base_url=base_url,
+            api_key=api_key,
+            model=os.getenv("QUESTION_GEN_MODEL", "gpt-4o"),
+        )
+
+
+@dataclass
+class LLMStats:
+    """Counters for one client's lifetime."""
+
+    requests: int = 0
+    cache_hits: int = 0
+    retries: int = 0
+    failures: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+
+
+class TokenBucket:
+    """Refills continuously at `per_minute` units per minute, up to one minute's worth.
+
+    Waiters are served in arrival order. A non-positive rate disables the bucket.
+    """
+
+    def __init__(self, per_minute: float):
+        self.capacity = float(per_minute)
+        self.rate = per_minute / 60.0
+        self.level = self.capacity
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def acquire(self, amount: float = 1) -> None:
+        """Wait until `amount` units are available, then take them."""
+        if self.rate <= 0:
+            return
+        # A request bigger than the bucket could never fit; let it drain the bucket instead
+        amount = min(amount, self.capacity)
+        async with self._lock:
+            self._refill()
+            while self.level < amount:
+                await asyncio.sleep((amount - self.level) / self.rate)
+                self._refill()
+            self.level -= amount
+
+    def adjust(self, amount: float) -> None:
+        """Take (or, if negative, return) units without waiting, e.g. once real usage is known."""
+        if self.rate <= 0:
+            return
+        self._refill()
+        self.level = min(self.capacity, self.level - amount)
+
+
+class ResponseCache:
+    """Completions keyed by a hash of (model, temperature, prompt), optionally persisted."""
+
+    def __init__(self, cache_dir: Path | None = None):
+        self.cache_dir = cache_dir
+        self._memory: dict[str, str] = {}
+        if cache_dir is not None:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def key(model: str, temperature: float, prompt: str) -> str:
+        payload = json.dumps([model, temperature, prompt], ensure_ascii=False)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path | None:
+        return self.cache_dir / f"{key}.json" if self.cache_dir is not None else None
+
+    def get(self, key: str) -> str | None:
+        if key in self._memory:
+            return self._memory[key]
+        path = self._path(key)
+        if path is None or not path.exists():
+            return None
+        try:
+            text = json.loads(path.read_text(encoding="utf-8"))["response"]
+        except (OSError, ValueError, KeyError):
+            return None
+        self._memory[key] = text
+        return text
+
+    def put(self, key: str, text: str) -> None:
+        self._memory[key] = text
+        path = self._path(key)
+        if path is not None:
+            # Write-then-rename so a concurrent reader never sees a partial file
+            tmp = path.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_text(
+                json.dumps({"response": text}, ensure_ascii=False), encoding="utf-8"
+            )
+            tmp.replace(path)
+
+
+def backoff_delay(
+    attempt: int, base: float, cap: float, retry_after: float | None = None
+) -> float:
+    """Full-jitter exponential backoff, never shorter than the server's Retry-After."""
+    delay = random.uniform(0, min(cap, base * 2**attempt))
+    if retry_after is not None:
+        delay = max(delay, min(retry_after, cap))
+    return delay
+
+
+def retry_after_seconds(error: Exception) -> float | None:
+    response = getattr(error, "response", None)
+    value = response.headers.get("retry-after") if response is not None else None
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+class AsyncLLMClient:
+    """Concurrent, rate-limited chat completions over one reused connection pool.
+
+    Create and use it inside a single event loop; the underlying HTTP client
+    and the asyncio primitives are bound to the loop that first uses them.
+    """
+
+    def __init__(self, config: LLMConfig):
+        import openai
+
+        self.config = config
+        self.stats = LLMStats()
+        self._openai = openai
+        self._client = openai.AsyncOpenAI(
+            base_url=config.base_url,
+            api_key=config.api_key,
+            timeout=config.timeout,
+            max_retries=0,  # retries are paced by our own backoff and rate limits
+        )
+        self._requests = TokenBucket(config.requests_per_minute)
+        self._tokens = TokenBucket(config.tokens_per_minute)
+        self._slots = asyncio.Semaphore(config.max_concurrency)
+        # Off by default: a repeated prompt should get a fresh sample, not the same question
+        self._cache = ResponseCache(config.cache_dir) if config.cache_dir is not None else None
+
+    async def __aenter__(self) -> AsyncLLMClient:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        await self._client.close()
+
+    def _is_retryable(self, error: Exception) -> bool:
+        return isinstance(
+            error,
+            self._openai.RateLimitError
+            | self._openai.APIConnectionError
+            | self._openai.InternalServerError,
+        )
+
+    async def complete(self, prompt: str) -> str:
+        """Return the completion for `prompt`, from cache when caching is on."""
+        if self._cache is None:
+            return await self._request(prompt)
+        key = ResponseCache.key(self.config.model, self.config.temperature, prompt)
+        cached = self._cache.get(key)
+        if cached is not None:
+            self.stats.cache_hits += 1
+            return cached
+
+        text = await self._request(prompt)
+        self._cache.put(key, text)
+        return text
+
+    async def complete_many(self, prompts: list[str]) -> list[str | BaseException]:
+        """Complete every prompt concurrently; failures are returned in place of text."""
+        return await asyncio.gather(
+            *(self.complete(p) for p in prompts), return_exceptions=True
+        )
+
+    async def _request(self, prompt: str) -> str:
+        estimate = (
+            len(prompt) // CHARS_PER_TOKEN_ESTIMATE
+            + self.config.expected_completion_tokens
+        )
+
+        attempt = 0
+        while True:
+            async with self._slots:
+                await self._requests.acquire(1)
+                await self._tokens.acquire(estimate)
+                self.stats.requests += 1
+                try:
+                    response = await self._client.chat.completions.create(
+                        model=self.config.model,
+                        messages=[{"role": "user", "content": prompt}],
+                        temperature=self.config.temperature,
+                    )
+                except Exception as e:
+                    if not self._is_retryable(e) or attempt >= self.config.max_retries:
+                        self.stats.failures += 1
+                        raise
+                    delay = backoff_delay(
+                        attempt,
+                        self.config.base_retry_delay,
+                        self.config.max_retry_delay,
+                        retry_after_seconds(e),
+                    )
+                else:
+                    if response.usage is not None:
+                        self.stats.prompt_tokens += response.usage.prompt_tokens
+                        self.stats.completion_tokens += response.usage.completion_tokens
+                        self._tokens.adjust(response.usage.total_tokens - estimate)
+                    return response.choices[0].message.content or ""
+
+            # Back off outside the slot so other requests keep flowing
+            attempt += 1
+            self.stats.retries += 1
+            await asyncio.sleep(delay)
@@ -0,0 +1,349 @@
+"""
+Streaming Pipeline for Code Graph RAG
+
+Runs clone -> index -> questions as overlapping stages instead of three
+back-to-back phases, so network-bound cloning and CPU-bound indexing keep
+each other busy.
+
+Each stage has its own pool. Stages are joined by bounded queues: when a
+downstream stage falls behind, the upstream stage stops admitting work until
+the queue drains.
+
+Usage:
+    from batch.pipeline import StageLimits, StreamingPipeline
+
+    pipeline = StreamingPipeline(cloner, output_dir, StageLimits(clone_workers=8))
+    result = pipeline.run(github_urls)
+"""
+from __future__ import annotations
+
+import multiprocessing
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import ExitStack
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from batch.batch_processor import (
+    WORKER_DIED,
+    ProcessResult,
+    estimate_repo_cost,
+    failed_result,
+    needs_isolated_retry,
+    process_single_repo,
+)
+from batch.github_cloner import CloneResult, GitHubCloner
+
+
+@dataclass
+class StageLimits:
+    """Concurrency and backpressure for each pipeline stage."""
+    clone_workers: int = 4
+    index_workers: int = 4
+    question_workers: int = 1
+    queue_depth: int = 8  # Finished items allowed to wait for the next stage
+
+
+@dataclass
+class PipelineCallbacks:
+    """Progress hooks, always invoked on the thread that called run()."""
+    on_clone: Callable[[CloneResult], None] | None = None
+    on_index_start: Callable[[Path], None] | None = None
+    on_index: Callable[[ProcessResult], None] | None = None
+    on_question: Callable[[dict], None] | None = None
+
+
+@dataclass
+class PipelineResult:
+    """Results collected from every stage, in completion order."""
+    clone_results: list[CloneResult] = field(default_factory=list)
+    process_results: list[ProcessResult] = field(default_factory=list)
+    question_results: list[dict] = field(default_factory=list)
+
+
+# Builds generate_questions_worker args for an indexed repo (None to skip it)
+QuestionTask = Callable[[ProcessResult], tuple | None]
+ExecutorFactory = Callable[[int], Executor]
+# Re-indexes a repo whose worker ran out of memory or died: (repo_path, output_dir)
+RetryFn = Callable[[Path, Path], ProcessResult]
+
+
+def _failed_clone(github_url: str, error: Exception) -> CloneResult:
+    return CloneResult(
+        github_url=github_url,
+        local_path=None,
+        success=False,
+        error=str(error),
+        duration_seconds=0,
+        retry_count=0,
+    )
+
+
+def _failed_questions(args: tuple, error: Exception) -> dict:
+    graph_path = args[0]
+    return {
+        "repo": graph_path.stem,
+        "graph": str(graph_path),
+        "generated": 0,
+        "skipped": True,
+        "reason": str(error),
+    }
+
+
+def _repo_cost(repo_path: Path) -> int:
+    return estimate_repo_cost(repo_path).score
+
+
+def _spawn_pool(workers: int) -> Executor:
+    # Pools are created while clone threads run; a forked child could inherit a held lock
+    return ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context("spawn"))
+
+
+class StreamingPipeline:
+    """
+    Overlapping clone, index and question stages.
+
+    Cloning runs on threads (it waits on git subprocesses); indexing and
+    question generation run in process pools. A single coordinator loop
+    admits work into each stage and routes finished items downstream, so
+    CloneState is only touched by the cloner and UI callbacks never race.
+    Repo sizing walks the tree, so it runs on the clone threads, never on
+    the coordinator.
+
+    Among repos waiting to be indexed, the largest is dispatched first. A
+    repo whose worker hits its memory limit or dies is handed to retry_fn
+    (typically an isolated single-repo process); a dead worker's pool is
+    replaced so the rest of the run continues.
+    """
+
+    def __init__(
+        self,
+        cloner: GitHubCloner,
+        output_dir: Path,
+        limits: StageLimits,
+        callbacks: PipelineCallbacks | None = None,
+        question_task: QuestionTask | None = None,
+        index_fn: Callable[[tuple[Path, Path]], ProcessResult] = process_single_repo,
+        question_fn: Callable[[tuple], dict] | None = None,
+        executor_factory: ExecutorFactory = _spawn_pool,
+        index_executor_factory: ExecutorFactory | None = None,
+        retry_fn: RetryFn | None = None,
+        cost_fn: Callable[[Path], int] = _repo_cost,
+    ):
+        self.cloner = cloner
+        self.output_dir = output_dir
+        self.limits = limits
+        self.callbacks = callbacks or PipelineCallbacks()
+        self.question_task = question_task
+        self.index_fn = index_fn
+        self.question_fn = question_fn
+        self.executor_factory = executor_factory
+        self.index_executor_factory = index_executor_factory or executor_factory
+        self.retry_fn = retry_fn
+        self.cost_fn = cost_fn
+
+        self._to_clone: deque[str] = deque()
+        self._to_index: dict[Path, int] = {}  # repo -> estimated cost
+        self._to_question: deque[tuple] = deque()
+        self._clone_futures: dict[Future, str] = {}
+        self._index_futures: dict[Future, Path] = {}
+        self._retry_futures: dict[Future, Path] = {}
+        self._question_futures: dict[Future, tuple] = {}
+        self._index_pool: Executor | None = None
+        self._index_pool_broken = False
+        self.result = PipelineResult()
+
+    @property
+    def _questions_enabled(self) -> bool:
+        return self.question_task is not None
+
+    def run(
+        self,
+        github_urls: list[str],
+        cloned_paths: list[Path] | None = None,
+    ) -> PipelineResult:
+        """
+        Stream repos through every stage.
+
+        Args:
+            github_urls: URLs to clone (already-cloned ones finish immediately)
+            cloned_paths: Local repos to index without cloning
+
+        Returns:
+            PipelineResult with per-stage results
+        """
+        self._to_clone.extend(github_urls)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+
+        if self._questions_enabled and self.question_fn is None:
+            from batch.batch_question_generator import generate_questions_worker
+            self.question_fn = generate_questions_worker
+
+        self._index_pool = self.index_executor_factory(self.limits.index_workers)
+        try:
+            with ExitStack() as stack:
+                clone_pool = stack.enter_context(
+                    ThreadPoolExecutor(max_workers=self.limits.clone_workers)
+                )
+                # Size local repos up front so the first dispatch is already largest-first
+                paths = cloned_paths or []
+                self._to_index.update(zip(paths, clone_pool.map(self.cost_fn, paths)))
+                # Isolated retries block on their own process, so they get a thread
+                retry_pool = stack.enter_context(ThreadPoolExecutor(max_workers=1))
+                question_pool = (
+                    stack.enter_context(self.executor_factory(self.limits.question_workers))
+                    if self._questions_enabled
+                    else None
+                )
+
+                while True:
+                    self._admit(clone_pool, question_pool)
+                    pending = [
+                        *self._clone_futures,
+                        *self._index_futures,
+                        *self._retry_futures,
+                        *self._question_futures,
+                    ]
+                    if not pending:
+                        break
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        self._route(future, retry_pool)
+                    # Route every finished future first: several may share the broken pool
+                    if self._index_pool_broken:
+                        self._replace_index_pool(retry_pool)
+        finally:
+            self._index_pool.shutdown()
+            # Clone state saves are batched; persist whatever is still pending
+            self.cloner.flush_state()
+
+        return self.result
+
+    def _clone(self, url: str) -> tuple[CloneResult, int | None]:
+        """Clone on a clone thread and size the repo there; cost is None if it is not indexable."""
+        clone_result = self.cloner.clone_repo(url)
+        local_path = clone_result.local_path
+        if clone_result.success and local_path and (local_path / ".git").exists():
+            return clone_result, self.cost_fn(local_path)
+        return clone_result, None
+
+    def _next_index(self) -> Path:
+        """Pop the largest repo waiting to be indexed."""
+        repo_path = max(self._to_index, key=self._to_index.__getitem__)
+        del self._to_index[repo_path]
+        return repo_path
+
+    def _admit(
+        self,
+        clone_pool: Executor,
+        question_pool: Executor | None,
+    ) -> None:
+        """Submit as much work as each stage's limits and queues allow."""
+        if question_pool is not None:
+            while self._to_question and len(self._question_futures) < self.limits.question_workers:
+                args = self._to_question.popleft()
+                self._question_futures[question_pool.submit(self.question_fn, args)] = args
+
+        # Indexing stalls while finished graphs pile up for question generation
+        while (
+            self._to_index
+            and len(self._index_futures) < self.limits.index_workers
+            and len(self._to_question) < self.limits.queue_depth
+        ):
+            repo_path = self._next_index()
+            future = self._index_pool.submit(self.index_fn, (repo_path, self.output_dir))
+            self._index_futures[future] = repo_path
+            if self.callbacks.on_index_start:
+                self.callbacks.on_index_start(repo_path)
+
+        # Cloning stalls while cloned repos pile up for indexing
+        while (
+            self._to_clone
+            and len(self._clone_futures) < self.limits.clone_workers
+            and len(self._to_index) < self.limits.queue_depth
+        ):
+            url = self._to_clone.popleft()
+            self._clone_futures[clone_pool.submit(self._clone, url)] = url
+
+    def _replace_index_pool(self, retry_pool: Executor) -> None:
+        """A dead worker broke the pool: retry everything it was running and start a new one."""
+        for repo_path in self._index_futures.values():
+            self._retry_or_fail(repo_path, retry_pool)
+        self._index_futures.clear()
+        self._index_pool.shutdown(wait=False, cancel_futures=True)
+        self._index_pool = self.index_executor_factory(self.limits.index_workers)
+        self._index_pool_broken = False
+
+    def _retry(self, repo_path: Path, retry_pool: Executor) -> bool:
+        if self.retry_fn is None:
+            return False
+        self._retry_futures[retry_pool.submit(self.retry_fn, repo_path, self.output_dir)] = repo_path
+        return True
+
+    def _retry_or_fail(self, repo_path: Path, retry_pool: Executor) -> None:
+        if not self._retry(repo_path, retry_pool):
+            self._finish_index(failed_result(repo_path, WORKER_DIED, memory_exceeded=True))
+
+    def _finish_index(self, process_result: ProcessResult) -> None:
+        self.result.process_results.append(process_result)
+        if self.callbacks.on_index:
+            self.callbacks.on_index(process_result)
+        if process_result.success and self.question_task is not None:
+            args = self.question_task(process_result)
+            if args is not None:
+                self._to_question.append(args)
+
+    def _route(self, future: Future, retry_pool: Executor) -> None:
+        """Record a finished item and queue it for the next stage."""
+        if future in self._clone_futures:
+            url = self._clone_futures.pop(future)
+            try:
+                clone_result, cost = future.result()
+            except Exception as e:
+                clone_result, cost = _failed_clone(url, e), None
+            self.result.clone_results.append(clone_result)
+            if self.callbacks.on_clone:
+                self.callbacks.on_clone(clone_result)
+            if cost is not None:
+                self._to_index[clone_result.local_path] = cost
+
+        elif future in self._index_futures:
+            repo_path = self._index_futures.pop(future)
+            try:
+                process_result = future.result()
+            except BrokenProcessPool:
+                self._retry_or_fail(repo_path, retry_pool)
+                self._index_pool_broken = True
+                return
+            except Exception as e:
+                process_result = failed_result(repo_path, str(e))
+            if needs_isolated_retry(process_result) and self._retry(repo_path, retry_pool):
+                return
+            self._finish_index(process_result)
+
+        elif future in self._retry_futures:
+            repo_path = self._retry_futures.pop(future)
+            try:
+                process_result = future.result()
+            except Exception as e:
+                process_result = failed_result(repo_path, str(e))
+            self._finish_index(process_result)
+
+        elif future in self._question_futures:
+            args = self._question_futures.pop(future)
+            try:
+                question_result = future.result()
+            except Exception as e:
+                question_result = _failed_questions(args, e)
+            self.result.question_results.append(question_result)
+            if self.callbacks.on_question:
+                self.callbacks.on_question(question_result)
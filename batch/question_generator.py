@@ -15,12 +15,15 @@ Usage:
 from __future__ import annotations
 
 import argparse
+import asyncio
+import functools
 import json
-import os
 import random
 import sys
-from dataclasses import dataclass
+from collections import Counter
+from dataclasses import dataclass, replace
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 BATCH_DIR = Path(__file__).parent
 PROJECT_ROOT = BATCH_DIR.parent
@@ -30,8 +33,13 @@ from codebase_rag.graph_loader import GraphLoader
 from codebase_rag.models import GraphNode
 from codebase_rag.node_text_extractor import NodeTextExtractor, NodeTextResult
 
+from deadline import NO_DEADLINE, Deadline
+from llm_client import AsyncLLMClient, LLMConfig
 from question_debug_stats import QuestionDebugStats
 
+if TYPE_CHECKING:
+    from openai import OpenAI
+
 
 @dataclass
 class GeneratedQuestion:
@@ -52,6 +60,22 @@ RELATIONSHIP_TYPES_TO_FOLLOW = frozenset(
 
 CHARS_PER_TOKEN_ESTIMATE = 4
 
+# Hard cap on the graph-structure part of a prompt; source code is already
+# capped by the token budget
+MAX_GRAPH_CONTEXT_CHARS = 12_000
+# Names listed per relationship in a code chunk
+MAX_RELATED_NAMES = 5
+
+
+def count_calls_degree(graph: GraphLoader) -> Counter[int]:
+    """CALLS edges touching each node (in + out), from one pass over the graph."""
+    degree: Counter[int] = Counter()
+    for rel in graph.relationships:
+        if rel.type == "CALLS":
+            degree[rel.from_id] += 1
+            degree[rel.to_id] += 1
+    return degree
+
 
 def get_all_candidate_seeds(
     graph: GraphLoader,
@@ -72,6 +96,7 @@ def get_all_candidate_seeds(
         debug_stats: Optional stats collector for debugging
     """
     candidates: list[tuple[GraphNode, int]] = []
+    calls_degree = count_calls_degree(graph)
 
     for label in ["Function", "Method"]:
         nodes = graph.find_nodes_by_label(label)
@@ -84,16 +109,13 @@ def get_all_candidate_seeds(
                 debug_stats.total_methods = len(nodes)
 
         for node in nodes:
-            outgoing = graph.get_outgoing_relationships(node.node_id)
-            incoming = graph.get_incoming_relationships(node.node_id)
-
             # Count CALLS relationships
-            calls_out = len([r for r in outgoing if r.type == "CALLS"])
-            calls_in = len([r for r in incoming if r.type == "CALLS"])
-            calls_total = calls_out + calls_in
+            calls_total = calls_degree[node.node_id]
 
             # Count all relationships (more permissive)
-            all_rels = len(outgoing) + len(incoming)
+            all_rels = len(graph.get_outgoing_relationships(node.node_id)) + len(
+                graph.get_incoming_relationships(node.node_id)
+            )
 
             # Check code quality indicators
             start_line = node.properties.get("start_line", 0)
@@ -246,7 +268,11 @@ def sample_seed_node(
 
 
 def expand_context(
-    graph: GraphLoader, seed_id: int, max_hops: int = 2, max_nodes: int = 25
+    graph: GraphLoader,
+    seed_id: int,
+    max_hops: int = 2,
+    max_nodes: int = 25,
+    deadline: Deadline = NO_DEADLINE,
 ) -> set[int]:
     visited: set[int] = {seed_id}
     frontier: set[int] = {seed_id}
@@ -257,6 +283,7 @@ def expand_context(
 
         next_frontier: set[int] = set()
         for node_id in frontier:
+            deadline.check()
             for rel in graph.get_outgoing_relationships(node_id):
                 if rel.type in RELATIONSHIP_TYPES_TO_FOLLOW:
                     next_frontier.add(rel.to_id)
@@ -276,6 +303,14 @@ def expand_context(
     return visited
 
 
+def cap_nodes(node_ids: set[int], seed_id: int, max_nodes: int) -> set[int]:
+    """Keep the seed plus a random sample, so no strategy exceeds max_nodes."""
+    if len(node_ids) <= max_nodes:
+        return node_ids
+    others = sorted(node_ids - {seed_id})
+    return {seed_id, *random.sample(others, max_nodes - 1)}
+
+
 def get_defining_module(graph: GraphLoader, node_id: int) -> GraphNode | None:
     """Find the module that defines this function/method."""
     incoming = graph.get_incoming_relationships(node_id)
@@ -312,6 +347,7 @@ def expand_chain_with_siblings(
     chain_depth: int = 4,
     siblings_per_node: int = 2,
     max_callers: int = 3,
+    deadline: Deadline = NO_DEADLINE,
 ) -> set[int]:
     """Follow call chains deeply, adding siblings at each level.
 
@@ -322,6 +358,7 @@ def expand_chain_with_siblings(
     chain = [seed_id]
     current = seed_id
     for _ in range(chain_depth):
+        deadline.check()
         callees = [
             r.to_id
             for r in graph.get_outgoing_relationships(current)
@@ -337,6 +374,7 @@ def expand_chain_with_siblings(
         current = next_node
 
     for node_id in chain:
+        deadline.check()
         siblings = get_siblings(graph, node_id)
         # Shuffle siblings for diversity
         random.shuffle(siblings)
@@ -357,7 +395,11 @@ def expand_chain_with_siblings(
 
 
 def expand_caller_tree(
-    graph: GraphLoader, seed_id: int, depth: int = 3, max_nodes: int = 30
+    graph: GraphLoader,
+    seed_id: int,
+    depth: int = 3,
+    max_nodes: int = 30,
+    deadline: Deadline = NO_DEADLINE,
 ) -> set[int]:
     """Focus on who calls this function - upstream focus.
 
@@ -371,6 +413,7 @@ def expand_caller_tree(
             break
         next_frontier: set[int] = set()
         for node_id in frontier:
+            deadline.check()
             for rel in graph.get_incoming_relationships(node_id):
                 if rel.type == "CALLS" and rel.from_id not in visited:
                     next_frontier.add(rel.from_id)
@@ -387,7 +430,11 @@ def expand_caller_tree(
 
 
 def expand_callee_tree(
-    graph: GraphLoader, seed_id: int, depth: int = 4, max_nodes: int = 30
+    graph: GraphLoader,
+    seed_id: int,
+    depth: int = 4,
+    max_nodes: int = 30,
+    deadline: Deadline = NO_DEADLINE,
 ) -> set[int]:
     """Focus on what this function calls - downstream focus.
 
@@ -401,6 +448,7 @@ def expand_callee_tree(
             break
         next_frontier: set[int] = set()
         for node_id in frontier:
+            deadline.check()
             for rel in graph.get_outgoing_relationships(node_id):
                 if rel.type == "CALLS" and rel.to_id not in visited:
                     next_frontier.add(rel.to_id)
@@ -417,22 +465,34 @@ def expand_callee_tree(
 
 
 def expand_file_centric(
-    graph: GraphLoader, seed_id: int, max_external: int = 5
+    graph: GraphLoader,
+    seed_id: int,
+    max_external: int = 5,
+    max_nodes: int = 30,
+    deadline: Deadline = NO_DEADLINE,
 ) -> set[int]:
-    """Get all functions in same file + external dependencies.
+    """Get functions in the same file (up to max_nodes) + external dependencies.
 
-    Non-deterministic: shuffles external calls for diversity.
+    Non-deterministic: samples definitions of large files and shuffles
+    external calls for diversity.
     """
     visited: set[int] = {seed_id}
 
     module = get_defining_module(graph, seed_id)
     if module:
-        for rel in graph.get_outgoing_relationships(module.node_id):
-            if rel.type in {"DEFINES", "DEFINES_METHOD"}:
-                visited.add(rel.to_id)
+        definitions = [
+            rel.to_id
+            for rel in graph.get_outgoing_relationships(module.node_id)
+            if rel.type in {"DEFINES", "DEFINES_METHOD"} and rel.to_id != seed_id
+        ]
+        room = max(max_nodes - max_external - 1, 0)
+        if len(definitions) > room:
+            definitions = random.sample(definitions, room)
+        visited.update(definitions)
 
     external_calls = []
     for node_id in list(visited):
+        deadline.check()
         for rel in graph.get_outgoing_relationships(node_id):
             if rel.type == "CALLS" and rel.to_id not in visited:
                 external_calls.append(rel.to_id)
@@ -617,8 +677,10 @@ def format_code_chunk(
             target = graph.get_node_by_id(r.to_id)
             if target:
                 call_names.append(target.properties.get("qualified_name", target.properties.get("name", "?")))
+                if len(call_names) == MAX_RELATED_NAMES:
+                    break
         if call_names:
-            lines.append(f"  <calls>{', '.join(call_names[:5])}</calls>")
+            lines.append(f"  <calls>{', '.join(call_names)}</calls>")
 
     if called_by:
         caller_names = []
@@ -626,8 +688,10 @@ def format_code_chunk(
             caller = graph.get_node_by_id(r.from_id)
             if caller:
                 caller_names.append(caller.properties.get("qualified_name", caller.properties.get("name", "?")))
+                if len(caller_names) == MAX_RELATED_NAMES:
+                    break
         if caller_names:
-            lines.append(f"  <called_by>{', '.join(caller_names[:5])}</called_by>")
+            lines.append(f"  <called_by>{', '.join(caller_names)}</called_by>")
 
     if inherits:
         parent_names = []
@@ -657,12 +721,25 @@ def format_code_chunk(
     return "\n".join(lines)
 
 
-def build_graph_context(graph: GraphLoader, node_ids: set[int]) -> str:
+def truncate_lines(text: str, max_chars: int) -> str:
+    """Cut text at a line boundary so it fits max_chars, noting the cut."""
+    if len(text) <= max_chars:
+        return text
+    cut = text.rfind("\n", 0, max_chars)
+    return text[: cut if cut > 0 else max_chars] + "\n... (truncated)"
+
+
+def build_graph_context(
+    graph: GraphLoader,
+    node_ids: set[int],
+    deadline: Deadline = NO_DEADLINE,
+) -> str:
     """Build a clean, scannable graph structure view."""
     lines = []
 
     nodes_by_file: dict[str, list[GraphNode]] = {}
     for node_id in node_ids:
+        deadline.check()
         node = graph.get_node_by_id(node_id)
         if node is None:
             continue
@@ -693,6 +770,7 @@ def build_graph_context(graph: GraphLoader, node_ids: set[int]) -> str:
 
     lines.append("\n## Call Graph")
     for node_id in sorted(node_ids):
+        deadline.check()
         node = graph.get_node_by_id(node_id)
         if node is None:
             continue
@@ -903,6 +981,7 @@ def build_source_context(
     node_ids: set[int],
     seed_id: int,
     max_chars: int,
+    deadline: Deadline = NO_DEADLINE,
 ) -> str:
     """Build source code chunks with priority ordering by distance from seed."""
     distances = compute_distances_from_seed(graph, seed_id, node_ids)
@@ -926,6 +1005,12 @@ def build_source_context(
         if node is None:
             continue
 
+        # A full budget fits nothing more, so skip reading the source
+        if total_chars >= max_chars:
+            skipped_nodes.append(node.properties.get("name", f"node_{node_id}"))
+            continue
+
+        deadline.check()
         result = extractor.extract(node_id)
         if result.error or not result.code_chunk:
             continue
@@ -954,18 +1039,27 @@ def build_context(
     node_ids: set[int],
     seed_id: int,
     max_tokens: int = 8000,
+    deadline: Deadline = NO_DEADLINE,
+    max_graph_chars: int = MAX_GRAPH_CONTEXT_CHARS,
 ) -> tuple[str, str]:
-    """Build both graph context and source context."""
+    """Build both graph context and source context.
+
+    Work stops with DeadlineExceeded once `deadline` passes; the graph part
+    is capped at max_graph_chars and the source part by the token budget.
+    """
     ascii_graph = build_ascii_graph(graph, seed_id, node_ids)
-    struct_graph = build_graph_context(graph, node_ids)
+    deadline.check()
+    struct_graph = build_graph_context(graph, node_ids, deadline)
 
-    graph_ctx = ascii_graph + "\n\n" + struct_graph
+    graph_ctx = truncate_lines(ascii_graph + "\n\n" + struct_graph, max_graph_chars)
 
     graph_tokens = len(graph_ctx) // CHARS_PER_TOKEN_ESTIMATE
     remaining_tokens = max_tokens - graph_tokens - 500
     max_source_chars = remaining_tokens * CHARS_PER_TOKEN_ESTIMATE
 
-    source_ctx = build_source_context(graph, extractor, node_ids, seed_id, max_source_chars)
+    source_ctx = build_source_context(
+        graph, extractor, node_ids, seed_id, max_source_chars, deadline
+    )
 
     return graph_ctx, source_ctx
 
@@ -1058,24 +1152,22 @@ OUTPUT FORMAT (respond with valid JSON only):
 }}"""
 
 
-def call_llm(prompt: str) -> str:
+@functools.cache
+def get_openai_client(base_url: str, api_key: str) -> OpenAI:
+    """One client per endpoint, so sequential calls reuse its connection pool."""
     from openai import OpenAI
 
-    base_url = os.getenv("QUESTION_GEN_BASE_URL")
-    api_key = os.getenv("QUESTION_GEN_API_KEY")
-    model = os.getenv("QUESTION_GEN_MODEL", "gpt-4o")
+    return OpenAI(base_url=base_url, api_key=api_key)
 
-    if not base_url or not api_key:
-        raise ValueError(
-            "QUESTION_GEN_BASE_URL and QUESTION_GEN_API_KEY environment variables required"
-        )
 
-    client = OpenAI(base_url=base_url, api_key=api_key)
+def call_llm(prompt: str) -> str:
+    config = LLMConfig.from_env()
+    client = get_openai_client(config.base_url, config.api_key)
 
     response = client.chat.completions.create(
-        model=model,
+        model=config.model,
         messages=[{"role": "user", "content": prompt}],
-        temperature=0.7,
+        temperature=config.temperature,
     )
 
     return response.choices[0].message.content or ""
@@ -1093,20 +1185,27 @@ def parse_llm_response(response: str) -> dict:
     return json.loads(response.strip())
 
 
-def generate_question(
+@dataclass
+class PreparedQuestion:
+    """A sampled seed and its context, ready to send to the LLM."""
+    seed_id: int
+    context_nodes: set[int]
+    prompt: str | None  # None when the context has no source code
+
+
+def prepare_question(
     graph: GraphLoader,
     extractor: NodeTextExtractor,
-    repo_name: str,
     max_hops: int = 2,
     max_nodes: int = 25,
     max_tokens: int = 8000,
     strategy: str = "bfs",
     exclude_ids: set[int] | None = None,
-) -> tuple[GeneratedQuestion | None, int | None]:
-    """Generate a question. Returns (question, seed_node_id) tuple."""
+) -> PreparedQuestion | None:
+    """Sample a seed and build its prompt. Returns None when no seed is left."""
     seed = sample_seed_node(graph, exclude_ids=exclude_ids)
     if seed is None:
-        return None, None
+        return None
 
     expand_fn = EXPANSION_STRATEGIES.get(strategy, expand_context)
     if strategy == "bfs":
@@ -1123,29 +1222,131 @@ def generate_question(
     graph_context, source_context = build_context(graph, extractor, context_nodes, seed.node_id, max_tokens)
 
     if not source_context.strip():
-        return None, seed.node_id
+        return PreparedQuestion(seed.node_id, context_nodes, None)
 
     prompt = META_PROMPT.format(graph_context=graph_context, source_context=source_context)
-    response = call_llm(prompt)
+    return PreparedQuestion(seed.node_id, context_nodes, prompt)
+
 
+def parse_question(
+    prepared: PreparedQuestion, response: str, repo_name: str
+) -> GeneratedQuestion | None:
     try:
         parsed = parse_llm_response(response)
     except json.JSONDecodeError:
         print(f"Failed to parse LLM response: {response[:200]}...")
-        return None, seed.node_id
+        return None
 
-    question = GeneratedQuestion(
+    return GeneratedQuestion(
         repo=repo_name,
         question=parsed.get("question") or "",
         difficulty=parsed.get("difficulty", "hard"),
         reasoning=parsed.get("reasoning", ""),
         expected_search_strategy=parsed.get("expected_search_strategy", ""),
-        seed_node=seed.node_id,
-        context_nodes=list(context_nodes),
+        seed_node=prepared.seed_id,
+        context_nodes=list(prepared.context_nodes),
         context_quality=parsed.get("context_quality", "unknown"),
         context_quality_reasoning=parsed.get("context_quality_reasoning", ""),
     )
-    return question, seed.node_id
+
+
+def generate_question(
+    graph: GraphLoader,
+    extractor: NodeTextExtractor,
+    repo_name: str,
+    max_hops: int = 2,
+    max_nodes: int = 25,
+    max_tokens: int = 8000,
+    strategy: str = "bfs",
+    exclude_ids: set[int] | None = None,
+) -> tuple[GeneratedQuestion | None, int | None]:
+    """Generate a question. Returns (question, seed_node_id) tuple."""
+    prepared = prepare_question(
+        graph, extractor, max_hops, max_nodes, max_tokens, strategy, exclude_ids
+    )
+    if prepared is None:
+        return None, None
+    if prepared.prompt is None:
+        return None, prepared.seed_id
+
+    response = call_llm(prepared.prompt)
+    return parse_question(prepared, response, repo_name), prepared.seed_id
+
+
+async def generate_questions_async(
+    graph: GraphLoader,
+    extractor: NodeTextExtractor,
+    repo_name: str,
+    config: LLMConfig,
+    num_questions: int = 10,
+    max_hops: int = 2,
+    max_nodes: int = 25,
+    max_tokens: int = 8000,
+    strategy: str = "bfs",
+    unique_seeds: bool = False,
+) -> tuple[list[GeneratedQuestion], int]:
+    """Build prompts in batches and send each batch to the LLM concurrently.
+
+    Returns (questions, used_seed_count). A batch never holds more prompts
+    than questions still missing, so the attempt budget is spent as before.
+    """
+    questions: list[GeneratedQuestion] = []
+    sent_prompts: set[str] = set()
+    used_seeds: set[int] = set()
+    attempts = 0
+    max_attempts = num_questions * 3
+    batch_limit = max(config.max_concurrency * 4, 1)
+    seeds_exhausted = False
+
+    async with AsyncLLMClient(config) as client:
+        while len(questions) < num_questions and attempts < max_attempts and not seeds_exhausted:
+            batch: list[PreparedQuestion] = []
+            wanted = min(num_questions - len(questions), batch_limit)
+            while len(batch) < wanted and attempts < max_attempts:
+                attempts += 1
+                exclude = used_seeds if unique_seeds else None
+                try:
+                    prepared = prepare_question(
+                        graph, extractor, max_hops, max_nodes, max_tokens,
+                        strategy=strategy, exclude_ids=exclude,
+                    )
+                except Exception as e:
+                    print(f"  Error: {e}")
+                    continue
+                if prepared is None:
+                    print("  No more unique seed candidates available")
+                    seeds_exhausted = True
+                    break
+                used_seeds.add(prepared.seed_id)
+                if prepared.prompt is None:
+                    continue
+                # Seeds are drawn with replacement; a cached reply to a repeated prompt is a duplicate question
+                if config.cache_dir is not None and prepared.prompt in sent_prompts:
+                    continue
+                sent_prompts.add(prepared.prompt)
+                batch.append(prepared)
+
+            if not batch:
+                continue
+            print(f"Sending {len(batch)} prompts ({len(questions)}/{num_questions} questions so far)...")
+            responses = await client.complete_many([p.prompt or "" for p in batch])
+
+            for prepared, response in zip(batch, responses, strict=True):
+                if isinstance(response, BaseException):
+                    print(f"  Error: {response}")
+                    continue
+                question = parse_question(prepared, response, repo_name)
+                if question and question.question and len(questions) < num_questions:
+                    questions.append(question)
+                    print(f"  Generated: {question.question[:80]}...")
+
+        stats = client.stats
+        print(
+            f"LLM: {stats.requests} requests, {stats.cache_hits} cache hits, "
+            f"{stats.retries} retries, {stats.failures} failures"
+        )
+
+    return questions, len(used_seeds)
 
 
 def generate_questions(
@@ -1158,51 +1359,32 @@ def generate_questions(
     strategy: str = "bfs",
     unique_seeds: bool = False,
     random_seed: int | None = None,
+    llm_config: LLMConfig | None = None,
 ) -> list[GeneratedQuestion]:
     if random_seed is not None:
         random.seed(random_seed)
         print(f"Using random seed: {random_seed}")
 
+    config = llm_config or LLMConfig.from_env()
+
     graph = GraphLoader(str(graph_path))
     graph.load()
 
-    extractor = NodeTextExtractor(graph_path, repo_path)
+    extractor = NodeTextExtractor(graph_path, repo_path, graph_loader=graph)
     repo_name = repo_path.name
 
     all_candidates = get_all_candidate_seeds(graph)
     print(f"Found {len(all_candidates)} candidate seed nodes")
 
-    questions: list[GeneratedQuestion] = []
-    used_seeds: set[int] = set()
-    attempts = 0
-    max_attempts = num_questions * 3
-
-    while len(questions) < num_questions and attempts < max_attempts:
-        attempts += 1
-        print(f"Generating question {len(questions) + 1}/{num_questions} (attempt {attempts})...")
-
-        exclude = used_seeds if unique_seeds else None
-
-        try:
-            question, seed_id = generate_question(
-                graph, extractor, repo_name, max_hops, max_nodes, max_tokens,
-                strategy=strategy, exclude_ids=exclude,
-            )
-
-            if seed_id is not None:
-                used_seeds.add(seed_id)
-
-            if question and question.question:
-                questions.append(question)
-                print(f"  Generated: {question.question[:80]}...")
-            elif seed_id is None:
-                print("  No more unique seed candidates available")
-                break
-        except Exception as e:
-            print(f"  Error: {e}")
+    questions, used_seed_count = asyncio.run(
+        generate_questions_async(
+            graph, extractor, repo_name, config, num_questions,
+            max_hops, max_nodes, max_tokens, strategy, unique_seeds,
+        )
+    )
 
     if unique_seeds:
-        print(f"Used {len(used_seeds)} unique seeds")
+        print(f"Used {used_seed_count} unique seeds")
 
     return questions
 
@@ -1265,6 +1447,30 @@ def main() -> None:
         default=None,
         help="Output JSONL file (default: stdout)",
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=16,
+        help="Maximum concurrent LLM requests (default: 16)",
+    )
+    parser.add_argument(
+        "--requests-per-minute",
+        type=int,
+        default=500,
+        help="LLM request rate limit, 0 for none (default: 500)",
+    )
+    parser.add_argument(
+        "--tokens-per-minute",
+        type=int,
+        default=200_000,
+        help="LLM token rate limit, 0 for none (default: 200000)",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=None,
+        help="Directory caching LLM responses by prompt hash (default: no caching)",
+    )
 
     args = parser.parse_args()
 
@@ -1286,6 +1492,13 @@ def main() -> None:
         strategy=args.strategy,
         unique_seeds=args.unique_seeds,
         random_seed=args.random_seed,
+        llm_config=replace(
+            LLMConfig.from_env(),
+            max_concurrency=args.concurrency,
+            requests_per_minute=args.requests_per_minute,
+            tokens_per_minute=args.tokens_per_minute,
+            cache_dir=args.cache_dir,
+        ),
     )
 
     output_lines = []
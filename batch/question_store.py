@@ -0,0 +1,218 @@
+"""
+Indexed Output Store for Generated Questions
+
+A SQLite database holding the question corpus for a batch run, partitioned
+by repo. Each repo's questions are inserted in one transaction together with
+its completion record, so a repo is either fully stored or not at all:
+- Resume checks a repo's completion with a primary-key lookup.
+- Duplicates (same seed, strategy and context nodes within a repo) are
+  rejected by a unique index on the context hash.
+- Summary and per-strategy/per-language stats are SQL aggregates, not
+  rescans of JSONL files.
+
+The combined JSONL file is exported from the store at the end of a run.
+
+Usage:
+    with QuestionStore(questions_dir / "questions.db") as store:
+        if not store.is_complete("owner/repo"):
+            store.add_repo(result)
+        store.export_jsonl(questions_dir / "all_questions.jsonl")
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import time
+from pathlib import Path
+from types import TracebackType
+
+STORE_FILENAME = "questions.db"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS repos (
+    repo TEXT PRIMARY KEY,
+    graph TEXT,
+    skipped INTEGER NOT NULL,
+    sparse_mode INTEGER NOT NULL,
+    generated INTEGER NOT NULL,
+    stored INTEGER NOT NULL,
+    duplicates INTEGER NOT NULL,
+    reason TEXT,
+    result_json TEXT NOT NULL,
+    completed_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS questions (
+    id INTEGER PRIMARY KEY,
+    repo TEXT NOT NULL,
+    context_hash TEXT NOT NULL,
+    prompt_id TEXT NOT NULL,
+    primary_language TEXT,
+    expansion_strategy TEXT,
+    record_json TEXT NOT NULL,
+    UNIQUE (repo, context_hash)
+);
+"""
+
+
+def context_hash(record: dict) -> str:
+    """Identity of a question within its repo: seed, strategy and context nodes."""
+    key = [
+        record.get("seed_node_id"),
+        record.get("expansion_strategy"),
+        record.get("context_node_ids"),
+    ]
+    return hashlib.sha1(json.dumps(key).encode()).hexdigest()
+
+
+class QuestionStore:
+    """SQLite-backed, per-repo partitioned question corpus.
+
+    Writes are made from a single process (the batch coordinator); WAL mode
+    lets other processes read the store while a run is in progress.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+
+    def __enter__(self) -> QuestionStore:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def clear(self) -> None:
+        """Drop every stored repo and question, for a fresh run."""
+        with self._conn:
+            self._conn.execute("DELETE FROM questions")
+            self._conn.execute("DELETE FROM repos")
+
+    def is_complete(self, repo: str) -> bool:
+        """True if the repo's questions were stored by an earlier run."""
+        row = self._conn.execute(
+            "SELECT 1 FROM repos WHERE repo = ? AND skipped = 0", (repo,)
+        ).fetchone()
+        return row is not None
+
+    def completed_repos(self) -> set[str]:
+        return {
+            row[0]
+            for row in self._conn.execute("SELECT repo FROM repos WHERE skipped = 0")
+        }
+
+    def add_repo(self, result: dict) -> int:
+        """Store a repo's result and the questions in its output file. Returns questions added.
+
+        Replaces anything stored for the repo before, so re-running a repo
+        never leaves stale questions behind.
+        """
+        repo = result["repo"]
+        records: list[dict] = []
+        output_file = result.get("output")
+        if not result.get("skipped") and output_file and Path(output_file).exists():
+            with open(output_file) as f:
+                records = [json.loads(line) for line in f if line.strip()]
+
+        with self._conn:
+            self._conn.execute("DELETE FROM questions WHERE repo = ?", (repo,))
+            added = 0
+            for record in records:
+                cursor = self._conn.execute(
+                    "INSERT OR IGNORE INTO questions"
+                    " (repo, context_hash, prompt_id, primary_language, expansion_strategy, record_json)"
+                    " VALUES (?, ?, ?, ?, ?, ?)",
+                    (
+                        repo,
+                        context_hash(record),
+                        record.get("prompt_id", ""),
+                        record.get("primary_language"),
+                        record.get("expansion_strategy"),
+                        json.dumps(record, ensure_ascii=False),
+                    ),
+                )
+                added += cursor.rowcount
+            self._conn.execute(
+                "INSERT OR REPLACE INTO repos"
+                " (repo, graph, skipped, sparse_mode, generated, stored, duplicates, reason, result_json, completed_at)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    repo,
+                    result.get("graph"),
+                    bool(result.get("skipped")),
+                    bool(result.get("sparse_mode")),
+                    result.get("generated", 0),
+                    added,
+                    len(records) - added,
+                    result.get("reason"),
+                    json.dumps(result, ensure_ascii=False),
+                    time.time(),
+                ),
+            )
+        return added
+
+    def results(self) -> list[dict]:
+        """Every stored repo result, in completion order."""
+        rows = self._conn.execute("SELECT result_json FROM repos ORDER BY completed_at")
+        return [json.loads(row[0]) for row in rows]
+
+    def question_count(self, repo: str | None = None) -> int:
+        if repo is None:
+            return self._conn.execute("SELECT COUNT(*) FROM questions").fetchone()[0]
+        return self._conn.execute(
+            "SELECT COUNT(*) FROM questions WHERE repo = ?", (repo,)
+        ).fetchone()[0]
+
+    def summary(self) -> dict:
+        """Aggregate run stats, computed by the database."""
+        total, successful, sparse, duplicates = self._conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(1 - skipped), 0), COALESCE(SUM(sparse_mode * (1 - skipped)), 0),"
+            " COALESCE(SUM(duplicates), 0) FROM repos"
+        ).fetchone()
+        return {
+            "total_repos": total,
+            "successful": successful,
+            "sparse_mode_used": sparse,
+            "skipped": total - successful,
+            "total_questions": self.question_count(),
+            "duplicates_dropped": duplicates,
+            "by_strategy": self._group_count("expansion_strategy"),
+            "by_language": self._group_count("primary_language"),
+            "skip_reasons": dict(
+                self._conn.execute(
+                    "SELECT reason, COUNT(*) FROM repos WHERE skipped = 1 GROUP BY reason ORDER BY COUNT(*) DESC"
+                ).fetchall()
+            ),
+        }
+
+    def _group_count(self, column: str) -> dict[str, int]:
+        rows = self._conn.execute(
+            f"SELECT {column}, COUNT(*) FROM questions GROUP BY {column} ORDER BY COUNT(*) DESC"
+        )
+        return {str(key): count for key, count in rows}
+
+    def export_jsonl(self, path: Path) -> int:
+        """Write every stored question to a JSONL file, repo by repo. Returns count written."""
+        count = 0
+        tmp = path.with_suffix(".jsonl.tmp")
+        with open(tmp, "w") as f:
+            for (record_json,) in self._conn.execute(
+                "SELECT record_json FROM questions ORDER BY id"
+            ):
+                f.write(record_json + "\n")
+                count += 1
+        tmp.replace(path)
+        return count
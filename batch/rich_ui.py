@@ -49,9 +49,11 @@ class BatchStats:
     process_failed: int = 0
     total_nodes: int = 0
     total_relationships: int = 0
+    question_repos: int = 0
+    questions_generated: int = 0
     start_time: float = field(default_factory=time.time)
     current_repo: str = ""
-    phase: str = "initializing"  # "cloning" | "processing" | "uploading" | "done"
+    phase: str = "initializing"  # "cloning" | "processing" | "streaming" | "uploading" | "done"
     in_progress_repos: list[str] = field(default_factory=list)  # Currently processing
 
     @property
@@ -110,10 +112,12 @@ class BatchProgressUI:
         total_repos: int,
         skip_clone: bool = False,
         max_activity_log: int = 5,
+        track_questions: bool = False,
     ):
         self.console = Console()
         self.total_repos = total_repos
         self.skip_clone = skip_clone
+        self.track_questions = track_questions
         self.max_activity_log = max_activity_log
 
         self.stats = BatchStats(total_repos=total_repos)
@@ -135,6 +139,7 @@ class BatchProgressUI:
         # Task IDs
         self._clone_task: TaskID | None = None
         self._process_task: TaskID | None = None
+        self._questions_task: TaskID | None = None
 
     def start(self) -> None:
         """Initialize progress bars."""
@@ -147,6 +152,11 @@ class BatchProgressUI:
             "Processing",
             total=self.total_repos,
         )
+        if self.track_questions:
+            self._questions_task = self.progress.add_task(
+                "Questions",
+                total=self.total_repos,
+            )
         self.stats.phase = "cloning" if not self.skip_clone else "processing"
 
     def live_context(self) -> Live:
@@ -236,6 +246,29 @@ class BatchProgressUI:
 
         self._refresh()
 
+    def update_question_progress(self, result: dict) -> None:
+        """Update after question generation for one repo completes."""
+        self.stats.question_repos += 1
+        generated = result.get("generated", 0)
+        self.stats.questions_generated += generated
+
+        repo_name = result.get("repo", "")
+        self.stats.current_repo = repo_name
+
+        skipped = result.get("skipped", False)
+        self.activity_log.append(ActivityLogEntry(
+            timestamp=time.time(),
+            repo_name=repo_name,
+            success=not skipped,
+            message=result.get("reason", "Skipped") if skipped else f"{generated:,} questions",
+        ))
+        self._trim_activity_log()
+
+        if self._questions_task is not None:
+            self.progress.update(self._questions_task, completed=self.stats.question_repos)
+
+        self._refresh()
+
     def set_phase(self, phase: str) -> None:
         """Set the current phase."""
         self.stats.phase = phase
@@ -290,6 +323,7 @@ class BatchProgressUI:
             "initializing": "dim",
             "cloning": "yellow",
             "processing": "cyan",
+            "streaming": "cyan",
             "uploading": "magenta",
             "done": "green",
         }
@@ -431,6 +465,8 @@ class BatchProgressUI:
         table.add_row("Failed:", f"[red]{self.stats.process_failed}[/red]")
         table.add_row("Total Nodes:", f"{self.stats.total_nodes:,}")
         table.add_row("Total Relationships:", f"{self.stats.total_relationships:,}")
+        if self.track_questions:
+            table.add_row("Questions:", f"{self.stats.questions_generated:,}")
         table.add_row("Total Time:", self._format_duration(self.stats.elapsed_seconds))
         table.add_row("Avg Time/Repo:", self._format_duration(
             self.stats.elapsed_seconds / max(1, self.stats.processed)
@@ -0,0 +1,79 @@
+"""
+Weighted Seed Sampler
+
+Draws candidate seeds in proportion to their quality score and lets a seed be
+withdrawn once it has been used enough. Weights live in a Fenwick (binary
+indexed) tree, so sampling and withdrawal are O(log n) instead of rebuilding a
+filtered candidate list on every draw.
+
+Usage:
+    sampler = WeightedSampler([score for _, score in candidates])
+    index = sampler.sample()
+    sampler.remove(index)
+"""
+from __future__ import annotations
+
+import random
+
+
+class WeightedSampler:
+    """Sample indices with probability proportional to integer weights."""
+
+    def __init__(self, weights: list[int]):
+        self._weights = [max(w, 0) for w in weights]
+        self._tree = [0] * (len(weights) + 1)
+        # Build the tree in O(n): push each node's sum to its parent once
+        for i, weight in enumerate(self._weights, start=1):
+            self._tree[i] += weight
+            parent = i + (i & -i)
+            if parent < len(self._tree):
+                self._tree[parent] += self._tree[i]
+        self._top_bit = 1 << (len(weights).bit_length() - 1) if weights else 0
+
+    def __len__(self) -> int:
+        return len(self._weights)
+
+    @property
+    def total(self) -> int:
+        """Sum of the weights still in play."""
+        return self._prefix_sum(len(self._weights))
+
+    def weight(self, index: int) -> int:
+        return self._weights[index]
+
+    def _prefix_sum(self, count: int) -> int:
+        total = 0
+        while count > 0:
+            total += self._tree[count]
+            count -= count & -count
+        return total
+
+    def _add(self, index: int, delta: int) -> None:
+        i = index + 1
+        while i < len(self._tree):
+            self._tree[i] += delta
+            i += i & -i
+
+    def remove(self, index: int) -> None:
+        """Withdraw an index so it is never sampled again."""
+        if self._weights[index]:
+            self._add(index, -self._weights[index])
+            self._weights[index] = 0
+
+    def sample(self, rng: random.Random | None = None) -> int:
+        """Draw an index; raises ValueError when every weight is zero."""
+        total = self.total
+        if total <= 0:
+            raise ValueError("No weight left to sample from")
+        target = (rng or random).randrange(total)
+
+        # Descend the tree to the first index whose prefix sum exceeds target
+        position = 0
+        step = self._top_bit
+        while step:
+            nxt = position + step
+            if nxt < len(self._tree) and self._tree[nxt] <= target:
+                position = nxt
+                target -= self._tree[nxt]
+            step >>= 1
+        return position
@@ -8,6 +8,7 @@ from __future__ import annotations
 import json
 import sys
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -17,8 +18,16 @@ PROJECT_ROOT = BATCH_DIR.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 sys.path.insert(0, str(BATCH_DIR))
 
-from batch_processor import process_single_repo
-from batch_question_generator import get_repo_path_for_graph
+from batch_processor import (
+    ProcessResult,
+    create_worker_pool,
+    overhead_per_repo,
+    process_single_repo,
+)
+from batch_question_generator import (
+    generate_questions_for_repo,
+    get_repo_path_for_graph,
+)
 
 
 class TestNameCollisionPrevention:
@@ -160,6 +169,54 @@ class TestSingleRepoProcessing:
         assert "metadata" in data
         assert data["metadata"]["total_nodes"] > 0
 
+    @pytest.mark.e2e
+    def test_result_counts_match_written_graph(
+        self, temp_workspace: Path, single_repo: Path
+    ) -> None:
+        """Counts reported by the ingestor agree with the graph on disk."""
+        from codebase_rag.graph_loader import load_graph
+
+        graphs_dir = temp_workspace / "graphs"
+
+        result = process_single_repo((single_repo, graphs_dir))
+        assert result.success
+
+        summary = load_graph(str(graphs_dir / "testowner__myrepo.json")).summary()
+        assert result.node_count == summary["total_nodes"]
+        assert result.relationship_count == summary["total_relationships"]
+        assert result.node_labels == summary["node_labels"]
+        assert result.relationship_types == summary["relationship_types"]
+
+
+class TestQuestionGraphSharing:
+    """Question generation loads each graph once per repo."""
+
+    @pytest.mark.e2e
+    @pytest.mark.parametrize("min_questions", [1, 1000])
+    def test_graph_is_loaded_once(
+        self, temp_workspace: Path, single_repo: Path, min_questions: int
+    ) -> None:
+        """Counting, sparse fallback and generation share one loaded graph."""
+        from codebase_rag.graph_loader import GraphLoader
+
+        graphs_dir = temp_workspace / "graphs"
+        assert process_single_repo((single_repo, graphs_dir)).success
+        load = GraphLoader.load
+
+        with patch.object(GraphLoader, "load", autospec=True, side_effect=load) as spy:
+            summary = generate_questions_for_repo(
+                graphs_dir / "testowner__myrepo.json",
+                single_repo,
+                temp_workspace / "questions" / "out.jsonl",
+                target_questions=2,
+                min_questions=min_questions,
+                quiet=True,
+                debug=True,
+            )
+
+        assert spy.call_count == 1
+        assert summary["skipped"] == (min_questions > 1)
+
 
 class TestBackwardsCompatibility:
     """Tests for backwards compatibility with old-style graph files."""
@@ -267,3 +324,50 @@ class TestEdgeCases:
 
         matched = get_repo_path_for_graph(graph, clones_dir)
         assert matched is None, "Should not match directory without .git"
+
+
+class TestWarmWorkers:
+    """Tests that indexing workers load parsers once and reuse them."""
+
+    @pytest.mark.e2e
+    def test_setup_is_charged_once_per_worker(
+        self, temp_workspace: Path, mock_repos: dict[str, Path]
+    ) -> None:
+        """A single warm worker pays setup on its first repo only."""
+        graphs_dir = temp_workspace / "graphs"
+
+        with create_worker_pool(1, max_tasks_per_child=None) as pool:
+            results = [
+                pool.submit(process_single_repo, (repo, graphs_dir)).result()
+                for repo in mock_repos.values()
+            ]
+
+        assert all(r.success for r in results), [r.error for r in results]
+        assert results[0].setup_seconds > 0
+        assert results[1].setup_seconds == 0
+
+    @pytest.mark.e2e
+    def test_recycled_workers_pay_setup_again(
+        self, temp_workspace: Path, mock_repos: dict[str, Path]
+    ) -> None:
+        """With max_tasks_per_child=1 every repo runs in a fresh worker."""
+        graphs_dir = temp_workspace / "graphs"
+
+        with create_worker_pool(1, max_tasks_per_child=1) as pool:
+            results = [
+                pool.submit(process_single_repo, (repo, graphs_dir)).result()
+                for repo in mock_repos.values()
+            ]
+
+        assert all(r.success for r in results), [r.error for r in results]
+        assert all(r.setup_seconds > 0 for r in results)
+
+    def test_overhead_is_amortized_over_all_repos(self) -> None:
+        """overhead_per_repo spreads worker setup across every result."""
+        results = [
+            ProcessResult(str(i), None, True, None, 1.0, 0, 0, setup_seconds=s)
+            for i, s in enumerate([3.0, 0.0, 0.0])
+        ]
+
+        assert overhead_per_repo(results) == pytest.approx(1.0)
+        assert overhead_per_repo([]) == 0.0
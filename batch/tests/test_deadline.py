@@ -0,0 +1,187 @@
+"""Tests for cooperative prompt deadlines and context budgets.
+
+Uses a small synthetic graph with one large module and a hub function, the
+shape that used to make a single seed run for tens of seconds.
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+BATCH_DIR = Path(__file__).parent.parent
+PROJECT_ROOT = BATCH_DIR.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+sys.path.insert(0, str(BATCH_DIR))
+
+from deadline import NO_DEADLINE, Deadline, DeadlineExceeded
+from generate_diverse_questions import expand_with_strategy
+from question_generator import (
+    EXPANSION_STRATEGIES,
+    build_context,
+    cap_nodes,
+    expand_file_centric,
+    truncate_lines,
+)
+
+from codebase_rag.graph_loader import GraphLoader, load_graph
+from codebase_rag.node_text_extractor import NodeTextExtractor
+
+FUNCTION_COUNT = 60
+HUB_ID = FUNCTION_COUNT + 1
+
+
+@pytest.fixture
+def hub_repo(tmp_path: Path) -> tuple[Path, Path]:
+    """Module 0 defines functions 1..N; every function calls the hub."""
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    source = [f"def f{i}():\n    return hub()\n" for i in range(1, FUNCTION_COUNT + 1)]
+    (repo / "mod.py").write_text("\n".join(source) + "\ndef hub():\n    return 1\n")
+
+    nodes = [
+        {
+            "node_id": 0,
+            "labels": ["Module"],
+            "properties": {"name": "mod", "path": "mod.py"},
+        }
+    ]
+    rels = []
+    for i in range(1, HUB_ID + 1):
+        name = "hub" if i == HUB_ID else f"f{i}"
+        start = 3 * (i - 1) + 1
+        nodes.append(
+            {
+                "node_id": i,
+                "labels": ["Function"],
+                "properties": {
+                    "name": name,
+                    "qualified_name": f"mod.{name}",
+                    "path": "mod.py",
+                    "start_line": start,
+                    "end_line": start + 1,
+                },
+            }
+        )
+        rels.append({"from_id": 0, "to_id": i, "type": "DEFINES", "properties": {}})
+        if i != HUB_ID:
+            rels.append(
+                {"from_id": i, "to_id": HUB_ID, "type": "CALLS", "properties": {}}
+            )
+
+    graph_file = tmp_path / "graph.json"
+    graph_file.write_text(
+        json.dumps({"nodes": nodes, "relationships": rels, "metadata": {}})
+    )
+    return graph_file, repo
+
+
+@pytest.fixture
+def hub_graph(hub_repo: tuple[Path, Path]) -> GraphLoader:
+    return load_graph(str(hub_repo[0]))
+
+
+class TestDeadline:
+    """Deadlines expire on the monotonic clock and only when asked."""
+
+    def test_no_deadline_never_expires(self) -> None:
+        assert Deadline.after(0) is NO_DEADLINE
+        assert NO_DEADLINE.remaining() == float("inf")
+        NO_DEADLINE.check()
+
+    def test_check_raises_once_passed(self) -> None:
+        assert not Deadline.after(60).expired()
+        expired = Deadline.after(1e-9)
+
+        assert expired.expired()
+        with pytest.raises(DeadlineExceeded):
+            expired.check()
+
+    def test_expired_deadline_stops_expansion_and_context(
+        self, hub_repo: tuple[Path, Path], hub_graph: GraphLoader
+    ) -> None:
+        expired = Deadline(0.0)
+        extractor = NodeTextExtractor(
+            str(hub_repo[0]), str(hub_repo[1]), graph_loader=hub_graph
+        )
+
+        with pytest.raises(DeadlineExceeded):
+            expand_with_strategy(hub_graph, HUB_ID, "callers", deadline=expired)
+        with pytest.raises(DeadlineExceeded):
+            build_context(
+                hub_graph, extractor, {1, 2, HUB_ID}, HUB_ID, deadline=expired
+            )
+
+    def test_generation_works_off_the_main_thread(
+        self, hub_repo: tuple[Path, Path], hub_graph: GraphLoader
+    ) -> None:
+        """signal.alarm only works on the main thread; deadlines work anywhere."""
+        extractor = NodeTextExtractor(
+            str(hub_repo[0]), str(hub_repo[1]), graph_loader=hub_graph
+        )
+        results: list[tuple[str, str]] = []
+
+        def work() -> None:
+            deadline = Deadline.after(30)
+            nodes = expand_with_strategy(hub_graph, 1, "bfs", deadline=deadline)
+            results.append(
+                build_context(hub_graph, extractor, nodes, 1, deadline=deadline)
+            )
+
+        thread = threading.Thread(target=work)
+        thread.start()
+        thread.join()
+
+        assert len(results) == 1
+        assert "def f1" in results[0][1]
+
+
+class TestContextBudgets:
+    """Every strategy stays within its node budget and the graph text is capped."""
+
+    def test_cap_nodes_keeps_the_seed(self) -> None:
+        capped = cap_nodes(set(range(100)), 42, 10)
+
+        assert len(capped) == 10 and 42 in capped
+        assert cap_nodes({1, 2}, 1, 10) == {1, 2}
+
+    def test_file_centric_samples_large_modules(self, hub_graph: GraphLoader) -> None:
+        nodes = expand_file_centric(hub_graph, 1, max_external=5, max_nodes=12)
+
+        assert 1 in nodes
+        assert len(nodes) <= 12
+
+    @pytest.mark.parametrize("strategy", EXPANSION_STRATEGIES)
+    def test_strategies_respect_max_nodes(
+        self, hub_graph: GraphLoader, strategy: str
+    ) -> None:
+        for seed in (1, HUB_ID):
+            nodes = expand_with_strategy(hub_graph, seed, strategy, max_nodes=8)
+            assert seed in nodes and len(nodes) <= 8
+
+    def test_truncate_lines_cuts_at_a_line_boundary(self) -> None:
+        text = "\n".join(f"line {i}" for i in range(100))
+
+        cut = truncate_lines(text, 50)
+
+        assert cut.endswith("... (truncated)")
+        assert all(line.startswith("line ") for line in cut.splitlines()[:-1])
+        assert truncate_lines("short", 50) == "short"
+
+    def test_graph_context_is_capped(
+        self, hub_repo: tuple[Path, Path], hub_graph: GraphLoader
+    ) -> None:
+        extractor = NodeTextExtractor(
+            str(hub_repo[0]), str(hub_repo[1]), graph_loader=hub_graph
+        )
+        node_ids = set(range(1, HUB_ID + 1))
+
+        graph_ctx, _ = build_context(
+            hub_graph, extractor, node_ids, HUB_ID, max_graph_chars=500
+        )
+
+        assert len(graph_ctx) <= 500 + len("\n... (truncated)")
@@ -0,0 +1,215 @@
+"""Tests for parallel, partial and resumable cloning.
+
+Real clones run against bare repos served over file://, which supports the
+same partial-clone protocol as GitHub once uploadpack.allowFilter is set.
+Concurrency tests swap `git` for a fake that records how many clones overlap.
+"""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+BATCH_DIR = Path(__file__).parent.parent
+PROJECT_ROOT = BATCH_DIR.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+sys.path.insert(0, str(BATCH_DIR))
+
+from github_cloner import CloneState, GitHubCloner, sparse_checkout_patterns
+
+FILES = {
+    "src/app.py": "def main():\n    return 1\n",
+    "web/index.ts": "export const x = 1;\n",
+    "package.json": "{}\n",
+    "Gemfile": "source 'https://rubygems.org'\n",
+    "assets/logo.png": "not really a png\n",
+    "data/fixtures.csv": "a,b\n1,2\n",
+}
+
+
+def git(*args: str, cwd: Path | None = None) -> None:
+    subprocess.run(["git", *args], cwd=cwd, check=True, capture_output=True)
+
+
+def make_source_repo(root: Path, owner: str, name: str) -> str:
+    """Create a bare repo holding FILES and return its file:// URL."""
+    work = root / "work" / owner / name
+    for rel, text in FILES.items():
+        (work / rel).parent.mkdir(parents=True, exist_ok=True)
+        (work / rel).write_text(text)
+    git("init", "-q", "-b", "main", str(work))
+    git("add", ".", cwd=work)
+    git(
+        "-c",
+        "user.name=t",
+        "-c",
+        "user.email=t@t",
+        "commit",
+        "-q",
+        "-m",
+        "init",
+        cwd=work,
+    )
+    bare = root / "remote" / owner / f"{name}.git"
+    git("clone", "-q", "--bare", str(work), str(bare))
+    git("config", "uploadpack.allowFilter", "true", cwd=bare)
+    git("config", "uploadpack.allowAnySHA1InWant", "true", cwd=bare)
+    return bare.as_uri()
+
+
+def checked_out(path: Path) -> set[str]:
+    return {
+        str(p.relative_to(path))
+        for p in path.rglob("*")
+        if p.is_file() and ".git" not in p.parts
+    }
+
+
+@pytest.fixture
+def source_urls(tmp_path: Path) -> list[str]:
+    return [make_source_repo(tmp_path, "owner", f"repo{i}") for i in range(4)]
+
+
+class TestClone:
+    """Real clones from local bare repos."""
+
+    def test_parallel_clones_return_in_input_order(
+        self, tmp_path: Path, source_urls: list[str]
+    ) -> None:
+        cloner = GitHubCloner(clone_dir=tmp_path / "clones")
+        seen_threads: set[int] = set()
+
+        results = cloner.clone_repos(
+            source_urls,
+            on_complete=lambda r: seen_threads.add(threading.get_ident()),
+            workers=4,
+        )
+
+        assert [r.github_url for r in results] == source_urls
+        assert all(r.success for r in results)
+        assert checked_out(results[0].local_path) == set(FILES)
+        assert seen_threads == {threading.get_ident()}
+
+    def test_sparse_clone_checks_out_only_indexed_files(
+        self, tmp_path: Path, source_urls: list[str]
+    ) -> None:
+        cloner = GitHubCloner(clone_dir=tmp_path / "clones", sparse=True)
+
+        result = cloner.clone_repo(source_urls[0])
+
+        assert result.success
+        assert checked_out(result.local_path) == {
+            "src/app.py",
+            "web/index.ts",
+            "package.json",
+            "Gemfile",
+        }
+
+    def test_manifest_patterns_ignore_case(self) -> None:
+        patterns = sparse_checkout_patterns()
+
+        assert "*.py" in patterns
+        assert "[gG][eE][mM][fF][iI][lL][eE]" in patterns
+
+    def test_reference_repo_is_borrowed_through_alternates(
+        self, tmp_path: Path, source_urls: list[str]
+    ) -> None:
+        reference = Path(source_urls[0].removeprefix("file://"))
+        cloner = GitHubCloner(clone_dir=tmp_path / "clones", reference=reference)
+
+        result = cloner.clone_repo(source_urls[0])
+
+        alternates = result.local_path / ".git" / "objects" / "info" / "alternates"
+        assert result.success
+        assert str(reference / "objects") in alternates.read_text()
+
+    def test_missing_reference_is_ignored(
+        self, tmp_path: Path, source_urls: list[str]
+    ) -> None:
+        cloner = GitHubCloner(
+            clone_dir=tmp_path / "clones", reference=tmp_path / "no-such-mirror"
+        )
+
+        assert cloner.clone_repo(source_urls[0]).success
+
+
+def slow_git(cmd: list[str], **kwargs: object) -> subprocess.CompletedProcess:
+    """Stands in for `git clone`, tracking how many clones overlap per host."""
+    with slow_git.lock:
+        slow_git.in_flight += 1
+        slow_git.max_in_flight = max(slow_git.max_in_flight, slow_git.in_flight)
+    time.sleep(0.05)
+    (Path(cmd[-1]) / ".git").mkdir(parents=True)
+    with slow_git.lock:
+        slow_git.in_flight -= 1
+    return subprocess.CompletedProcess(cmd, 0, "", "")
+
+
+@pytest.fixture
+def fake_git():
+    slow_git.lock = threading.Lock()
+    slow_git.in_flight = 0
+    slow_git.max_in_flight = 0
+    with patch("github_cloner.subprocess.run", side_effect=slow_git):
+        yield slow_git
+
+
+def github_urls(n: int) -> list[str]:
+    return [f"https://github.com/owner/repo{i}" for i in range(n)]
+
+
+class TestConcurrencyAndState:
+    """Per-host limits, batched state saves and resume."""
+
+    def test_per_host_limit_caps_overlapping_clones(
+        self, tmp_path: Path, fake_git
+    ) -> None:
+        cloner = GitHubCloner(clone_dir=tmp_path / "clones", max_per_host=2)
+
+        results = cloner.clone_repos(github_urls(8), workers=8)
+
+        assert all(r.success for r in results)
+        assert fake_git.max_in_flight == 2
+
+    def test_state_saves_are_batched_and_flushed(
+        self, tmp_path: Path, fake_git
+    ) -> None:
+        cloner = GitHubCloner(clone_dir=tmp_path / "clones", state_save_interval=60)
+
+        with patch.object(
+            GitHubCloner,
+            "save_state",
+            autospec=True,
+            side_effect=GitHubCloner.save_state,
+        ) as save:
+            cloner.clone_repos(github_urls(6), workers=3)
+
+        saved = json.loads(cloner.state_file.read_text())
+        assert save.call_count == 2  # the first change, then the final flush
+        assert sorted(saved["completed"]) == sorted(github_urls(6))
+        assert saved["in_progress"] == []
+
+    def test_resume_skips_completed_clones(self, tmp_path: Path, fake_git) -> None:
+        GitHubCloner(clone_dir=tmp_path / "clones").clone_repos(github_urls(3))
+
+        resumed = GitHubCloner(clone_dir=tmp_path / "clones")
+        resumed.load_state()
+        with patch("github_cloner.subprocess.run", side_effect=slow_git) as run:
+            results = resumed.clone_repos(github_urls(4), workers=2)
+
+        assert [r.github_url for r in results] == github_urls(4)
+        assert [r.duration_seconds == 0 for r in results] == [True, True, True, False]
+        assert run.call_count == 1
+
+    def test_old_single_url_in_progress_still_loads(self) -> None:
+        state = CloneState.from_dict({"in_progress": "https://github.com/a/b"})
+
+        assert state.in_progress == ["https://github.com/a/b"]
+        assert CloneState.from_dict({"in_progress": None}).in_progress == []
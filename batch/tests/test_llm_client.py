@@ -0,0 +1,288 @@
+"""Tests for the async, rate-limited LLM client.
+
+Requests go to a stub OpenAI-compatible HTTP server on localhost, which can be
+told to fail, to slow down, and to report which connections it saw.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import sys
+import threading
+import time
+from collections.abc import Generator
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+BATCH_DIR = Path(__file__).parent.parent
+PROJECT_ROOT = BATCH_DIR.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+sys.path.insert(0, str(BATCH_DIR))
+
+from batch_processor import process_single_repo
+from llm_client import AsyncLLMClient, LLMConfig, TokenBucket, backoff_delay
+from question_generator import generate_questions
+
+QUESTION = {
+    "context_quality": "good",
+    "context_quality_reasoning": "enough code",
+    "question": "Which function ends up handling the parsed value?",
+    "difficulty": "hard",
+    "reasoning": "crosses files",
+    "expected_search_strategy": "grep then read",
+}
+
+
+@dataclass
+class StubState:
+    """What the stub server should do next, and what it has seen."""
+
+    failures: list[tuple[int, dict[str, str]]] = field(default_factory=list)
+    delay: float = 0.0
+    prompts: list[str] = field(default_factory=list)
+    client_ports: set[int] = field(default_factory=set)
+    in_flight: int = 0
+    max_in_flight: int = 0
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, so connection reuse is observable
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+    def do_POST(self) -> None:
+        state: StubState = self.server.state  # type: ignore[attr-defined]
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        prompt = body["messages"][0]["content"]
+        with state.lock:
+            state.prompts.append(prompt)
+            state.client_ports.add(self.client_address[1])
+            state.in_flight += 1
+            state.max_in_flight = max(state.max_in_flight, state.in_flight)
+            failure = state.failures.pop(0) if state.failures else None
+        time.sleep(state.delay)
+        with state.lock:
+            state.in_flight -= 1
+
+        if failure:
+            status, headers = failure
+            self.reply(
+                status, {"error": {"message": "stub failure", "type": "stub"}}, headers
+            )
+            return
+        content = (
+            json.dumps(QUESTION) if prompt.startswith("You are") else f"echo: {prompt}"
+        )
+        self.reply(
+            200,
+            {
+                "id": "stub",
+                "object": "chat.completion",
+                "created": 0,
+                "model": body["model"],
+                "choices": [
+                    {
+                        "index": 0,
+                        "finish_reason": "stop",
+                        "message": {"role": "assistant", "content": content},
+                    }
+                ],
+                "usage": {
+                    "prompt_tokens": 10,
+                    "completion_tokens": 5,
+                    "total_tokens": 15,
+                },
+            },
+        )
+
+    def reply(
+        self, status: int, payload: dict, headers: dict[str, str] | None = None
+    ) -> None:
+        data = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+
+@pytest.fixture
+def stub_server() -> Generator[tuple[str, StubState], None, None]:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    server.state = StubState()  # type: ignore[attr-defined]
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}/v1", server.state  # type: ignore[attr-defined]
+    server.shutdown()
+    server.server_close()
+
+
+def make_config(base_url: str, **kwargs: object) -> LLMConfig:
+    kwargs.setdefault("base_retry_delay", 0.01)
+    return LLMConfig(base_url=base_url, api_key="test", **kwargs)  # type: ignore[arg-type]
+
+
+class TestAsyncLLMClient:
+    """Completions, retries, caching and concurrency against the stub server."""
+
+    @pytest.mark.asyncio
+    async def test_sequential_requests_reuse_one_connection(
+        self, stub_server: tuple[str, StubState]
+    ) -> None:
+        base_url, state = stub_server
+
+        async with AsyncLLMClient(make_config(base_url, max_concurrency=1)) as client:
+            responses = [await client.complete(f"p{i}") for i in range(5)]
+
+        assert responses == [f"echo: p{i}" for i in range(5)]
+        assert len(state.client_ports) == 1
+        assert client.stats.prompt_tokens == 50
+
+    @pytest.mark.asyncio
+    async def test_transient_failures_are_retried(
+        self, stub_server: tuple[str, StubState]
+    ) -> None:
+        base_url, state = stub_server
+        state.failures = [(429, {"Retry-After": "0"}), (503, {})]
+
+        async with AsyncLLMClient(make_config(base_url)) as client:
+            response = await client.complete("hello")
+
+        assert response == "echo: hello"
+        assert client.stats.retries == 2
+        assert len(state.prompts) == 3
+
+    @pytest.mark.asyncio
+    async def test_client_errors_are_not_retried(
+        self, stub_server: tuple[str, StubState]
+    ) -> None:
+        base_url, state = stub_server
+        state.failures = [(400, {})]
+
+        async with AsyncLLMClient(make_config(base_url)) as client:
+            results = await client.complete_many(["bad", "good"])
+
+        assert isinstance(results[0], Exception) or isinstance(results[1], Exception)
+        assert "echo: good" in results or "echo: bad" in results
+        assert client.stats.retries == 0 and client.stats.failures == 1
+
+    @pytest.mark.asyncio
+    async def test_retries_give_up_after_max_retries(
+        self, stub_server: tuple[str, StubState]
+    ) -> None:
+        base_url, state = stub_server
+        state.failures = [(500, {})] * 3
+
+        async with AsyncLLMClient(make_config(base_url, max_retries=2)) as client:
+            [result] = await client.complete_many(["x"])
+
+        assert isinstance(result, Exception)
+        assert len(state.prompts) == 3
+
+    @pytest.mark.asyncio
+    async def test_responses_are_cached_by_prompt(
+        self, stub_server: tuple[str, StubState], tmp_path: Path
+    ) -> None:
+        """Repeats are served from memory, and from disk by a later client."""
+        base_url, state = stub_server
+        config = make_config(base_url, cache_dir=tmp_path / "cache")
+
+        async with AsyncLLMClient(config) as client:
+            await client.complete("same")
+            await client.complete("same")
+        async with AsyncLLMClient(config) as later:
+            assert await later.complete("same") == "echo: same"
+
+        assert state.prompts == ["same"]
+        assert client.stats.cache_hits == 1 and later.stats.cache_hits == 1
+
+    @pytest.mark.asyncio
+    async def test_repeated_prompts_are_not_cached_by_default(
+        self, stub_server: tuple[str, StubState]
+    ) -> None:
+        """Without a cache directory every repeat is a fresh sample."""
+        base_url, state = stub_server
+
+        async with AsyncLLMClient(make_config(base_url)) as client:
+            await client.complete_many(["same", "same"])
+            await client.complete("same")
+
+        assert state.prompts == ["same"] * 3
+        assert client.stats.cache_hits == 0
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(
+        self, stub_server: tuple[str, StubState]
+    ) -> None:
+        base_url, state = stub_server
+        state.delay = 0.05
+
+        async with AsyncLLMClient(make_config(base_url, max_concurrency=3)) as client:
+            results = await client.complete_many([f"p{i}" for i in range(9)])
+
+        assert results == [f"echo: p{i}" for i in range(9)]
+        assert 1 < state.max_in_flight <= 3
+
+
+class TestRateLimiting:
+    """Token buckets pace requests once their burst is used up."""
+
+    @pytest.mark.asyncio
+    async def test_bucket_waits_for_refill(self) -> None:
+        bucket = TokenBucket(per_minute=600)  # 10 per second
+        await bucket.acquire(600)
+
+        start = time.perf_counter()
+        await bucket.acquire(2)
+
+        assert time.perf_counter() - start >= 0.15
+
+    @pytest.mark.asyncio
+    async def test_disabled_bucket_never_waits(self) -> None:
+        bucket = TokenBucket(per_minute=0)
+
+        await asyncio.wait_for(
+            asyncio.gather(*(bucket.acquire(1000) for _ in range(100))), timeout=1
+        )
+
+    def test_backoff_is_jittered_and_honours_retry_after(self) -> None:
+        delays = {backoff_delay(3, 1.0, 60.0) for _ in range(20)}
+
+        assert len(delays) > 1 and all(0 <= d <= 8 for d in delays)
+        assert backoff_delay(0, 1.0, 60.0, retry_after=5) == 5
+        assert backoff_delay(0, 1.0, 60.0, retry_after=600) == 60
+
+
+class TestGenerateQuestions:
+    """generate_questions sends its prompts through the async client."""
+
+    @pytest.mark.e2e
+    def test_questions_come_back_from_the_stub(
+        self,
+        temp_workspace: Path,
+        single_repo: Path,
+        stub_server: tuple[str, StubState],
+    ) -> None:
+        base_url, state = stub_server
+        graphs_dir = temp_workspace / "graphs"
+        assert process_single_repo((single_repo, graphs_dir)).success
+
+        questions = generate_questions(
+            graphs_dir / "testowner__myrepo.json",
+            single_repo,
+            num_questions=3,
+            random_seed=1,
+            llm_config=make_config(base_url, max_concurrency=4),
+        )
+
+        assert len(questions) == 3
+        assert all(q.question == QUESTION["question"] for q in questions)
+        assert len(state.client_ports) <= 4
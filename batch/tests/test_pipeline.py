@@ -0,0 +1,331 @@
+"""Tests for the streaming clone -> index -> questions pipeline.
+
+Git and graph indexing are replaced with fast fakes, and the process pools
+with thread pools, so the tests exercise scheduling and backpressure only.
+"""
+from __future__ import annotations
+
+import multiprocessing
+import os
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+BATCH_DIR = Path(__file__).parent.parent
+PROJECT_ROOT = BATCH_DIR.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from batch.batch_processor import ProcessResult, failed_result
+from batch.github_cloner import GitHubCloner
+from batch.pipeline import PipelineCallbacks, StageLimits, StreamingPipeline
+
+
+def urls(count: int) -> list[str]:
+    return [f"https://github.com/owner/repo{i}" for i in range(count)]
+
+
+def fake_git_clone(cmd: list[str], **kwargs: object) -> subprocess.CompletedProcess:
+    """Stands in for `git clone` by creating the target's .git directory."""
+    target = Path(cmd[-1])
+    if target.name == "missing":
+        return subprocess.CompletedProcess(cmd, 128, "", "fatal: repository not found (404)")
+    (target / ".git").mkdir(parents=True)
+    return subprocess.CompletedProcess(cmd, 0, "", "")
+
+
+def fake_index(args: tuple[Path, Path]) -> ProcessResult:
+    repo_path, output_dir = args
+    if repo_path.name == "broken":
+        raise RuntimeError("parser crashed")
+    output = output_dir / f"{repo_path.parent.name}__{repo_path.name}.json"
+    output.write_text("{}")
+    return ProcessResult(
+        repo_path=str(repo_path),
+        output_path=str(output),
+        success=True,
+        error=None,
+        duration_seconds=0,
+        node_count=1,
+        relationship_count=0,
+    )
+
+
+def crashing_index(args: tuple[Path, Path]) -> ProcessResult:
+    """Kills its worker process for the "crash" repo; the others stay in flight meanwhile."""
+    if args[0].name == "crash":
+        os._exit(1)
+    time.sleep(0.5)
+    return fake_index(args)
+
+
+def fake_questions(args: tuple) -> dict:
+    return {"repo": args[0].stem, "graph": str(args[0]), "generated": 3, "skipped": False}
+
+
+def question_task(result: ProcessResult) -> tuple:
+    return (Path(result.output_path), Path(result.repo_path))
+
+
+@pytest.fixture
+def cloner(tmp_path: Path) -> GitHubCloner:
+    return GitHubCloner(clone_dir=tmp_path / "clones", max_retries=1, base_retry_delay=0)
+
+
+def make_pipeline(
+    cloner: GitHubCloner,
+    output_dir: Path,
+    limits: StageLimits,
+    **kwargs: object,
+) -> StreamingPipeline:
+    return StreamingPipeline(
+        cloner,
+        output_dir,
+        limits,
+        index_fn=kwargs.pop("index_fn", fake_index),
+        executor_factory=lambda workers: ThreadPoolExecutor(max_workers=workers),
+        **kwargs,
+    )
+
+
+class TestStreamingPipeline:
+    """Repos flow through every stage and failures stay in their stage."""
+
+    def test_every_repo_reaches_every_stage(self, cloner: GitHubCloner, tmp_path: Path) -> None:
+        """Cloned repos are indexed and indexed repos get questions."""
+        pipeline = make_pipeline(
+            cloner,
+            tmp_path / "graphs",
+            StageLimits(clone_workers=3, index_workers=2, question_workers=2),
+            question_task=question_task,
+            question_fn=fake_questions,
+        )
+
+        with patch("batch.github_cloner.subprocess.run", side_effect=fake_git_clone):
+            result = pipeline.run(urls(6))
+
+        assert len(result.clone_results) == 6
+        assert all(r.success for r in result.process_results)
+        assert len(result.question_results) == 6
+        assert sorted(cloner.state.completed) == sorted(urls(6))
+
+    def test_failures_do_not_flow_downstream(self, cloner: GitHubCloner, tmp_path: Path) -> None:
+        """A failed clone is never indexed and a crashed index gets no questions."""
+        pipeline = make_pipeline(
+            cloner,
+            tmp_path / "graphs",
+            StageLimits(),
+            question_task=question_task,
+            question_fn=fake_questions,
+        )
+        github_urls = [*urls(2), "https://github.com/owner/missing", "https://github.com/owner/broken"]
+
+        with patch("batch.github_cloner.subprocess.run", side_effect=fake_git_clone):
+            result = pipeline.run(github_urls)
+
+        assert [r.success for r in result.clone_results].count(False) == 1
+        failed = [r for r in result.process_results if not r.success]
+        assert len(result.process_results) == 3
+        assert len(failed) == 1 and "parser crashed" in (failed[0].error or "")
+        assert len(result.question_results) == 2
+        assert "https://github.com/owner/missing" in cloner.state.failed
+
+    def test_callbacks_run_on_the_calling_thread(self, cloner: GitHubCloner, tmp_path: Path) -> None:
+        """UI callbacks are invoked from the coordinator, never from pool threads."""
+        caller = threading.get_ident()
+        seen: set[int] = set()
+
+        def record(_: object) -> None:
+            seen.add(threading.get_ident())
+
+        pipeline = make_pipeline(
+            cloner,
+            tmp_path / "graphs",
+            StageLimits(clone_workers=4),
+            callbacks=PipelineCallbacks(on_clone=record, on_index_start=record, on_index=record),
+        )
+
+        with patch("batch.github_cloner.subprocess.run", side_effect=fake_git_clone):
+            pipeline.run(urls(5))
+
+        assert seen == {caller}
+
+
+class TestBackpressure:
+    """Upstream stages pause when the downstream queue is full."""
+
+    def test_cloning_waits_for_slow_indexing(self, cloner: GitHubCloner, tmp_path: Path) -> None:
+        """Cloned-but-unindexed repos never exceed the queue depth plus in-flight clones."""
+        limits = StageLimits(clone_workers=2, index_workers=1, queue_depth=1)
+        indexed: list[str] = []
+        max_backlog = 0
+
+        def slow_index(args: tuple[Path, Path]) -> ProcessResult:
+            time.sleep(0.02)
+            indexed.append(args[0].name)
+            return fake_index(args)
+
+        def on_clone(_: object) -> None:
+            nonlocal max_backlog
+            backlog = len(cloner.state.completed) - len(indexed)
+            max_backlog = max(max_backlog, backlog)
+
+        pipeline = make_pipeline(
+            cloner,
+            tmp_path / "graphs",
+            limits,
+            index_fn=slow_index,
+            callbacks=PipelineCallbacks(on_clone=on_clone),
+        )
+
+        with patch("batch.github_cloner.subprocess.run", side_effect=fake_git_clone):
+            result = pipeline.run(urls(8))
+
+        assert len(result.process_results) == 8
+        bound = limits.clone_workers + limits.queue_depth + limits.index_workers
+        assert max_backlog <= bound
+
+
+class TestIndexScheduling:
+    """Large repos go first and memory failures are retried in isolation."""
+
+    def test_largest_waiting_repo_is_indexed_first(self, cloner: GitHubCloner, tmp_path: Path) -> None:
+        """Among queued repos, dispatch order follows the cost estimate."""
+        local = [cloner.get_local_path(url) for url in urls(4)]
+        costs = {path: cost for path, cost in zip(local, (5, 40, 1, 20), strict=True)}
+        started: list[Path] = []
+        pipeline = make_pipeline(
+            cloner,
+            tmp_path / "graphs",
+            StageLimits(index_workers=1),
+            cost_fn=costs.__getitem__,
+            callbacks=PipelineCallbacks(on_index_start=started.append),
+        )
+
+        pipeline.run([], cloned_paths=local)
+
+        assert started == sorted(local, key=costs.__getitem__, reverse=True)
+
+    def test_repos_are_sized_off_the_coordinator_thread(self, cloner: GitHubCloner, tmp_path: Path) -> None:
+        """Walking a repo tree never stalls routing and admission."""
+        sizing_threads: set[int] = set()
+
+        def cost(path: Path) -> int:
+            sizing_threads.add(threading.get_ident())
+            return 0
+
+        pipeline = make_pipeline(cloner, tmp_path / "graphs", StageLimits(), cost_fn=cost)
+
+        with patch("batch.github_cloner.subprocess.run", side_effect=fake_git_clone):
+            result = pipeline.run(urls(3), cloned_paths=[tmp_path / "local"])
+
+        assert len(result.process_results) == 4
+        assert sizing_threads and threading.get_ident() not in sizing_threads
+
+    def test_memory_failures_and_dead_workers_are_retried(self, cloner: GitHubCloner, tmp_path: Path) -> None:
+        """Out-of-memory results and broken pools go to retry_fn; the pool is replaced."""
+        local = [cloner.get_local_path(url) for url in urls(2)]
+        oom = cloner.get_local_path("https://github.com/owner/oom")
+        crash = cloner.get_local_path("https://github.com/owner/crash")
+        pools: list[ThreadPoolExecutor] = []
+        retried: list[str] = []
+
+        def index(args: tuple[Path, Path]) -> ProcessResult:
+            if args[0] == crash:
+                raise BrokenProcessPool("worker died")
+            if args[0] == oom:
+                return failed_result(oom, "Memory limit exceeded", memory_exceeded=True)
+            return fake_index(args)
+
+        def retry(repo_path: Path, output_dir: Path) -> ProcessResult:
+            retried.append(repo_path.name)
+            return fake_index((repo_path, output_dir))
+
+        def index_pool(workers: int) -> ThreadPoolExecutor:
+            pools.append(ThreadPoolExecutor(max_workers=workers))
+            return pools[-1]
+
+        pipeline = make_pipeline(
+            cloner,
+            tmp_path / "graphs",
+            StageLimits(index_workers=1),
+            index_fn=index,
+            index_executor_factory=index_pool,
+            retry_fn=retry,
+            cost_fn=lambda path: 0,
+        )
+
+        result = pipeline.run([], cloned_paths=[oom, crash, *local])
+
+        assert sorted(retried) == ["crash", "oom"]
+        assert len(pools) == 2
+        assert len(result.process_results) == 4
+        assert all(r.success for r in result.process_results)
+
+    def test_dead_worker_with_several_repos_in_flight(self, cloner: GitHubCloner, tmp_path: Path) -> None:
+        """Every repo on the broken pool is retried once and the run goes on."""
+        local = [cloner.get_local_path(url) for url in [*urls(3), "https://github.com/owner/crash"]]
+        retried: list[str] = []
+        pools: list[ProcessPoolExecutor] = []
+
+        def retry(repo_path: Path, output_dir: Path) -> ProcessResult:
+            retried.append(repo_path.name)
+            return fake_index((repo_path, output_dir))
+
+        def index_pool(workers: int) -> ProcessPoolExecutor:
+            pools.append(ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context("spawn")))
+            return pools[-1]
+
+        pipeline = make_pipeline(
+            cloner,
+            tmp_path / "graphs",
+            StageLimits(index_workers=4, question_workers=2),
+            index_fn=crashing_index,
+            index_executor_factory=index_pool,
+            retry_fn=retry,
+            question_task=question_task,
+            question_fn=fake_questions,
+            cost_fn=lambda path: 0,
+        )
+
+        result = pipeline.run([], cloned_paths=local)
+
+        assert "crash" in retried
+        assert len(retried) == len(set(retried))
+        assert len(pools) == 2
+        assert sorted(Path(r.repo_path).name for r in result.process_results) == sorted(p.name for p in local)
+        assert len(result.question_results) == 4
+
+
+class TestResume:
+    """CloneState resume semantics are kept in the pipeline."""
+
+    def test_completed_clones_are_not_cloned_again(self, cloner: GitHubCloner, tmp_path: Path) -> None:
+        """Repos recorded as cloned go straight to indexing."""
+        done = urls(1)[0]
+        (cloner.get_local_path(done) / ".git").mkdir(parents=True)
+        cloner.state.completed.append(done)
+        pipeline = make_pipeline(cloner, tmp_path / "graphs", StageLimits())
+
+        with patch("batch.github_cloner.subprocess.run", side_effect=fake_git_clone) as run:
+            result = pipeline.run(urls(3))
+
+        assert run.call_count == 2
+        assert len(result.process_results) == 3
+
+    def test_already_cloned_paths_skip_the_clone_stage(self, cloner: GitHubCloner, tmp_path: Path) -> None:
+        """--skip-clone feeds local repos directly to indexing."""
+        local = cloner.get_local_path(urls(1)[0])
+        (local / ".git").mkdir(parents=True)
+        pipeline = make_pipeline(cloner, tmp_path / "graphs", StageLimits())
+
+        result = pipeline.run([], cloned_paths=[local])
+
+        assert result.clone_results == []
+        assert [r.repo_path for r in result.process_results] == [str(local)]
@@ -0,0 +1,232 @@
+"""Tests for the SQLite question store and resumable batch question generation.
+
+Unit tests feed the store hand-written per-repo JSONL files; the e2e tests
+run batch_generate_questions twice over a real indexed repo.
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+BATCH_DIR = Path(__file__).parent.parent
+PROJECT_ROOT = BATCH_DIR.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+sys.path.insert(0, str(BATCH_DIR))
+
+from batch_processor import process_single_repo
+from batch_question_generator import batch_generate_questions
+from question_store import STORE_FILENAME, QuestionStore, context_hash
+
+
+def record(
+    prompt_id: str, seed: int, strategy: str = "bfs", language: str = "python"
+) -> dict:
+    return {
+        "prompt_id": prompt_id,
+        "repo_name": "o/r",
+        "primary_language": language,
+        "expansion_strategy": strategy,
+        "seed_node_id": seed,
+        "context_node_ids": [seed, seed + 1],
+        "prompt_text": "...",
+    }
+
+
+def repo_result(
+    tmp_path: Path, repo: str, records: list[dict], **kwargs: object
+) -> dict:
+    output = tmp_path / f"{repo.replace('/', '__')}_questions.jsonl"
+    output.write_text("".join(json.dumps(r) + "\n" for r in records))
+    return {
+        "repo": repo,
+        "graph": "g.json",
+        "output": str(output),
+        "generated": len(records),
+        "skipped": False,
+        **kwargs,
+    }
+
+
+@pytest.fixture
+def store(tmp_path: Path):
+    with QuestionStore(tmp_path / STORE_FILENAME) as question_store:
+        yield question_store
+
+
+class TestQuestionStore:
+    """Per-repo partitions, context-hash de-dup and aggregate queries."""
+
+    def test_duplicate_contexts_are_stored_once(
+        self, store: QuestionStore, tmp_path: Path
+    ) -> None:
+        records = [
+            record("a", 1),
+            record("b", 1),
+            record("c", 1, "chain"),
+            record("d", 2),
+        ]
+
+        added = store.add_repo(repo_result(tmp_path, "o/r", records))
+
+        assert added == 3
+        assert store.question_count("o/r") == 3
+        assert store.summary()["duplicates_dropped"] == 1
+        assert (
+            context_hash(records[0])
+            == context_hash(records[1])
+            != context_hash(records[2])
+        )
+
+    def test_same_context_in_another_repo_is_kept(
+        self, store: QuestionStore, tmp_path: Path
+    ) -> None:
+        store.add_repo(repo_result(tmp_path, "o/one", [record("a", 1)]))
+        store.add_repo(repo_result(tmp_path, "o/two", [record("a", 1)]))
+
+        assert store.question_count() == 2
+
+    def test_re_adding_a_repo_replaces_its_partition(
+        self, store: QuestionStore, tmp_path: Path
+    ) -> None:
+        store.add_repo(repo_result(tmp_path, "o/r", [record("a", 1), record("b", 2)]))
+        store.add_repo(repo_result(tmp_path, "o/r", [record("c", 3)]))
+
+        assert store.question_count("o/r") == 1
+        assert len(store.results()) == 1
+
+    def test_only_successful_repos_are_complete(
+        self, store: QuestionStore, tmp_path: Path
+    ) -> None:
+        store.add_repo(repo_result(tmp_path, "o/done", [record("a", 1)]))
+        store.add_repo(
+            {
+                "repo": "o/slow",
+                "generated": 0,
+                "skipped": True,
+                "reason": "Timeout after 600s",
+            }
+        )
+
+        assert store.is_complete("o/done")
+        assert not store.is_complete("o/slow")
+        assert store.completed_repos() == {"o/done"}
+
+    def test_summary_is_aggregated_by_the_store(
+        self, store: QuestionStore, tmp_path: Path
+    ) -> None:
+        store.add_repo(
+            repo_result(
+                tmp_path,
+                "o/a",
+                [record("a", 1, "chain"), record("b", 5, "bfs", "rust")],
+            )
+        )
+        store.add_repo(
+            repo_result(tmp_path, "o/b", [record("c", 1, "chain")], sparse_mode=True)
+        )
+        store.add_repo(
+            {
+                "repo": "o/c",
+                "generated": 0,
+                "skipped": True,
+                "reason": "Too few candidates (3 < 10)",
+            }
+        )
+
+        summary = store.summary()
+
+        assert (summary["total_repos"], summary["successful"], summary["skipped"]) == (
+            3,
+            2,
+            1,
+        )
+        assert summary["sparse_mode_used"] == 1
+        assert summary["total_questions"] == 3
+        assert summary["by_strategy"] == {"chain": 2, "bfs": 1}
+        assert summary["by_language"] == {"python": 2, "rust": 1}
+        assert summary["skip_reasons"] == {"Too few candidates (3 < 10)": 1}
+
+    def test_export_writes_every_question(
+        self, store: QuestionStore, tmp_path: Path
+    ) -> None:
+        store.add_repo(repo_result(tmp_path, "o/a", [record("a", 1), record("b", 2)]))
+        store.add_repo(repo_result(tmp_path, "o/b", [record("c", 1)]))
+        combined = tmp_path / "all_questions.jsonl"
+
+        count = store.export_jsonl(combined)
+
+        lines = [json.loads(line) for line in combined.read_text().splitlines()]
+        assert count == 3
+        assert [r["prompt_id"] for r in lines] == ["a", "b", "c"]
+
+    def test_clear_starts_fresh(self, store: QuestionStore, tmp_path: Path) -> None:
+        store.add_repo(repo_result(tmp_path, "o/a", [record("a", 1)]))
+
+        store.clear()
+
+        assert store.question_count() == 0 and store.results() == []
+
+
+class TestResume:
+    """A resumed run skips repos already in the store and keeps their questions."""
+
+    @pytest.mark.e2e
+    def test_resume_skips_completed_repos(
+        self, temp_workspace: Path, single_repo: Path
+    ) -> None:
+        graphs_dir = temp_workspace / "graphs"
+        questions_dir = temp_workspace / "questions"
+        assert process_single_repo((single_repo, graphs_dir)).success
+
+        def run(resume: bool) -> list[dict]:
+            return batch_generate_questions(
+                graphs_dir,
+                temp_workspace / "clones",
+                questions_dir,
+                target_per_repo=20,
+                min_questions=1,
+                verbose=True,
+                prompt_timeout=0,
+                resume=resume,
+            )
+
+        first = run(resume=False)
+        combined = (questions_dir / "all_questions.jsonl").read_text().splitlines()
+        assert [r["repo"] for r in first] == ["testowner/myrepo"]
+        assert first[0]["generated"] > 0 and len(combined) > 0
+
+        resumed = run(resume=True)
+        summary = json.loads((questions_dir / "_questions_summary.json").read_text())
+
+        assert resumed == []
+        assert (
+            questions_dir / "all_questions.jsonl"
+        ).read_text().splitlines() == combined
+        assert summary["total_questions"] == len(combined)
+        assert summary["successful"] == 1
+
+    @pytest.mark.e2e
+    def test_fresh_run_clears_the_store(
+        self, temp_workspace: Path, single_repo: Path
+    ) -> None:
+        questions_dir = temp_workspace / "questions"
+        with QuestionStore(questions_dir / STORE_FILENAME) as store:
+            store.add_repo(repo_result(temp_workspace, "gone/repo", [record("a", 1)]))
+        assert process_single_repo((single_repo, temp_workspace / "graphs")).success
+
+        batch_generate_questions(
+            temp_workspace / "graphs",
+            temp_workspace / "clones",
+            questions_dir,
+            target_per_repo=5,
+            min_questions=1,
+            verbose=True,
+            prompt_timeout=0,
+        )
+
+        with QuestionStore(questions_dir / STORE_FILENAME) as store:
+            assert store.completed_repos() == {"testowner/myrepo"}
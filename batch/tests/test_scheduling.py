@@ -0,0 +1,131 @@
+"""Tests for size-aware scheduling and memory-failure retries in batch_processor.
+
+Worker pools are replaced with thread pools and indexing with fakes, so the
+tests cover ordering and retry decisions without spawning processes.
+"""
+from __future__ import annotations
+
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+BATCH_DIR = Path(__file__).parent.parent
+PROJECT_ROOT = BATCH_DIR.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from batch import batch_processor
+from batch.batch_processor import (
+    ProcessResult,
+    estimate_repo_cost,
+    order_by_cost,
+    schedule_repos,
+)
+
+
+def make_repo(root: Path, name: str, files: dict[str, int]) -> Path:
+    repo = root / "owner" / name
+    repo.mkdir(parents=True)
+    for rel_path, size in files.items():
+        path = repo / rel_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("x" * size)
+    return repo
+
+
+def ok_result(repo_path: Path, **kwargs: object) -> ProcessResult:
+    return ProcessResult(str(repo_path), "out.json", True, None, 0.0, 1, 0, **kwargs)
+
+
+def fake_index(args: tuple[Path, Path]) -> ProcessResult:
+    repo_path, _ = args
+    if repo_path.name == "crash":
+        raise BrokenProcessPool("worker died")
+    if repo_path.name == "huge":
+        return ProcessResult(str(repo_path), None, False, "Memory limit exceeded", 0.0, 0, 0, memory_exceeded=True)
+    return ok_result(repo_path)
+
+
+def fake_isolated(repo_path: Path, output_dir: Path, memory_limit_mb: int | None = None) -> ProcessResult:
+    return ok_result(repo_path, isolated_retry=True)
+
+
+@pytest.fixture
+def thread_pools():
+    """Run schedule_repos on threads with fake indexing and isolated retries."""
+    pools: list[ThreadPoolExecutor] = []
+
+    def create_pool(workers: int, *args: object, **kwargs: object) -> ThreadPoolExecutor:
+        pool = ThreadPoolExecutor(max_workers=workers)
+        pools.append(pool)
+        return pool
+
+    with (
+        patch.object(batch_processor, "create_worker_pool", side_effect=create_pool),
+        patch.object(batch_processor, "process_single_repo", fake_index),
+        patch.object(batch_processor, "process_repo_isolated", side_effect=fake_isolated) as isolated,
+    ):
+        yield pools, isolated
+
+
+class TestRepoCost:
+    """Cost estimates come from supported source files only."""
+
+    def test_counts_supported_files_per_extension(self, tmp_path: Path) -> None:
+        repo = make_repo(tmp_path, "repo", {"a.py": 100, "pkg/b.py": 50, "c.rs": 10, "notes.txt": 999})
+
+        cost = estimate_repo_cost(repo)
+
+        assert (cost.files, cost.bytes) == (3, 160)
+        assert cost.by_extension == {".py": [2, 150], ".rs": [1, 10]}
+
+    def test_skips_ignored_directories(self, tmp_path: Path) -> None:
+        repo = make_repo(tmp_path, "repo", {"main.py": 10, "node_modules/dep/index.js": 5000, ".git/hooks/x.py": 5000})
+
+        assert estimate_repo_cost(repo).files == 1
+
+    def test_largest_repos_are_ordered_first(self, tmp_path: Path) -> None:
+        small = make_repo(tmp_path, "small", {"a.py": 10})
+        large = make_repo(tmp_path, "large", {"a.py": 50_000})
+        medium = make_repo(tmp_path, "medium", {f"m{i}.py": 100 for i in range(10)})
+
+        assert order_by_cost([small, medium, large]) == [large, medium, small]
+
+
+class TestScheduleRepos:
+    """Largest-first dispatch with isolated retries for memory failures."""
+
+    def test_dispatches_largest_first(self, tmp_path: Path, thread_pools: tuple) -> None:
+        repos = [make_repo(tmp_path, f"r{size}", {"a.py": size}) for size in (10, 30_000, 500)]
+        started: list[str] = []
+
+        results = schedule_repos(repos, tmp_path / "out", workers=1, on_start=lambda p: started.append(p.name))
+
+        assert started == ["r30000", "r500", "r10"]
+        assert all(r.success for r in results)
+
+    def test_memory_failure_is_retried_in_isolation(self, tmp_path: Path, thread_pools: tuple) -> None:
+        repos = [make_repo(tmp_path, name, {"a.py": 10}) for name in ("huge", "fine")]
+        _, isolated = thread_pools
+
+        results = schedule_repos(repos, tmp_path / "out", workers=2)
+
+        assert isolated.call_count == 1
+        assert isolated.call_args.args[0].name == "huge"
+        by_name = {Path(r.repo_path).name: r for r in results}
+        assert by_name["huge"].success and by_name["huge"].isolated_retry
+        assert not by_name["fine"].isolated_retry
+
+    def test_broken_pool_is_replaced_and_run_continues(self, tmp_path: Path, thread_pools: tuple) -> None:
+        repos = [make_repo(tmp_path, name, {"a.py": size}) for name, size in (("crash", 900), ("b", 10), ("c", 5))]
+        pools, isolated = thread_pools
+
+        results = schedule_repos(repos, tmp_path / "out", workers=1)
+
+        assert len(pools) == 2
+        assert [c.args[0].name for c in isolated.call_args_list] == ["crash"]
+        assert sorted(Path(r.repo_path).name for r in results) == ["b", "c", "crash"]
+        assert all(r.success for r in results)
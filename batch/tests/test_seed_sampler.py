@@ -0,0 +1,192 @@
+"""Tests for weighted seed sampling, candidate scoring and sharded generation.
+
+Covers the Fenwick-tree sampler on its own, the prompt-generation loop that
+uses it to cap repeats per (seed, strategy) combo, and merging of
+per-repo shards generated in worker processes.
+"""
+from __future__ import annotations
+
+import json
+import random
+import sys
+from collections import Counter
+from dataclasses import asdict
+from pathlib import Path
+
+import pytest
+
+BATCH_DIR = Path(__file__).parent.parent
+PROJECT_ROOT = BATCH_DIR.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+sys.path.insert(0, str(BATCH_DIR))
+
+from batch_processor import process_single_repo
+from generate_diverse_questions import (
+    MAX_REPEATS_PER_COMBO,
+    DiversePromptRecord,
+    generate_diverse_prompts,
+    merge_shard_prompts,
+    shard_context,
+    shard_random_seeds,
+    split_evenly,
+)
+from question_generator import get_all_candidate_seeds
+from seed_sampler import WeightedSampler
+
+from codebase_rag.graph_loader import load_graph
+
+
+class FixedDraw:
+    """Stands in for random.Random and always draws the given target."""
+
+    def __init__(self, target: int):
+        self.target = target
+
+    def randrange(self, stop: int) -> int:
+        return self.target
+
+
+def linear_pick(weights: list[int], target: int) -> int:
+    for index, weight in enumerate(weights):
+        if target < weight:
+            return index
+        target -= weight
+    raise AssertionError("target beyond total weight")
+
+
+class TestWeightedSampler:
+    """Sampling follows the weights and honours removals."""
+
+    @pytest.mark.parametrize("weights", [[1], [3, 0, 2, 5], [0, 4, 0, 1, 1, 7, 2], list(range(1, 18))])
+    def test_every_target_maps_like_a_linear_scan(self, weights: list[int]) -> None:
+        """The tree descent picks the same index as scanning cumulative weights."""
+        sampler = WeightedSampler(weights)
+
+        assert sampler.total == sum(weights)
+        for target in range(sum(weights)):
+            assert sampler.sample(FixedDraw(target)) == linear_pick(weights, target)
+
+    def test_removed_indices_are_never_sampled(self) -> None:
+        sampler = WeightedSampler([5, 1, 5, 1])
+        sampler.remove(0)
+        sampler.remove(2)
+        rng = random.Random(0)
+
+        drawn = {sampler.sample(rng) for _ in range(200)}
+
+        assert drawn == {1, 3}
+        assert sampler.total == 2
+
+    def test_draws_are_proportional_to_weight(self) -> None:
+        sampler = WeightedSampler([1, 3, 6])
+        rng = random.Random(42)
+
+        counts = Counter(sampler.sample(rng) for _ in range(10_000))
+
+        assert counts[2] > counts[1] > counts[0]
+        assert abs(counts[2] / 10_000 - 0.6) < 0.03
+
+    def test_empty_sampler_raises(self) -> None:
+        sampler = WeightedSampler([2])
+        sampler.remove(0)
+
+        with pytest.raises(ValueError):
+            sampler.sample()
+
+
+class TestCandidateScoring:
+    """CALLS degree is counted once per edge end, including self-calls."""
+
+    def test_scores_count_calls_in_both_directions(self, tmp_path: Path) -> None:
+        graph_file = tmp_path / "graph.json"
+        nodes = [
+            {"node_id": i, "labels": ["Function"], "properties": {"name": f"f{i}", "start_line": 1, "end_line": 2}}
+            for i in range(3)
+        ]
+        rels = [
+            {"from_id": 0, "to_id": 1, "type": "CALLS", "properties": {}},
+            {"from_id": 2, "to_id": 2, "type": "CALLS", "properties": {}},
+            {"from_id": 1, "to_id": 2, "type": "IMPORTS", "properties": {}},
+        ]
+        graph_file.write_text(json.dumps({"nodes": nodes, "relationships": rels, "metadata": {}}))
+
+        scores = {node.node_id: score for node, score in get_all_candidate_seeds(load_graph(str(graph_file)))}
+
+        # calls * 10 + all relationships * 2 + code lines
+        assert scores == {0: 10 + 2 + 1, 1: 10 + 4 + 1, 2: 20 + 6 + 1}
+
+
+class TestComboRepeats:
+    """Prompt generation never reuses a (seed, strategy) combo past the cap."""
+
+    @pytest.mark.e2e
+    def test_combos_stop_at_max_repeats(self, temp_workspace: Path, single_repo: Path) -> None:
+        graphs_dir = temp_workspace / "graphs"
+        assert process_single_repo((single_repo, graphs_dir)).success
+
+        prompts, stats = generate_diverse_prompts(
+            graphs_dir / "testowner__myrepo.json",
+            single_repo,
+            num_prompts=500,
+            random_seed=7,
+            quiet=True,
+            prompt_timeout=0,
+        )
+
+        combos = Counter((p.seed_node_id, p.expansion_strategy) for p in prompts)
+        assert prompts
+        assert max(combos.values()) <= MAX_REPEATS_PER_COMBO
+        assert stats.attempt_count < 500 * 5
+
+
+def record(seed: int, strategy: str, context: list[int], prompt_id: str = "x") -> DiversePromptRecord:
+    return DiversePromptRecord(prompt_id, "o/r", "python", strategy, seed, "f", "m.f", context, [], "prompt")
+
+
+class TestShardMerge:
+    """Shard plans are deterministic and merged output has no duplicates."""
+
+    def test_budget_split_and_seeds_are_deterministic(self) -> None:
+        assert split_evenly(10, 3) == [4, 3, 3]
+        assert shard_random_seeds(5, 3) == shard_random_seeds(5, 3)
+        assert len(set(shard_random_seeds(5, 3))) == 3
+        assert shard_random_seeds(None, 2) == [None, None]
+
+    def test_shard_workers_are_never_forked(self) -> None:
+        """Shards may start while other threads run, so this process is never forked."""
+        assert shard_context().get_start_method() in ("forkserver", "spawn")
+
+    def test_merge_interleaves_dedups_and_renumbers(self) -> None:
+        shard_a = [record(1, "bfs", [1, 2]), record(1, "bfs", [1, 3])]
+        shard_b = [record(1, "bfs", [1, 2]), record(2, "file", [2])]
+
+        merged = merge_shard_prompts([shard_a, shard_b], "o/r")
+
+        assert [(r.seed_node_id, r.context_node_ids) for r in merged] == [(1, [1, 2]), (1, [1, 3]), (2, [2])]
+        assert [r.prompt_id for r in merged] == ["o/r_0001", "o/r_0002", "o/r_0003"]
+
+    @pytest.mark.e2e
+    def test_parallel_run_is_reproducible(self, temp_workspace: Path, single_repo: Path) -> None:
+        """Two seeded parallel runs agree, and combos stay under the repeat cap."""
+        graphs_dir = temp_workspace / "graphs"
+        assert process_single_repo((single_repo, graphs_dir)).success
+
+        def run() -> list[DiversePromptRecord]:
+            prompts, stats = generate_diverse_prompts(
+                graphs_dir / "testowner__myrepo.json",
+                single_repo,
+                num_prompts=40,
+                random_seed=11,
+                quiet=True,
+                prompt_timeout=0,
+                workers=2,
+            )
+            assert stats.attempt_count > 0
+            return prompts
+
+        first, second = run(), run()
+
+        assert first and [asdict(r) for r in first] == [asdict(r) for r in second]
+        combos = Counter((p.seed_node_id, p.expansion_strategy) for p in first)
+        assert max(combos.values()) <= MAX_REPEATS_PER_COMBO
+        assert len({p.prompt_id for p in first}) == len(first)
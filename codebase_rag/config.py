@@ -52,6 +52,19 @@ class AppConfig(BaseSettings):
     MEMGRAPH_HTTP_PORT: int = 7444
     LAB_PORT: int = 3000
     MEMGRAPH_BATCH_SIZE: int = 1000
+    MEMGRAPH_POOL_SIZE: int = 8
+    MEMGRAPH_POOL_TIMEOUT: float = 30.0
+    # (H) Writes from other processes (e.g. realtime_updater.py) cannot invalidate
+    # (H) this process's cache, so it is opt-in and entries expire after the TTL
+    QUERY_CACHE_ENABLED: bool = False
+    QUERY_CACHE_MAX_ENTRIES: int = 512
+    QUERY_CACHE_MAX_ROWS: int = 1000
+    QUERY_CACHE_TTL: float = 5.0
+
+    CYPHER_CACHE_ENABLED: bool = True
+    CYPHER_CACHE_MAX_ENTRIES: int = 1000
+    CYPHER_CACHE_SIMILARITY_THRESHOLD: float | None = None
+
     AGENT_RETRIES: int = 3
     ORCHESTRATOR_OUTPUT_RETRIES: int = 100
 
@@ -155,6 +168,8 @@ class AppConfig(BaseSettings):
 
     OLLAMA_HEALTH_TIMEOUT: float = 5.0
 
+    MCP_MAX_WORKERS: int = 4
+
     _active_orchestrator: ModelConfig | None = None
     _active_cypher: ModelConfig | None = None
 
@@ -199,6 +199,7 @@ ONEOF_FILE = "file"
 ONEOF_EXTERNAL_PACKAGE = "external_package"
 ONEOF_MODULE_IMPLEMENTATION = "module_implementation"
 ONEOF_MODULE_INTERFACE = "module_interface"
+ONEOF_PAYLOAD = "payload"
 
 # (H) CLI error and info messages
 CLI_ERR_OUTPUT_REQUIRES_UPDATE = (
@@ -295,6 +296,8 @@ CPP_PARTITION_PREFIX = "partition_"
 TRIE_TYPE_KEY = "__type__"
 TRIE_QN_KEY = "__qn__"
 TRIE_INTERNAL_PREFIX = "__"
+# (H) Lowest distance _calculate_import_distance can return (candidate == caller)
+IMPORT_DISTANCE_FLOOR = -1
 
 
 class NodeLabel(StrEnum):
@@ -370,11 +373,11 @@ CSPROJ_SUFFIX = ".csproj"
 
 # (H) Cypher queries
 CYPHER_QUERY_EMBEDDINGS = """
-MATCH (m:Module)-[:DEFINES]->(n)
-WHERE n:Function OR n:Method
+MATCH (n)
+WHERE (n:Function OR n:Method) AND n.path IS NOT NULL
 RETURN id(n) AS node_id, n.qualified_name AS qualified_name,
        n.start_line AS start_line, n.end_line AS end_line,
-       m.path AS path
+       n.path AS path
 ORDER BY n.qualified_name
 """
 
@@ -917,6 +920,39 @@ NODE_UNIQUE_CONSTRAINTS: dict[str, str] = {
     "ExternalPackage": "name",
 }
 
+# (H) Definitions carry their file's path so lookups never walk the graph
+DEFINITION_PATH_LABELS = frozenset({
+    NodeLabel.CLASS,
+    NodeLabel.FUNCTION,
+    NodeLabel.METHOD,
+    NodeLabel.INTERFACE,
+    NodeLabel.ENUM,
+    NodeLabel.TYPE,
+    NodeLabel.UNION,
+})
+QUALIFIED_NAME_LOOKUP_LABELS: tuple[str, ...] = (
+    NodeLabel.FUNCTION,
+    NodeLabel.METHOD,
+    NodeLabel.CLASS,
+    NodeLabel.INTERFACE,
+    NodeLabel.ENUM,
+    NodeLabel.TYPE,
+    NodeLabel.UNION,
+    NodeLabel.MODULE,
+)
+# (H) Lookups outside the MERGE keys: realtime module deletes, file lookups
+# (H) and the name-based matches generated Cypher leans on
+NODE_LOOKUP_PROPERTIES: tuple[tuple[str, str], ...] = (
+    (NodeLabel.MODULE, KEY_PATH),
+    (NodeLabel.FILE, KEY_PATH),
+    (NodeLabel.FUNCTION, KEY_NAME),
+    (NodeLabel.METHOD, KEY_NAME),
+    (NodeLabel.CLASS, KEY_NAME),
+)
+INDEX_INFO_LABEL = "label"
+INDEX_INFO_PROPERTY = "property"
+EXPLAIN_PLAN_COLUMN = "QUERY PLAN"
+
 # (H) Cypher response cleaning
 CYPHER_PREFIX = "cypher"
 CYPHER_SEMICOLON = ";"
@@ -1090,7 +1126,6 @@ MSG_SEMANTIC_SOURCE_UNAVAILABLE = (
 MSG_SEMANTIC_SOURCE_FORMAT = "Source code for node ID {id}:\n\n```\n{code}\n```"
 MSG_SEMANTIC_RESULT_HEADER = "Found {count} semantic matches for '{query}':\n\n"
 MSG_SEMANTIC_RESULT_FOOTER = "\n\nUse the qualified names above with other tools to get more details or source code."
-SEMANTIC_BATCH_SIZE = 100
 SEMANTIC_TYPE_UNKNOWN = "Unknown"
 
 # (H) Document analyzer constants
@@ -1532,9 +1567,36 @@ GEMFILE_GEM_PREFIX = "gem "
 # (H) Import processor cache config
 IMPORT_CACHE_TTL = 3600
 IMPORT_CACHE_DIR = ".cache/codebase_rag"
-IMPORT_CACHE_FILE = "stdlib_cache.json"
-IMPORT_CACHE_KEY = "cache"
-IMPORT_TIMESTAMPS_KEY = "timestamps"
+IMPORT_CACHE_FILE = "stdlib_cache.sqlite3"
+IMPORT_CACHE_TABLE_PREFIX = "stdlib_"
+IMPORT_CACHE_WRITE_BATCH_SIZE = 256
+IMPORT_CACHE_SIDECAR_SUFFIXES = ("-wal", "-shm")
+
+# (H) Read query result cache; any of these clauses marks a query as a write
+QUERY_CACHE_WRITE_PATTERN = (
+    r"\b(?:CREATE|MERGE|SET|DELETE|REMOVE|DROP|FOREACH|CALL|LOAD\s+CSV)\b"
+)
+
+# (H) Natural-language to Cypher cache
+CYPHER_CACHE_FILE = "cypher_cache.sqlite3"
+CYPHER_CACHE_SLOT = "<<slot{index}>>"
+CYPHER_CACHE_SLOT_GROUP = "s{index}"
+CYPHER_CACHE_SLOT_PATTERN = r"[^\s'\"\\]+"
+CYPHER_CACHE_LITERAL_PATTERN = r"'((?:[^'\\]|\\.)*)'|\"((?:[^\"\\]|\\.)*)\""
+CYPHER_CACHE_QUESTION_TRAILING = "?!.。？！ "
+CYPHER_CACHE_SCHEMA_HASH_LENGTH = 16
+
+# (H) Out-of-process stdlib introspection workers
+STDLIB_WORKER_BATCH_SIZE = 64
+# (H) Compiling the Go and Java workers, and waiting for a killed worker
+STDLIB_WORKER_TIMEOUT = 30
+STDLIB_WORKER_REPLY_TIMEOUT = 2.0
+# (H) Added per name in a batch: the Python worker imports modules one by one
+STDLIB_WORKER_TIMEOUT_PER_NAME = 0.1
+STDLIB_WORKER_MAX_REPLY_TIMEOUT = 5.0
+STDLIB_WORKER_MAX_RESTARTS = 2
+STDLIB_WORKER_FIELD_SEP = "\t"
+STDLIB_WORKER_FOUND = "1"
 
 # (H) Tree-sitter Python import node types
 TS_IMPORT_STATEMENT = "import_statement"
@@ -2254,6 +2316,38 @@ JS_ES6_EXPORT_FUNCTION_QUERY = """
   [(function_declaration) (generator_function_declaration)] @export_function)
 """
 
+
+# (H) Per-file JS/TS queries, compiled once per grammar by parser_loader
+class AuxiliaryQuery(StrEnum):
+    PROTOTYPE_INHERITANCE = "prototype_inheritance"
+    PROTOTYPE_METHOD = "prototype_method"
+    OBJECT_METHOD = "object_method"
+    METHOD_DEF = "method_def"
+    OBJECT_ARROW = "object_arrow"
+    ASSIGNMENT_ARROW = "assignment_arrow"
+    ASSIGNMENT_FUNCTION = "assignment_function"
+    COMMONJS_DESTRUCTURE = "commonjs_destructure"
+    COMMONJS_EXPORTS_FUNCTION = "commonjs_exports_function"
+    COMMONJS_MODULE_EXPORTS = "commonjs_module_exports"
+    ES6_EXPORT_CONST = "es6_export_const"
+    ES6_EXPORT_FUNCTION = "es6_export_function"
+
+
+AUXILIARY_QUERY_SOURCES: dict[AuxiliaryQuery, str] = {
+    AuxiliaryQuery.PROTOTYPE_INHERITANCE: JS_PROTOTYPE_INHERITANCE_QUERY,
+    AuxiliaryQuery.PROTOTYPE_METHOD: JS_PROTOTYPE_METHOD_QUERY,
+    AuxiliaryQuery.OBJECT_METHOD: JS_OBJECT_METHOD_QUERY,
+    AuxiliaryQuery.METHOD_DEF: JS_METHOD_DEF_QUERY,
+    AuxiliaryQuery.OBJECT_ARROW: JS_OBJECT_ARROW_QUERY,
+    AuxiliaryQuery.ASSIGNMENT_ARROW: JS_ASSIGNMENT_ARROW_QUERY,
+    AuxiliaryQuery.ASSIGNMENT_FUNCTION: JS_ASSIGNMENT_FUNCTION_QUERY,
+    AuxiliaryQuery.COMMONJS_DESTRUCTURE: JS_COMMONJS_DESTRUCTURE_QUERY,
+    AuxiliaryQuery.COMMONJS_EXPORTS_FUNCTION: JS_COMMONJS_EXPORTS_FUNCTION_QUERY,
+    AuxiliaryQuery.COMMONJS_MODULE_EXPORTS: JS_COMMONJS_MODULE_EXPORTS_QUERY,
+    AuxiliaryQuery.ES6_EXPORT_CONST: JS_ES6_EXPORT_CONST_QUERY,
+    AuxiliaryQuery.ES6_EXPORT_FUNCTION: JS_ES6_EXPORT_FUNCTION_QUERY,
+}
+
 # (H) Query capture names for module system
 CAPTURE_FUNC = "func"
 CAPTURE_VARIABLE_DECLARATOR = "variable_declarator"
@@ -2314,6 +2408,7 @@ class MCPToolName(StrEnum):
     READ_FILE = "read_file"
     WRITE_FILE = "write_file"
     LIST_DIRECTORY = "list_directory"
+    GET_INDEX_STATUS = "get_index_status"
 
 
 # (H) MCP environment variables
@@ -2328,6 +2423,7 @@ class MCPSchemaType(StrEnum):
     OBJECT = "object"
     STRING = "string"
     INTEGER = "integer"
+    BOOLEAN = "boolean"
 
 
 # (H) MCP schema fields
@@ -2350,6 +2446,26 @@ class MCPParamName(StrEnum):
     LIMIT = "limit"
     CONTENT = "content"
     DIRECTORY_PATH = "directory_path"
+    BACKGROUND = "background"
+
+
+# (H) MCP background indexing job states
+class IndexJobState(StrEnum):
+    IDLE = "idle"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+# (H) GraphUpdater phases reported as indexing progress
+class IndexPhase(StrEnum):
+    PENDING = "pending"
+    CLEARING = "clearing"
+    STRUCTURE = "structure"
+    DEFINITIONS = "definitions"
+    CALLS = "calls"
+    FLUSHING = "flushing"
+    EMBEDDINGS = "embeddings"
 
 
 # (H) MCP server constants
@@ -2360,10 +2476,15 @@ MCP_JSON_INDENT = 2
 MCP_LOG_LEVEL_INFO = "INFO"
 MCP_LOG_FORMAT = "<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <level>{message}</level>"
 MCP_PAGINATION_HEADER = "# Lines {start}-{end} of {total}\n"
+MCP_WORKER_THREAD_PREFIX = "cgr-mcp"
 
 # (H) MCP response messages
 MCP_INDEX_SUCCESS = "Successfully indexed repository at {path}. Knowledge graph has been updated (previous data cleared)."
 MCP_INDEX_ERROR = "Error indexing repository: {error}"
+MCP_INDEX_STARTED = (
+    "Started indexing repository at {path} in the background. "
+    "Call {status_tool} to follow its progress."
+)
 MCP_WRITE_SUCCESS = "Successfully wrote file: {path}"
 MCP_UNKNOWN_TOOL_ERROR = "Unknown tool: {name}"
 MCP_TOOL_EXEC_ERROR = "Error executing tool '{name}': {error}"
@@ -1,3 +1,12 @@
+from collections.abc import Iterable, Mapping, Sequence
+
+from .constants import (
+    KEY_QUALIFIED_NAME,
+    NODE_LOOKUP_PROPERTIES,
+    NODE_UNIQUE_CONSTRAINTS,
+    QUALIFIED_NAME_LOOKUP_LABELS,
+)
+
 CYPHER_DELETE_ALL = "MATCH (n) DETACH DELETE n;"
 
 CYPHER_EXAMPLE_DECORATED_FUNCTIONS = """MATCH (n:Function|Method)
@@ -39,16 +48,19 @@ CYPHER_RETURN_COUNT = "RETURN count(r) as created"
 CYPHER_SET_PROPS_RETURN_COUNT = "SET r += row.props\nRETURN count(r) as created"
 
 CYPHER_GET_FUNCTION_SOURCE_LOCATION = """
-MATCH (m:Module)-[:DEFINES]->(n)
+MATCH (n)
 WHERE id(n) = $node_id
+OPTIONAL MATCH (m:Module)-[:DEFINES]->(n)
 RETURN n.qualified_name AS qualified_name, n.start_line AS start_line,
-       n.end_line AS end_line, m.path AS path
+       n.end_line AS end_line, coalesce(n.path, m.path) AS path
 """
 
-CYPHER_FIND_BY_QUALIFIED_NAME = """
+# (H) Graphs indexed before definitions carried a path only reach their file
+# (H) through the defining module; the walk is directed and bounded
+CYPHER_FIND_DEFINING_MODULE_PATH = """
 MATCH (n) WHERE n.qualified_name = $qn
-OPTIONAL MATCH (m:Module)-[*]-(n)
-RETURN n.name AS name, n.start_line AS start, n.end_line AS end, m.path AS path, n.docstring AS docstring
+MATCH (m:Module)-[:DEFINES|DEFINES_METHOD*1..4]->(n)
+RETURN m.path AS path
 LIMIT 1
 """
 
@@ -68,6 +80,50 @@ ORDER BY n.qualified_name
 """
 
 
+def build_find_by_qualified_name_query(labels: Sequence[str]) -> str:
+    # (H) One labelled branch per definition kind, so each is an index seek
+    return "\nUNION ALL\n".join(
+        f"MATCH (n:{label} {{qualified_name: $qn}})\n"
+        "RETURN n.name AS name, n.start_line AS start, n.end_line AS end, "
+        "n.path AS path, n.docstring AS docstring"
+        for label in labels
+    )
+
+
+CYPHER_FIND_BY_QUALIFIED_NAME = build_find_by_qualified_name_query(
+    QUALIFIED_NAME_LOOKUP_LABELS
+)
+
+
+def build_index_query(label: str, prop: str) -> str:
+    return f"CREATE INDEX ON :{label}({prop});"
+
+
+CYPHER_SHOW_INDEX_INFO = "SHOW INDEX INFO;"
+
+
+def build_explain_query(query: str) -> str:
+    return f"EXPLAIN {query}"
+
+
+def build_index_plan(
+    merge_keys: Mapping[str, str],
+    qualified_name_labels: Iterable[str],
+    lookups: Iterable[tuple[str, str]],
+) -> tuple[tuple[str, str], ...]:
+    # (H) Uniqueness constraints do not give the planner an index, so every key
+    # (H) the MERGE builders match on is indexed alongside the lookup keys
+    plan = [*merge_keys.items()]
+    plan.extend((label, KEY_QUALIFIED_NAME) for label in qualified_name_labels)
+    plan.extend(lookups)
+    return tuple(dict.fromkeys((str(label), prop) for label, prop in plan))
+
+
+NODE_PROPERTY_INDEXES = build_index_plan(
+    NODE_UNIQUE_CONSTRAINTS, QUALIFIED_NAME_LOOKUP_LABELS, NODE_LOOKUP_PROPERTIES
+)
+
+
 def build_constraint_query(label: str, prop: str) -> str:
     return f"CREATE CONSTRAINT ON (n:{label}) ASSERT n.{prop} IS UNIQUE;"
 
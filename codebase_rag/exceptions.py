@@ -25,6 +25,9 @@ PROVIDER_EMPTY = "Provider name cannot be empty in 'provider:model' format."
 BATCH_SIZE_POSITIVE = "batch_size must be a positive integer"
 CONFIG = "{role} configuration error: {error}"
 
+# (H) Parser loading errors
+AUXILIARY_QUERY_INVALID = "Query '{name}' cannot be compiled for {lang}: {error}"
+
 # (H) Graph loading errors
 GRAPH_FILE_NOT_FOUND = "Graph file not found: {path}"
 FAILED_TO_LOAD_DATA = "Failed to load data from file"
@@ -44,6 +47,11 @@ LLM_INIT_ORCHESTRATOR = "Failed to initialize RAG Orchestrator: {error}"
 # (H) Graph service errors
 BATCH_SIZE = "batch_size must be a positive integer"
 CONN = "Not connected to Memgraph."
+POOL_SIZE = "Connection pool max_size must be a positive integer"
+POOL_CLOSED = "Memgraph connection pool is closed."
+POOL_EXHAUSTED = (
+    "No Memgraph connection became available within {timeout}s (pool size {size})."
+)
 
 # (H) Access control errors (used with raise)
 ACCESS_DENIED = "Access denied: Cannot access files outside the project root."
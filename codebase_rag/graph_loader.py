@@ -1,5 +1,6 @@
 import json
 from collections import Counter, defaultdict
+from collections.abc import Iterable
 from pathlib import Path
 
 from loguru import logger
@@ -9,7 +10,27 @@ from . import exceptions as ex
 from . import logs as ls
 from .decorators import ensure_loaded
 from .models import GraphNode, GraphRelationship
-from .types_defs import GraphData, GraphMetadata, GraphSummary, PropertyValue
+from .types_defs import (
+    GraphCounts,
+    GraphData,
+    GraphMetadata,
+    GraphSummary,
+    PropertyValue,
+)
+
+
+def count_graph(
+    node_labels: Iterable[str], relationship_types: Iterable[str]
+) -> GraphCounts:
+    # (H) One label per node and one type per relationship, as ingestors emit them
+    labels = Counter(node_labels)
+    rel_types = Counter(relationship_types)
+    return GraphCounts(
+        total_nodes=labels.total(),
+        total_relationships=rel_types.total(),
+        node_labels=dict(labels),
+        relationship_types=dict(rel_types),
+    )
 
 
 class GraphLoader:
@@ -1,6 +1,6 @@
 import sys
 from collections import OrderedDict, defaultdict
-from collections.abc import Callable, ItemsView, KeysView
+from collections.abc import Callable, ItemsView, Iterable, KeysView, Mapping
 from pathlib import Path
 
 from loguru import logger
@@ -9,35 +9,45 @@ from tree_sitter import Node, Parser
 from . import constants as cs
 from . import logs as ls
 from .config import settings
-from .language_spec import LANGUAGE_FQN_SPECS, get_language_spec
+from .language_spec import LANGUAGE_FQN_SPECS
 from .parsers.factory import ProcessorFactory
+from .parsers.symbol_table import SymbolTable
 from .services import IngestorProtocol, QueryProtocol
 from .types_defs import (
     EmbeddingQueryResult,
     FunctionRegistry,
+    IndexProgress,
     LanguageQueries,
     NodeType,
     QualifiedName,
+    RepoEntry,
     ResultRow,
     SimpleNameLookup,
     TrieNode,
 )
 from .utils.dependencies import has_semantic_dependencies
 from .utils.fqn_resolver import find_function_source_by_fqn
-from .utils.path_utils import should_skip_path
+from .utils.path_utils import build_path_matcher, walk_repository
 from .utils.source_extraction import extract_source_with_fallback
 
 
 class FunctionRegistryTrie:
-    def __init__(self, simple_name_lookup: SimpleNameLookup | None = None) -> None:
+    def __init__(
+        self,
+        simple_name_lookup: SimpleNameLookup | None = None,
+        *,
+        symbol_table: SymbolTable | None = None,
+    ) -> None:
         self.root: TrieNode = {}
         self._entries: FunctionRegistry = {}
         self._simple_name_lookup = simple_name_lookup
+        self.symbol_table = symbol_table if symbol_table is not None else SymbolTable()
 
     def insert(self, qualified_name: QualifiedName, func_type: NodeType) -> None:
+        qualified_name = self.symbol_table.intern(qualified_name)
         self._entries[qualified_name] = func_type
 
-        parts = qualified_name.split(cs.SEPARATOR_DOT)
+        parts = self.symbol_table.parts(qualified_name)
         current: TrieNode = self.root
 
         for part in parts:
@@ -70,7 +80,7 @@ class FunctionRegistryTrie:
 
         del self._entries[qualified_name]
 
-        parts = qualified_name.split(cs.SEPARATOR_DOT)
+        parts = list(self.symbol_table.parts(qualified_name))
         self._cleanup_trie_path(parts, self.root)
 
     def _cleanup_trie_path(self, parts: list[str], node: TrieNode) -> bool:
@@ -225,7 +235,7 @@ class GraphUpdater:
         self,
         ingestor: IngestorProtocol,
         repo_path: Path,
-        parsers: dict[cs.SupportedLanguage, Parser],
+        parsers: Mapping[cs.SupportedLanguage, Parser],
         queries: dict[cs.SupportedLanguage, LanguageQueries],
         include_paths: frozenset[str] | None = None,
         exclude_paths: frozenset[str] | None = None,
@@ -236,12 +246,17 @@ class GraphUpdater:
         self.queries = queries
         self.project_name = repo_path.name
         self.simple_name_lookup: SimpleNameLookup = defaultdict(set)
+        self.symbol_table = SymbolTable()
         self.function_registry = FunctionRegistryTrie(
-            simple_name_lookup=self.simple_name_lookup
+            simple_name_lookup=self.simple_name_lookup,
+            symbol_table=self.symbol_table,
         )
         self.ast_cache = BoundedASTCache()
         self.include_paths = include_paths
         self.exclude_paths = exclude_paths
+        self.path_matcher = build_path_matcher(repo_path, exclude_paths, include_paths)
+        # (H) Replaced wholesale as work advances so other threads can poll it
+        self.progress = IndexProgress(cs.IndexPhase.PENDING, 0, 0)
 
         self.factory = ProcessorFactory(
             ingestor=self.ingestor,
@@ -251,6 +266,7 @@ class GraphUpdater:
             function_registry=self.function_registry,
             simple_name_lookup=self.simple_name_lookup,
             ast_cache=self.ast_cache,
+            symbol_table=self.symbol_table,
             include_paths=self.include_paths,
             exclude_paths=self.exclude_paths,
         )
@@ -267,11 +283,16 @@ class GraphUpdater:
         )
         logger.info(ls.ENSURING_PROJECT.format(name=self.project_name))
 
+        # (H) One walk of the tree feeds both the structure and the file pass
+        entries = list(walk_repository(self.repo_path, self.path_matcher))
+
         logger.info(ls.PASS_1_STRUCTURE)
-        self.factory.structure_processor.identify_structure()
+        self.progress = IndexProgress(cs.IndexPhase.STRUCTURE, 0, len(entries))
+        self.factory.structure_processor.identify_structure(entries)
 
         logger.info(ls.PASS_2_FILES)
-        self._process_files()
+        self._process_files(entries)
+        self.factory.import_processor.flush_import_relationships()
 
         logger.info(ls.FOUND_FUNCTIONS.format(count=len(self.function_registry)))
         logger.info(ls.PASS_3_CALLS)
@@ -280,6 +301,7 @@ class GraphUpdater:
         self.factory.definition_processor.process_all_method_overrides()
 
         logger.info(ls.ANALYSIS_COMPLETE)
+        self.progress = IndexProgress(cs.IndexPhase.FLUSHING, 0, 0)
         self.ingestor.flush_all()
 
         self._generate_semantic_embeddings()
@@ -316,39 +338,38 @@ class GraphUpdater:
                 self.simple_name_lookup[simple_name] = new_qn_set
                 logger.debug(ls.CLEANED_SIMPLE_NAME.format(name=simple_name))
 
-    def _process_files(self) -> None:
-        for filepath in self.repo_path.rglob("*"):
-            if filepath.is_file() and not should_skip_path(
-                filepath,
-                self.repo_path,
-                exclude_paths=self.exclude_paths,
-                include_paths=self.include_paths,
-            ):
-                lang_config = get_language_spec(filepath.suffix)
-                if (
-                    lang_config
-                    and isinstance(lang_config.language, cs.SupportedLanguage)
-                    and lang_config.language in self.parsers
-                ):
-                    result = self.factory.definition_processor.process_file(
-                        filepath,
-                        lang_config.language,
-                        self.queries,
-                        self.factory.structure_processor.structural_elements,
-                    )
-                    if result:
-                        root_node, language = result
-                        self.ast_cache[filepath] = (root_node, language)
-                elif self._is_dependency_file(filepath.name, filepath):
-                    self.factory.definition_processor.process_dependencies(filepath)
-
-                self.factory.structure_processor.process_generic_file(
-                    filepath, filepath.name
+    def _process_files(self, entries: Iterable[RepoEntry] | None = None) -> None:
+        if entries is None:
+            entries = walk_repository(self.repo_path, self.path_matcher)
+        total = len(entries) if isinstance(entries, list) else 0
+        for processed, (filepath, entry, language) in enumerate(entries, 1):
+            self.progress = IndexProgress(cs.IndexPhase.DEFINITIONS, processed, total)
+            if not entry.is_file():
+                continue
+            if language is not None and language in self.parsers:
+                result = self.factory.definition_processor.process_file(
+                    filepath,
+                    language,
+                    self.queries,
+                    self.factory.structure_processor.structural_elements,
                 )
+                if result:
+                    root_node, language = result
+                    self.ast_cache[filepath] = (root_node, language)
+            elif self._is_dependency_file(filepath.name, filepath):
+                self.factory.definition_processor.process_dependencies(filepath)
+
+            self.factory.structure_processor.process_generic_file(
+                filepath, filepath.name
+            )
 
     def _process_function_calls(self) -> None:
         ast_cache_items = list(self.ast_cache.items())
-        for file_path, (root_node, language) in ast_cache_items:
+        total = len(ast_cache_items)
+        for processed, (file_path, (root_node, language)) in enumerate(
+            ast_cache_items, 1
+        ):
+            self.progress = IndexProgress(cs.IndexPhase.CALLS, processed, total)
             self.factory.call_processor.process_calls_in_file(
                 file_path, root_node, language, self.queries
             )
@@ -375,6 +396,7 @@ class GraphUpdater:
                 return
 
             logger.info(ls.GENERATING_EMBEDDINGS.format(count=len(results)))
+            self.progress = IndexProgress(cs.IndexPhase.EMBEDDINGS, 0, len(results))
 
             embedded_count = 0
             for row in results:
@@ -398,6 +420,7 @@ class GraphUpdater:
                         embedding = embed_code(source_code)
                         store_embedding(node_id, embedding, qualified_name)
                         embedded_count += 1
+                        self.progress = self.progress._replace(processed=embedded_count)
 
                         if embedded_count % settings.EMBEDDING_PROGRESS_INTERVAL == 0:
                             logger.debug(
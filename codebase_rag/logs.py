@@ -93,9 +93,10 @@ NO_LANG_ATTR = (
 SUBMODULE_LOAD_FAILED = "Failed to load {lang} from submodule bindings: {error}"
 LIB_NOT_AVAILABLE = "Tree-sitter library for {lang} not available."
 LOCALS_QUERY_FAILED = "Failed to create locals query for {lang}: {error}"
+AUXILIARY_QUERY_FAILED = "Failed to compile {name} query for {lang}: {error}"
 GRAMMAR_LOADED = "Successfully loaded {lang} grammar."
 GRAMMAR_LOAD_FAILED = "Failed to load {lang} grammar: {error}"
-INITIALIZED_PARSERS = "Initialized parsers for: {languages}"
+INITIALIZED_PARSERS = "Grammars available for: {languages}"
 
 # (H) Ignore pattern logs
 CGRIGNORE_LOADED = "Loaded {count} patterns from {path}"
@@ -172,6 +173,7 @@ MG_CLEANING_DB = "--- Cleaning database... ---"
 MG_DB_CLEANED = "--- Database cleaned. ---"
 MG_ENSURING_CONSTRAINTS = "Ensuring constraints..."
 MG_CONSTRAINTS_DONE = "Constraints checked/created."
+MG_INDEXES_ENSURED = "Property indexes: {created} created, {total} planned."
 MG_NODE_BUFFER_FLUSH = (
     "Node buffer reached batch size ({size}). Performing incremental flush."
 )
@@ -191,6 +193,13 @@ MG_RELS_FLUSHED = (
 )
 MG_FLUSH_START = "--- Flushing all pending writes to database... ---"
 MG_FLUSH_COMPLETE = "--- Flushing complete. ---"
+MG_POOL_CONNECTING = "Opening pooled Memgraph connection to {host}:{port}"
+MG_POOL_STALE = "Discarding unhealthy pooled Memgraph connection; reconnecting"
+MG_POOL_RETRY = "Pooled Memgraph connection failed ({error}); retrying once"
+MG_POOL_CLOSE_FAILED = "Ignoring error while closing Memgraph connection: {error}"
+QUERY_CACHE_CREATED = (
+    "Query result cache enabled ({entries} entries, {rows} rows max, {ttl}s TTL)"
+)
 MG_FETCH_QUERY = "Executing fetch query: {query} with params: {params}"
 MG_WRITE_QUERY = "Executing write query: {query} with params: {params}"
 MG_EXPORTING = "Exporting graph data..."
@@ -200,6 +209,13 @@ MG_EXPORTED = "Exported {nodes} nodes and {rels} relationships"
 CYPHER_GENERATING = "  [CypherGenerator] Generating query for: '{query}'"
 CYPHER_GENERATED = "  [CypherGenerator] Generated Cypher: {query}"
 CYPHER_ERROR = "  [CypherGenerator] Error: {error}"
+CYPHER_CACHE_HIT = "  [CypherGenerator] Cache {kind} hit for: '{query}'"
+CYPHER_CACHE_MISS = "  [CypherGenerator] Cache miss for: '{query}'"
+CYPHER_CACHE_STORED = "  [CypherGenerator] Cached validated Cypher for: '{query}'"
+CYPHER_CACHE_EVICTED = "Cypher cache evicted {count} least recently used entries"
+CYPHER_CACHE_OPEN_ERROR = "Cypher cache unavailable ({error}); using memory only"
+CYPHER_CACHE_WRITE_ERROR = "Failed to write Cypher cache entry: {error}"
+CYPHER_CACHE_EMBED_ERROR = "Cypher cache could not embed question: {error}"
 
 # (H) Tool file logs
 TOOL_FILE_READ = "[FileReader] Attempting to read file: {path}"
@@ -381,12 +397,20 @@ DEP_PARSE_ERROR_CSPROJ = "Error parsing .csproj {path}: {error}"
 
 # (H) Import processor logs
 IMP_TOOL_NOT_AVAILABLE = "External tool '{tool}' not available for stdlib introspection"
-IMP_CACHE_LOADED = "Loaded stdlib cache from {path}"
+IMP_CACHE_LOADED = "Opened stdlib cache at {path}"
 IMP_CACHE_LOAD_ERROR = "Could not load stdlib cache: {error}"
-IMP_CACHE_SAVED = "Saved stdlib cache to {path}"
+IMP_CACHE_SAVED = "Wrote {count} stdlib cache entries to {path}"
 IMP_CACHE_SAVE_ERROR = "Could not save stdlib cache: {error}"
 IMP_CACHE_CLEARED = "Cleared stdlib cache from disk"
 IMP_CACHE_CLEAR_ERROR = "Could not clear stdlib cache from disk: {error}"
+IMP_WORKER_STARTED = "Started {language} stdlib introspection worker"
+IMP_WORKER_UNAVAILABLE = "Could not start {language} introspection worker: {error}"
+IMP_WORKER_RESTARTED = (
+    "{language} introspection worker stopped responding; restarting ({attempt}/{limit})"
+)
+IMP_WORKER_FAILED = (
+    "{language} introspection worker stopped responding; using heuristics"
+)
 IMP_PARSED_COUNT = "Parsed {count} imports in {module}"
 IMP_CREATED_RELATIONSHIP = (
     "  Created IMPORTS relationship: {from_module} -> {to_module} (from {full_name})"
@@ -575,6 +599,10 @@ MCP_INDEXING_REPO = "[MCP] Indexing repository at: {path}"
 MCP_CLEARING_DB = "[MCP] Clearing existing database to avoid conflicts..."
 MCP_DB_CLEARED = "[MCP] Database cleared. Starting fresh indexing..."
 MCP_ERROR_INDEXING = "[MCP] Error indexing repository: {error}"
+MCP_INDEX_JOB_STARTED = "[MCP] Indexing job started in the background for: {path}"
+MCP_INDEX_JOB_BUSY = "[MCP] Indexing already in progress for: {path}"
+MCP_INDEX_JOB_FINISHED = "[MCP] Indexing job {state} after {elapsed:.1f}s"
+MCP_GET_INDEX_STATUS = "[MCP] get_index_status"
 MCP_QUERY_CODE_GRAPH = "[MCP] query_code_graph: {query}"
 MCP_QUERY_RESULTS = "[MCP] Query returned {count} results"
 MCP_ERROR_QUERY = "[MCP] Error querying code graph: {error}"
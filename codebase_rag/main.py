@@ -31,7 +31,8 @@ from .config import load_cgrignore_patterns, settings
 from .models import AppContext
 from .prompts import OPTIMIZATION_PROMPT, OPTIMIZATION_PROMPT_WITH_REFERENCE
 from .services import QueryProtocol
-from .services.graph_service import MemgraphIngestor
+from .services.cypher_cache import open_cypher_cache
+from .services.graph_service import MemgraphIngestor, get_connection_pool
 from .services.llm import CypherGenerator, create_rag_orchestrator
 from .tools.code_retrieval import CodeRetriever, create_code_retrieval_tool
 from .tools.codebase_query import create_query_tool
@@ -638,6 +639,7 @@ def connect_memgraph(batch_size: int) -> MemgraphIngestor:
         host=settings.MEMGRAPH_HOST,
         port=settings.MEMGRAPH_PORT,
         batch_size=batch_size,
+        pool=get_connection_pool(settings.MEMGRAPH_HOST, settings.MEMGRAPH_PORT),
     )
 
 
@@ -862,7 +864,7 @@ def _initialize_services_and_agent(
     )
     _validate_provider_config(cs.ModelRole.CYPHER, settings.active_cypher_config)
 
-    cypher_generator = CypherGenerator()
+    cypher_generator = CypherGenerator(cache=open_cypher_cache())
     code_retriever = CodeRetriever(project_root=repo_path, ingestor=ingestor)
     file_reader = FileReader(project_root=repo_path)
     file_writer = FileWriter(project_root=repo_path)
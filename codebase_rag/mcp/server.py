@@ -1,6 +1,8 @@
+import asyncio
 import json
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from loguru import logger
@@ -13,7 +15,12 @@ from codebase_rag import logs as lg
 from codebase_rag import tool_errors as te
 from codebase_rag.config import settings
 from codebase_rag.mcp.tools import create_mcp_tools_registry
-from codebase_rag.services.graph_service import MemgraphIngestor
+from codebase_rag.services.cypher_cache import open_cypher_cache
+from codebase_rag.services.graph_service import (
+    MemgraphIngestor,
+    close_connection_pools,
+    get_connection_pool,
+)
 from codebase_rag.services.llm import CypherGenerator
 from codebase_rag.types_defs import MCPToolArguments
 
@@ -71,9 +78,10 @@ def create_server() -> tuple[Server, MemgraphIngestor]:
         host=settings.MEMGRAPH_HOST,
         port=settings.MEMGRAPH_PORT,
         batch_size=settings.MEMGRAPH_BATCH_SIZE,
+        pool=get_connection_pool(settings.MEMGRAPH_HOST, settings.MEMGRAPH_PORT),
     )
 
-    cypher_generator = CypherGenerator()
+    cypher_generator = CypherGenerator(cache=open_cypher_cache())
 
     tools = create_mcp_tools_registry(
         project_root=str(project_root),
@@ -141,6 +149,14 @@ async def main() -> None:
     server, ingestor = create_server()
     logger.info(lg.MCP_SERVER_CREATED)
 
+    # (H) Blocking graph, file and indexing work is handed to this pool so the
+    # (H) stdio loop stays responsive; the bound caps concurrent Memgraph calls
+    executor = ThreadPoolExecutor(
+        max_workers=settings.MCP_MAX_WORKERS,
+        thread_name_prefix=cs.MCP_WORKER_THREAD_PREFIX,
+    )
+    asyncio.get_running_loop().set_default_executor(executor)
+
     with ingestor:
         logger.info(
             lg.MCP_SERVER_CONNECTED.format(
@@ -157,9 +173,8 @@ async def main() -> None:
             raise
         finally:
             logger.info(lg.MCP_SERVER_SHUTDOWN)
+            close_connection_pools()
 
 
 if __name__ == "__main__":
-    import asyncio
-
     asyncio.run(main())
@@ -1,4 +1,7 @@
+import asyncio
 import itertools
+import time
+from dataclasses import dataclass, field
 from pathlib import Path
 
 from loguru import logger
@@ -23,6 +26,8 @@ from codebase_rag.tools.file_reader import FileReader, create_file_reader_tool
 from codebase_rag.tools.file_writer import FileWriter, create_file_writer_tool
 from codebase_rag.types_defs import (
     CodeSnippetResultDict,
+    IndexJobStatusDict,
+    IndexProgress,
     MCPHandlerType,
     MCPInputSchema,
     MCPInputSchemaProperty,
@@ -31,6 +36,52 @@ from codebase_rag.types_defs import (
 )
 
 
+@dataclass
+class IndexJob:
+    project_root: str
+    state: cs.IndexJobState = cs.IndexJobState.RUNNING
+    progress: IndexProgress = IndexProgress(cs.IndexPhase.PENDING, 0, 0)
+    updater: GraphUpdater | None = None
+    started_at: float = field(default_factory=time.monotonic)
+    finished_at: float | None = None
+    message: str = ""
+    error: str | None = None
+    future: asyncio.Future[str] | None = None
+
+    def finish(
+        self, state: cs.IndexJobState, message: str, error: str | None = None
+    ) -> None:
+        if self.updater is not None:
+            self.progress = self.updater.progress
+        self.updater = None
+        self.finished_at = time.monotonic()
+        self.message = message
+        self.error = error
+        self.state = state
+        logger.info(
+            lg.MCP_INDEX_JOB_FINISHED.format(
+                state=state, elapsed=self.finished_at - self.started_at
+            )
+        )
+
+    def status(self) -> IndexJobStatusDict:
+        # (H) Progress is read from the live updater while the worker runs
+        progress = self.updater.progress if self.updater is not None else self.progress
+        end = self.finished_at if self.finished_at is not None else time.monotonic()
+        status = IndexJobStatusDict(
+            state=self.state,
+            project_root=self.project_root,
+            phase=progress.phase,
+            processed=progress.processed,
+            total=progress.total,
+            elapsed_seconds=round(end - self.started_at, 3),
+            message=self.message,
+        )
+        if self.error is not None:
+            status[cs.MCP_KEY_ERROR] = self.error
+        return status
+
+
 class MCPToolsRegistry:
     def __init__(
         self,
@@ -43,9 +94,10 @@ class MCPToolsRegistry:
         self.cypher_gen = cypher_gen
 
         self.parsers, self.queries = load_parsers()
+        self._index_job: IndexJob | None = None
 
         self.code_retriever = CodeRetriever(project_root, ingestor)
-        self.file_editor = FileEditor(project_root=project_root)
+        self.file_editor = FileEditor(project_root=project_root, parsers=self.parsers)
         self.file_reader = FileReader(project_root=project_root)
         self.file_writer = FileWriter(project_root=project_root)
         self.directory_lister = DirectoryLister(project_root=project_root)
@@ -67,12 +119,28 @@ class MCPToolsRegistry:
                 description=td.MCP_TOOLS[cs.MCPToolName.INDEX_REPOSITORY],
                 input_schema=MCPInputSchema(
                     type=cs.MCPSchemaType.OBJECT,
-                    properties={},
+                    properties={
+                        cs.MCPParamName.BACKGROUND: MCPInputSchemaProperty(
+                            type=cs.MCPSchemaType.BOOLEAN,
+                            description=td.MCP_PARAM_BACKGROUND,
+                        )
+                    },
                     required=[],
                 ),
                 handler=self.index_repository,
                 returns_json=False,
             ),
+            cs.MCPToolName.GET_INDEX_STATUS: ToolMetadata(
+                name=cs.MCPToolName.GET_INDEX_STATUS,
+                description=td.MCP_TOOLS[cs.MCPToolName.GET_INDEX_STATUS],
+                input_schema=MCPInputSchema(
+                    type=cs.MCPSchemaType.OBJECT,
+                    properties={},
+                    required=[],
+                ),
+                handler=self.get_index_status,
+                returns_json=True,
+            ),
             cs.MCPToolName.QUERY_CODE_GRAPH: ToolMetadata(
                 name=cs.MCPToolName.QUERY_CODE_GRAPH,
                 description=td.MCP_TOOLS[cs.MCPToolName.QUERY_CODE_GRAPH],
@@ -199,26 +267,67 @@ class MCPToolsRegistry:
             ),
         }
 
-    async def index_repository(self) -> str:
+    async def index_repository(self, background: bool = False) -> str:
+        if self._index_job is not None and (
+            self._index_job.state == cs.IndexJobState.RUNNING
+        ):
+            logger.warning(lg.MCP_INDEX_JOB_BUSY.format(path=self.project_root))
+            return te.ERROR_WRAPPER.format(
+                message=te.MCP_INDEX_ALREADY_RUNNING.format(
+                    path=self.project_root,
+                    status_tool=cs.MCPToolName.GET_INDEX_STATUS,
+                )
+            )
+
         logger.info(lg.MCP_INDEXING_REPO.format(path=self.project_root))
+        job = IndexJob(project_root=self.project_root)
+        self._index_job = job
+        # (H) GraphUpdater.run blocks for minutes, so it runs on the loop's
+        # (H) bounded executor and other tool calls keep being served
+        job.future = asyncio.get_running_loop().run_in_executor(
+            None, self._run_index_job, job
+        )
+        if background:
+            logger.info(lg.MCP_INDEX_JOB_STARTED.format(path=self.project_root))
+            return cs.MCP_INDEX_STARTED.format(
+                path=self.project_root, status_tool=cs.MCPToolName.GET_INDEX_STATUS
+            )
+        return await asyncio.shield(job.future)
 
+    def _run_index_job(self, job: IndexJob) -> str:
         try:
+            job.progress = IndexProgress(cs.IndexPhase.CLEARING, 0, 0)
             logger.info(lg.MCP_CLEARING_DB)
             self.ingestor.clean_database()
             logger.info(lg.MCP_DB_CLEARED)
 
-            updater = GraphUpdater(
+            # (H) Parsers are not thread-safe, so the job gets its own set
+            # (H) rather than sharing the ones the file editor uses
+            parsers, queries = load_parsers()
+            job.updater = GraphUpdater(
                 ingestor=self.ingestor,
                 repo_path=Path(self.project_root),
-                parsers=self.parsers,
-                queries=self.queries,
+                parsers=parsers,
+                queries=queries,
             )
-            updater.run()
+            job.updater.run()
 
-            return cs.MCP_INDEX_SUCCESS.format(path=self.project_root)
+            message = cs.MCP_INDEX_SUCCESS.format(path=self.project_root)
+            job.finish(cs.IndexJobState.SUCCEEDED, message)
+            return message
         except Exception as e:
             logger.error(lg.MCP_ERROR_INDEXING.format(error=e))
-            return cs.MCP_INDEX_ERROR.format(error=e)
+            message = cs.MCP_INDEX_ERROR.format(error=e)
+            job.finish(cs.IndexJobState.FAILED, message, error=str(e))
+            return message
+
+    async def get_index_status(self) -> IndexJobStatusDict:
+        logger.info(lg.MCP_GET_INDEX_STATUS)
+        if self._index_job is None:
+            return IndexJobStatusDict(
+                state=cs.IndexJobState.IDLE, project_root=self.project_root
+            )
+        return self._index_job.status()
 
     async def query_code_graph(self, natural_language_query: str) -> QueryResultDict:
         logger.info(lg.MCP_QUERY_CODE_GRAPH.format(query=natural_language_query))
@@ -283,30 +392,9 @@ class MCPToolsRegistry:
         logger.info(lg.MCP_READ_FILE.format(path=file_path, offset=offset, limit=limit))
         try:
             if offset is not None or limit is not None:
-                full_path = Path(self.project_root) / file_path
-                start = offset if offset is not None else 0
-
-                with open(full_path, encoding=cs.ENCODING_UTF8) as f:
-                    skipped_count = sum(1 for _ in itertools.islice(f, start))
-
-                    if limit is not None:
-                        sliced_lines = [line for _, line in zip(range(limit), f)]
-                    else:
-                        sliced_lines = list(f)
-
-                    paginated_content = "".join(sliced_lines)
-
-                    remaining_lines_count = sum(1 for _ in f)
-                    total_lines = (
-                        skipped_count + len(sliced_lines) + remaining_lines_count
-                    )
-
-                    header = cs.MCP_PAGINATION_HEADER.format(
-                        start=start + 1,
-                        end=start + len(sliced_lines),
-                        total=total_lines,
-                    )
-                    return header + paginated_content
+                return await asyncio.to_thread(
+                    self._read_file_page, file_path, offset, limit
+                )
             else:
                 result = await self._file_reader_tool.function(file_path=file_path)
                 return str(result)
@@ -315,6 +403,32 @@ class MCPToolsRegistry:
             logger.error(lg.MCP_ERROR_READ.format(error=e))
             return te.ERROR_WRAPPER.format(message=e)
 
+    def _read_file_page(
+        self, file_path: str, offset: int | None, limit: int | None
+    ) -> str:
+        full_path = Path(self.project_root) / file_path
+        start = offset if offset is not None else 0
+
+        with open(full_path, encoding=cs.ENCODING_UTF8) as f:
+            skipped_count = sum(1 for _ in itertools.islice(f, start))
+
+            if limit is not None:
+                sliced_lines = [line for _, line in zip(range(limit), f)]
+            else:
+                sliced_lines = list(f)
+
+            paginated_content = "".join(sliced_lines)
+
+            remaining_lines_count = sum(1 for _ in f)
+            total_lines = skipped_count + len(sliced_lines) + remaining_lines_count
+
+            header = cs.MCP_PAGINATION_HEADER.format(
+                start=start + 1,
+                end=start + len(sliced_lines),
+                total=total_lines,
+            )
+            return header + paginated_content
+
     async def write_file(self, file_path: str, content: str) -> str:
         logger.info(lg.MCP_WRITE_FILE.format(path=file_path))
         try:
@@ -333,7 +447,9 @@ class MCPToolsRegistry:
     ) -> str:
         logger.info(lg.MCP_LIST_DIR.format(path=directory_path))
         try:
-            result = self._directory_lister_tool.function(directory_path=directory_path)
+            result = await asyncio.to_thread(
+                self._directory_lister_tool.function, directory_path=directory_path
+            )
             return str(result)
         except Exception as e:
             logger.error(lg.MCP_ERROR_LIST_DIR.format(error=e))
@@ -85,8 +85,14 @@ class NodeTextResult:
 
 
 class NodeTextExtractor:
-    def __init__(self, graph_path: str | Path, repo_base_path: str | Path):
-        self.graph_loader = GraphLoader(str(graph_path))
+    def __init__(
+        self,
+        graph_path: str | Path,
+        repo_base_path: str | Path,
+        graph_loader: GraphLoader | None = None,
+    ):
+        # (H) Callers that already loaded the graph share it instead of re-reading it
+        self.graph_loader = graph_loader or GraphLoader(str(graph_path))
         self.repo_base_path = Path(repo_base_path).resolve()
         # File cache to avoid reading the same file multiple times
         self._file_cache: dict[str, str | None] = {}
@@ -1,8 +1,14 @@
+from __future__ import annotations
+
 import importlib
+import importlib.util
 import subprocess
 import sys
+import threading
+from collections.abc import Iterator, Mapping
 from copy import deepcopy
 from pathlib import Path
+from typing import cast
 
 from loguru import logger
 from tree_sitter import Language, Parser, Query
@@ -11,7 +17,12 @@ from . import constants as cs
 from . import exceptions as ex
 from . import logs as ls
 from .language_spec import LANGUAGE_SPECS, LanguageSpec
-from .types_defs import LanguageImport, LanguageLoader, LanguageQueries
+from .types_defs import (
+    CompiledGrammar,
+    LanguageImport,
+    LanguageLoader,
+    LanguageQueries,
+)
 
 
 def _try_load_from_submodule(lang_name: cs.SupportedLanguage) -> LanguageLoader:
@@ -93,8 +104,9 @@ def _try_import_language(
         return _try_load_from_submodule(lang_name)
 
 
-def _import_language_loaders() -> dict[cs.SupportedLanguage, LanguageLoader]:
-    language_imports: list[LanguageImport] = [
+_LANGUAGE_IMPORTS: dict[cs.SupportedLanguage, LanguageImport] = {
+    lang_import.lang_key: lang_import
+    for lang_import in (
         LanguageImport(
             cs.SupportedLanguage.PYTHON,
             cs.TreeSitterModule.PYTHON,
@@ -149,27 +161,34 @@ def _import_language_loaders() -> dict[cs.SupportedLanguage, LanguageLoader]:
             cs.QUERY_LANGUAGE,
             cs.SupportedLanguage.LUA,
         ),
-    ]
+    )
+}
 
-    loaders: dict[cs.SupportedLanguage, LanguageLoader] = {
-        lang_import.lang_key: _try_import_language(
-            lang_import.module_path,
-            lang_import.attr_name,
-            lang_import.submodule_name,
-        )
-        for lang_import in language_imports
-    }
-    for lang_key in LANGUAGE_SPECS:
-        lang_name = cs.SupportedLanguage(lang_key)
-        if lang_name not in loaders or loaders[lang_name] is None:
-            loaders[lang_name] = _try_load_from_submodule(lang_name)
 
-    return loaders
+def _submodule_bindings_exist(lang_name: cs.SupportedLanguage) -> bool:
+    submodule_path = Path(cs.GRAMMARS_DIR) / f"{cs.TREE_SITTER_PREFIX}{lang_name}"
+    return (submodule_path / cs.BINDINGS_DIR / cs.SupportedLanguage.PYTHON).exists()
 
 
-_language_loaders = _import_language_loaders()
+def _has_grammar(lang_name: cs.SupportedLanguage) -> bool:
+    # (H) Answered from import metadata alone: nothing is imported or built
+    if (lang_import := _LANGUAGE_IMPORTS.get(lang_name)) is not None:
+        try:
+            if importlib.util.find_spec(lang_import.module_path) is not None:
+                return True
+        except (ImportError, ValueError):
+            pass
+    return _submodule_bindings_exist(lang_name)
+
 
-LANGUAGE_LIBRARIES: dict[cs.SupportedLanguage, LanguageLoader] = _language_loaders
+def _language_loader(lang_name: cs.SupportedLanguage) -> LanguageLoader:
+    if (lang_import := _LANGUAGE_IMPORTS.get(lang_name)) is not None:
+        return _try_import_language(
+            lang_import.module_path,
+            lang_import.attr_name,
+            lang_import.submodule_name,
+        )
+    return _try_load_from_submodule(lang_name)
 
 
 def _build_query_pattern(node_types: tuple[str, ...], capture_name: str) -> str:
@@ -219,12 +238,60 @@ def _create_locals_query(
         return None
 
 
+class QueryRegistry:
+    def __init__(self) -> None:
+        # (H) Failures are remembered as messages so a grammar that cannot host a
+        # (H) query is not recompiled for every file
+        self._compiled: dict[tuple[Language, cs.AuxiliaryQuery], Query | str] = {}
+        self._lock = threading.Lock()
+
+    def get(self, language: Language, name: cs.AuxiliaryQuery) -> Query:
+        key = (language, name)
+        if (compiled := self._compiled.get(key)) is None:
+            with self._lock:
+                if (compiled := self._compiled.get(key)) is None:
+                    compiled = self._compile(language, name)
+                    self._compiled[key] = compiled
+        if isinstance(compiled, str):
+            raise ValueError(compiled)
+        return compiled
+
+    @staticmethod
+    def _compile(language: Language, name: cs.AuxiliaryQuery) -> Query | str:
+        # (H) On a QueryError py-tree-sitter writes a NUL into the source
+        # (H) string's own buffer at the error offset, so each compile gets a
+        # (H) fresh copy and the shared constant is never corrupted. encode/
+        # (H) decode always allocates; str() or an empty strip() would not.
+        source = cs.AUXILIARY_QUERY_SOURCES[name].encode().decode()
+        try:
+            return Query(language, source)
+        except Exception as e:
+            lang = getattr(language, "name", language)
+            logger.debug(
+                ls.AUXILIARY_QUERY_FAILED.format(name=name, lang=lang, error=e)
+            )
+            return ex.AUXILIARY_QUERY_INVALID.format(name=name, lang=lang, error=e)
+
+    def __len__(self) -> int:
+        return len(self._compiled)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._compiled.clear()
+
+
+QUERY_REGISTRY = QueryRegistry()
+
+
+def get_auxiliary_query(language: Language, name: cs.AuxiliaryQuery) -> Query:
+    return QUERY_REGISTRY.get(language, name)
+
+
 def _create_language_queries(
     language: Language,
-    parser: Parser,
     lang_config: LanguageSpec,
     lang_name: cs.SupportedLanguage,
-) -> LanguageQueries:
+) -> CompiledGrammar:
     function_patterns = lang_config.function_query or _build_query_pattern(
         lang_config.function_node_types, cs.CAPTURE_FUNCTION
     )
@@ -236,57 +303,155 @@ def _create_language_queries(
     )
     combined_import_patterns = _build_combined_import_pattern(lang_config)
 
-    return LanguageQueries(
+    return CompiledGrammar(
+        language=language,
         functions=_create_optional_query(language, function_patterns),
         classes=_create_optional_query(language, class_patterns),
         calls=_create_optional_query(language, call_patterns),
         imports=_create_optional_query(language, combined_import_patterns),
         locals=_create_locals_query(language, lang_name),
-        config=lang_config,
-        language=language,
-        parser=parser,
     )
 
 
-def _process_language(
-    lang_name: cs.SupportedLanguage,
-    lang_config: LanguageSpec,
-    parsers: dict[cs.SupportedLanguage, Parser],
-    queries: dict[cs.SupportedLanguage, LanguageQueries],
-) -> bool:
-    lang_lib = LANGUAGE_LIBRARIES.get(lang_name)
+def _compile_grammar(lang_name: cs.SupportedLanguage) -> CompiledGrammar | None:
+    lang_lib = _language_loader(lang_name)
     if not lang_lib:
         logger.debug(ls.LIB_NOT_AVAILABLE.format(lang=lang_name))
-        return False
+        return None
 
     try:
-        language = Language(lang_lib())
-        parser = Parser(language)
-        parsers[lang_name] = parser
-        queries[lang_name] = _create_language_queries(
-            language, parser, lang_config, lang_name
+        grammar = _create_language_queries(
+            Language(lang_lib()), LANGUAGE_SPECS[lang_name], lang_name
         )
         logger.success(ls.GRAMMAR_LOADED.format(lang=lang_name))
-        return True
+        return grammar
     except Exception as e:
         logger.warning(ls.GRAMMAR_LOAD_FAILED.format(lang=lang_name, error=e))
-        return False
+        return None
+
+
+class GrammarCache:
+    def __init__(self) -> None:
+        # (H) None marks a grammar that failed to load so it is not retried
+        self._grammars: dict[cs.SupportedLanguage, CompiledGrammar | None] = {}
+        self._lock = threading.Lock()
+
+    def get(self, lang_name: cs.SupportedLanguage) -> CompiledGrammar | None:
+        if lang_name in self._grammars:
+            return self._grammars[lang_name]
+        with self._lock:
+            if lang_name not in self._grammars:
+                self._grammars[lang_name] = _compile_grammar(lang_name)
+            return self._grammars[lang_name]
+
+    def __contains__(self, lang_name: object) -> bool:
+        return lang_name in self._grammars
+
+    def __len__(self) -> int:
+        return len(self._grammars)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._grammars.clear()
+
+
+GRAMMAR_CACHE = GrammarCache()
+
+_LANGUAGE_QUERY_KEYS = tuple(LanguageQueries.__annotations__)
+
+
+class LazyLanguageQueries(Mapping[str, object]):
+    def __init__(
+        self,
+        lang_name: cs.SupportedLanguage,
+        lang_config: LanguageSpec,
+        parsers: LazyParsers,
+    ) -> None:
+        # (H) The config is all the structure pass needs, so every other value
+        # (H) waits until the grammar is first used; the keys are known up front
+        self._values: dict[str, object] = {cs.QUERY_CONFIG: lang_config}
+        self._lang_name = lang_name
+        self._parsers = parsers
+
+    def fill(self, values: Mapping[str, object]) -> None:
+        self._values.update(values)
+
+    def __getitem__(self, key: str) -> object:
+        if key not in self._values:
+            self._parsers.load(self._lang_name)
+        return self._values[key]
+
+    def __iter__(self) -> Iterator[str]:
+        if self._parsers.is_unavailable(self._lang_name):
+            return iter(self._values)
+        return iter(_LANGUAGE_QUERY_KEYS)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+
+class LazyParsers(Mapping[cs.SupportedLanguage, Parser]):
+    def __init__(self, grammars: GrammarCache) -> None:
+        # (H) Iterates every registered language without loading it; a lookup or
+        # (H) membership test builds the parser the first time a file needs it
+        self._grammars = grammars
+        self._parsers: dict[cs.SupportedLanguage, Parser] = {}
+        self._queries: dict[cs.SupportedLanguage, LazyLanguageQueries] = {}
+
+    def register(
+        self, lang_name: cs.SupportedLanguage, lang_config: LanguageSpec
+    ) -> LazyLanguageQueries:
+        entry = LazyLanguageQueries(lang_name, lang_config, self)
+        self._queries[lang_name] = entry
+        return entry
+
+    def is_unavailable(self, lang_name: cs.SupportedLanguage) -> bool:
+        # (H) Only a grammar that already failed counts; nothing is loaded here
+        return lang_name in self._grammars and self._grammars.get(lang_name) is None
+
+    def load(self, lang_name: str) -> Parser | None:
+        if (parser := self._parsers.get(lang_name)) is not None:
+            return parser
+        if (entry := self._queries.get(lang_name)) is None:
+            return None
+        language = cs.SupportedLanguage(lang_name)
+        if (grammar := self._grammars.get(language)) is None:
+            return None
+        parser = Parser(grammar.language)
+        entry.fill({**grammar._asdict(), cs.KEY_PARSER: parser})
+        self._parsers[language] = parser
+        return parser
+
+    def __getitem__(self, lang_name: str) -> Parser:
+        if (parser := self.load(lang_name)) is None:
+            raise KeyError(lang_name)
+        return parser
+
+    def __iter__(self) -> Iterator[cs.SupportedLanguage]:
+        return (lang for lang in self._queries if not self.is_unavailable(lang))
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
 
 
 def load_parsers() -> tuple[
-    dict[cs.SupportedLanguage, Parser], dict[cs.SupportedLanguage, LanguageQueries]
+    Mapping[cs.SupportedLanguage, Parser], dict[cs.SupportedLanguage, LanguageQueries]
 ]:
-    parsers: dict[cs.SupportedLanguage, Parser] = {}
+    # (H) Only grammar availability is checked here; parsers and queries are
+    # (H) built per language on first use and compiled once per process
+    parsers = LazyParsers(GRAMMAR_CACHE)
     queries: dict[cs.SupportedLanguage, LanguageQueries] = {}
-    available_languages: list[cs.SupportedLanguage] = []
 
     for lang_key, lang_config in deepcopy(LANGUAGE_SPECS).items():
         lang_name = cs.SupportedLanguage(lang_key)
-        if _process_language(lang_name, lang_config, parsers, queries):
-            available_languages.append(lang_name)
+        if _has_grammar(lang_name):
+            # (H) Entries are read-only lazy mappings over the LanguageQueries keys
+            queries[lang_name] = cast(
+                LanguageQueries, parsers.register(lang_name, lang_config)
+            )
 
-    if not available_languages:
+    if not queries:
         raise RuntimeError(ex.NO_LANGUAGES)
 
-    logger.info(ls.INITIALIZED_PARSERS.format(languages=", ".join(available_languages)))
+    logger.info(ls.INITIALIZED_PARSERS.format(languages=", ".join(queries)))
     return parsers, queries
@@ -13,6 +13,7 @@ from ..types_defs import FunctionRegistryTrieProtocol, LanguageQueries
 from .call_resolver import CallResolver
 from .cpp import utils as cpp_utils
 from .import_processor import ImportProcessor
+from .symbol_table import SymbolTable
 from .type_inference import TypeInferenceEngine
 from .utils import get_function_captures, is_method_node
 
@@ -27,16 +28,20 @@ class CallProcessor:
         import_processor: ImportProcessor,
         type_inference: TypeInferenceEngine,
         class_inheritance: dict[str, list[str]],
+        *,
+        symbol_table: SymbolTable | None = None,
     ) -> None:
         self.ingestor = ingestor
         self.repo_path = repo_path
         self.project_name = project_name
+        self.symbol_table = symbol_table if symbol_table is not None else SymbolTable()
 
         self._resolver = CallResolver(
             function_registry=function_registry,
             import_processor=import_processor,
             type_inference=type_inference,
             class_inheritance=class_inheritance,
+            symbol_table=self.symbol_table,
         )
 
     def _get_node_name(self, node: Node, field: str = cs.FIELD_NAME) -> str | None:
@@ -265,6 +270,8 @@ class CallProcessor:
         if not calls_query:
             return
 
+        caller_qn = self.symbol_table.intern(caller_qn)
+
         local_var_types = self._resolver.type_inference.build_local_variable_type_map(
             caller_node, module_qn, language
         )
@@ -322,7 +329,11 @@ class CallProcessor:
             self.ingestor.ensure_relationship_batch(
                 (caller_type, cs.KEY_QUALIFIED_NAME, caller_qn),
                 cs.RelationshipType.CALLS,
-                (callee_type, cs.KEY_QUALIFIED_NAME, callee_qn),
+                (
+                    callee_type,
+                    cs.KEY_QUALIFIED_NAME,
+                    self.symbol_table.intern(callee_qn),
+                ),
             )
 
     def _build_nested_qualified_name(
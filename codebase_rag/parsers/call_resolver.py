@@ -1,15 +1,17 @@
 from __future__ import annotations
 
 import re
+from collections.abc import Iterable
 
 from loguru import logger
 from tree_sitter import Node
 
 from .. import constants as cs
 from .. import logs as ls
-from ..types_defs import FunctionRegistryTrieProtocol, NodeType
+from ..types_defs import FunctionRegistryTrieProtocol, NodeType, QualifiedName
 from .import_processor import ImportProcessor
 from .py import resolve_class_name
+from .symbol_table import SymbolTable
 from .type_inference import TypeInferenceEngine
 
 
@@ -20,11 +22,14 @@ class CallResolver:
         import_processor: ImportProcessor,
         type_inference: TypeInferenceEngine,
         class_inheritance: dict[str, list[str]],
+        *,
+        symbol_table: SymbolTable | None = None,
     ) -> None:
         self.function_registry = function_registry
         self.import_processor = import_processor
         self.type_inference = type_inference
         self.class_inheritance = class_inheritance
+        self.symbol_table = symbol_table if symbol_table is not None else SymbolTable()
 
     def _resolve_class_qn_from_type(
         self, var_type: str, import_map: dict[str, str], module_qn: str
@@ -213,10 +218,9 @@ class CallResolver:
             logger.debug(ls.CALL_UNRESOLVED.format(call_name=call_name))
             return None
 
-        possible_matches.sort(
-            key=lambda qn: self._calculate_import_distance(qn, module_qn)
-        )
-        best_candidate_qn = possible_matches[0]
+        best_candidate_qn = self._find_closest_candidate(possible_matches, module_qn)
+        if best_candidate_qn is None:
+            return None
         logger.debug(
             ls.CALL_TRIE_FALLBACK.format(call_name=call_name, qn=best_candidate_qn)
         )
@@ -515,8 +519,7 @@ class CallResolver:
                 if qn.startswith(module_qn) and call_name in qn
             ]
             candidates = same_module_ops or possible_matches
-            candidates.sort(key=lambda qn: (len(qn), qn))
-            best = candidates[0]
+            best = min(candidates, key=lambda qn: (len(qn), qn))
             return (self.function_registry[best], best)
 
         return None
@@ -651,23 +654,62 @@ class CallResolver:
 
         return None
 
+    def _split_qn(self, qualified_name: QualifiedName) -> tuple[str, ...]:
+        return self.symbol_table.parts(qualified_name)
+
+    def _find_closest_candidate(
+        self, candidates: Iterable[QualifiedName], caller_module_qn: str
+    ) -> QualifiedName | None:
+        # (H) Equivalent to a stable sort by import distance followed by taking
+        # (H) the head, but in one pass: candidates whose length difference alone
+        # (H) rules out a strictly better distance skip the prefix comparison.
+        caller_parts = self._split_qn(caller_module_qn)
+        caller_len = len(caller_parts)
+        best_qn: QualifiedName | None = None
+        best_distance = 0
+        for candidate_qn in candidates:
+            candidate_parts = self._split_qn(candidate_qn)
+            if (
+                best_qn is not None
+                and abs(len(candidate_parts) - caller_len) - 1 >= best_distance
+            ):
+                continue
+            distance = self._import_distance_from_parts(candidate_parts, caller_parts)
+            if best_qn is None or distance < best_distance:
+                best_qn, best_distance = candidate_qn, distance
+                if best_distance <= cs.IMPORT_DISTANCE_FLOOR:
+                    break
+        return best_qn
+
     def _calculate_import_distance(
         self, candidate_qn: str, caller_module_qn: str
     ) -> int:
-        caller_parts = caller_module_qn.split(cs.SEPARATOR_DOT)
-        candidate_parts = candidate_qn.split(cs.SEPARATOR_DOT)
+        return self._import_distance_from_parts(
+            self._split_qn(candidate_qn), self._split_qn(caller_module_qn)
+        )
+
+    @staticmethod
+    def _import_distance_from_parts(
+        candidate_parts: tuple[str, ...], caller_parts: tuple[str, ...]
+    ) -> int:
+        caller_len = len(caller_parts)
+        candidate_len = len(candidate_parts)
 
         common_prefix = 0
-        for i in range(min(len(caller_parts), len(candidate_parts))):
-            if caller_parts[i] == candidate_parts[i]:
-                common_prefix += 1
-            else:
+        for caller_part, candidate_part in zip(caller_parts, candidate_parts):
+            if caller_part != candidate_part:
                 break
+            common_prefix += 1
 
-        base_distance = max(len(caller_parts), len(candidate_parts)) - common_prefix
+        base_distance = max(caller_len, candidate_len) - common_prefix
 
-        if candidate_qn.startswith(
-            cs.SEPARATOR_DOT.join(caller_parts[:-1]) + cs.SEPARATOR_DOT
+        # (H) Same check as "candidate_qn starts with the caller's parent package
+        # (H) plus a dot", done on the already split parts.
+        parent_len = caller_len - 1
+        if (
+            common_prefix >= parent_len
+            and candidate_len > parent_len
+            and (parent_len > 0 or (candidate_len > 1 and candidate_parts[0] == ""))
         ):
             base_distance -= 1
 
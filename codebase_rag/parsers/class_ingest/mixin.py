@@ -29,6 +29,7 @@ if TYPE_CHECKING:
         SimpleNameLookup,
     )
     from ..import_processor import ImportProcessor
+    from ..symbol_table import SymbolTable
 
 
 class ClassIngestMixin:
@@ -37,6 +38,7 @@ class ClassIngestMixin:
     project_name: str
     function_registry: FunctionRegistryTrieProtocol
     simple_name_lookup: SimpleNameLookup
+    symbol_table: SymbolTable
     module_qn_to_file_path: dict[str, Path]
     import_processor: ImportProcessor
     class_inheritance: dict[str, list[str]]
@@ -44,6 +46,9 @@ class ClassIngestMixin:
     @abstractmethod
     def _get_docstring(self, node: ASTNode) -> str | None: ...
 
+    @abstractmethod
+    def _definition_path(self, module_qn: str) -> str | None: ...
+
     @abstractmethod
     def _extract_decorators(self, node: ASTNode) -> list[str]: ...
 
@@ -118,6 +123,7 @@ class ClassIngestMixin:
             )
             return
 
+        path = self._definition_path(module_qn)
         identity = id_.resolve_class_identity(
             class_node,
             module_qn,
@@ -131,6 +137,7 @@ class ClassIngestMixin:
             return
 
         class_qn, class_name, is_exported = identity
+        class_qn = self.symbol_table.intern(class_qn)
         node_type = nt.determine_node_type(class_node, class_name, class_qn, language)
 
         class_props: PropertyDict = {
@@ -141,6 +148,7 @@ class ClassIngestMixin:
             cs.KEY_END_LINE: class_node.end_point[0] + 1,
             cs.KEY_DOCSTRING: self._get_docstring(class_node),
             cs.KEY_IS_EXPORTED: is_exported,
+            cs.KEY_PATH: path,
         }
         self.ingestor.ensure_node_batch(node_type, class_props)
         self.function_registry[class_qn] = node_type
@@ -159,8 +167,9 @@ class ClassIngestMixin:
             self.import_processor,
             self._resolve_to_qn,
             self.function_registry,
+            symbol_table=self.symbol_table,
         )
-        self._ingest_class_methods(class_node, class_qn, language, lang_queries)
+        self._ingest_class_methods(class_node, class_qn, language, lang_queries, path)
 
     def _ingest_rust_impl_methods(
         self,
@@ -173,6 +182,7 @@ class ClassIngestMixin:
             return
 
         class_qn = f"{module_qn}.{impl_target}"
+        path = self._definition_path(module_qn)
         body_node = class_node.child_by_field_name("body")
         method_query = lang_queries[cs.QUERY_FUNCTIONS]
 
@@ -192,6 +202,8 @@ class ClassIngestMixin:
                     self.simple_name_lookup,
                     self._get_docstring,
                     language,
+                    symbol_table=self.symbol_table,
+                    path=path,
                 )
 
     def _ingest_class_methods(
@@ -200,6 +212,7 @@ class ClassIngestMixin:
         class_qn: str,
         language: cs.SupportedLanguage,
         lang_queries: LanguageQueries,
+        path: str | None,
     ) -> None:
         body_node = class_node.child_by_field_name("body")
         method_query = lang_queries[cs.QUERY_FUNCTIONS]
@@ -233,6 +246,8 @@ class ClassIngestMixin:
                 language,
                 self._extract_decorators,
                 method_qualified_name,
+                symbol_table=self.symbol_table,
+                path=path,
             )
 
     def _process_inline_modules(
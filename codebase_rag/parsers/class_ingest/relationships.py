@@ -13,6 +13,7 @@ if TYPE_CHECKING:
     from ...services import IngestorProtocol
     from ...types_defs import FunctionRegistryTrieProtocol
     from ..import_processor import ImportProcessor
+    from ..symbol_table import SymbolTable
 
 
 def create_class_relationships(
@@ -27,10 +28,14 @@ def create_class_relationships(
     import_processor: ImportProcessor,
     resolve_to_qn: Callable[[str, str], str],
     function_registry: FunctionRegistryTrieProtocol,
+    *,
+    symbol_table: SymbolTable | None = None,
 ) -> None:
     parent_classes = pe.extract_parent_classes(
         class_node, module_qn, import_processor, resolve_to_qn
     )
+    if symbol_table is not None:
+        parent_classes = [symbol_table.intern(qn) for qn in parent_classes]
     class_inheritance[class_qn] = parent_classes
 
     ingestor.ensure_relationship_batch(
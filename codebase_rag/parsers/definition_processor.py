@@ -13,6 +13,7 @@ from .dependency_parser import parse_dependencies
 from .function_ingest import FunctionIngestMixin
 from .handlers import get_handler
 from .js_ts.ingest import JsTsIngestMixin
+from .symbol_table import SymbolTable
 from .utils import safe_decode_with_fallback
 
 if TYPE_CHECKING:
@@ -38,6 +39,8 @@ class DefinitionProcessor(
         simple_name_lookup: SimpleNameLookup,
         import_processor: ImportProcessor,
         module_qn_to_file_path: dict[str, Path],
+        *,
+        symbol_table: SymbolTable | None = None,
     ):
         super().__init__()
         self.ingestor = ingestor
@@ -47,6 +50,7 @@ class DefinitionProcessor(
         self.simple_name_lookup = simple_name_lookup
         self.import_processor = import_processor
         self.module_qn_to_file_path = module_qn_to_file_path
+        self.symbol_table = symbol_table if symbol_table is not None else SymbolTable()
         self.class_inheritance: dict[str, list[str]] = {}
         self._handler = get_handler(cs.SupportedLanguage.PYTHON)
 
@@ -142,6 +146,13 @@ class DefinitionProcessor(
             logger.error(ls.DEF_PARSE_FAILED.format(path=file_path, error=e))
             return None
 
+    def _definition_path(self, module_qn: str) -> str | None:
+        # (H) Every definition node carries its file's relative path, so a
+        # (H) lookup by qualified name never has to walk back to its module
+        if (file_path := self.module_qn_to_file_path.get(module_qn)) is None:
+            return None
+        return str(file_path.relative_to(self.repo_path))
+
     def process_dependencies(self, filepath: Path) -> None:
         logger.info(ls.DEF_PARSING_DEPENDENCY.format(path=filepath))
 
@@ -12,6 +12,7 @@ from .call_processor import CallProcessor
 from .definition_processor import DefinitionProcessor
 from .import_processor import ImportProcessor
 from .structure_processor import StructureProcessor
+from .symbol_table import SymbolTable
 from .type_inference import TypeInferenceEngine
 
 
@@ -27,6 +28,8 @@ class ProcessorFactory:
         ast_cache: ASTCacheProtocol,
         include_paths: frozenset[str] | None = None,
         exclude_paths: frozenset[str] | None = None,
+        *,
+        symbol_table: SymbolTable | None = None,
     ) -> None:
         self.ingestor = ingestor
         self.repo_path = repo_path
@@ -37,6 +40,7 @@ class ProcessorFactory:
         self.ast_cache = ast_cache
         self.include_paths = include_paths
         self.exclude_paths = exclude_paths
+        self.symbol_table = symbol_table if symbol_table is not None else SymbolTable()
 
         self.module_qn_to_file_path: dict[str, Path] = {}
 
@@ -54,6 +58,7 @@ class ProcessorFactory:
                 project_name=self.project_name,
                 ingestor=self.ingestor,
                 function_registry=self.function_registry,
+                symbol_table=self.symbol_table,
             )
         return self._import_processor
 
@@ -81,6 +86,7 @@ class ProcessorFactory:
                 simple_name_lookup=self.simple_name_lookup,
                 import_processor=self.import_processor,
                 module_qn_to_file_path=self.module_qn_to_file_path,
+                symbol_table=self.symbol_table,
             )
         return self._definition_processor
 
@@ -111,5 +117,6 @@ class ProcessorFactory:
                 import_processor=self.import_processor,
                 type_inference=self.type_inference,
                 class_inheritance=self.definition_processor.class_inheritance,
+                symbol_table=self.symbol_table,
             )
         return self._call_processor
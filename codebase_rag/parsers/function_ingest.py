@@ -27,6 +27,7 @@ if TYPE_CHECKING:
     from ..services import IngestorProtocol
     from ..types_defs import LanguageQueries
     from .handlers import LanguageHandler
+    from .symbol_table import SymbolTable
 
 
 class FunctionResolution(NamedTuple):
@@ -41,12 +42,16 @@ class FunctionIngestMixin:
     project_name: str
     function_registry: FunctionRegistryTrieProtocol
     simple_name_lookup: SimpleNameLookup
+    symbol_table: SymbolTable
     module_qn_to_file_path: dict[str, Path]
     _handler: LanguageHandler
 
     @abstractmethod
     def _get_docstring(self, node: ASTNode) -> str | None: ...
 
+    @abstractmethod
+    def _definition_path(self, module_qn: str) -> str | None: ...
+
     @abstractmethod
     def _extract_decorators(self, node: ASTNode) -> list[str]: ...
 
@@ -202,7 +207,11 @@ class FunctionIngestMixin:
         language: cs.SupportedLanguage,
         lang_config: LanguageSpec,
     ) -> None:
+        resolution = resolution._replace(
+            qualified_name=self.symbol_table.intern(resolution.qualified_name)
+        )
         func_props = self._build_function_props(func_node, resolution)
+        func_props[cs.KEY_PATH] = self._definition_path(module_qn)
         logger.info(
             ls.FUNC_FOUND.format(name=resolution.name, qn=resolution.qualified_name)
         )
@@ -19,6 +19,7 @@ from .stdlib_extractor import (
     load_persistent_cache,
     save_persistent_cache,
 )
+from .symbol_table import SymbolTable
 from .utils import get_query_cursor, safe_decode_text, safe_decode_with_fallback
 
 
@@ -29,12 +30,16 @@ class ImportProcessor:
         project_name: str,
         ingestor: IngestorProtocol | None = None,
         function_registry: FunctionRegistryTrieProtocol | None = None,
+        *,
+        symbol_table: SymbolTable | None = None,
     ) -> None:
         self.repo_path = repo_path
         self.project_name = project_name
         self.ingestor = ingestor
         self.function_registry = function_registry
+        self.symbol_table = symbol_table if symbol_table is not None else SymbolTable()
         self.import_mapping: dict[str, dict[str, str]] = {}
+        self._pending_imports: dict[cs.SupportedLanguage, list[tuple[str, str]]] = {}
         self.stdlib_extractor = StdlibExtractor(function_registry)
 
         load_persistent_cache()
@@ -72,6 +77,7 @@ class ImportProcessor:
 
         lang_config = queries[language]["config"]
 
+        module_qn = self.symbol_table.intern(module_qn)
         self.import_mapping[module_qn] = {}
 
         try:
@@ -96,6 +102,9 @@ class ImportProcessor:
                 case _:
                     self._parse_generic_imports(captures, module_qn, lang_config)
 
+            self.import_mapping[module_qn] = self.symbol_table.intern_mapping(
+                self.import_mapping[module_qn]
+            )
             logger.debug(
                 ls.IMP_PARSED_COUNT.format(
                     count=len(self.import_mapping[module_qn]), module=module_qn
@@ -103,35 +112,47 @@ class ImportProcessor:
             )
 
             if self.ingestor:
-                for local_name, full_name in self.import_mapping[module_qn].items():
-                    module_path = self.stdlib_extractor.extract_module_path(
-                        full_name, language
-                    )
-
-                    self.ingestor.ensure_relationship_batch(
-                        (
-                            cs.NodeLabel.MODULE,
-                            cs.KEY_QUALIFIED_NAME,
-                            module_qn,
-                        ),
-                        cs.RelationshipType.IMPORTS,
-                        (
-                            cs.NodeLabel.MODULE,
-                            cs.KEY_QUALIFIED_NAME,
-                            module_path,
-                        ),
-                    )
-                    logger.debug(
-                        ls.IMP_CREATED_RELATIONSHIP.format(
-                            from_module=module_qn,
-                            to_module=module_path,
-                            full_name=full_name,
-                        )
-                    )
+                self._pending_imports.setdefault(language, []).extend(
+                    (module_qn, full_name)
+                    for full_name in self.import_mapping[module_qn].values()
+                )
 
         except Exception as e:
             logger.warning(ls.IMP_PARSE_FAILED.format(module=module_qn, error=e))
 
+    def flush_import_relationships(self) -> None:
+        # (H) IMPORTS edges are emitted once per pass so every language's external
+        # (H) names are resolved in a few batched introspection round trips
+        pending, self._pending_imports = self._pending_imports, {}
+        if not self.ingestor:
+            return
+        for language, imports in pending.items():
+            module_paths = self.stdlib_extractor.extract_module_paths(
+                (full_name for _, full_name in imports), language
+            )
+            for module_qn, full_name in imports:
+                module_path = module_paths[full_name]
+                self.ingestor.ensure_relationship_batch(
+                    (
+                        cs.NodeLabel.MODULE,
+                        cs.KEY_QUALIFIED_NAME,
+                        module_qn,
+                    ),
+                    cs.RelationshipType.IMPORTS,
+                    (
+                        cs.NodeLabel.MODULE,
+                        cs.KEY_QUALIFIED_NAME,
+                        module_path,
+                    ),
+                )
+                logger.debug(
+                    ls.IMP_CREATED_RELATIONSHIP.format(
+                        from_module=module_qn,
+                        to_module=module_path,
+                        full_name=full_name,
+                    )
+                )
+
     def _parse_python_imports(self, captures: dict, module_qn: str) -> None:
         for import_node in captures.get(cs.CAPTURE_IMPORT, []) + captures.get(
             cs.CAPTURE_IMPORT_FROM, []
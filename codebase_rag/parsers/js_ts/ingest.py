@@ -5,10 +5,11 @@ from pathlib import Path
 from typing import TYPE_CHECKING
 
 from loguru import logger
-from tree_sitter import Query, QueryCursor
+from tree_sitter import QueryCursor
 
 from ... import constants as cs
 from ... import logs as lg
+from ...parser_loader import get_auxiliary_query
 from ...types_defs import (
     ASTNode,
     FunctionRegistryTrieProtocol,
@@ -26,6 +27,7 @@ if TYPE_CHECKING:
     from ...types_defs import LanguageQueries
     from ..handlers import LanguageHandler
     from ..import_processor import ImportProcessor
+    from ..symbol_table import SymbolTable
 
 
 class JsTsIngestMixin(JsTsModuleSystemMixin):
@@ -34,6 +36,7 @@ class JsTsIngestMixin(JsTsModuleSystemMixin):
     project_name: str
     function_registry: FunctionRegistryTrieProtocol
     simple_name_lookup: SimpleNameLookup
+    symbol_table: SymbolTable
     module_qn_to_file_path: dict[str, Path]
     import_processor: ImportProcessor
     class_inheritance: dict[str, list[str]]
@@ -42,6 +45,9 @@ class JsTsIngestMixin(JsTsModuleSystemMixin):
     @abstractmethod
     def _get_docstring(self, node: ASTNode) -> str | None: ...
 
+    @abstractmethod
+    def _definition_path(self, module_qn: str) -> str | None: ...
+
     @abstractmethod
     def _build_nested_qualified_name(
         self,
@@ -93,7 +99,9 @@ class JsTsIngestMixin(JsTsModuleSystemMixin):
     def _process_prototype_inheritance_captures(
         self, language_obj, root_node, module_qn
     ):
-        query = Query(language_obj, cs.JS_PROTOTYPE_INHERITANCE_QUERY)
+        query = get_auxiliary_query(
+            language_obj, cs.AuxiliaryQuery.PROTOTYPE_INHERITANCE
+        )
         cursor = QueryCursor(query)
         captures = cursor.captures(root_node)
 
@@ -107,8 +115,12 @@ class JsTsIngestMixin(JsTsModuleSystemMixin):
                 child_name = safe_decode_text(child_node)
                 parent_name = safe_decode_text(parent_node)
 
-                child_qn = f"{module_qn}{cs.SEPARATOR_DOT}{child_name}"
-                parent_qn = f"{module_qn}{cs.SEPARATOR_DOT}{parent_name}"
+                child_qn = self.symbol_table.intern(
+                    f"{module_qn}{cs.SEPARATOR_DOT}{child_name}"
+                )
+                parent_qn = self.symbol_table.intern(
+                    f"{module_qn}{cs.SEPARATOR_DOT}{parent_name}"
+                )
 
                 if child_qn not in self.class_inheritance:
                     self.class_inheritance[child_qn] = []
@@ -146,7 +158,9 @@ class JsTsIngestMixin(JsTsModuleSystemMixin):
             logger.debug(lg.JS_PROTOTYPE_METHODS_FAILED.format(error=e))
 
     def _process_prototype_method_captures(self, language_obj, root_node, module_qn):
-        method_query = Query(language_obj, cs.JS_PROTOTYPE_METHOD_QUERY)
+        method_query = get_auxiliary_query(
+            language_obj, cs.AuxiliaryQuery.PROTOTYPE_METHOD
+        )
         method_cursor = QueryCursor(method_query)
         method_captures = method_cursor.captures(root_node)
 
@@ -164,7 +178,9 @@ class JsTsIngestMixin(JsTsModuleSystemMixin):
 
             if constructor_name and method_name:
                 constructor_qn = f"{module_qn}{cs.SEPARATOR_DOT}{constructor_name}"
-                method_qn = f"{constructor_qn}{cs.SEPARATOR_DOT}{method_name}"
+                method_qn = self.symbol_table.intern(
+                    f"{constructor_qn}{cs.SEPARATOR_DOT}{method_name}"
+                )
 
                 method_props: PropertyDict = {
                     cs.KEY_QUALIFIED_NAME: method_qn,
@@ -172,6 +188,7 @@ class JsTsIngestMixin(JsTsModuleSystemMixin):
                     cs.KEY_START_LINE: func_node.start_point[0] + 1,
                     cs.KEY_END_LINE: func_node.end_point[0] + 1,
                     cs.KEY_DOCSTRING: self._get_docstring(func_node),
+                    cs.KEY_PATH: self._definition_path(module_qn),
                 }
                 logger.info(
                     lg.JS_PROTOTYPE_METHOD_FOUND.format(
@@ -208,9 +225,12 @@ class JsTsIngestMixin(JsTsModuleSystemMixin):
 
         lang_config = queries[language].get(cs.QUERY_CONFIG)
         try:
-            for query_text in [cs.JS_OBJECT_METHOD_QUERY, cs.JS_METHOD_DEF_QUERY]:
+            for query_name in (
+                cs.AuxiliaryQuery.OBJECT_METHOD,
+                cs.AuxiliaryQuery.METHOD_DEF,
+            ):
                 self._process_object_method_query(
-                    language_obj, query_text, root_node, module_qn, lang_config
+                    language_obj, query_name, root_node, module_qn, lang_config
                 )
         except Exception as e:
             logger.debug(lg.JS_OBJECT_METHODS_DETECT_FAILED.format(error=e))
@@ -218,13 +238,13 @@ class JsTsIngestMixin(JsTsModuleSystemMixin):
     def _process_object_method_query(
         self,
         language_obj,
-        query_text: str,
+        query_name: cs.AuxiliaryQuery,
         root_node: ASTNode,
         module_qn: str,
         lang_config,
     ) -> None:
         try:
-            query = Query(language_obj, query_text)
+            query = get_auxiliary_query(language_obj, query_name)
             cursor = QueryCursor(query)
             captures = cursor.captures(root_node)
 
@@ -306,12 +326,14 @@ class JsTsIngestMixin(JsTsModuleSystemMixin):
         method_func_node: ASTNode,
         module_qn: str,
     ) -> None:
+        method_qn = self.symbol_table.intern(method_qn)
         method_props: PropertyDict = {
             cs.KEY_QUALIFIED_NAME: method_qn,
             cs.KEY_NAME: method_name,
             cs.KEY_START_LINE: method_func_node.start_point[0] + 1,
             cs.KEY_END_LINE: method_func_node.end_point[0] + 1,
             cs.KEY_DOCSTRING: self._get_docstring(method_func_node),
+            cs.KEY_PATH: self._definition_path(module_qn),
         }
         logger.info(
             lg.JS_OBJECT_METHOD_FOUND.format(
@@ -343,13 +365,13 @@ class JsTsIngestMixin(JsTsModuleSystemMixin):
             lang_query = queries[language][cs.QUERY_LANGUAGE]
             lang_config = queries[language].get(cs.QUERY_CONFIG)
 
-            for query_text in [
-                cs.JS_OBJECT_ARROW_QUERY,
-                cs.JS_ASSIGNMENT_ARROW_QUERY,
-                cs.JS_ASSIGNMENT_FUNCTION_QUERY,
-            ]:
+            for query_name in (
+                cs.AuxiliaryQuery.OBJECT_ARROW,
+                cs.AuxiliaryQuery.ASSIGNMENT_ARROW,
+                cs.AuxiliaryQuery.ASSIGNMENT_FUNCTION,
+            ):
                 self._process_arrow_query(
-                    lang_query, query_text, root_node, module_qn, lang_config
+                    lang_query, query_name, root_node, module_qn, lang_config
                 )
         except Exception as e:
             logger.debug(lg.JS_ASSIGNMENT_ARROW_DETECT_FAILED.format(error=e))
@@ -357,13 +379,13 @@ class JsTsIngestMixin(JsTsModuleSystemMixin):
     def _process_arrow_query(
         self,
         lang_query,
-        query_text: str,
+        query_name: cs.AuxiliaryQuery,
         root_node: ASTNode,
         module_qn: str,
         lang_config,
     ) -> None:
         try:
-            query = Query(lang_query, query_text)
+            query = get_auxiliary_query(lang_query, query_name)
             cursor = QueryCursor(query)
             captures = cursor.captures(root_node)
 
@@ -412,7 +434,11 @@ class JsTsIngestMixin(JsTsModuleSystemMixin):
             )
 
             self._register_arrow_function(
-                function_name, function_qn, arrow_function, lg.JS_OBJECT_ARROW_FOUND
+                function_name,
+                function_qn,
+                arrow_function,
+                module_qn,
+                lg.JS_OBJECT_ARROW_FOUND,
             )
 
     def _resolve_direct_arrow_qn(
@@ -472,7 +498,7 @@ class JsTsIngestMixin(JsTsModuleSystemMixin):
             )
 
             self._register_arrow_function(
-                function_name, function_qn, function_node, log_message
+                function_name, function_qn, function_node, module_qn, log_message
             )
 
     def _resolve_member_expr_qn(
@@ -496,14 +522,17 @@ class JsTsIngestMixin(JsTsModuleSystemMixin):
         function_name: str,
         function_qn: str,
         function_node: ASTNode,
+        module_qn: str,
         log_message: str,
     ) -> None:
+        function_qn = self.symbol_table.intern(function_qn)
         function_props: PropertyDict = {
             cs.KEY_QUALIFIED_NAME: function_qn,
             cs.KEY_NAME: function_name,
             cs.KEY_START_LINE: function_node.start_point[0] + 1,
             cs.KEY_END_LINE: function_node.end_point[0] + 1,
             cs.KEY_DOCSTRING: self._get_docstring(function_node),
+            cs.KEY_PATH: self._definition_path(module_qn),
         }
 
         logger.debug(
@@ -1,15 +1,15 @@
 from __future__ import annotations
 
-import textwrap
 from abc import abstractmethod
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 from loguru import logger
-from tree_sitter import Query, QueryCursor
+from tree_sitter import QueryCursor
 
 from ... import constants as cs
 from ... import logs as ls
+from ...parser_loader import get_auxiliary_query
 from ...types_defs import ASTNode
 from ..utils import (
     ingest_exported_function,
@@ -26,6 +26,7 @@ if TYPE_CHECKING:
         SimpleNameLookup,
     )
     from ..import_processor import ImportProcessor
+    from ..symbol_table import SymbolTable
 
 
 class JsTsModuleSystemMixin:
@@ -34,12 +35,16 @@ class JsTsModuleSystemMixin:
     project_name: str
     function_registry: FunctionRegistryTrieProtocol
     simple_name_lookup: SimpleNameLookup
+    symbol_table: SymbolTable
     import_processor: ImportProcessor
     _processed_imports: set[str]
 
     @abstractmethod
     def _get_docstring(self, node: ASTNode) -> str | None: ...
 
+    @abstractmethod
+    def _definition_path(self, module_qn: str) -> str | None: ...
+
     @abstractmethod
     def _is_export_inside_function(self, node: ASTNode) -> bool: ...
 
@@ -59,7 +64,9 @@ class JsTsModuleSystemMixin:
 
         try:
             try:
-                query = Query(language_obj, cs.JS_COMMONJS_DESTRUCTURE_QUERY)
+                query = get_auxiliary_query(
+                    language_obj, cs.AuxiliaryQuery.COMMONJS_DESTRUCTURE
+                )
                 cursor = QueryCursor(query)
                 captures = cursor.captures(root_node)
 
@@ -212,6 +219,8 @@ class JsTsModuleSystemMixin:
             self.simple_name_lookup,
             self._get_docstring,
             self._is_export_inside_function,
+            symbol_table=self.symbol_table,
+            path=self._definition_path(module_qn),
         )
 
     def _process_exports_pattern(
@@ -275,16 +284,16 @@ class JsTsModuleSystemMixin:
         if not language_obj:
             return
 
-        query_texts = [
-            cs.JS_COMMONJS_EXPORTS_FUNCTION_QUERY,
-            cs.JS_COMMONJS_MODULE_EXPORTS_QUERY,
-        ]
+        query_names = (
+            cs.AuxiliaryQuery.COMMONJS_EXPORTS_FUNCTION,
+            cs.AuxiliaryQuery.COMMONJS_MODULE_EXPORTS,
+        )
 
-        for query_text in query_texts:
+        for query_name in query_names:
             try:
-                captures = QueryCursor(Query(language_obj, query_text)).captures(
-                    root_node
-                )
+                captures = QueryCursor(
+                    get_auxiliary_query(language_obj, query_name)
+                ).captures(root_node)
 
                 self._process_exports_pattern(
                     captures.get(cs.CAPTURE_EXPORTS_OBJ, []),
@@ -311,16 +320,18 @@ class JsTsModuleSystemMixin:
         language: cs.SupportedLanguage,
         queries: dict[cs.SupportedLanguage, LanguageQueries],
     ) -> None:
+        if language not in cs.JS_TS_LANGUAGES:
+            return
+
         try:
             lang_query = queries[language][cs.QUERY_LANGUAGE]
 
-            for query_text in [
-                cs.JS_ES6_EXPORT_CONST_QUERY,
-                cs.JS_ES6_EXPORT_FUNCTION_QUERY,
-            ]:
+            for query_name in (
+                cs.AuxiliaryQuery.ES6_EXPORT_CONST,
+                cs.AuxiliaryQuery.ES6_EXPORT_FUNCTION,
+            ):
                 try:
-                    cleaned_query = textwrap.dedent(query_text).strip()
-                    query = Query(lang_query, cleaned_query)
+                    query = get_auxiliary_query(lang_query, query_name)
                     cursor = QueryCursor(query)
                     captures = cursor.captures(root_node)
 
@@ -342,6 +353,8 @@ class JsTsModuleSystemMixin:
                                     self.simple_name_lookup,
                                     self._get_docstring,
                                     self._is_export_inside_function,
+                                    symbol_table=self.symbol_table,
+                                    path=self._definition_path(module_qn),
                                 )
 
                     if not export_names:
@@ -362,6 +375,8 @@ class JsTsModuleSystemMixin:
                                                 self.simple_name_lookup,
                                                 self._get_docstring,
                                                 self._is_export_inside_function,
+                                                symbol_table=self.symbol_table,
+                                                path=self._definition_path(module_qn),
                                             )
 
                 except Exception as e:
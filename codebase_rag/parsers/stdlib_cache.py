@@ -0,0 +1,236 @@
+from __future__ import annotations
+
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+from loguru import logger
+
+from .. import constants as cs
+from .. import logs as ls
+
+_TABLE_NAME_UNSAFE = re.compile(r"\W")
+
+
+class StdlibCacheStore:
+    def __init__(self, db_path: Path, ttl: float = cs.IMPORT_CACHE_TTL) -> None:
+        self.db_path = db_path
+        self.ttl = ttl
+        self._conn: sqlite3.Connection | None = None
+        self._unavailable = False
+        self._lock = threading.Lock()
+        self._tables: dict[str, str] = {}
+        # (H) Hits already read from disk (or written) this session; rows are
+        # (H) fetched one key at a time, never loaded wholesale.
+        self._memo: dict[tuple[str, str], tuple[str, float]] = {}
+        self._pending: dict[tuple[str, str], tuple[str, float]] = {}
+
+    def _connection(self) -> sqlite3.Connection | None:
+        if self._conn is not None or self._unavailable:
+            return self._conn
+        try:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(
+                self.db_path, check_same_thread=False, isolation_level=None
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS cache_languages (
+                    language TEXT PRIMARY KEY,
+                    table_name TEXT NOT NULL
+                )
+            """)
+            self._tables = dict(
+                conn.execute("SELECT language, table_name FROM cache_languages")
+            )
+        except (OSError, sqlite3.Error) as e:
+            logger.debug(ls.IMP_CACHE_LOAD_ERROR.format(error=e))
+            self._unavailable = True
+            return None
+        self._conn = conn
+        logger.debug(ls.IMP_CACHE_LOADED.format(path=self.db_path))
+        return conn
+
+    def _table_for(self, conn: sqlite3.Connection, language: str) -> str:
+        if (table := self._tables.get(language)) is not None:
+            return table
+        table = cs.IMPORT_CACHE_TABLE_PREFIX + _TABLE_NAME_UNSAFE.sub("_", language)
+        conn.execute(f"""
+            CREATE TABLE IF NOT EXISTS "{table}" (
+                qualified_name TEXT PRIMARY KEY,
+                module_path TEXT NOT NULL,
+                cached_at REAL NOT NULL
+            ) WITHOUT ROWID
+        """)
+        conn.execute(
+            "INSERT OR REPLACE INTO cache_languages (language, table_name) VALUES (?, ?)",
+            (language, table),
+        )
+        self._tables[language] = table
+        return table
+
+    def open(self) -> bool:
+        with self._lock:
+            return self._connection() is not None
+
+    def get(self, language: str, qualified_name: str) -> str | None:
+        key = (language, qualified_name)
+        now = time.time()
+        with self._lock:
+            entry = self._pending.get(key) or self._memo.get(key)
+            if entry is None:
+                entry = self._read(language, qualified_name)
+                if entry is not None:
+                    self._memo[key] = entry
+            if entry is None:
+                return None
+            module_path, cached_at = entry
+            if now - cached_at > self.ttl:
+                self._expire(key)
+                return None
+            return module_path
+
+    def _read(self, language: str, qualified_name: str) -> tuple[str, float] | None:
+        conn = self._connection()
+        if conn is None or (table := self._tables.get(language)) is None:
+            return None
+        try:
+            row = conn.execute(
+                f'SELECT module_path, cached_at FROM "{table}" WHERE qualified_name = ?',
+                (qualified_name,),
+            ).fetchone()
+        except sqlite3.Error as e:
+            logger.debug(ls.IMP_CACHE_LOAD_ERROR.format(error=e))
+            return None
+        return (row[0], row[1]) if row else None
+
+    def _expire(self, key: tuple[str, str]) -> None:
+        self._memo.pop(key, None)
+        self._pending.pop(key, None)
+        language, qualified_name = key
+        conn = self._connection()
+        if conn is None or (table := self._tables.get(language)) is None:
+            return
+        try:
+            conn.execute(
+                f'DELETE FROM "{table}" WHERE qualified_name = ?', (qualified_name,)
+            )
+        except sqlite3.Error as e:
+            logger.debug(ls.IMP_CACHE_SAVE_ERROR.format(error=e))
+
+    def put(self, language: str, qualified_name: str, module_path: str) -> None:
+        key = (language, qualified_name)
+        entry = (module_path, time.time())
+        with self._lock:
+            self._memo[key] = entry
+            self._pending[key] = entry
+            if len(self._pending) >= cs.IMPORT_CACHE_WRITE_BATCH_SIZE:
+                self._flush_locked()
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self) -> None:
+        if not self._pending:
+            return
+        conn = self._connection()
+        if conn is None:
+            return
+        rows_by_language: dict[str, list[tuple[str, str, float]]] = {}
+        for (language, qualified_name), entry in self._pending.items():
+            rows_by_language.setdefault(language, []).append((qualified_name, *entry))
+        try:
+            conn.execute("BEGIN")
+            for language, rows in rows_by_language.items():
+                table = self._table_for(conn, language)
+                conn.executemany(
+                    f'INSERT OR REPLACE INTO "{table}" '
+                    "(qualified_name, module_path, cached_at) VALUES (?, ?, ?)",
+                    rows,
+                )
+            conn.execute("COMMIT")
+        except sqlite3.Error as e:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            # (H) Tables created inside the rolled-back transaction are gone too
+            self._tables = dict(
+                conn.execute("SELECT language, table_name FROM cache_languages")
+            )
+            logger.debug(ls.IMP_CACHE_SAVE_ERROR.format(error=e))
+            return
+        logger.debug(
+            ls.IMP_CACHE_SAVED.format(count=len(self._pending), path=self.db_path)
+        )
+        self._pending.clear()
+
+    def stats(self) -> tuple[int, list[str], int]:
+        with self._lock:
+            self._flush_locked()
+            conn = self._connection()
+            if conn is None:
+                fresh = sum(
+                    1
+                    for _, cached_at in self._memo.values()
+                    if time.time() - cached_at <= self.ttl
+                )
+                languages = sorted({language for language, _ in self._memo})
+                return len(self._memo), languages, fresh
+
+            cutoff = time.time() - self.ttl
+            total = fresh = 0
+            languages = []
+            for language, table in sorted(self._tables.items()):
+                count, fresh_count = conn.execute(
+                    f'SELECT COUNT(*), COALESCE(SUM(cached_at >= ?), 0) FROM "{table}"',
+                    (cutoff,),
+                ).fetchone()
+                if count:
+                    languages.append(language)
+                total += count
+                fresh += fresh_count
+            return total, languages, fresh
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memo.clear()
+            self._pending.clear()
+            if (conn := self._connection()) is not None:
+                try:
+                    for table in self._tables.values():
+                        conn.execute(f'DROP TABLE IF EXISTS "{table}"')
+                    conn.execute("DELETE FROM cache_languages")
+                except sqlite3.Error as e:
+                    logger.debug(ls.IMP_CACHE_CLEAR_ERROR.format(error=e))
+            self._tables.clear()
+            self._close_locked()
+            self._unavailable = False
+            try:
+                for path in (
+                    self.db_path,
+                    *(
+                        self.db_path.with_name(self.db_path.name + suffix)
+                        for suffix in cs.IMPORT_CACHE_SIDECAR_SUFFIXES
+                    ),
+                ):
+                    if path.exists():
+                        path.unlink()
+                logger.debug(ls.IMP_CACHE_CLEARED)
+            except OSError as e:
+                logger.debug(ls.IMP_CACHE_CLEAR_ERROR.format(error=e))
+
+    def close(self) -> None:
+        with self._lock:
+            self._flush_locked()
+            self._close_locked()
+
+    def _close_locked(self) -> None:
+        if self._conn is not None:
+            try:
+                self._conn.close()
+            except sqlite3.Error:
+                pass
+            self._conn = None
@@ -1,5 +1,5 @@
-import json
-import time
+import os
+from collections.abc import Callable, Iterable
 from pathlib import Path
 from typing import TypedDict
 
@@ -8,6 +8,8 @@ from loguru import logger
 from .. import constants as cs
 from .. import logs as ls
 from ..types_defs import FunctionRegistryTrieProtocol
+from .stdlib_cache import StdlibCacheStore
+from .stdlib_workers import IntrospectionPool
 
 
 class StdlibCacheStats(TypedDict):
@@ -17,9 +19,9 @@ class StdlibCacheStats(TypedDict):
     external_tools_checked: dict[str, bool]
 
 
-_STDLIB_CACHE: dict[str, dict[str, str]] = {}
 _CACHE_TTL = cs.IMPORT_CACHE_TTL
-_CACHE_TIMESTAMPS: dict[str, float] = {}
+_STDLIB_STORE: StdlibCacheStore | None = None
+_INTROSPECTION_POOL: tuple[int, IntrospectionPool] | None = None
 
 _EXTERNAL_TOOLS: dict[str, bool] = {}
 
@@ -46,60 +48,47 @@ def _is_tool_available(tool_name: str) -> bool:
         return False
 
 
-def _get_cached_stdlib_result(language: str, full_qualified_name: str) -> str | None:
-    cache_key = f"{language}:{full_qualified_name}"
+def _cache_path() -> Path:
+    return Path.home() / cs.IMPORT_CACHE_DIR / cs.IMPORT_CACHE_FILE
 
-    if cache_key not in _STDLIB_CACHE:
-        return None
 
-    if (
-        cache_key in _CACHE_TIMESTAMPS
-        and time.time() - _CACHE_TIMESTAMPS[cache_key] > _CACHE_TTL
-    ):
-        del _STDLIB_CACHE[cache_key]
-        del _CACHE_TIMESTAMPS[cache_key]
-        return None
+def _stdlib_store() -> StdlibCacheStore:
+    global _STDLIB_STORE
+    if _STDLIB_STORE is None:
+        _STDLIB_STORE = StdlibCacheStore(_cache_path(), ttl=_CACHE_TTL)
+    return _STDLIB_STORE
 
-    return _STDLIB_CACHE[cache_key].get(full_qualified_name)
+
+def _introspection_pool() -> IntrospectionPool:
+    # (H) Keyed on the pid so a forked child starts its own workers instead of
+    # (H) sharing the parent's pipes and reader threads
+    global _INTROSPECTION_POOL
+    pid = os.getpid()
+    if _INTROSPECTION_POOL is None or _INTROSPECTION_POOL[0] != pid:
+        _INTROSPECTION_POOL = (pid, IntrospectionPool())
+    return _INTROSPECTION_POOL[1]
+
+
+def _get_cached_stdlib_result(language: str, full_qualified_name: str) -> str | None:
+    return _stdlib_store().get(language, full_qualified_name)
 
 
 def _cache_stdlib_result(language: str, full_qualified_name: str, result: str) -> None:
-    cache_key = f"{language}:{full_qualified_name}"
-    _STDLIB_CACHE.setdefault(cache_key, {})[full_qualified_name] = result
-    _CACHE_TIMESTAMPS[cache_key] = time.time()
+    _stdlib_store().put(language, full_qualified_name, result)
 
 
 def load_persistent_cache() -> None:
-    try:
-        cache_file = Path.home() / cs.IMPORT_CACHE_DIR / cs.IMPORT_CACHE_FILE
-        if cache_file.exists():
-            with cache_file.open() as f:
-                data = json.load(f)
-                _STDLIB_CACHE.update(data.get(cs.IMPORT_CACHE_KEY, {}))
-                _CACHE_TIMESTAMPS.update(data.get(cs.IMPORT_TIMESTAMPS_KEY, {}))
-            logger.debug(ls.IMP_CACHE_LOADED.format(path=cache_file))
-    except (json.JSONDecodeError, OSError) as e:
-        logger.debug(ls.IMP_CACHE_LOAD_ERROR.format(error=e))
+    global _STDLIB_STORE
+    cache_path = _cache_path()
+    if _STDLIB_STORE is not None and _STDLIB_STORE.db_path != cache_path:
+        _STDLIB_STORE.close()
+        _STDLIB_STORE = None
+    _stdlib_store().open()
 
 
 def save_persistent_cache() -> None:
-    try:
-        cache_dir = Path.home() / cs.IMPORT_CACHE_DIR
-        cache_dir.mkdir(parents=True, exist_ok=True)
-        cache_file = cache_dir / cs.IMPORT_CACHE_FILE
-
-        with cache_file.open("w") as f:
-            json.dump(
-                {
-                    cs.IMPORT_CACHE_KEY: _STDLIB_CACHE,
-                    cs.IMPORT_TIMESTAMPS_KEY: _CACHE_TIMESTAMPS,
-                },
-                f,
-                indent=2,
-            )
-        logger.debug(ls.IMP_CACHE_SAVED.format(path=cache_file))
-    except OSError as e:
-        logger.debug(ls.IMP_CACHE_SAVE_ERROR.format(error=e))
+    if _STDLIB_STORE is not None:
+        _STDLIB_STORE.flush()
 
 
 def flush_stdlib_cache() -> None:
@@ -107,28 +96,38 @@ def flush_stdlib_cache() -> None:
 
 
 def clear_stdlib_cache() -> None:
-    _STDLIB_CACHE.clear()
-    _CACHE_TIMESTAMPS.clear()
-    try:
-        cache_file = Path.home() / cs.IMPORT_CACHE_DIR / cs.IMPORT_CACHE_FILE
-        if cache_file.exists():
-            cache_file.unlink()
-            logger.debug(ls.IMP_CACHE_CLEARED)
-    except OSError as e:
-        logger.debug(ls.IMP_CACHE_CLEAR_ERROR.format(error=e))
+    _stdlib_store().clear()
 
 
 def get_stdlib_cache_stats() -> StdlibCacheStats:
+    cache_entries, cache_languages, total_cached_results = _stdlib_store().stats()
     return StdlibCacheStats(
-        cache_entries=len(_STDLIB_CACHE),
-        cache_languages=list(_STDLIB_CACHE.keys()),
-        total_cached_results=sum(
-            len(lang_cache) for lang_cache in _STDLIB_CACHE.values()
-        ),
+        cache_entries=cache_entries,
+        cache_languages=cache_languages,
+        total_cached_results=total_cached_results,
         external_tools_checked=_EXTERNAL_TOOLS.copy(),
     )
 
 
+def _starts_uppercase(entity_name: str) -> bool:
+    return entity_name[:1].isupper()
+
+
+def _looks_like_java_class(entity_name: str) -> bool:
+    return (
+        _starts_uppercase(entity_name)
+        or entity_name.endswith(cs.JAVA_SUFFIX_EXCEPTION)
+        or entity_name.endswith(cs.JAVA_SUFFIX_ERROR)
+        or entity_name.endswith(cs.JAVA_SUFFIX_INTERFACE)
+        or entity_name.endswith(cs.JAVA_SUFFIX_BUILDER)
+        or entity_name in cs.JAVA_STDLIB_CLASSES
+    )
+
+
+def _looks_like_lua_member(entity_name: str) -> bool:
+    return _starts_uppercase(entity_name) or entity_name in cs.LUA_STDLIB_MODULES
+
+
 class StdlibExtractor:
     def __init__(
         self,
@@ -141,292 +140,173 @@ class StdlibExtractor:
         full_qualified_name: str,
         language: cs.SupportedLanguage = cs.SupportedLanguage.PYTHON,
     ) -> str:
-        if self.function_registry and full_qualified_name in self.function_registry:
-            entity_type = self.function_registry[full_qualified_name]
-            if entity_type in (cs.ENTITY_CLASS, cs.ENTITY_FUNCTION, cs.ENTITY_METHOD):
-                parts = full_qualified_name.rsplit(cs.SEPARATOR_DOT, 1)
-                if len(parts) == 2:
-                    return parts[0]
+        return self.extract_module_paths([full_qualified_name], language)[
+            full_qualified_name
+        ]
+
+    def extract_module_paths(
+        self,
+        full_qualified_names: Iterable[str],
+        language: cs.SupportedLanguage = cs.SupportedLanguage.PYTHON,
+    ) -> dict[str, str]:
+        results: dict[str, str] = {}
+        unresolved: list[str] = []
+        for full_qualified_name in dict.fromkeys(full_qualified_names):
+            if (
+                module_path := self._registry_module_path(full_qualified_name)
+            ) is not None:
+                results[full_qualified_name] = module_path
+            else:
+                unresolved.append(full_qualified_name)
+        if not unresolved:
+            return results
 
         match language:
             case cs.SupportedLanguage.PYTHON:
-                return self._extract_python_stdlib_path(full_qualified_name)
+                results.update(self._extract_python_stdlib_paths(unresolved))
             case cs.SupportedLanguage.JS | cs.SupportedLanguage.TS:
-                return self._extract_js_stdlib_path(full_qualified_name)
+                results.update(self._extract_js_stdlib_paths(unresolved))
             case cs.SupportedLanguage.GO:
-                return self._extract_go_stdlib_path(full_qualified_name)
-            case cs.SupportedLanguage.RUST:
-                return self._extract_rust_stdlib_path(full_qualified_name)
-            case cs.SupportedLanguage.CPP:
-                return self._extract_cpp_stdlib_path(full_qualified_name)
+                results.update(self._extract_go_stdlib_paths(unresolved))
             case cs.SupportedLanguage.JAVA:
-                return self._extract_java_stdlib_path(full_qualified_name)
+                results.update(self._extract_java_stdlib_paths(unresolved))
             case cs.SupportedLanguage.LUA:
-                return self._extract_lua_stdlib_path(full_qualified_name)
+                results.update(self._extract_lua_stdlib_paths(unresolved))
+            case cs.SupportedLanguage.RUST:
+                results.update(
+                    (name, self._extract_rust_stdlib_path(name)) for name in unresolved
+                )
+            case cs.SupportedLanguage.CPP:
+                results.update(
+                    (name, self._extract_cpp_stdlib_path(name)) for name in unresolved
+                )
             case _:
-                return self._extract_generic_stdlib_path(full_qualified_name)
-
-    def _extract_python_stdlib_path(self, full_qualified_name: str) -> str:
-        cached_result = _get_cached_stdlib_result(
-            cs.SupportedLanguage.PYTHON, full_qualified_name
-        )
-        if cached_result is not None:
-            return cached_result
-
-        parts = full_qualified_name.split(cs.SEPARATOR_DOT)
-        if len(parts) >= 2:
-            return self._resolve_python_entity_module_path(parts, full_qualified_name)
-        return full_qualified_name
-
-    def _resolve_python_entity_module_path(
-        self, parts: list[str], full_qualified_name: str
-    ) -> str:
-        module_name = parts[0]
-        entity_name = parts[-1]
-
-        try:
-            import importlib
-            import inspect
-
-            module = importlib.import_module(module_name)
-
-            if hasattr(module, entity_name):
-                obj = getattr(module, entity_name)
-                if (
-                    inspect.isclass(obj)
-                    or inspect.isfunction(obj)
-                    or not inspect.ismodule(obj)
-                ):
-                    module_path = cs.SEPARATOR_DOT.join(parts[:-1])
-                    _cache_stdlib_result(
-                        cs.SupportedLanguage.PYTHON, full_qualified_name, module_path
-                    )
-                    return module_path
-        except (ImportError, AttributeError):
-            pass
-
-        result = (
-            cs.SEPARATOR_DOT.join(parts[:-1])
-            if entity_name[0].isupper()
-            else full_qualified_name
-        )
-        _cache_stdlib_result(cs.SupportedLanguage.PYTHON, full_qualified_name, result)
-        return result
-
-    def _extract_js_stdlib_path(self, full_qualified_name: str) -> str:
-        cached_result = _get_cached_stdlib_result(
-            cs.SupportedLanguage.JS, full_qualified_name
-        )
-        if cached_result is not None:
-            return cached_result
-
-        parts = full_qualified_name.split(cs.SEPARATOR_DOT)
-        if len(parts) >= 2:
-            return self._resolve_js_entity_module_path(parts, full_qualified_name)
-        return full_qualified_name
-
-    def _resolve_js_entity_module_path(
-        self, parts: list[str], full_qualified_name: str
-    ) -> str:
-        module_name = parts[0]
-        entity_name = parts[-1]
-
-        if _is_tool_available("node"):
-            try:
-                import os
-                import subprocess
-
-                node_script = """
-                    const moduleName = process.env.MODULE_NAME;
-                    const entityName = process.env.ENTITY_NAME;
-
-                    if (!moduleName || !entityName) {
-                        console.log(JSON.stringify({hasEntity: false, entityType: null}));
-                        process.exit(0);
-                    }
-
-                    try {
-                        const module = require(moduleName);
-                        const hasEntity = entityName in module;
-                        const entityType = hasEntity ? typeof module[entityName] : null;
-                        console.log(JSON.stringify({hasEntity, entityType}));
-                    } catch (e) {
-                        console.log(JSON.stringify({hasEntity: false, entityType: null}));
-                    }
-                    """
-
-                env = os.environ.copy()
-                env["MODULE_NAME"] = module_name
-                env["ENTITY_NAME"] = entity_name
-
-                subprocess_result = subprocess.run(
-                    ["node", "-e", node_script],
-                    check=False,
-                    capture_output=True,
-                    text=True,
-                    timeout=5,
-                    env=env,
+                results.update(
+                    (name, self._extract_generic_stdlib_path(name))
+                    for name in unresolved
                 )
+        return results
 
-                if subprocess_result.returncode == 0:
-                    data = json.loads(subprocess_result.stdout.strip())
-                    if data[cs.JSON_KEY_HAS_ENTITY] and data[
-                        cs.JSON_KEY_ENTITY_TYPE
-                    ] in {
-                        cs.TS_FIELD_FUNCTION,
-                        cs.TS_FIELD_OBJECT,
-                    }:
-                        module_path = cs.SEPARATOR_DOT.join(parts[:-1])
-                        _cache_stdlib_result(
-                            cs.SupportedLanguage.JS, full_qualified_name, module_path
-                        )
-                        return module_path
+    def _registry_module_path(self, full_qualified_name: str) -> str | None:
+        if self.function_registry and full_qualified_name in self.function_registry:
+            entity_type = self.function_registry[full_qualified_name]
+            if entity_type in (cs.ENTITY_CLASS, cs.ENTITY_FUNCTION, cs.ENTITY_METHOD):
+                parts = full_qualified_name.rsplit(cs.SEPARATOR_DOT, 1)
+                if len(parts) == 2:
+                    return parts[0]
+        return None
 
-            except (
-                subprocess.TimeoutExpired,
-                subprocess.CalledProcessError,
-                json.JSONDecodeError,
+    def _introspect_paths(
+        self,
+        full_qualified_names: list[str],
+        language: cs.SupportedLanguage,
+        separator: str,
+        looks_like_member: Callable[[str], bool],
+        *,
+        tool: str | None = None,
+        package_scoped: bool = False,
+        cached: bool = False,
+    ) -> dict[str, str]:
+        results: dict[str, str] = {}
+        candidates: list[tuple[str, list[str]]] = []
+        for full_qualified_name in full_qualified_names:
+            if (
+                cached
+                and (hit := _get_cached_stdlib_result(language, full_qualified_name))
+                is not None
             ):
-                pass
+                results[full_qualified_name] = hit
+                continue
+            parts = full_qualified_name.split(separator)
+            if len(parts) < 2:
+                results[full_qualified_name] = full_qualified_name
+            else:
+                candidates.append((full_qualified_name, parts))
+        if not candidates:
+            return results
+
+        # (H) One round trip to the language's worker for the whole batch;
+        # (H) Go and Java look entities up in the full package, others in the root module
+        found: list[bool] | None = None
+        if tool is None or _is_tool_available(tool):
+            found = _introspection_pool().query(
+                language,
+                [
+                    (
+                        separator.join(parts[:-1]) if package_scoped else parts[0],
+                        parts[-1],
+                    )
+                    for _, parts in candidates
+                ],
+            )
 
-        result = (
-            cs.SEPARATOR_DOT.join(parts[:-1])
-            if entity_name[0].isupper()
-            else full_qualified_name
+        for index, (full_qualified_name, parts) in enumerate(candidates):
+            if (found is not None and found[index]) or looks_like_member(parts[-1]):
+                result = separator.join(parts[:-1])
+            else:
+                result = full_qualified_name
+            if cached:
+                _cache_stdlib_result(language, full_qualified_name, result)
+            results[full_qualified_name] = result
+        return results
+
+    def _extract_python_stdlib_paths(
+        self, full_qualified_names: list[str]
+    ) -> dict[str, str]:
+        return self._introspect_paths(
+            full_qualified_names,
+            cs.SupportedLanguage.PYTHON,
+            cs.SEPARATOR_DOT,
+            _starts_uppercase,
+            cached=True,
         )
-        _cache_stdlib_result(cs.SupportedLanguage.JS, full_qualified_name, result)
-        return result
 
-    def _extract_go_stdlib_path(self, full_qualified_name: str) -> str:
-        parts = full_qualified_name.split(cs.SEPARATOR_SLASH)
-        if len(parts) >= 2:
-            try:
-                import os
-                import subprocess
-
-                package_path = cs.SEPARATOR_SLASH.join(parts[:-1])
-                entity_name = parts[-1]
-
-                resolve_result = subprocess.run(
-                    ["go", "list", "-f", "{{.Dir}}", package_path],
-                    check=False,
-                    capture_output=True,
-                    text=True,
-                    timeout=5,
-                )
-
-                if resolve_result.returncode != 0:
-                    raise subprocess.CalledProcessError(
-                        resolve_result.returncode, resolve_result.args
-                    )
+    def _extract_js_stdlib_paths(
+        self, full_qualified_names: list[str]
+    ) -> dict[str, str]:
+        return self._introspect_paths(
+            full_qualified_names,
+            cs.SupportedLanguage.JS,
+            cs.SEPARATOR_DOT,
+            _starts_uppercase,
+            tool="node",
+            cached=True,
+        )
 
-                package_dir = resolve_result.stdout.strip()
-                if not package_dir:
-                    raise subprocess.CalledProcessError(1, ["go", "list"])
-
-                go_script = """
-package main
-
-import (
-    "encoding/json"
-    "fmt"
-    "go/doc"
-    "go/parser"
-    "go/token"
-    "os"
-)
-
-func main() {
-    packagePath := os.Getenv("PACKAGE_PATH")
-    entityName := os.Getenv("ENTITY_NAME")
-
-    if packagePath == "" || entityName == "" {
-        fmt.Print("{\"hasEntity\": false}")
-        return
-    }
-
-    fset := token.NewFileSet()
-    pkgs, err := parser.ParseDir(fset, packagePath, nil, parser.ParseComments)
-    if err != nil {
-        fmt.Print("{\"hasEntity\": false}")
-        return
-    }
-
-    for _, pkg := range pkgs {
-        d := doc.New(pkg, packagePath, doc.AllDecls)
-
-        // Check functions
-        for _, f := range d.Funcs {
-            if f.Name == entityName {
-                fmt.Print("{\"hasEntity\": true, \"entityType\": \"function\"}")
-                return
-            }
-        }
-
-        // Check types (structs, interfaces, etc.)
-        for _, t := range d.Types {
-            if t.Name == entityName {
-                fmt.Print("{\"hasEntity\": true, \"entityType\": \"type\"}")
-                return
-            }
-        }
-
-        // Check constants and variables
-        for _, v := range d.Vars {
-            for _, name := range v.Names {
-                if name == entityName {
-                    fmt.Print("{\"hasEntity\": true, \"entityType\": \"variable\"}")
-                    return
-                }
-            }
-        }
-
-        for _, c := range d.Consts {
-            for _, name := range c.Names {
-                if name == entityName {
-                    fmt.Print("{\"hasEntity\": true, \"entityType\": \"constant\"}")
-                    return
-                }
-            }
-        }
-    }
-
-    fmt.Print("{\"hasEntity\": false}")
-}
-                """
-
-                env = os.environ.copy()
-                env["PACKAGE_PATH"] = package_dir
-                env["ENTITY_NAME"] = entity_name
-
-                with subprocess.Popen(
-                    ["go", "run", "-"],
-                    stdin=subprocess.PIPE,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    text=True,
-                    env=env,
-                ) as proc:
-                    stdout, _ = proc.communicate(go_script, timeout=10)
-
-                    if proc.returncode == 0:
-                        data = json.loads(stdout.strip())
-                        if data[cs.JSON_KEY_HAS_ENTITY]:
-                            return package_path
-
-            except (
-                subprocess.TimeoutExpired,
-                subprocess.CalledProcessError,
-                json.JSONDecodeError,
-                FileNotFoundError,
-            ):
-                pass
+    def _extract_go_stdlib_paths(
+        self, full_qualified_names: list[str]
+    ) -> dict[str, str]:
+        return self._introspect_paths(
+            full_qualified_names,
+            cs.SupportedLanguage.GO,
+            cs.SEPARATOR_SLASH,
+            _starts_uppercase,
+            tool="go",
+            package_scoped=True,
+        )
 
-            entity_name = parts[-1]
-            if entity_name[0].isupper():
-                return cs.SEPARATOR_SLASH.join(parts[:-1])
+    def _extract_java_stdlib_paths(
+        self, full_qualified_names: list[str]
+    ) -> dict[str, str]:
+        return self._introspect_paths(
+            full_qualified_names,
+            cs.SupportedLanguage.JAVA,
+            cs.SEPARATOR_DOT,
+            _looks_like_java_class,
+            tool="javac",
+            package_scoped=True,
+        )
 
-        return full_qualified_name
+    def _extract_lua_stdlib_paths(
+        self, full_qualified_names: list[str]
+    ) -> dict[str, str]:
+        return self._introspect_paths(
+            full_qualified_names,
+            cs.SupportedLanguage.LUA,
+            cs.SEPARATOR_DOT,
+            _looks_like_lua_member,
+            tool="lua",
+        )
 
     def _extract_rust_stdlib_path(self, full_qualified_name: str) -> str:
         parts = full_qualified_name.split(cs.SEPARATOR_DOUBLE_COLON)
@@ -509,211 +389,6 @@ int main() {{
 
         return full_qualified_name
 
-    def _extract_java_stdlib_path(self, full_qualified_name: str) -> str:
-        parts = full_qualified_name.split(cs.SEPARATOR_DOT)
-        if len(parts) >= 2:
-            try:
-                import os
-                import subprocess
-                import tempfile
-
-                package_name = cs.SEPARATOR_DOT.join(parts[:-1])
-                entity_name = parts[-1]
-
-                java_program = """
-import java.lang.reflect.*;
-
-public class StdlibCheck {
-    public static void main(String[] args) {
-        if (args.length < 2) {
-            System.out.println("{\\"hasEntity\\": false}");
-            return;
-        }
-
-        String packageName = args[0];
-        String entityName = args[1];
-
-        try {
-            Class<?> clazz = Class.forName(packageName + "." + entityName);
-            System.out.println("{\\"hasEntity\\": true, \\"entityType\\": \\"class\\"}");
-        } catch (ClassNotFoundException e) {
-            // Try as method or field in parent package
-            try {
-                Class<?> packageClass = Class.forName(packageName);
-                Method[] methods = packageClass.getMethods();
-                Field[] fields = packageClass.getFields();
-
-                boolean foundMethod = false;
-                for (Method method : methods) {
-                    if (method.getName().equals(entityName)) {
-                        foundMethod = true;
-                        break;
-                    }
-                }
-
-                boolean foundField = false;
-                for (Field field : fields) {
-                    if (field.getName().equals(entityName)) {
-                        foundField = true;
-                        break;
-                    }
-                }
-
-                if (foundMethod || foundField) {
-                    System.out.println("{\\"hasEntity\\": true, \\"entityType\\": \\"member\\"}");
-                } else {
-                    System.out.println("{\\"hasEntity\\": false}");
-                }
-            } catch (Exception ex) {
-                System.out.println("{\\"hasEntity\\": false}");
-            }
-        }
-    }
-}
-                """
-
-                with tempfile.NamedTemporaryFile(
-                    mode="w", suffix=".java", delete=False
-                ) as f:
-                    f.write(java_program)
-                    java_file = f.name
-
-                try:
-                    compile_result = subprocess.run(
-                        ["javac", java_file],
-                        check=False,
-                        capture_output=True,
-                        text=True,
-                        timeout=10,
-                    )
-
-                    if compile_result.returncode == 0:
-                        class_name = os.path.splitext(os.path.basename(java_file))[0]
-                        run_result = subprocess.run(
-                            [
-                                "java",
-                                "-cp",
-                                os.path.dirname(java_file),
-                                class_name,
-                                package_name,
-                                entity_name,
-                            ],
-                            check=False,
-                            capture_output=True,
-                            text=True,
-                            timeout=10,
-                        )
-
-                        if run_result.returncode == 0:
-                            data = json.loads(run_result.stdout.strip())
-                            if data.get(cs.JSON_KEY_HAS_ENTITY):
-                                return cs.SEPARATOR_DOT.join(parts[:-1])
-
-                finally:
-                    for ext in (cs.EXT_JAVA, cs.EXT_CLASS):
-                        temp_file = os.path.splitext(java_file)[0] + ext
-                        try:
-                            os.unlink(temp_file)
-                        except OSError:
-                            pass
-
-            except (
-                subprocess.TimeoutExpired,
-                subprocess.CalledProcessError,
-                json.JSONDecodeError,
-                OSError,
-            ):
-                pass
-
-            entity_name = parts[-1]
-            if (
-                entity_name[0].isupper()
-                or entity_name.endswith(cs.JAVA_SUFFIX_EXCEPTION)
-                or entity_name.endswith(cs.JAVA_SUFFIX_ERROR)
-                or entity_name.endswith(cs.JAVA_SUFFIX_INTERFACE)
-                or entity_name.endswith(cs.JAVA_SUFFIX_BUILDER)
-                or entity_name in cs.JAVA_STDLIB_CLASSES
-            ):
-                return cs.SEPARATOR_DOT.join(parts[:-1])
-
-        return full_qualified_name
-
-    def _extract_lua_stdlib_path(self, full_qualified_name: str) -> str:
-        parts = full_qualified_name.split(cs.SEPARATOR_DOT)
-        if len(parts) >= 2:
-            module_name = parts[0]
-            entity_name = parts[-1]
-
-            try:
-                import os
-                import subprocess
-
-                lua_script = """
--- Get module and entity names from environment
-local module_name = os.getenv("MODULE_NAME")
-local entity_name = os.getenv("ENTITY_NAME")
-
-if not module_name or not entity_name then
-    print("hasEntity=false")
-    return
-end
-
--- Check built-in modules first (they're global tables in Lua)
-local module_table = _G[module_name]
-if module_table and type(module_table) == "table" then
-    local hasEntity = module_table[entity_name] ~= nil
-    if hasEntity then
-        print("hasEntity=true")
-    else
-        print("hasEntity=false")
-    end
-else
-    -- Try require for user modules
-    local success, loaded_module = pcall(require, module_name)
-    if success and type(loaded_module) == "table" then
-        local hasEntity = loaded_module[entity_name] ~= nil
-        if hasEntity then
-            print("hasEntity=true")
-        else
-            print("hasEntity=false")
-        end
-    else
-        print("hasEntity=false")
-    end
-end
-                """
-
-                env = os.environ.copy()
-                env["MODULE_NAME"] = module_name
-                env["ENTITY_NAME"] = entity_name
-
-                result = subprocess.run(
-                    ["lua", "-e", lua_script],
-                    check=False,
-                    capture_output=True,
-                    text=True,
-                    timeout=5,
-                    env=env,
-                )
-
-                if result.returncode == 0:
-                    output = result.stdout.strip()
-                    if "hasEntity=true" in output:
-                        return cs.SEPARATOR_DOT.join(parts[:-1])
-
-            except (
-                subprocess.TimeoutExpired,
-                subprocess.CalledProcessError,
-                FileNotFoundError,
-            ):
-                pass
-
-            entity_name = parts[-1]
-            if entity_name[0].isupper() or entity_name in cs.LUA_STDLIB_MODULES:
-                return cs.SEPARATOR_DOT.join(parts[:-1])
-
-        return full_qualified_name
-
     def _extract_generic_stdlib_path(self, full_qualified_name: str) -> str:
         parts = full_qualified_name.split(cs.SEPARATOR_DOT)
         if len(parts) >= 2:
@@ -0,0 +1,450 @@
+from __future__ import annotations
+
+import atexit
+import os
+import queue
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+from collections.abc import Callable
+from pathlib import Path
+
+from loguru import logger
+
+from .. import constants as cs
+from .. import logs as ls
+
+# (H) Wire protocol shared by every worker: one "module<TAB>entity" line per
+# (H) name, a blank line ends the batch, and the worker answers with a single
+# (H) line of 0/1 flags, one per name, in request order.
+
+_PYTHON_WORKER = r"""
+import importlib
+import inspect
+import os
+import sys
+
+# Keep a private copy of fd 1 for replies, then point fd 1 at stderr so
+# imports (including C extensions writing to the fd) cannot break framing
+out = os.fdopen(os.dup(1), "w")
+os.dup2(2, 1)
+sys.stdout = sys.stderr
+batch = []
+for line in sys.stdin:
+    line = line.rstrip("\n")
+    if line:
+        batch.append(line.split("\t", 1))
+        continue
+    flags = []
+    for module_name, entity_name in batch:
+        try:
+            module = importlib.import_module(module_name)
+            found = hasattr(module, entity_name) and not inspect.ismodule(
+                getattr(module, entity_name)
+            )
+        except (Exception, SystemExit):
+            found = False
+        flags.append("1" if found else "0")
+    out.write("".join(flags) + "\n")
+    out.flush()
+    batch = []
+"""
+
+_NODE_WORKER = r"""
+const readline = require("readline");
+const write = process.stdout.write.bind(process.stdout);
+console.log = console.error;
+let batch = [];
+readline.createInterface({ input: process.stdin }).on("line", (line) => {
+    if (line) {
+        batch.push(line.split("\t"));
+        return;
+    }
+    const flags = batch.map(([moduleName, entityName]) => {
+        try {
+            const module = require(moduleName);
+            if (!(entityName in module)) return "0";
+            const entityType = typeof module[entityName];
+            return entityType === "function" || entityType === "object" ? "1" : "0";
+        } catch (e) {
+            return "0";
+        }
+    });
+    write(flags.join("") + "\n");
+    batch = [];
+});
+"""
+
+_LUA_WORKER = r"""
+local batch = {}
+for line in io.lines() do
+    if line ~= "" then
+        local module_name, entity_name = line:match("^([^\t]*)\t(.*)$")
+        batch[#batch + 1] = { module_name, entity_name }
+    else
+        local flags = {}
+        for i, pair in ipairs(batch) do
+            local module_table = _G[pair[1]]
+            if type(module_table) ~= "table" then
+                local ok, loaded = pcall(require, pair[1])
+                module_table = ok and loaded or nil
+            end
+            local found = type(module_table) == "table"
+                and module_table[pair[2]] ~= nil
+            flags[i] = found and "1" or "0"
+        end
+        io.write(table.concat(flags), "\n")
+        io.flush()
+        batch = {}
+    end
+end
+"""
+
+_GO_WORKER = r"""
+package main
+
+import (
+    "bufio"
+    "go/doc"
+    "go/parser"
+    "go/token"
+    "os"
+    "os/exec"
+    "strings"
+)
+
+func packageNames(packagePath string) map[string]bool {
+    names := map[string]bool{}
+    out, err := exec.Command("go", "list", "-f", "{{.Dir}}", packagePath).Output()
+    if err != nil {
+        return names
+    }
+    dir := strings.TrimSpace(string(out))
+    if dir == "" {
+        return names
+    }
+
+    fset := token.NewFileSet()
+    pkgs, err := parser.ParseDir(fset, dir, nil, parser.ParseComments)
+    if err != nil {
+        return names
+    }
+
+    for _, pkg := range pkgs {
+        d := doc.New(pkg, packagePath, doc.AllDecls)
+        for _, f := range d.Funcs {
+            names[f.Name] = true
+        }
+        for _, t := range d.Types {
+            names[t.Name] = true
+        }
+        for _, v := range d.Vars {
+            for _, name := range v.Names {
+                names[name] = true
+            }
+        }
+        for _, c := range d.Consts {
+            for _, name := range c.Names {
+                names[name] = true
+            }
+        }
+    }
+    return names
+}
+
+func main() {
+    packages := map[string]map[string]bool{}
+    scanner := bufio.NewScanner(os.Stdin)
+    writer := bufio.NewWriter(os.Stdout)
+    var flags strings.Builder
+
+    for scanner.Scan() {
+        line := scanner.Text()
+        if line != "" {
+            found := false
+            if parts := strings.SplitN(line, "\t", 2); len(parts) == 2 {
+                names, ok := packages[parts[0]]
+                if !ok {
+                    names = packageNames(parts[0])
+                    packages[parts[0]] = names
+                }
+                found = names[parts[1]]
+            }
+            if found {
+                flags.WriteByte('1')
+            } else {
+                flags.WriteByte('0')
+            }
+            continue
+        }
+        writer.WriteString(flags.String())
+        writer.WriteByte('\n')
+        writer.Flush()
+        flags.Reset()
+    }
+}
+"""
+
+_JAVA_WORKER = r"""
+import java.io.*;
+import java.lang.reflect.*;
+
+public class StdlibWorker {
+    static boolean hasEntity(String packageName, String entityName) {
+        ClassLoader loader = StdlibWorker.class.getClassLoader();
+        try {
+            Class.forName(packageName + "." + entityName, false, loader);
+            return true;
+        } catch (Throwable e) {
+            // Try as method or field in parent package
+            try {
+                Class<?> packageClass = Class.forName(packageName, false, loader);
+                for (Method method : packageClass.getMethods()) {
+                    if (method.getName().equals(entityName)) {
+                        return true;
+                    }
+                }
+                for (Field field : packageClass.getFields()) {
+                    if (field.getName().equals(entityName)) {
+                        return true;
+                    }
+                }
+            } catch (Throwable ex) {
+            }
+            return false;
+        }
+    }
+
+    public static void main(String[] args) throws IOException {
+        BufferedReader in = new BufferedReader(new InputStreamReader(System.in));
+        PrintStream out = System.out;
+        System.setOut(System.err);
+        StringBuilder flags = new StringBuilder();
+        String line;
+        while ((line = in.readLine()) != null) {
+            if (!line.isEmpty()) {
+                String[] parts = line.split("\t", 2);
+                flags.append(parts.length == 2 && hasEntity(parts[0], parts[1]) ? '1' : '0');
+                continue;
+            }
+            out.println(flags);
+            out.flush();
+            flags.setLength(0);
+        }
+    }
+}
+"""
+
+
+def _is_framable(value: str) -> bool:
+    return (
+        "\n" not in value
+        and "\r" not in value
+        and cs.STDLIB_WORKER_FIELD_SEP not in value
+    )
+
+
+def reply_timeout(names: int) -> float:
+    # (H) Capped so a hung worker costs seconds, not minutes, per attempt
+    return min(
+        cs.STDLIB_WORKER_REPLY_TIMEOUT + names * cs.STDLIB_WORKER_TIMEOUT_PER_NAME,
+        cs.STDLIB_WORKER_MAX_REPLY_TIMEOUT,
+    )
+
+
+class IntrospectionWorker:
+    def __init__(self, command: list[str], workdir: Path | None = None) -> None:
+        self.command = command
+        self.workdir = workdir
+        self._proc = subprocess.Popen(
+            command,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            bufsize=1,
+        )
+        self._lines: queue.Queue[str | None] = queue.Queue()
+        self.answered = False
+        threading.Thread(target=self._pump, daemon=True).start()
+
+    def _pump(self) -> None:
+        assert self._proc.stdout is not None
+        for line in self._proc.stdout:
+            self._lines.put(line)
+        self._lines.put(None)
+
+    def query(self, pairs: list[tuple[str, str]]) -> list[bool] | None:
+        assert self._proc.stdin is not None
+        # (H) A name that would break the line framing is sent as an empty
+        # (H) lookup, which every worker reports as not found
+        request = "".join(
+            f"{module_name}{cs.STDLIB_WORKER_FIELD_SEP}{entity_name}\n"
+            if _is_framable(module_name) and _is_framable(entity_name)
+            else f"{cs.STDLIB_WORKER_FIELD_SEP}\n"
+            for module_name, entity_name in pairs
+        )
+        try:
+            self._proc.stdin.write(f"{request}\n")
+            self._proc.stdin.flush()
+            line = self._lines.get(timeout=reply_timeout(len(pairs)))
+        except (OSError, queue.Empty):
+            return None
+        if line is None or len(flags := line.rstrip("\n")) != len(pairs):
+            return None
+        self.answered = True
+        return [flag == cs.STDLIB_WORKER_FOUND for flag in flags]
+
+    def close(self) -> None:
+        if self._proc.poll() is None:
+            self._proc.kill()
+        try:
+            self._proc.wait(timeout=cs.STDLIB_WORKER_TIMEOUT)
+        except subprocess.TimeoutExpired:
+            pass
+        for stream in (self._proc.stdin, self._proc.stdout):
+            if stream is not None:
+                try:
+                    stream.close()
+                except OSError:
+                    pass
+        if self.workdir is not None:
+            shutil.rmtree(self.workdir, ignore_errors=True)
+
+
+def _start_python_worker() -> IntrospectionWorker:
+    return IntrospectionWorker([sys.executable, "-c", _PYTHON_WORKER])
+
+
+def _start_node_worker() -> IntrospectionWorker:
+    return IntrospectionWorker(["node", "-e", _NODE_WORKER])
+
+
+def _start_lua_worker() -> IntrospectionWorker:
+    return IntrospectionWorker(["lua", "-e", _LUA_WORKER])
+
+
+def _start_go_worker() -> IntrospectionWorker:
+    # (H) Built up front like the Java worker: a cold `go run` compiles for
+    # (H) seconds, which would otherwise count against the first reply
+    workdir = Path(tempfile.mkdtemp())
+    try:
+        source = workdir / "stdlib_worker.go"
+        binary = workdir / "stdlib_worker"
+        source.write_text(_GO_WORKER)
+        subprocess.run(
+            ["go", "build", "-o", str(binary), str(source)],
+            check=True,
+            capture_output=True,
+            timeout=cs.STDLIB_WORKER_TIMEOUT,
+        )
+        return IntrospectionWorker([str(binary)], workdir=workdir)
+    except (OSError, subprocess.SubprocessError):
+        shutil.rmtree(workdir, ignore_errors=True)
+        raise
+
+
+def _start_java_worker() -> IntrospectionWorker:
+    workdir = Path(tempfile.mkdtemp())
+    try:
+        source = workdir / "StdlibWorker.java"
+        source.write_text(_JAVA_WORKER)
+        subprocess.run(
+            ["javac", str(source)],
+            check=True,
+            capture_output=True,
+            timeout=cs.STDLIB_WORKER_TIMEOUT,
+        )
+        return IntrospectionWorker(
+            ["java", "-cp", str(workdir), "StdlibWorker"], workdir=workdir
+        )
+    except (OSError, subprocess.SubprocessError):
+        shutil.rmtree(workdir, ignore_errors=True)
+        raise
+
+
+_WORKER_FACTORIES: dict[cs.SupportedLanguage, Callable[[], IntrospectionWorker]] = {
+    cs.SupportedLanguage.PYTHON: _start_python_worker,
+    cs.SupportedLanguage.JS: _start_node_worker,
+    cs.SupportedLanguage.LUA: _start_lua_worker,
+    cs.SupportedLanguage.GO: _start_go_worker,
+    cs.SupportedLanguage.JAVA: _start_java_worker,
+}
+
+
+class IntrospectionPool:
+    def __init__(self) -> None:
+        self._workers: dict[cs.SupportedLanguage, IntrospectionWorker] = {}
+        self._unavailable: set[cs.SupportedLanguage] = set()
+        self._restarts: dict[cs.SupportedLanguage, int] = {}
+        self._lock = threading.Lock()
+        self._registered_exit = False
+        self._pid = os.getpid()
+
+    def _worker_for(self, language: cs.SupportedLanguage) -> IntrospectionWorker | None:
+        if (worker := self._workers.get(language)) is not None:
+            return worker
+        if language in self._unavailable or language not in _WORKER_FACTORIES:
+            return None
+        try:
+            worker = _WORKER_FACTORIES[language]()
+        except (OSError, subprocess.SubprocessError) as e:
+            logger.debug(ls.IMP_WORKER_UNAVAILABLE.format(language=language, error=e))
+            self._unavailable.add(language)
+            return None
+        if not self._registered_exit:
+            atexit.register(self.close)
+            self._registered_exit = True
+        self._workers[language] = worker
+        logger.debug(ls.IMP_WORKER_STARTED.format(language=language))
+        return worker
+
+    def query(
+        self, language: cs.SupportedLanguage, pairs: list[tuple[str, str]]
+    ) -> list[bool] | None:
+        with self._lock:
+            if (worker := self._worker_for(language)) is None:
+                return None
+            found: list[bool] = []
+            for start in range(0, len(pairs), cs.STDLIB_WORKER_BATCH_SIZE):
+                batch = pairs[start : start + cs.STDLIB_WORKER_BATCH_SIZE]
+                while (flags := worker.query(batch)) is None:
+                    worker.close()
+                    del self._workers[language]
+                    if (worker := self._restart(language, worker)) is None:
+                        return None
+                found.extend(flags)
+            return found
+
+    def _restart(
+        self, language: cs.SupportedLanguage, failed: IntrospectionWorker
+    ) -> IntrospectionWorker | None:
+        # (H) A hung or crashed worker gets a fresh process and the batch is
+        # (H) resent; past the restart limit callers fall back to naming
+        # (H) heuristics for the rest of the run. A worker that never answered
+        # (H) points at a broken toolchain, so it is not restarted at all.
+        attempt = self._restarts.get(language, 0) + 1
+        if not failed.answered or attempt > cs.STDLIB_WORKER_MAX_RESTARTS:
+            logger.debug(ls.IMP_WORKER_FAILED.format(language=language))
+            self._unavailable.add(language)
+            return None
+        self._restarts[language] = attempt
+        logger.debug(
+            ls.IMP_WORKER_RESTARTED.format(
+                language=language, attempt=attempt, limit=cs.STDLIB_WORKER_MAX_RESTARTS
+            )
+        )
+        return self._worker_for(language)
+
+    def close(self) -> None:
+        # (H) A forked child inherits the atexit hook but not the workers
+        if os.getpid() != self._pid:
+            return
+        with self._lock:
+            for worker in self._workers.values():
+                worker.close()
+            self._workers.clear()
+            self._unavailable.clear()
+            self._restarts.clear()
@@ -1,3 +1,6 @@
+import os
+from collections import defaultdict
+from collections.abc import Iterable
 from pathlib import Path
 
 from loguru import logger
@@ -5,8 +8,8 @@ from loguru import logger
 from .. import constants as cs
 from .. import logs
 from ..services import IngestorProtocol
-from ..types_defs import LanguageQueries, NodeIdentifier
-from ..utils.path_utils import should_skip_path
+from ..types_defs import LanguageQueries, NodeIdentifier, RepoEntry
+from ..utils.path_utils import build_path_matcher, walk_repository
 
 
 class StructureProcessor:
@@ -36,16 +39,36 @@ class StructureProcessor:
             return (cs.NodeLabel.PACKAGE, cs.KEY_QUALIFIED_NAME, parent_container_qn)
         return (cs.NodeLabel.FOLDER, cs.KEY_PATH, str(parent_rel_path))
 
-    def identify_structure(self) -> None:
-        directories = {self.repo_path}
-        for path in self.repo_path.rglob(cs.GLOB_ALL):
-            if path.is_dir() and not should_skip_path(
-                path,
+    def _package_indicators(self) -> frozenset[str]:
+        return frozenset(
+            indicator
+            for lang_queries in self.queries.values()
+            for indicator in lang_queries[cs.QUERY_CONFIG].package_indicators
+        )
+
+    def identify_structure(self, entries: Iterable[RepoEntry] | None = None) -> None:
+        if entries is None:
+            entries = walk_repository(
                 self.repo_path,
-                exclude_paths=self.exclude_paths,
-                include_paths=self.include_paths,
-            ):
-                directories.add(path)
+                build_path_matcher(
+                    self.repo_path, self.exclude_paths, self.include_paths
+                ),
+            )
+        package_indicators = self._package_indicators()
+        # (H) Names seen under each directory during the walk, keyed by the raw
+        # (H) scandir path, so package status is a set intersection rather than
+        # (H) a stat per indicator
+        directories = {self.repo_path: str(self.repo_path)}
+        child_names: defaultdict[str, set[str]] = defaultdict(set)
+        unscanned: set[Path] = set()
+        for repo_entry in entries:
+            child_names[os.path.dirname(repo_entry.entry.path)].add(
+                repo_entry.entry.name
+            )
+            if repo_entry.entry.is_dir():
+                directories[repo_entry.path] = repo_entry.entry.path
+                if repo_entry.entry.is_symlink():
+                    unscanned.add(repo_entry.path)
 
         for root in sorted(directories):
             relative_root = root.relative_to(self.repo_path)
@@ -53,17 +76,14 @@ class StructureProcessor:
             parent_rel_path = relative_root.parent
             parent_container_qn = self.structural_elements.get(parent_rel_path)
 
-            is_package = False
-            package_indicators: set[str] = set()
-
-            for lang_queries in self.queries.values():
-                lang_config = lang_queries[cs.QUERY_CONFIG]
-                package_indicators.update(lang_config.package_indicators)
-
-            for indicator in package_indicators:
-                if (root / indicator).exists():
-                    is_package = True
-                    break
+            if root in unscanned:
+                is_package = any(
+                    (root / indicator).exists() for indicator in package_indicators
+                )
+            else:
+                is_package = not package_indicators.isdisjoint(
+                    child_names[directories[root]]
+                )
 
             if is_package:
                 package_qn = cs.SEPARATOR_DOT.join(
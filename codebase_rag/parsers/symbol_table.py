@@ -0,0 +1,52 @@
+import sys
+
+from .. import constants as cs
+from ..types_defs import QualifiedName
+
+
+# (H) Interns qualified names so every map, trie path and relationship buffer
+# (H) holding the same QN shares one string object, and caches each QN's
+# (H) dot-split parts. Maps stay keyed by str: type inference, graph export
+# (H) and the realtime updater read them directly.
+class SymbolTable:
+    def __init__(self) -> None:
+        self._index: dict[QualifiedName, int] = {}
+        self._names: list[QualifiedName] = []
+        self._parts: list[tuple[str, ...] | None] = []
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __contains__(self, qualified_name: QualifiedName) -> bool:
+        return qualified_name in self._index
+
+    def _slot(self, qualified_name: QualifiedName) -> int:
+        if (slot := self._index.get(qualified_name)) is not None:
+            return slot
+        slot = len(self._names)
+        self._index[qualified_name] = slot
+        self._names.append(qualified_name)
+        self._parts.append(None)
+        return slot
+
+    def intern(self, qualified_name: QualifiedName) -> QualifiedName:
+        return self._names[self._slot(qualified_name)]
+
+    def parts(self, qualified_name: QualifiedName) -> tuple[str, ...]:
+        slot = self._slot(qualified_name)
+        if (parts := self._parts[slot]) is None:
+            # (H) Parts are shared process-wide, so "proj", "utils", "get", ...
+            # (H) exist once no matter how many QNs or trie levels use them.
+            parts = tuple(
+                sys.intern(part) for part in qualified_name.split(cs.SEPARATOR_DOT)
+            )
+            self._parts[slot] = parts
+        return parts
+
+    def intern_mapping(
+        self, mapping: dict[str, QualifiedName]
+    ) -> dict[str, QualifiedName]:
+        return {
+            sys.intern(local_name): self.intern(qualified_name)
+            for local_name, qualified_name in mapping.items()
+        }
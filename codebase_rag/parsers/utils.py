@@ -22,6 +22,7 @@ if TYPE_CHECKING:
     from ..language_spec import LanguageSpec
     from ..services import IngestorProtocol
     from ..types_defs import FunctionRegistryTrieProtocol
+    from .symbol_table import SymbolTable
 
 
 class FunctionCapturesResult(NamedTuple):
@@ -83,6 +84,9 @@ def ingest_method(
     language: cs.SupportedLanguage | None = None,
     extract_decorators_func: Callable[[ASTNode], list[str]] | None = None,
     method_qualified_name: str | None = None,
+    *,
+    symbol_table: SymbolTable | None = None,
+    path: str | None = None,
 ) -> None:
     if language == cs.SupportedLanguage.CPP:
         from .cpp import utils as cpp_utils
@@ -98,6 +102,8 @@ def ingest_method(
         method_name = text.decode(cs.ENCODING_UTF8)
 
     method_qn = method_qualified_name or f"{container_qn}.{method_name}"
+    if symbol_table is not None:
+        method_qn = symbol_table.intern(method_qn)
 
     decorators = extract_decorators_func(method_node) if extract_decorators_func else []
 
@@ -108,6 +114,7 @@ def ingest_method(
         cs.KEY_START_LINE: method_node.start_point[0] + 1,
         cs.KEY_END_LINE: method_node.end_point[0] + 1,
         cs.KEY_DOCSTRING: get_docstring_func(method_node),
+        cs.KEY_PATH: path,
     }
 
     logger.info(logs.METHOD_FOUND.format(name=method_name, qn=method_qn))
@@ -132,11 +139,16 @@ def ingest_exported_function(
     simple_name_lookup: SimpleNameLookup,
     get_docstring_func: Callable[[ASTNode], str | None],
     is_export_inside_function_func: Callable[[ASTNode], bool],
+    *,
+    symbol_table: SymbolTable | None = None,
+    path: str | None = None,
 ) -> None:
     if is_export_inside_function_func(function_node):
         return
 
     function_qn = f"{module_qn}.{function_name}"
+    if symbol_table is not None:
+        function_qn = symbol_table.intern(function_qn)
 
     function_props = {
         cs.KEY_QUALIFIED_NAME: function_qn,
@@ -144,6 +156,7 @@ def ingest_exported_function(
         cs.KEY_START_LINE: function_node.start_point[0] + 1,
         cs.KEY_END_LINE: function_node.end_point[0] + 1,
         cs.KEY_DOCSTRING: get_docstring_func(function_node),
+        cs.KEY_PATH: path,
     }
 
     logger.info(
@@ -0,0 +1,390 @@
+from __future__ import annotations
+
+import hashlib
+import math
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from array import array
+from collections.abc import Callable, Sequence
+from pathlib import Path
+
+from loguru import logger
+
+from .. import constants as cs
+from .. import logs as ls
+from ..config import settings
+from ..types_defs import CypherCacheStats
+
+EmbedFunction = Callable[[str], Sequence[float]]
+
+_WHITESPACE = re.compile(r"\s+")
+_CYPHER_LITERAL = re.compile(cs.CYPHER_CACHE_LITERAL_PATTERN)
+_SLOT_VALUE = re.compile(cs.CYPHER_CACHE_SLOT_PATTERN)
+_QUERIES = "cypher_queries"
+_TEMPLATES = "cypher_templates"
+_KEY_COLUMNS = {_QUERIES: "question", _TEMPLATES: "pattern"}
+
+
+def normalize_question(question: str) -> str:
+    text = unicodedata.normalize("NFKC", question)
+    return _WHITESPACE.sub(" ", text).strip().rstrip(cs.CYPHER_CACHE_QUESTION_TRAILING)
+
+
+def schema_fingerprint(schema: str) -> str:
+    digest = hashlib.sha256(schema.encode()).hexdigest()
+    return digest[: cs.CYPHER_CACHE_SCHEMA_HASH_LENGTH]
+
+
+def build_template(question: str, cypher: str) -> tuple[str, str] | None:
+    # (H) Literals the model copied verbatim from the question become slots, so
+    # (H) "callers of foo" can answer "callers of bar" without another LLM call.
+    # (H) Slot values may not contain quotes or backslashes, which keeps the
+    # (H) substituted Cypher inside its original string literal.
+    literals: list[str] = []
+    for match in _CYPHER_LITERAL.finditer(cypher):
+        value = match.group(1) if match.group(1) is not None else match.group(2)
+        if value and value not in literals and _SLOT_VALUE.fullmatch(value):
+            literals.append(value)
+    if not literals:
+        return None
+
+    spans: list[tuple[int, int, int]] = []
+    for index, literal in enumerate(literals):
+        boundary = re.compile(rf"(?<![\w.]){re.escape(literal)}(?![\w.])")
+        if (found := boundary.search(question)) is None:
+            continue
+        if any(found.start() < end and start < found.end() for start, end, _ in spans):
+            continue
+        spans.append((found.start(), found.end(), index))
+    if not spans:
+        return None
+
+    pattern_parts: list[str] = []
+    position = 0
+    for start, end, index in sorted(spans):
+        pattern_parts.append(re.escape(question[position:start]))
+        group = cs.CYPHER_CACHE_SLOT_GROUP.format(index=index)
+        pattern_parts.append(f"(?P<{group}>{cs.CYPHER_CACHE_SLOT_PATTERN})")
+        position = end
+    pattern_parts.append(re.escape(question[position:]))
+
+    template = cypher
+    for _, _, index in spans:
+        literal = literals[index]
+        slot = cs.CYPHER_CACHE_SLOT.format(index=index)
+        template = template.replace(f"'{literal}'", f"'{slot}'")
+        template = template.replace(f'"{literal}"', f'"{slot}"')
+    return "".join(pattern_parts), template
+
+
+def _fill_template(pattern: str, template: str, question: str) -> str | None:
+    try:
+        match = re.fullmatch(pattern, question, flags=re.IGNORECASE)
+    except re.error:
+        return None
+    if match is None:
+        return None
+    cypher = template
+    for group, value in match.groupdict().items():
+        index = group.removeprefix(cs.CYPHER_CACHE_SLOT_GROUP.format(index=""))
+        cypher = cypher.replace(cs.CYPHER_CACHE_SLOT.format(index=index), value)
+    return cypher
+
+
+def _pack_embedding(vector: Sequence[float]) -> bytes | None:
+    norm = math.sqrt(sum(value * value for value in vector))
+    if not norm:
+        return None
+    return array("f", (value / norm for value in vector)).tobytes()
+
+
+def _unpack_embedding(blob: bytes) -> array[float]:
+    vector = array("f")
+    vector.frombytes(blob)
+    return vector
+
+
+class CypherCacheStore:
+    def __init__(
+        self,
+        db_path: Path | str,
+        max_entries: int = settings.CYPHER_CACHE_MAX_ENTRIES,
+        similarity_threshold: float | None = None,
+        embed: EmbedFunction | None = None,
+    ) -> None:
+        self.db_path = db_path
+        self.max_entries = max_entries
+        self.similarity_threshold = similarity_threshold
+        self._embed = embed if similarity_threshold is not None else None
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+        self._exact_hits = 0
+        self._similar_hits = 0
+        self._template_hits = 0
+        self._misses = 0
+        self._stores = 0
+        self._evictions = 0
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is not None:
+            return self._conn
+        try:
+            if isinstance(self.db_path, Path):
+                self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(
+                self.db_path, check_same_thread=False, isolation_level=None
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._create_tables(conn)
+        except (OSError, sqlite3.Error) as e:
+            # (H) A read-only home or a corrupt file must not break queries;
+            # (H) the cache still works for the lifetime of the process.
+            logger.warning(ls.CYPHER_CACHE_OPEN_ERROR.format(error=e))
+            conn = sqlite3.connect(
+                ":memory:", check_same_thread=False, isolation_level=None
+            )
+            self._create_tables(conn)
+        self._conn = conn
+        return conn
+
+    @staticmethod
+    def _create_tables(conn: sqlite3.Connection) -> None:
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS cypher_queries (
+                model TEXT NOT NULL,
+                schema_hash TEXT NOT NULL,
+                question TEXT NOT NULL,
+                cypher TEXT NOT NULL,
+                embedding BLOB,
+                hits INTEGER NOT NULL DEFAULT 0,
+                last_used REAL NOT NULL,
+                PRIMARY KEY (model, schema_hash, question)
+            ) WITHOUT ROWID
+        """)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS cypher_templates (
+                model TEXT NOT NULL,
+                schema_hash TEXT NOT NULL,
+                pattern TEXT NOT NULL,
+                cypher_template TEXT NOT NULL,
+                hits INTEGER NOT NULL DEFAULT 0,
+                last_used REAL NOT NULL,
+                PRIMARY KEY (model, schema_hash, pattern)
+            ) WITHOUT ROWID
+        """)
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS cypher_queries_last_used "
+            "ON cypher_queries (last_used)"
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS cypher_templates_last_used "
+            "ON cypher_templates (last_used)"
+        )
+
+    def lookup(self, question: str, model: str, schema_hash: str) -> str | None:
+        key = normalize_question(question)
+        scope = (model, schema_hash)
+        with self._lock:
+            conn = self._connection()
+            if (cypher := self._exact(conn, scope, key)) is not None:
+                self._exact_hits += 1
+                logger.debug(ls.CYPHER_CACHE_HIT.format(kind="exact", query=key))
+                return cypher
+            if (cypher := self._templated(conn, scope, key)) is not None:
+                self._template_hits += 1
+                logger.debug(ls.CYPHER_CACHE_HIT.format(kind="template", query=key))
+                return cypher
+
+        # (H) Embedding can take a while, so it runs without holding the lock
+        probe = self._embedding(key)
+        with self._lock:
+            if probe is not None and (
+                cypher := self._similar(self._connection(), scope, probe)
+            ):
+                self._similar_hits += 1
+                logger.debug(ls.CYPHER_CACHE_HIT.format(kind="similar", query=key))
+                return cypher
+            self._misses += 1
+        logger.debug(ls.CYPHER_CACHE_MISS.format(query=key))
+        return None
+
+    def _exact(
+        self, conn: sqlite3.Connection, scope: tuple[str, str], question: str
+    ) -> str | None:
+        row = conn.execute(
+            "SELECT cypher FROM cypher_queries "
+            "WHERE model = ? AND schema_hash = ? AND question = ?",
+            (*scope, question),
+        ).fetchone()
+        if row is None:
+            return None
+        self._touch(conn, _QUERIES, scope, question)
+        return str(row[0])
+
+    def _templated(
+        self, conn: sqlite3.Connection, scope: tuple[str, str], question: str
+    ) -> str | None:
+        for pattern, template in conn.execute(
+            "SELECT pattern, cypher_template FROM cypher_templates "
+            "WHERE model = ? AND schema_hash = ? ORDER BY hits DESC",
+            scope,
+        ).fetchall():
+            if (cypher := _fill_template(pattern, template, question)) is not None:
+                self._touch(conn, _TEMPLATES, scope, pattern)
+                return cypher
+        return None
+
+    def _similar(
+        self, conn: sqlite3.Connection, scope: tuple[str, str], probe: bytes
+    ) -> str | None:
+        if self.similarity_threshold is None:
+            return None
+        query = _unpack_embedding(probe)
+        best_score = self.similarity_threshold
+        best: tuple[str, str] | None = None
+        for stored_question, cypher, blob in conn.execute(
+            "SELECT question, cypher, embedding FROM cypher_queries "
+            "WHERE model = ? AND schema_hash = ? AND embedding IS NOT NULL",
+            scope,
+        ):
+            candidate = _unpack_embedding(blob)
+            if len(candidate) != len(query):
+                continue
+            score = sum(a * b for a, b in zip(query, candidate))
+            if score >= best_score:
+                best_score, best = score, (stored_question, cypher)
+        if best is None:
+            return None
+        self._touch(conn, _QUERIES, scope, best[0])
+        return best[1]
+
+    def _embedding(self, question: str) -> bytes | None:
+        if self._embed is None:
+            return None
+        try:
+            return _pack_embedding(self._embed(question))
+        except Exception as e:
+            logger.debug(ls.CYPHER_CACHE_EMBED_ERROR.format(error=e))
+            return None
+
+    @staticmethod
+    def _touch(
+        conn: sqlite3.Connection, table: str, scope: tuple[str, str], key: str
+    ) -> None:
+        conn.execute(
+            f"UPDATE {table} SET hits = hits + 1, last_used = ? "
+            f"WHERE model = ? AND schema_hash = ? AND {_KEY_COLUMNS[table]} = ?",
+            (time.time(), *scope, key),
+        )
+
+    def record(self, question: str, cypher: str, model: str, schema_hash: str) -> None:
+        key = normalize_question(question)
+        embedding = self._embedding(key)
+        template = build_template(key, cypher)
+        with self._lock:
+            conn = self._connection()
+            now = time.time()
+            try:
+                conn.execute("BEGIN")
+                conn.execute(
+                    "INSERT INTO cypher_queries "
+                    "(model, schema_hash, question, cypher, embedding, last_used) "
+                    "VALUES (?, ?, ?, ?, ?, ?) "
+                    "ON CONFLICT (model, schema_hash, question) DO UPDATE SET "
+                    "cypher = excluded.cypher, embedding = excluded.embedding, "
+                    "last_used = excluded.last_used",
+                    (model, schema_hash, key, cypher, embedding, now),
+                )
+                if template is not None:
+                    conn.execute(
+                        "INSERT INTO cypher_templates "
+                        "(model, schema_hash, pattern, cypher_template, last_used) "
+                        "VALUES (?, ?, ?, ?, ?) "
+                        "ON CONFLICT (model, schema_hash, pattern) DO UPDATE SET "
+                        "cypher_template = excluded.cypher_template, "
+                        "last_used = excluded.last_used",
+                        (model, schema_hash, *template, now),
+                    )
+                evicted = self._evict(conn, _QUERIES) + self._evict(conn, _TEMPLATES)
+                conn.execute("COMMIT")
+            except sqlite3.Error as e:
+                conn.rollback()
+                logger.warning(ls.CYPHER_CACHE_WRITE_ERROR.format(error=e))
+                return
+            self._stores += 1
+            if evicted:
+                self._evictions += evicted
+                logger.debug(ls.CYPHER_CACHE_EVICTED.format(count=evicted))
+        logger.debug(ls.CYPHER_CACHE_STORED.format(query=key))
+
+    def _evict(self, conn: sqlite3.Connection, table: str) -> int:
+        key_column = _KEY_COLUMNS[table]
+        (count,) = conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()
+        overflow = count - self.max_entries
+        if overflow <= 0:
+            return 0
+        conn.execute(
+            f"DELETE FROM {table} WHERE (model, schema_hash, {key_column}) IN ("
+            f"SELECT model, schema_hash, {key_column} FROM {table} "
+            f"ORDER BY last_used LIMIT ?)",
+            (overflow,),
+        )
+        return int(overflow)
+
+    def stats(self) -> CypherCacheStats:
+        with self._lock:
+            conn = self._connection()
+            (entries,) = conn.execute("SELECT COUNT(*) FROM cypher_queries").fetchone()
+            (templates,) = conn.execute(
+                "SELECT COUNT(*) FROM cypher_templates"
+            ).fetchone()
+            return CypherCacheStats(
+                exact_hits=self._exact_hits,
+                similar_hits=self._similar_hits,
+                template_hits=self._template_hits,
+                misses=self._misses,
+                stores=self._stores,
+                evictions=self._evictions,
+                entries=entries,
+                templates=templates,
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            conn = self._connection()
+            conn.execute("DELETE FROM cypher_queries")
+            conn.execute("DELETE FROM cypher_templates")
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+def default_cypher_cache_path() -> Path:
+    return Path.home() / cs.IMPORT_CACHE_DIR / cs.CYPHER_CACHE_FILE
+
+
+def open_cypher_cache() -> CypherCacheStore | None:
+    if not settings.CYPHER_CACHE_ENABLED:
+        return None
+    threshold = settings.CYPHER_CACHE_SIMILARITY_THRESHOLD
+    embed: EmbedFunction | None = None
+    if threshold is not None:
+        from ..utils.dependencies import has_semantic_dependencies
+
+        if has_semantic_dependencies():
+            from ..embedder import embed_code
+
+            embed = embed_code
+    return CypherCacheStore(
+        default_cypher_cache_path(),
+        max_entries=settings.CYPHER_CACHE_MAX_ENTRIES,
+        similarity_threshold=threshold,
+        embed=embed,
+    )
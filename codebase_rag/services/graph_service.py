@@ -1,3 +1,5 @@
+import threading
+import time
 from collections import defaultdict
 from collections.abc import Generator, Sequence
 from contextlib import contextmanager
@@ -10,12 +12,15 @@ from codebase_rag.types_defs import CursorProtocol, ResultValue
 
 from .. import exceptions as ex
 from .. import logs as ls
+from ..config import settings
 from ..constants import (
     ERR_SUBSTR_ALREADY_EXISTS,
     ERR_SUBSTR_CONSTRAINT,
+    EXPLAIN_PLAN_COLUMN,
+    INDEX_INFO_LABEL,
+    INDEX_INFO_PROPERTY,
     KEY_CREATED,
     KEY_FROM_VAL,
-    KEY_PROPS,
     KEY_TO_VAL,
     NODE_UNIQUE_CONSTRAINTS,
     REL_TYPE_CALLS,
@@ -24,7 +29,11 @@ from ..cypher_queries import (
     CYPHER_DELETE_ALL,
     CYPHER_EXPORT_NODES,
     CYPHER_EXPORT_RELATIONSHIPS,
+    CYPHER_SHOW_INDEX_INFO,
+    NODE_PROPERTY_INDEXES,
     build_constraint_query,
+    build_explain_query,
+    build_index_query,
     build_merge_node_query,
     build_merge_relationship_query,
     wrap_with_unwind,
@@ -37,28 +46,227 @@ from ..types_defs import (
     NodeBatchRow,
     PropertyDict,
     PropertyValue,
-    RelBatchRow,
     ResultRow,
 )
+from .query_cache import (
+    QueryResultCache,
+    bump_graph_generation,
+    get_query_cache,
+    is_read_only,
+)
+from .relationship_buffer import RelationshipBuffer
+
+
+def cursor_to_results(cursor: CursorProtocol) -> list[ResultRow]:
+    if not cursor.description:
+        return []
+    column_names = [desc.name for desc in cursor.description]
+    return [dict[str, ResultValue](zip(column_names, row)) for row in cursor.fetchall()]
+
+
+class MemgraphConnectionPool:
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        max_size: int | None = None,
+        acquire_timeout: float | None = None,
+        result_cache: QueryResultCache | None = None,
+    ):
+        self._host = host
+        self._port = port
+        self._result_cache = result_cache
+        self.max_size = (
+            max_size if max_size is not None else settings.MEMGRAPH_POOL_SIZE
+        )
+        if self.max_size < 1:
+            raise ValueError(ex.POOL_SIZE)
+        self.acquire_timeout = (
+            acquire_timeout
+            if acquire_timeout is not None
+            else settings.MEMGRAPH_POOL_TIMEOUT
+        )
+        self._idle: list[mgclient.Connection] = []
+        self._size = 0
+        self._closed = False
+        self._available = threading.Condition()
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def idle_count(self) -> int:
+        return len(self._idle)
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def _connect(self) -> mgclient.Connection:
+        logger.debug(ls.MG_POOL_CONNECTING.format(host=self._host, port=self._port))
+        conn = mgclient.connect(host=self._host, port=self._port)
+        conn.autocommit = True
+        return conn
+
+    @staticmethod
+    def _is_healthy(conn: mgclient.Connection) -> bool:
+        return conn.status == mgclient.CONN_STATUS_READY
+
+    @staticmethod
+    def _close_quietly(conn: mgclient.Connection) -> None:
+        try:
+            conn.close()
+        except Exception as e:
+            logger.debug(ls.MG_POOL_CLOSE_FAILED.format(error=e))
+
+    def _checkout(self) -> mgclient.Connection:
+        deadline = time.monotonic() + self.acquire_timeout
+        with self._available:
+            while True:
+                if self._closed:
+                    raise ConnectionError(ex.POOL_CLOSED)
+                if self._idle or self._size < self.max_size:
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not self._available.wait(remaining):
+                    raise ConnectionError(
+                        ex.POOL_EXHAUSTED.format(
+                            size=self.max_size, timeout=self.acquire_timeout
+                        )
+                    )
+            conn = self._idle.pop() if self._idle else None
+            if conn is None:
+                self._size += 1
+
+        if conn is not None:
+            if self._is_healthy(conn):
+                return conn
+            # (H) The slot stays reserved while the stale connection is replaced
+            logger.warning(ls.MG_POOL_STALE)
+            self._close_quietly(conn)
+        try:
+            return self._connect()
+        except Exception:
+            self._discard_slot()
+            raise
+
+    def _discard_slot(self) -> None:
+        with self._available:
+            self._size -= 1
+            self._available.notify()
+
+    def _checkin(self, conn: mgclient.Connection, broken: bool) -> None:
+        with self._available:
+            if broken or self._closed or not self._is_healthy(conn):
+                self._size -= 1
+                self._close_quietly(conn)
+            else:
+                self._idle.append(conn)
+            self._available.notify()
+
+    @contextmanager
+    def connection(self) -> Generator[mgclient.Connection, None, None]:
+        conn = self._checkout()
+        broken = False
+        try:
+            yield conn
+        except (mgclient.OperationalError, mgclient.InterfaceError):
+            broken = True
+            raise
+        finally:
+            self._checkin(conn, broken)
+
+    def fetch_all(
+        self, query: str, params: dict[str, PropertyValue] | None = None
+    ) -> list[ResultRow]:
+        if self._result_cache is None:
+            return self._fetch_uncached(query, params)
+        return self._result_cache.fetch(
+            f"{self._host}:{self._port}",
+            query,
+            params,
+            lambda: self._fetch_uncached(query, params),
+        )
+
+    def _fetch_uncached(
+        self, query: str, params: dict[str, PropertyValue] | None = None
+    ) -> list[ResultRow]:
+        params = params or {}
+        # (H) A connection dropped by the server surfaces on first use; it is
+        # (H) discarded on check-in and the read retried once on a fresh one
+        for attempt in range(2):
+            with self.connection() as conn:
+                cursor = conn.cursor()
+                try:
+                    cursor.execute(query, params)
+                    return cursor_to_results(cursor)
+                except mgclient.Error as e:
+                    if attempt or self._is_healthy(conn):
+                        raise
+                    logger.warning(ls.MG_POOL_RETRY.format(error=e))
+                finally:
+                    cursor.close()
+        return []
+
+    def close(self) -> None:
+        with self._available:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._size -= len(idle)
+            self._available.notify_all()
+        for conn in idle:
+            self._close_quietly(conn)
+
+
+_POOLS: dict[tuple[str, int], MemgraphConnectionPool] = {}
+_POOLS_LOCK = threading.Lock()
+
+
+def get_connection_pool(
+    host: str | None = None, port: int | None = None
+) -> MemgraphConnectionPool:
+    key = (host or settings.MEMGRAPH_HOST, port or settings.MEMGRAPH_PORT)
+    with _POOLS_LOCK:
+        pool = _POOLS.get(key)
+        if pool is None or pool.closed:
+            pool = _POOLS[key] = MemgraphConnectionPool(
+                *key, result_cache=get_query_cache()
+            )
+        return pool
+
+
+def close_connection_pools() -> None:
+    with _POOLS_LOCK:
+        pools = list(_POOLS.values())
+        _POOLS.clear()
+    for pool in pools:
+        pool.close()
 
 
 class MemgraphIngestor:
-    def __init__(self, host: str, port: int, batch_size: int = 1000):
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        batch_size: int = 1000,
+        pool: MemgraphConnectionPool | None = None,
+        result_cache: QueryResultCache | None = None,
+    ):
         self._host = host
         self._port = port
+        self._result_cache = result_cache
+        # (H) Reads go through the shared pool when given, so they never wait
+        # (H) behind the batched writes serialized on this ingestor's connection
+        self._pool = pool
         if batch_size < 1:
             raise ValueError(ex.BATCH_SIZE)
         self.batch_size = batch_size
         self.conn: mgclient.Connection | None = None
         self.node_buffer: list[tuple[str, dict[str, PropertyValue]]] = []
-        self.relationship_buffer: list[
-            tuple[
-                tuple[str, str, PropertyValue],
-                str,
-                tuple[str, str, PropertyValue],
-                dict[str, PropertyValue] | None,
-            ]
-        ] = []
+        self.relationship_buffer = RelationshipBuffer()
+        # (H) One connection is shared by the MCP worker threads; statements are
+        # (H) serialized on it so reads interleave between indexing batches
+        self._conn_lock = threading.RLock()
 
     def __enter__(self) -> "MemgraphIngestor":
         logger.info(ls.MG_CONNECTING.format(host=self._host, port=self._port))
@@ -82,20 +290,16 @@ class MemgraphIngestor:
         if not self.conn:
             raise ConnectionError(ex.CONN)
         cursor: CursorProtocol | None = None
-        try:
-            cursor = self.conn.cursor()
-            yield cursor
-        finally:
-            if cursor:
-                cursor.close()
+        with self._conn_lock:
+            try:
+                cursor = self.conn.cursor()
+                yield cursor
+            finally:
+                if cursor:
+                    cursor.close()
 
     def _cursor_to_results(self, cursor: CursorProtocol) -> list[ResultRow]:
-        if not cursor.description:
-            return []
-        column_names = [desc.name for desc in cursor.description]
-        return [
-            dict[str, ResultValue](zip(column_names, row)) for row in cursor.fetchall()
-        ]
+        return cursor_to_results(cursor)
 
     def _execute_query(
         self,
@@ -120,48 +324,55 @@ class MemgraphIngestor:
     def _execute_batch(self, query: str, params_list: Sequence[BatchParams]) -> None:
         if not self.conn or not params_list:
             return
-        cursor = None
-        try:
-            cursor = self.conn.cursor()
-            cursor.execute(wrap_with_unwind(query), BatchWrapper(batch=params_list))
-        except Exception as e:
-            if ERR_SUBSTR_ALREADY_EXISTS not in str(e).lower():
-                logger.error(ls.MG_BATCH_ERROR.format(error=e))
-                logger.error(ls.MG_CYPHER_QUERY.format(query=query))
-                if len(params_list) > 10:
-                    logger.error(
-                        ls.MG_BATCH_PARAMS_TRUNCATED.format(
-                            count=len(params_list), params=params_list[:10]
+        with self._conn_lock:
+            cursor = None
+            try:
+                cursor = self.conn.cursor()
+                cursor.execute(wrap_with_unwind(query), BatchWrapper(batch=params_list))
+            except Exception as e:
+                if ERR_SUBSTR_ALREADY_EXISTS not in str(e).lower():
+                    logger.error(ls.MG_BATCH_ERROR.format(error=e))
+                    logger.error(ls.MG_CYPHER_QUERY.format(query=query))
+                    if len(params_list) > 10:
+                        logger.error(
+                            ls.MG_BATCH_PARAMS_TRUNCATED.format(
+                                count=len(params_list), params=params_list[:10]
+                            )
                         )
-                    )
-                else:
-                    logger.error(ls.MG_CYPHER_PARAMS.format(params=params_list))
-            raise
-        finally:
-            if cursor:
-                cursor.close()
+                    else:
+                        logger.error(ls.MG_CYPHER_PARAMS.format(params=params_list))
+                raise
+            finally:
+                bump_graph_generation()
+                if cursor:
+                    cursor.close()
 
     def _execute_batch_with_return(
         self, query: str, params_list: Sequence[BatchParams]
     ) -> list[ResultRow]:
         if not self.conn or not params_list:
             return []
-        cursor = None
-        try:
-            cursor = self.conn.cursor()
-            cursor.execute(wrap_with_unwind(query), BatchWrapper(batch=params_list))
-            return self._cursor_to_results(cursor)
-        except Exception as e:
-            logger.error(ls.MG_BATCH_ERROR.format(error=e))
-            logger.error(ls.MG_CYPHER_QUERY.format(query=query))
-            raise
-        finally:
-            if cursor:
-                cursor.close()
+        with self._conn_lock:
+            cursor = None
+            try:
+                cursor = self.conn.cursor()
+                cursor.execute(wrap_with_unwind(query), BatchWrapper(batch=params_list))
+                return self._cursor_to_results(cursor)
+            except Exception as e:
+                logger.error(ls.MG_BATCH_ERROR.format(error=e))
+                logger.error(ls.MG_CYPHER_QUERY.format(query=query))
+                raise
+            finally:
+                bump_graph_generation()
+                if cursor:
+                    cursor.close()
 
     def clean_database(self) -> None:
         logger.info(ls.MG_CLEANING_DB)
-        self._execute_query(CYPHER_DELETE_ALL)
+        try:
+            self._execute_query(CYPHER_DELETE_ALL)
+        finally:
+            bump_graph_generation()
         logger.info(ls.MG_DB_CLEANED)
 
     def ensure_constraints(self) -> None:
@@ -171,8 +382,45 @@ class MemgraphIngestor:
                 self._execute_query(build_constraint_query(label, prop))
             except Exception:
                 pass
+        existing = self._existing_indexes()
+        created = 0
+        for label, prop in NODE_PROPERTY_INDEXES:
+            if (label, prop) in existing:
+                continue
+            try:
+                self._execute_query(build_index_query(label, prop))
+                created += 1
+            except Exception:
+                pass
+        logger.info(
+            ls.MG_INDEXES_ENSURED.format(
+                created=created, total=len(NODE_PROPERTY_INDEXES)
+            )
+        )
         logger.info(ls.MG_CONSTRAINTS_DONE)
 
+    def _existing_indexes(self) -> set[tuple[str, str]]:
+        try:
+            rows = self._execute_query(CYPHER_SHOW_INDEX_INFO)
+        except Exception:
+            return set()
+        existing: set[tuple[str, str]] = set()
+        for row in rows or []:
+            label = row.get(INDEX_INFO_LABEL)
+            prop = row.get(INDEX_INFO_PROPERTY)
+            # (H) Newer Memgraph releases report index properties as a list
+            if isinstance(prop, list) and len(prop) == 1:
+                prop = prop[0]
+            if isinstance(label, str) and isinstance(prop, str):
+                existing.add((label, prop))
+        return existing
+
+    def explain(
+        self, query: str, params: dict[str, PropertyValue] | None = None
+    ) -> list[str]:
+        rows = self._execute_query(build_explain_query(query), params)
+        return [str(row.get(EXPLAIN_PLAN_COLUMN, "")) for row in rows]
+
     def ensure_node_batch(
         self, label: str, properties: dict[str, PropertyValue]
     ) -> None:
@@ -188,16 +436,7 @@ class MemgraphIngestor:
         to_spec: tuple[str, str, PropertyValue],
         properties: dict[str, PropertyValue] | None = None,
     ) -> None:
-        from_label, from_key, from_val = from_spec
-        to_label, to_key, to_val = to_spec
-        self.relationship_buffer.append(
-            (
-                (from_label, from_key, from_val),
-                rel_type,
-                (to_label, to_key, to_val),
-                properties,
-            )
-        )
+        self.relationship_buffer.append(from_spec, rel_type, to_spec, properties)
         if len(self.relationship_buffer) >= self.batch_size:
             logger.debug(ls.MG_REL_BUFFER_FLUSH.format(size=self.batch_size))
             self.flush_nodes()
@@ -255,24 +494,15 @@ class MemgraphIngestor:
         if not self.relationship_buffer:
             return
 
-        rels_by_pattern: defaultdict[
-            tuple[str, str, str, str, str], list[RelBatchRow]
-        ] = defaultdict(list)
-        for from_node, rel_type, to_node, props in self.relationship_buffer:
-            pattern = (from_node[0], from_node[1], rel_type, to_node[0], to_node[1])
-            rels_by_pattern[pattern].append(
-                RelBatchRow(from_val=from_node[2], to_val=to_node[2], props=props or {})
-            )
-
         total_attempted = 0
         total_successful = 0
 
-        for pattern, params_list in rels_by_pattern.items():
+        for pattern, columns in self.relationship_buffer.items():
             from_label, from_key, rel_type, to_label, to_key = pattern
-            has_props = any(p[KEY_PROPS] for p in params_list)
             query = build_merge_relationship_query(
-                from_label, from_key, rel_type, to_label, to_key, has_props
+                from_label, from_key, rel_type, to_label, to_key, columns.has_props
             )
+            params_list = columns.rows()
 
             total_attempted += len(params_list)
             results = self._execute_batch_with_return(query, params_list)
@@ -317,13 +547,30 @@ class MemgraphIngestor:
         self, query: str, params: dict[str, PropertyValue] | None = None
     ) -> list[ResultRow]:
         logger.debug(ls.MG_FETCH_QUERY.format(query=query, params=params))
-        return self._execute_query(query, params)
+        if self._pool is not None:
+            results = self._pool.fetch_all(query, params)
+        elif self._result_cache is not None:
+            results = self._result_cache.fetch(
+                f"{self._host}:{self._port}",
+                query,
+                params,
+                lambda: self._execute_query(query, params),
+            )
+        else:
+            results = self._execute_query(query, params)
+        # (H) Generated queries can write too; they invalidate like any write
+        if not is_read_only(query):
+            bump_graph_generation()
+        return results
 
     def execute_write(
         self, query: str, params: dict[str, PropertyValue] | None = None
     ) -> None:
         logger.debug(ls.MG_WRITE_QUERY.format(query=query, params=params))
-        self._execute_query(query, params)
+        try:
+            self._execute_query(query, params)
+        finally:
+            bump_graph_generation()
 
     def export_graph_to_dict(self) -> GraphData:
         logger.info(ls.MG_EXPORTING)
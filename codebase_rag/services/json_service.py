@@ -8,7 +8,15 @@ from loguru import logger
 
 from .. import constants as cs
 from .. import logs as ls
-from ..types_defs import GraphData, GraphMetadata, PropertyDict, PropertyValue
+from ..graph_loader import count_graph
+from ..types_defs import (
+    GraphCounts,
+    GraphData,
+    GraphMetadata,
+    PropertyDict,
+    PropertyValue,
+)
+from .relationship_buffer import RelationshipBuffer
 
 PATH_BASED_LABELS = frozenset({cs.NodeLabel.FOLDER, cs.NodeLabel.FILE})
 NAME_BASED_LABELS = frozenset({cs.NodeLabel.EXTERNAL_PACKAGE, cs.NodeLabel.PROJECT})
@@ -18,9 +26,10 @@ class JsonFileIngestor:
     def __init__(self, output_path: str):
         self.output_path = Path(output_path)
         self._nodes: dict[str, dict] = {}
-        self._relationships: list[dict] = []
+        self._relationships = RelationshipBuffer()
         self._node_counter = 0
         self._node_id_lookup: dict[str, int] = {}
+        self._counts = count_graph((), ())
         logger.info(ls.JSON_INIT.format(path=self.output_path))
 
     def _get_node_id_key(self, label: str, properties: PropertyDict) -> str:
@@ -50,6 +59,10 @@ class JsonFileIngestor:
             cs.KEY_PROPERTIES: {k: v for k, v in properties.items() if v is not None},
         }
 
+    def summary(self) -> GraphCounts:
+        # (H) Counts as of the last flush, so callers need not re-read the output
+        return self._counts
+
     def ensure_relationship_batch(
         self,
         from_spec: tuple[str, str, PropertyValue],
@@ -57,18 +70,7 @@ class JsonFileIngestor:
         to_spec: tuple[str, str, PropertyValue],
         properties: PropertyDict | None = None,
     ) -> None:
-        from_label, _, from_val = from_spec
-        to_label, _, to_val = to_spec
-
-        from_node_key = f"{from_label}:{from_val}"
-        to_node_key = f"{to_label}:{to_val}"
-
-        self._relationships.append({
-            "from_key": from_node_key,
-            "to_key": to_node_key,
-            cs.KEY_TYPE: rel_type,
-            cs.KEY_PROPERTIES: dict(properties) if properties else {},
-        })
+        self._relationships.append(from_spec, rel_type, to_spec, properties)
 
     def flush_all(self) -> None:
         logger.info(ls.JSON_FLUSHING.format(path=self.output_path))
@@ -76,27 +78,36 @@ class JsonFileIngestor:
         nodes_list = list(self._nodes.values())
 
         resolved_relationships = []
-        for rel in self._relationships:
-            from_id = self._node_id_lookup.get(rel["from_key"])
-            to_id = self._node_id_lookup.get(rel["to_key"])
-
-            if from_id is not None and to_id is not None:
-                resolved_relationships.append({
-                    cs.KEY_FROM_ID: from_id,
-                    cs.KEY_TO_ID: to_id,
-                    cs.KEY_TYPE: rel[cs.KEY_TYPE],
-                    cs.KEY_PROPERTIES: rel[cs.KEY_PROPERTIES],
-                })
-            else:
-                logger.debug(
-                    ls.JSON_SKIPPING_REL.format(
-                        from_key=rel["from_key"], to_key=rel["to_key"]
+        for pattern, columns in self._relationships.items():
+            for row, (from_val, to_val) in enumerate(
+                zip(columns.from_vals, columns.to_vals)
+            ):
+                from_node_key = f"{pattern.from_label}:{from_val}"
+                to_node_key = f"{pattern.to_label}:{to_val}"
+                from_id = self._node_id_lookup.get(from_node_key)
+                to_id = self._node_id_lookup.get(to_node_key)
+
+                if from_id is not None and to_id is not None:
+                    resolved_relationships.append({
+                        cs.KEY_FROM_ID: from_id,
+                        cs.KEY_TO_ID: to_id,
+                        cs.KEY_TYPE: pattern.rel_type,
+                        cs.KEY_PROPERTIES: columns.row_props(row),
+                    })
+                else:
+                    logger.debug(
+                        ls.JSON_SKIPPING_REL.format(
+                            from_key=from_node_key, to_key=to_node_key
+                        )
                     )
-                )
 
+        self._counts = count_graph(
+            (node[cs.KEY_LABELS][0] for node in nodes_list),
+            (rel[cs.KEY_TYPE] for rel in resolved_relationships),
+        )
         metadata: GraphMetadata = {
-            cs.KEY_TOTAL_NODES: len(nodes_list),
-            cs.KEY_TOTAL_RELATIONSHIPS: len(resolved_relationships),
+            cs.KEY_TOTAL_NODES: self._counts[cs.KEY_TOTAL_NODES],
+            cs.KEY_TOTAL_RELATIONSHIPS: self._counts[cs.KEY_TOTAL_RELATIONSHIPS],
             cs.KEY_EXPORTED_AT: datetime.now(UTC).isoformat(),
         }
 
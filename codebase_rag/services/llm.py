@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from typing import TYPE_CHECKING
 
 from loguru import logger
@@ -15,10 +16,13 @@ from ..prompts import (
     build_rag_orchestrator_prompt,
 )
 from ..providers.base import get_provider_from_config
+from .cypher_cache import schema_fingerprint
 
 if TYPE_CHECKING:
     from pydantic_ai.models import Model
 
+    from .cypher_cache import CypherCacheStore
+
 
 def _create_provider_model(config: ModelConfig) -> Model:
     provider = get_provider_from_config(config)
@@ -35,7 +39,7 @@ def _clean_cypher_response(response_text: str) -> str:
 
 
 class CypherGenerator:
-    def __init__(self) -> None:
+    def __init__(self, cache: CypherCacheStore | None = None) -> None:
         try:
             config = settings.active_cypher_config
             llm = _create_provider_model(config)
@@ -45,6 +49,11 @@ class CypherGenerator:
                 if config.provider == cs.Provider.OLLAMA
                 else CYPHER_SYSTEM_PROMPT
             )
+            # (H) A different model or prompt (which embeds the graph schema)
+            # (H) must never be served another one's cached Cypher
+            self.cache = cache
+            self.model_name = f"{config.provider}:{config.model_id}"
+            self.schema_hash = schema_fingerprint(system_prompt)
 
             self.agent = Agent(
                 model=llm,
@@ -56,6 +65,15 @@ class CypherGenerator:
             raise ex.LLMGenerationError(ex.LLM_INIT_CYPHER.format(error=e)) from e
 
     async def generate(self, natural_language_query: str) -> str:
+        if self.cache is not None and (
+            cached := await asyncio.to_thread(
+                self.cache.lookup,
+                natural_language_query,
+                self.model_name,
+                self.schema_hash,
+            )
+        ):
+            return cached
         logger.info(ls.CYPHER_GENERATING.format(query=natural_language_query))
         try:
             result = await self.agent.run(natural_language_query)
@@ -74,6 +92,14 @@ class CypherGenerator:
             logger.error(ls.CYPHER_ERROR.format(error=e))
             raise ex.LLMGenerationError(ex.LLM_GENERATION_FAILED.format(error=e)) from e
 
+    def record_success(self, natural_language_query: str, query: str) -> None:
+        # (H) Only called once the query ran against the graph, so the cache
+        # (H) never learns Cypher that the database rejected
+        if self.cache is not None:
+            self.cache.record(
+                natural_language_query, query, self.model_name, self.schema_hash
+            )
+
 
 def create_rag_orchestrator(tools: list[Tool]) -> Agent:
     try:
@@ -8,7 +8,9 @@ import codec.schema_pb2 as pb
 
 from .. import constants as cs
 from .. import logs as ls
-from ..types_defs import PropertyDict, PropertyValue
+from ..graph_loader import count_graph
+from ..types_defs import GraphCounts, PropertyDict, PropertyValue
+from .relationship_buffer import RelationshipBuffer
 
 LABEL_TO_ONEOF_FIELD: dict[cs.NodeLabel, str] = {
     cs.NodeLabel.PROJECT: cs.ONEOF_PROJECT,
@@ -36,8 +38,10 @@ class ProtobufFileIngestor:
     def __init__(self, output_path: str, split_index: bool = False):
         self.output_dir = Path(output_path)
         self._nodes: dict[str, pb.Node] = {}
+        self._relationship_buffer = RelationshipBuffer()
         self._relationships: dict[tuple[str, int, str], pb.Relationship] = {}
         self.split_index = split_index
+        self._counts = count_graph((), ())
         logger.info(ls.PROTOBUF_INIT.format(path=self.output_dir))
 
     def _get_node_id(self, label: cs.NodeLabel, properties: PropertyDict) -> str:
@@ -87,6 +91,32 @@ class ProtobufFileIngestor:
         rel_type: str,
         to_spec: tuple[str, str, PropertyValue],
         properties: PropertyDict | None = None,
+    ) -> None:
+        self._relationship_buffer.append(from_spec, rel_type, to_spec, properties)
+
+    def summary(self) -> GraphCounts:
+        # (H) Counts as of the last flush, so callers need not re-read the output
+        return self._counts
+
+    def _build_relationships(self) -> None:
+        for pattern, columns in self._relationship_buffer.items():
+            for row, (from_val, to_val) in enumerate(
+                zip(columns.from_vals, columns.to_vals)
+            ):
+                self._add_relationship(
+                    (pattern.from_label, pattern.from_key, from_val),
+                    pattern.rel_type,
+                    (pattern.to_label, pattern.to_key, to_val),
+                    columns.row_props(row),
+                )
+        self._relationship_buffer.clear()
+
+    def _add_relationship(
+        self,
+        from_spec: tuple[str, str, PropertyValue],
+        rel_type: str,
+        to_spec: tuple[str, str, PropertyValue],
+        properties: PropertyDict | None = None,
     ) -> None:
         rel = pb.Relationship()
 
@@ -174,4 +204,15 @@ class ProtobufFileIngestor:
     def flush_all(self) -> None:
         logger.info(ls.PROTOBUF_FLUSHING.format(path=self.output_dir))
 
+        self._build_relationships()
+        self._counts = count_graph(
+            (
+                str(ONEOF_FIELD_TO_LABEL[node.WhichOneof(cs.ONEOF_PAYLOAD)])
+                for node in self._nodes.values()
+            ),
+            (
+                pb.Relationship.RelationshipType.Name(rel.type)
+                for rel in self._relationships.values()
+            ),
+        )
         return self._flush_split() if self.split_index else self._flush_joint()
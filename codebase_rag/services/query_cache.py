@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import json
+import re
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+
+from loguru import logger
+
+from .. import constants as cs
+from .. import logs as ls
+from ..config import settings
+from ..types_defs import PropertyValue, QueryCacheStats, ResultRow
+
+QueryKey = tuple[str, str, str]
+
+_WRITE_CLAUSE = re.compile(cs.QUERY_CACHE_WRITE_PATTERN, re.IGNORECASE)
+
+# (H) Every graph write in this process bumps the generation; cached rows are
+# (H) only served for the generation they were read in
+_generation = 0
+_generation_lock = threading.Lock()
+
+
+def graph_generation() -> int:
+    return _generation
+
+
+def bump_graph_generation() -> int:
+    global _generation
+    with _generation_lock:
+        _generation += 1
+        return _generation
+
+
+def is_read_only(query: str) -> bool:
+    return _WRITE_CLAUSE.search(query) is None
+
+
+class QueryResultCache:
+    def __init__(
+        self,
+        max_entries: int | None = None,
+        max_rows: int | None = None,
+        ttl: float | None = None,
+    ) -> None:
+        self.max_entries = (
+            max_entries if max_entries is not None else settings.QUERY_CACHE_MAX_ENTRIES
+        )
+        self.max_rows = (
+            max_rows if max_rows is not None else settings.QUERY_CACHE_MAX_ROWS
+        )
+        self.ttl = ttl if ttl is not None else settings.QUERY_CACHE_TTL
+        # (H) Entries keep their store time: the generation only sees writes made
+        # (H) by this process, the TTL bounds staleness from every other writer
+        self._entries: OrderedDict[QueryKey, tuple[float, list[ResultRow]]] = (
+            OrderedDict()
+        )
+        self._generation = graph_generation()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.bypassed = 0
+        self.invalidations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _key(
+        scope: str, query: str, params: dict[str, PropertyValue] | None
+    ) -> QueryKey | None:
+        try:
+            encoded = json.dumps(params or {}, sort_keys=True)
+        except (TypeError, ValueError):
+            return None
+        return (scope, query, encoded)
+
+    def _sync_generation(self, generation: int) -> None:
+        if generation != self._generation:
+            self._entries.clear()
+            self._generation = generation
+            self.invalidations += 1
+
+    def fetch(
+        self,
+        scope: str,
+        query: str,
+        params: dict[str, PropertyValue] | None,
+        fetch: Callable[[], list[ResultRow]],
+    ) -> list[ResultRow]:
+        key = self._key(scope, query, params) if is_read_only(query) else None
+        if key is None:
+            with self._lock:
+                self.bypassed += 1
+            return fetch()
+
+        generation = graph_generation()
+        with self._lock:
+            self._sync_generation(generation)
+            entry = self._entries.get(key)
+            if entry is not None and time.monotonic() - entry[0] < self.ttl:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return [dict(row) for row in entry[1]]
+            self._entries.pop(key, None)
+            self.misses += 1
+
+        rows = fetch()
+        if len(rows) > self.max_rows:
+            return rows
+        with self._lock:
+            # (H) A write that landed while the query ran makes its rows stale
+            if graph_generation() == generation == self._generation:
+                self._entries[key] = (
+                    time.monotonic(),
+                    [dict(row) for row in rows],
+                )
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        return rows
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> QueryCacheStats:
+        with self._lock:
+            return QueryCacheStats(
+                hits=self.hits,
+                misses=self.misses,
+                bypassed=self.bypassed,
+                invalidations=self.invalidations,
+                entries=len(self._entries),
+            )
+
+
+_QUERY_CACHE: QueryResultCache | None = None
+_QUERY_CACHE_LOCK = threading.Lock()
+
+
+def get_query_cache() -> QueryResultCache | None:
+    global _QUERY_CACHE
+    if not settings.QUERY_CACHE_ENABLED:
+        return None
+    with _QUERY_CACHE_LOCK:
+        if _QUERY_CACHE is None:
+            _QUERY_CACHE = QueryResultCache()
+            logger.debug(
+                ls.QUERY_CACHE_CREATED.format(
+                    entries=_QUERY_CACHE.max_entries,
+                    rows=_QUERY_CACHE.max_rows,
+                    ttl=_QUERY_CACHE.ttl,
+                )
+            )
+        return _QUERY_CACHE
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+from collections.abc import ItemsView
+from typing import NamedTuple
+
+from ..types_defs import PropertyDict, PropertyValue, RelBatchRow
+
+
+class RelationshipPattern(NamedTuple):
+    from_label: str
+    from_key: str
+    rel_type: str
+    to_label: str
+    to_key: str
+
+
+class RelationshipColumns:
+    __slots__ = ("from_vals", "to_vals", "props", "_row_index")
+
+    def __init__(self) -> None:
+        self.from_vals: list[PropertyValue] = []
+        self.to_vals: list[PropertyValue] = []
+        # (H) Only allocated once an edge of this pattern carries properties
+        self.props: list[PropertyDict] | None = None
+        self._row_index: dict[tuple[PropertyValue, PropertyValue], int] = {}
+
+    def __len__(self) -> int:
+        return len(self.from_vals)
+
+    @property
+    def has_props(self) -> bool:
+        return self.props is not None
+
+    def append(
+        self,
+        from_val: PropertyValue,
+        to_val: PropertyValue,
+        properties: PropertyDict | None = None,
+    ) -> bool:
+        edge_key = (from_val, to_val)
+        if (row := self._row_index.get(edge_key)) is not None:
+            # (H) Same outcome as MERGE followed by SET r += row.props per duplicate
+            if properties:
+                self._props_column()[row].update(properties)
+            return False
+
+        self._row_index[edge_key] = len(self.from_vals)
+        self.from_vals.append(from_val)
+        self.to_vals.append(to_val)
+        if self.props is not None:
+            self.props.append(dict(properties) if properties else {})
+        elif properties:
+            self._props_column()[-1] = dict(properties)
+        return True
+
+    def _props_column(self) -> list[PropertyDict]:
+        if self.props is None:
+            self.props = [{} for _ in self.from_vals]
+        return self.props
+
+    def row_props(self, row: int) -> PropertyDict:
+        return self.props[row] if self.props is not None else {}
+
+    def rows(self) -> list[RelBatchRow]:
+        if self.props is None:
+            return [
+                RelBatchRow(from_val=from_val, to_val=to_val)
+                for from_val, to_val in zip(self.from_vals, self.to_vals)
+            ]
+        return [
+            RelBatchRow(from_val=from_val, to_val=to_val, props=props)
+            for from_val, to_val, props in zip(self.from_vals, self.to_vals, self.props)
+        ]
+
+
+class RelationshipBuffer:
+    def __init__(self) -> None:
+        self._columns: dict[RelationshipPattern, RelationshipColumns] = {}
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(
+        self,
+        from_spec: tuple[str, str, PropertyValue],
+        rel_type: str,
+        to_spec: tuple[str, str, PropertyValue],
+        properties: PropertyDict | None = None,
+    ) -> None:
+        from_label, from_key, from_val = from_spec
+        to_label, to_key, to_val = to_spec
+        pattern = RelationshipPattern(from_label, from_key, rel_type, to_label, to_key)
+        if (columns := self._columns.get(pattern)) is None:
+            columns = self._columns[pattern] = RelationshipColumns()
+        if columns.append(from_val, to_val, properties):
+            self._size += 1
+
+    def items(self) -> ItemsView[RelationshipPattern, RelationshipColumns]:
+        return self._columns.items()
+
+    def clear(self) -> None:
+        self._columns.clear()
+        self._size = 0
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Mapping
 from pathlib import Path
 from typing import TYPE_CHECKING
 from unittest.mock import MagicMock, patch
@@ -20,7 +21,7 @@ if TYPE_CHECKING:
 
 @pytest.fixture
 def parsers_and_queries() -> tuple[
-    dict[cs.SupportedLanguage, Parser], dict[cs.SupportedLanguage, LanguageQueries]
+    Mapping[cs.SupportedLanguage, Parser], dict[cs.SupportedLanguage, LanguageQueries]
 ]:
     parsers, queries = load_parsers()
     return parsers, queries
@@ -41,7 +42,7 @@ def call_processor(temp_repo: Path, mock_ingestor: MagicMock) -> CallProcessor:
 def parse_code(
     code: str,
     language: cs.SupportedLanguage,
-    parsers: dict[cs.SupportedLanguage, Parser],
+    parsers: Mapping[cs.SupportedLanguage, Parser],
 ) -> Node:
     parser = parsers[language]
     tree = parser.parse(code.encode(cs.ENCODING_UTF8))
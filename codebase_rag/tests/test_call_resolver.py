@@ -873,6 +873,66 @@ class TestCalculateImportDistance:
         assert distance_far > distance_close
 
 
+class TestFindClosestCandidate:
+    def _sorted_head(
+        self, call_resolver: CallResolver, candidates: list[str], module_qn: str
+    ) -> str:
+        return sorted(
+            candidates,
+            key=lambda qn: call_resolver._calculate_import_distance(qn, module_qn),
+        )[0]
+
+    def test_matches_stable_sort_head(self, call_resolver: CallResolver) -> None:
+        candidates = [
+            "external.lib.utils.get",
+            "proj.pkg.sub.deep.Cls.get",
+            "proj.pkg.other.get",
+            "proj.pkg.caller.get",
+            "proj.get",
+            ".get",
+        ]
+        for module_qn in ("proj.pkg.caller", "proj.pkg", "proj", "external.lib"):
+            assert call_resolver._find_closest_candidate(
+                candidates, module_qn
+            ) == self._sorted_head(call_resolver, candidates, module_qn)
+
+    def test_ties_keep_first_candidate(self, call_resolver: CallResolver) -> None:
+        candidates = ["proj.b.run", "proj.a.run"]
+        assert (
+            call_resolver._find_closest_candidate(candidates, "proj.c") == "proj.b.run"
+        )
+
+    def test_empty_candidates(self, call_resolver: CallResolver) -> None:
+        assert call_resolver._find_closest_candidate([], "proj.module") is None
+
+    def test_split_parts_are_interned(self, call_resolver: CallResolver) -> None:
+        first = call_resolver._split_qn("proj.pkg.mod.get")
+        second = call_resolver._split_qn("proj.pkg.other.get")
+        assert first[0] is second[0]
+        assert first[-1] is second[-1]
+
+    @pytest.mark.slow
+    def test_matches_sort_on_100k_symbol_registry(
+        self, call_resolver: CallResolver
+    ) -> None:
+        packages = [f"pkg{i}" for i in range(50)]
+        candidates = [
+            f"proj.{packages[i % 50]}.mod{i % 400}.Cls{i}.get" for i in range(100_000)
+        ]
+        caller_modules = [f"proj.{packages[i % 50]}.mod{i}" for i in range(5)]
+
+        expected = [
+            self._sorted_head(call_resolver, candidates, module_qn)
+            for module_qn in caller_modules
+        ]
+        actual = [
+            call_resolver._find_closest_candidate(candidates, module_qn)
+            for module_qn in caller_modules
+        ]
+
+        assert actual == expected
+
+
 class TestIsMethodChain:
     def test_simple_method_not_chain(self, call_resolver: CallResolver) -> None:
         assert call_resolver._is_method_chain("obj.method") is False
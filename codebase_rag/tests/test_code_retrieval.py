@@ -113,6 +113,24 @@ class TestFindCodeSnippet:
         assert "end_line" in query or "end" in query
         assert params == {"qn": "module.func"}
 
+    @pytest.mark.asyncio
+    async def test_falls_back_to_defining_module_path(
+        self, tmp_path: Path, mock_ingestor: MagicMock
+    ) -> None:
+        (tmp_path / "mod.py").write_text("def func():\n    return 1\n")
+        mock_ingestor.fetch_all.side_effect = [
+            [{"path": None, "start": 1, "end": 2, "name": "func"}],
+            [{"path": "mod.py"}],
+        ]
+        retriever = CodeRetriever(str(tmp_path), mock_ingestor)
+
+        result = await retriever.find_code_snippet("module.func")
+
+        assert result.found is True
+        assert result.file_path == "mod.py"
+        fallback_query = mock_ingestor.fetch_all.call_args_list[1].args[0]
+        assert "[*]" not in fallback_query
+
 
 class TestCreateCodeRetrievalTool:
     def test_creates_tool_with_description(self) -> None:
@@ -0,0 +1,257 @@
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterator
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+from pydantic_ai.messages import ModelMessage, ModelResponse, TextPart
+from pydantic_ai.models.function import AgentInfo, FunctionModel
+
+from codebase_rag import constants as cs
+from codebase_rag.services.cypher_cache import (
+    CypherCacheStore,
+    build_template,
+    normalize_question,
+)
+from codebase_rag.services.llm import CypherGenerator
+from codebase_rag.tools.codebase_query import create_query_tool
+
+pytestmark = [pytest.mark.anyio]
+
+MODEL = "stub:cypher"
+SCHEMA = "schema-a"
+
+
+class StubLLM:
+    def __init__(self) -> None:
+        self.prompts: list[str] = []
+
+    def respond(self, messages: list[ModelMessage], info: AgentInfo) -> ModelResponse:
+        prompt = str(messages[-1].parts[-1].content)
+        self.prompts.append(prompt)
+        name = prompt.rsplit(" ", 1)[-1]
+        return ModelResponse(
+            parts=[
+                TextPart(
+                    f"MATCH (caller:Function)-[:CALLS]->(f:Function {{name: '{name}'}}) "
+                    "RETURN caller.qualified_name"
+                )
+            ]
+        )
+
+
+@pytest.fixture(params=["asyncio"])
+def anyio_backend(request: pytest.FixtureRequest) -> str:
+    return str(request.param)
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> Iterator[CypherCacheStore]:
+    cache = CypherCacheStore(tmp_path / cs.CYPHER_CACHE_FILE, max_entries=10)
+    yield cache
+    cache.close()
+
+
+@pytest.fixture
+def stub_llm() -> Iterator[StubLLM]:
+    llm = StubLLM()
+    config = MagicMock(provider="stub", model_id="cypher")
+    with (
+        patch("codebase_rag.services.llm.settings") as mock_settings,
+        patch(
+            "codebase_rag.services.llm._create_provider_model",
+            return_value=FunctionModel(llm.respond),
+        ),
+    ):
+        mock_settings.active_cypher_config = config
+        mock_settings.AGENT_RETRIES = 1
+        yield llm
+
+
+class TestNormalization:
+    def test_whitespace_and_trailing_punctuation_are_ignored(self) -> None:
+        assert normalize_question("  Who   calls\tmain?  ") == "Who calls main"
+
+    def test_identifier_case_is_preserved(self) -> None:
+        assert normalize_question("callers of Foo") != normalize_question(
+            "callers of foo"
+        )
+
+    def test_template_slots_literals_copied_from_question(self) -> None:
+        template = build_template(
+            "who calls parse_args", "MATCH (f {name: 'parse_args'}) RETURN f;"
+        )
+
+        assert template is not None
+        pattern, cypher = template
+        assert "parse_args" not in cypher
+        assert cs.CYPHER_CACHE_SLOT.format(index=0) in cypher
+
+    def test_no_template_without_shared_literal(self) -> None:
+        assert build_template("list all classes", "MATCH (c:Class) RETURN c;") is None
+
+
+class TestCypherCacheStore:
+    def test_exact_hit_after_record(self, store: CypherCacheStore) -> None:
+        store.record("list all classes?", "MATCH (c:Class) RETURN c;", MODEL, SCHEMA)
+
+        assert store.lookup("list  all classes", MODEL, SCHEMA) == (
+            "MATCH (c:Class) RETURN c;"
+        )
+        stats = store.stats()
+        assert (stats.exact_hits, stats.misses, stats.stores) == (1, 0, 1)
+
+    def test_model_and_schema_are_part_of_the_key(
+        self, store: CypherCacheStore
+    ) -> None:
+        store.record("list all classes", "MATCH (c:Class) RETURN c;", MODEL, SCHEMA)
+
+        assert store.lookup("list all classes", "other:model", SCHEMA) is None
+        assert store.lookup("list all classes", MODEL, "schema-b") is None
+        assert store.stats().misses == 2
+
+    def test_template_hit_substitutes_identifier(self, store: CypherCacheStore) -> None:
+        store.record(
+            "who calls parse_args",
+            "MATCH (c)-[:CALLS]->(f {name: 'parse_args'}) RETURN c;",
+            MODEL,
+            SCHEMA,
+        )
+
+        cypher = store.lookup("Who calls load_config?", MODEL, SCHEMA)
+
+        assert cypher == "MATCH (c)-[:CALLS]->(f {name: 'load_config'}) RETURN c;"
+        assert store.stats().template_hits == 1
+
+    def test_template_slot_rejects_quotes(self, store: CypherCacheStore) -> None:
+        store.record(
+            "who calls parse_args",
+            "MATCH (c)-[:CALLS]->(f {name: 'parse_args'}) RETURN c;",
+            MODEL,
+            SCHEMA,
+        )
+
+        assert store.lookup("who calls x'}) DETACH DELETE f//", MODEL, SCHEMA) is None
+
+    def test_similarity_hit_above_threshold(self, tmp_path: Path) -> None:
+        vectors = {
+            "list all classes": [1.0, 0.0],
+            "show every class": [0.95, 0.05],
+            "list all functions": [0.0, 1.0],
+        }
+        store = CypherCacheStore(
+            tmp_path / cs.CYPHER_CACHE_FILE,
+            similarity_threshold=0.9,
+            embed=vectors.__getitem__,
+        )
+        store.record("list all classes", "MATCH (c:Class) RETURN c;", MODEL, SCHEMA)
+
+        assert store.lookup("show every class", MODEL, SCHEMA) == (
+            "MATCH (c:Class) RETURN c;"
+        )
+        assert store.lookup("list all functions", MODEL, SCHEMA) is None
+        stats = store.stats()
+        assert (stats.similar_hits, stats.misses) == (1, 1)
+        store.close()
+
+    def test_least_recently_used_entries_are_evicted(self, tmp_path: Path) -> None:
+        store = CypherCacheStore(tmp_path / cs.CYPHER_CACHE_FILE, max_entries=2)
+        store.record("first question", "MATCH (a) RETURN a;", MODEL, SCHEMA)
+        store.record("second question", "MATCH (b) RETURN b;", MODEL, SCHEMA)
+        store.lookup("first question", MODEL, SCHEMA)
+        store.record("third question", "MATCH (c) RETURN c;", MODEL, SCHEMA)
+
+        assert store.lookup("second question", MODEL, SCHEMA) is None
+        assert store.lookup("first question", MODEL, SCHEMA) is not None
+        stats = store.stats()
+        assert (stats.entries, stats.evictions) == (2, 1)
+        store.close()
+
+    def test_entries_persist_across_instances(self, tmp_path: Path) -> None:
+        path = tmp_path / cs.CYPHER_CACHE_FILE
+        first = CypherCacheStore(path)
+        first.record("list all classes", "MATCH (c:Class) RETURN c;", MODEL, SCHEMA)
+        first.close()
+
+        second = CypherCacheStore(path)
+        assert second.lookup("list all classes", MODEL, SCHEMA) is not None
+        second.close()
+
+    def test_unwritable_path_falls_back_to_memory(self, tmp_path: Path) -> None:
+        blocker = tmp_path / "file"
+        blocker.write_text("")
+        store = CypherCacheStore(blocker / "nested" / cs.CYPHER_CACHE_FILE)
+
+        store.record("list all classes", "MATCH (c:Class) RETURN c;", MODEL, SCHEMA)
+
+        assert store.lookup("list all classes", MODEL, SCHEMA) is not None
+        store.close()
+
+    def test_concurrent_records_are_serialized(self, store: CypherCacheStore) -> None:
+        threads = [
+            threading.Thread(
+                target=store.record,
+                args=(f"question {i}", f"MATCH (n{i}) RETURN n{i};", MODEL, SCHEMA),
+            )
+            for i in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert store.stats().stores == 8
+
+
+class TestCypherGeneratorCache:
+    async def test_repeated_question_skips_llm(
+        self, stub_llm: StubLLM, store: CypherCacheStore
+    ) -> None:
+        generator = CypherGenerator(cache=store)
+
+        first = await generator.generate("who calls parse_args")
+        generator.record_success("who calls parse_args", first)
+        second = await generator.generate("who calls parse_args?")
+
+        assert second == first
+        assert len(stub_llm.prompts) == 1
+        assert store.stats().exact_hits == 1
+
+    async def test_template_answers_new_identifier_without_llm(
+        self, stub_llm: StubLLM, store: CypherCacheStore
+    ) -> None:
+        generator = CypherGenerator(cache=store)
+        first = await generator.generate("who calls parse_args")
+        generator.record_success("who calls parse_args", first)
+
+        cypher = await generator.generate("who calls load_config")
+
+        assert "'load_config'" in cypher
+        assert len(stub_llm.prompts) == 1
+
+    async def test_unrecorded_query_is_not_cached(
+        self, stub_llm: StubLLM, store: CypherCacheStore
+    ) -> None:
+        generator = CypherGenerator(cache=store)
+
+        await generator.generate("who calls parse_args")
+        await generator.generate("who calls parse_args")
+
+        assert len(stub_llm.prompts) == 2
+        assert store.stats().misses == 2
+
+    async def test_query_tool_caches_only_successful_queries(
+        self, stub_llm: StubLLM, store: CypherCacheStore
+    ) -> None:
+        ingestor = MagicMock()
+        ingestor.fetch_all.side_effect = [RuntimeError("syntax error"), [], []]
+        tool = create_query_tool(ingestor, CypherGenerator(cache=store))
+
+        await tool.function("who calls parse_args")
+        await tool.function("who calls parse_args")
+        await tool.function("who calls parse_args")
+
+        assert len(stub_llm.prompts) == 2
+        assert store.stats().exact_hits == 1
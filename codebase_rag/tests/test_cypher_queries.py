@@ -4,13 +4,19 @@ from typing import TYPE_CHECKING
 
 import pytest
 
+from codebase_rag.constants import CYPHER_DELETE_MODULE, NODE_UNIQUE_CONSTRAINTS
 from codebase_rag.cypher_queries import (
     CYPHER_DELETE_ALL,
     CYPHER_EXPORT_NODES,
     CYPHER_EXPORT_RELATIONSHIPS,
     CYPHER_FIND_BY_QUALIFIED_NAME,
     CYPHER_GET_FUNCTION_SOURCE_LOCATION,
+    NODE_PROPERTY_INDEXES,
     build_constraint_query,
+    build_explain_query,
+    build_find_by_qualified_name_query,
+    build_index_plan,
+    build_index_query,
     build_merge_node_query,
     build_merge_relationship_query,
     build_nodes_by_ids_query,
@@ -376,3 +382,109 @@ class TestBuildNodesByIdsQueryIntegration:
         results = memgraph_ingestor._execute_query(query, params)
 
         assert len(results) == 0
+
+
+class TestFindByQualifiedNameQueryUnit:
+    def test_each_branch_is_a_labelled_lookup(self) -> None:
+        query = build_find_by_qualified_name_query(["Function", "Method"])
+
+        branches = query.split("UNION ALL")
+        assert len(branches) == 2
+        assert "MATCH (n:Function {qualified_name: $qn})" in branches[0]
+        assert "MATCH (n:Method {qualified_name: $qn})" in branches[1]
+
+    def test_has_no_unbounded_path_expansion(self) -> None:
+        assert "[*]" not in CYPHER_FIND_BY_QUALIFIED_NAME
+        assert "OPTIONAL MATCH" not in CYPHER_FIND_BY_QUALIFIED_NAME
+
+    def test_reads_path_from_the_node(self) -> None:
+        assert "n.path AS path" in CYPHER_FIND_BY_QUALIFIED_NAME
+
+    def test_index_query(self) -> None:
+        assert (
+            build_index_query("Function", "qualified_name")
+            == "CREATE INDEX ON :Function(qualified_name);"
+        )
+
+
+class TestBuildIndexPlanUnit:
+    def test_merge_keys_come_first_and_duplicates_are_dropped(self) -> None:
+        plan = build_index_plan(
+            {"Module": "qualified_name", "File": "path"},
+            ["Module", "Function"],
+            [("File", "path"), ("Module", "path")],
+        )
+
+        assert plan == (
+            ("Module", "qualified_name"),
+            ("File", "path"),
+            ("Function", "qualified_name"),
+            ("Module", "path"),
+        )
+
+    def test_every_merge_key_is_indexed(self) -> None:
+        for label, prop in NODE_UNIQUE_CONSTRAINTS.items():
+            assert (label, prop) in NODE_PROPERTY_INDEXES
+
+    @pytest.mark.parametrize(
+        "entry", [("Module", "path"), ("File", "path"), ("Function", "name")]
+    )
+    def test_hot_lookups_are_indexed(self, entry: tuple[str, str]) -> None:
+        assert entry in NODE_PROPERTY_INDEXES
+
+    def test_explain_query(self) -> None:
+        assert build_explain_query("MATCH (n) RETURN n") == "EXPLAIN MATCH (n) RETURN n"
+
+
+INDEX_SCAN = "ScanAllByLabelProperty"
+
+
+@pytest.mark.integration
+class TestIndexPlanIntegration:
+    @pytest.mark.parametrize(
+        ("query", "params"),
+        [
+            (CYPHER_DELETE_MODULE, {"path": "pkg/mod.py"}),
+            (CYPHER_FIND_BY_QUALIFIED_NAME, {"qn": "pkg.mod.func"}),
+            (
+                "MATCH (f:Function {name: $name}) RETURN f.qualified_name",
+                {"name": "main"},
+            ),
+            (
+                "MATCH (f:File {path: $path}) RETURN f.name",
+                {"path": "README.md"},
+            ),
+            (
+                wrap_with_unwind(build_merge_node_query("Module", "qualified_name")),
+                {"batch": []},
+            ),
+            (
+                wrap_with_unwind(
+                    build_merge_relationship_query(
+                        "Folder", "path", "CONTAINS_FILE", "File", "path"
+                    )
+                ),
+                {"batch": []},
+            ),
+        ],
+    )
+    def test_hot_queries_use_index_scans(
+        self,
+        memgraph_ingestor: MemgraphIngestor,
+        query: str,
+        params: dict[str, str | list[str]],
+    ) -> None:
+        memgraph_ingestor.ensure_constraints()
+
+        plan = "\n".join(memgraph_ingestor.explain(query, params))
+
+        assert INDEX_SCAN in plan, plan
+        assert "ScanAll (" not in plan, plan
+
+    def test_ensure_constraints_is_idempotent(
+        self, memgraph_ingestor: MemgraphIngestor
+    ) -> None:
+        memgraph_ingestor.ensure_constraints()
+        memgraph_ingestor.ensure_constraints()
+
+        assert set(NODE_PROPERTY_INDEXES) <= memgraph_ingestor._existing_indexes()
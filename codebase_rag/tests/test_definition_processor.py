@@ -5,6 +5,7 @@ from unittest.mock import MagicMock
 import pytest
 from tree_sitter import Language, Parser
 
+from codebase_rag import constants as cs
 from codebase_rag.graph_updater import GraphUpdater
 from codebase_rag.parser_loader import load_parsers
 from codebase_rag.tests.conftest import create_mock_node
@@ -1046,3 +1047,81 @@ class TestProcessFileRust:
         qn = module_props["qualified_name"]
         assert "mod" not in qn or "mod.rs" not in qn
         assert "utils" in qn
+
+
+class TestDefinitionPath:
+    def test_definitions_carry_relative_file_path(
+        self, temp_repo: Path, definition_processor: GraphUpdater
+    ) -> None:
+        package = temp_repo / "pkg"
+        package.mkdir()
+        source = package / "shapes.py"
+        source.write_text(
+            "class Square:\n"
+            "    def area(self):\n"
+            "        return 1\n\n\n"
+            "def make():\n"
+            "    return Square()\n"
+        )
+
+        definition_processor.factory.definition_processor.process_file(
+            source,
+            cs.SupportedLanguage.PYTHON,
+            definition_processor.queries,
+            {},
+        )
+
+        node_calls = definition_processor.ingestor.ensure_node_batch.call_args_list
+        paths = {
+            c.args[0]: c.args[1].get(cs.KEY_PATH)
+            for c in node_calls
+            if c.args[0] in cs.DEFINITION_PATH_LABELS
+        }
+        expected = str(Path("pkg") / "shapes.py")
+        assert paths == {
+            cs.NodeLabel.CLASS: expected,
+            cs.NodeLabel.METHOD: expected,
+            cs.NodeLabel.FUNCTION: expected,
+        }
+
+    def test_javascript_definitions_carry_relative_file_path(
+        self, temp_repo: Path, definition_processor: GraphUpdater
+    ) -> None:
+        pytest.importorskip("tree_sitter_javascript")
+        source = temp_repo / "shapes.js"
+        source.write_text(
+            "function Shape() {}\n"
+            "Shape.prototype.area = function () { return 1; };\n"
+            "export function make() { return new Shape(); }\n"
+            "const helpers = { scale: () => 2 };\n"
+            "module.exports.build = function () { return 3; };\n"
+        )
+
+        definition_processor.factory.definition_processor.process_file(
+            source,
+            cs.SupportedLanguage.JS,
+            definition_processor.queries,
+            {},
+        )
+
+        node_calls = definition_processor.ingestor.ensure_node_batch.call_args_list
+        definitions = [
+            c.args[1] for c in node_calls if c.args[0] in cs.DEFINITION_PATH_LABELS
+        ]
+        names = {props[cs.KEY_NAME] for props in definitions}
+        assert {"Shape", "area", "make", "build"} <= names
+        assert {props[cs.KEY_PATH] for props in definitions} == {"shapes.js"}
+
+    def test_processor_keeps_its_ingestor(
+        self, temp_repo: Path, definition_processor: GraphUpdater
+    ) -> None:
+        source = temp_repo / "solo.py"
+        source.write_text("def solo():\n    return 1\n")
+        processor = definition_processor.factory.definition_processor
+        ingestor = processor.ingestor
+
+        processor.process_file(
+            source, cs.SupportedLanguage.PYTHON, definition_processor.queries, {}
+        )
+
+        assert processor.ingestor is ingestor
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Mapping
 from pathlib import Path
 
 import pytest
@@ -71,7 +72,7 @@ class TestFileEditorInit:
 
     def test_init_loads_parsers(self, file_editor: FileEditor) -> None:
         assert file_editor.parsers is not None
-        assert isinstance(file_editor.parsers, dict)
+        assert isinstance(file_editor.parsers, Mapping)
 
 
 class TestEditResult:
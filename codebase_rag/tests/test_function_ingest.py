@@ -1,3 +1,4 @@
+from collections.abc import Mapping
 from pathlib import Path
 from unittest.mock import MagicMock
 
@@ -14,7 +15,7 @@ from codebase_rag.tests.conftest import get_node_names, run_updater
 def parse_code(
     code: str,
     language: cs.SupportedLanguage,
-    parsers: dict[cs.SupportedLanguage, Parser],
+    parsers: Mapping[cs.SupportedLanguage, Parser],
 ) -> Node:
     parser = parsers[language]
     tree = parser.parse(code.encode(cs.ENCODING_UTF8))
@@ -1,12 +1,22 @@
 from __future__ import annotations
 
+import threading
+from collections.abc import Iterator
 from unittest.mock import MagicMock, patch
 
+import mgclient  # ty: ignore[unresolved-import]
 import pytest
 
 from codebase_rag.constants import NODE_UNIQUE_CONSTRAINTS
-from codebase_rag.cypher_queries import wrap_with_unwind
-from codebase_rag.services.graph_service import MemgraphIngestor
+from codebase_rag.cypher_queries import (
+    CYPHER_SHOW_INDEX_INFO,
+    NODE_PROPERTY_INDEXES,
+    wrap_with_unwind,
+)
+from codebase_rag.services.graph_service import (
+    MemgraphConnectionPool,
+    MemgraphIngestor,
+)
 
 
 class TestMemgraphIngestorInit:
@@ -38,7 +48,7 @@ class TestMemgraphIngestorInit:
         ingestor = MemgraphIngestor(host="localhost", port=7687)
 
         assert ingestor.node_buffer == []
-        assert ingestor.relationship_buffer == []
+        assert len(ingestor.relationship_buffer) == 0
 
     def test_init_conn_is_none(self) -> None:
         ingestor = MemgraphIngestor(host="localhost", port=7687)
@@ -285,7 +295,52 @@ class TestEnsureConstraints:
         with patch.object(ingestor, "_execute_query", side_effect=fail_then_succeed):
             ingestor.ensure_constraints()
 
-        assert call_count == len(NODE_UNIQUE_CONSTRAINTS)
+        assert call_count == (
+            len(NODE_UNIQUE_CONSTRAINTS) + 1 + len(NODE_PROPERTY_INDEXES)
+        )
+
+    def test_creates_property_indexes(self) -> None:
+        ingestor = MemgraphIngestor(host="localhost", port=7687)
+
+        with patch.object(ingestor, "_execute_query") as mock_execute:
+            ingestor.ensure_constraints()
+
+        executed = [c.args[0] for c in mock_execute.call_args_list]
+        for label, prop in NODE_PROPERTY_INDEXES:
+            assert f"CREATE INDEX ON :{label}({prop});" in executed
+
+    def test_skips_indexes_that_already_exist(self) -> None:
+        ingestor = MemgraphIngestor(host="localhost", port=7687)
+        existing = [
+            {"index type": "label+property", "label": "Module", "property": "path"},
+            {"index type": "label+property", "label": "File", "property": ["path"]},
+        ]
+
+        def show_indexes(query: str) -> list[dict]:
+            return existing if query == CYPHER_SHOW_INDEX_INFO else []
+
+        with patch.object(ingestor, "_execute_query", side_effect=show_indexes) as m:
+            ingestor.ensure_constraints()
+
+        executed = [c.args[0] for c in m.call_args_list]
+        assert "CREATE INDEX ON :Module(path);" not in executed
+        assert "CREATE INDEX ON :File(path);" not in executed
+        assert "CREATE INDEX ON :Function(name);" in executed
+
+    def test_index_listing_failure_still_creates_indexes(self) -> None:
+        ingestor = MemgraphIngestor(host="localhost", port=7687)
+
+        def fail_listing(query: str) -> list[dict]:
+            if query == CYPHER_SHOW_INDEX_INFO:
+                raise RuntimeError("not supported")
+            return []
+
+        with patch.object(ingestor, "_execute_query", side_effect=fail_listing) as m:
+            ingestor.ensure_constraints()
+
+        executed = [c.args[0] for c in m.call_args_list]
+        for label, prop in NODE_PROPERTY_INDEXES:
+            assert f"CREATE INDEX ON :{label}({prop});" in executed
 
 
 class TestFlushNodesEdgeCases:
@@ -433,3 +488,129 @@ class TestGetCurrentTimestamp:
 
         assert "T" in result
         assert len(result) > 10
+
+
+def _fake_connection(rows: list[tuple[int]] | None = None) -> MagicMock:
+    conn = MagicMock()
+    conn.status = mgclient.CONN_STATUS_READY
+    cursor = conn.cursor.return_value
+    cursor.description = [MagicMock()]
+    cursor.description[0].name = "n"
+    cursor.fetchall.return_value = rows if rows is not None else [(1,)]
+    return conn
+
+
+@pytest.fixture
+def mock_connect() -> Iterator[MagicMock]:
+    with patch(
+        "codebase_rag.services.graph_service.mgclient.connect",
+        side_effect=lambda **_: _fake_connection(),
+    ) as connect:
+        yield connect
+
+
+class TestConnectionPool:
+    def test_connections_are_reused(self, mock_connect: MagicMock) -> None:
+        pool = MemgraphConnectionPool(host="h", port=1, max_size=2)
+
+        first = pool.fetch_all("RETURN 1 AS n")
+        second = pool.fetch_all("RETURN 1 AS n")
+
+        assert first == second == [{"n": 1}]
+        assert mock_connect.call_count == 1
+        assert pool.idle_count == 1
+
+    def test_raises_when_exhausted(self, mock_connect: MagicMock) -> None:
+        pool = MemgraphConnectionPool(
+            host="h", port=1, max_size=1, acquire_timeout=0.05
+        )
+
+        with pool.connection():
+            with pytest.raises(ConnectionError, match="pool size 1"):
+                pool.fetch_all("RETURN 1 AS n")
+
+        assert pool.fetch_all("RETURN 1 AS n") == [{"n": 1}]
+
+    def test_unhealthy_idle_connection_is_replaced(
+        self, mock_connect: MagicMock
+    ) -> None:
+        pool = MemgraphConnectionPool(host="h", port=1, max_size=1)
+        with pool.connection() as stale:
+            pass
+        stale.status = mgclient.CONN_STATUS_BAD
+
+        with pool.connection() as fresh:
+            assert fresh is not stale
+
+        stale.close.assert_called_once()
+        assert len(pool) == 1
+
+    def test_read_is_retried_on_a_new_connection(self, mock_connect: MagicMock) -> None:
+        broken = _fake_connection()
+
+        def reset(*_: object) -> None:
+            broken.status = mgclient.CONN_STATUS_BAD
+            raise mgclient.DatabaseError("connection reset by peer")
+
+        broken.cursor.return_value.execute.side_effect = reset
+        mock_connect.side_effect = [broken, _fake_connection([(7,)])]
+        pool = MemgraphConnectionPool(host="h", port=1, max_size=1)
+
+        assert pool.fetch_all("RETURN 7 AS n") == [{"n": 7}]
+        broken.close.assert_called_once()
+        assert len(pool) == 1
+
+    def test_query_errors_do_not_discard_connection(
+        self, mock_connect: MagicMock
+    ) -> None:
+        pool = MemgraphConnectionPool(host="h", port=1, max_size=1)
+        with pool.connection() as conn:
+            pass
+        conn.cursor.return_value.execute.side_effect = mgclient.DatabaseError(
+            "syntax error"
+        )
+
+        with pytest.raises(mgclient.DatabaseError):
+            pool.fetch_all("RETURN")
+
+        assert pool.idle_count == 1
+        conn.close.assert_not_called()
+
+    def test_concurrent_reads_stay_within_max_size(
+        self, mock_connect: MagicMock
+    ) -> None:
+        pool = MemgraphConnectionPool(host="h", port=1, max_size=2)
+        results: list[list] = []
+
+        def worker() -> None:
+            for _ in range(20):
+                results.append(pool.fetch_all("RETURN 1 AS n"))
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(results) == 160
+        assert mock_connect.call_count <= 2
+        assert len(pool) <= 2
+
+    def test_close_rejects_new_checkouts(self, mock_connect: MagicMock) -> None:
+        pool = MemgraphConnectionPool(host="h", port=1, max_size=1)
+        with pool.connection() as conn:
+            pass
+
+        pool.close()
+
+        conn.close.assert_called_once()
+        with pytest.raises(ConnectionError, match="closed"):
+            pool.fetch_all("RETURN 1 AS n")
+
+    def test_ingestor_reads_through_pool(self) -> None:
+        pool = MagicMock()
+        pool.fetch_all.return_value = [{"n": 1}]
+        ingestor = MemgraphIngestor(host="h", port=1, pool=pool)
+
+        assert ingestor.fetch_all("RETURN 1 AS n", {"x": 1}) == [{"n": 1}]
+        pool.fetch_all.assert_called_once_with("RETURN 1 AS n", {"x": 1})
@@ -1,6 +1,6 @@
 import tempfile
 from pathlib import Path
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 import tree_sitter_python as tsp
@@ -9,6 +9,8 @@ from tree_sitter import Language, Parser
 from codebase_rag.graph_updater import FunctionRegistryTrie, GraphUpdater
 from codebase_rag.parser_loader import load_parsers
 from codebase_rag.parsers.import_processor import ImportProcessor
+from codebase_rag.parsers.stdlib_extractor import StdlibExtractor
+from codebase_rag.tests.conftest import get_relationships, run_updater
 from codebase_rag.types_defs import NodeType
 
 
@@ -255,3 +257,31 @@ class TestImportProcessorCacheUtilities:
 
         stats = ImportProcessor.get_stdlib_cache_stats()
         assert isinstance(stats, dict), "Cache stats should return a dictionary"
+
+
+class TestImportRelationshipBatching:
+    def test_external_names_are_resolved_once_per_language(
+        self, temp_repo: Path, mock_ingestor: MagicMock
+    ) -> None:
+        project = temp_repo / "batched_imports"
+        project.mkdir()
+        (project / "a.py").write_text("import os\nfrom json import loads\n")
+        (project / "b.py").write_text("from collections import Counter\n")
+
+        with patch.object(
+            StdlibExtractor,
+            "extract_module_paths",
+            autospec=True,
+            side_effect=lambda self, names, language: {
+                name: name.rsplit(".", 1)[0] for name in names
+            },
+        ) as extract:
+            run_updater(project, mock_ingestor)
+
+        assert extract.call_count == 1
+        imported = {
+            (call.args[0][2], call.args[2][2])
+            for call in get_relationships(mock_ingestor, "IMPORTS")
+        }
+        assert ("batched_imports.a", "json") in imported
+        assert ("batched_imports.b", "collections") in imported
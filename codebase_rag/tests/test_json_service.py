@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from codebase_rag.graph_loader import count_graph, load_graph
+from codebase_rag.services.json_service import JsonFileIngestor
+
+
+def _ingest(output: Path) -> JsonFileIngestor:
+    ingestor = JsonFileIngestor(str(output))
+    ingestor.ensure_node_batch(
+        "Module", {"qualified_name": "pkg.mod", "path": "mod.py"}
+    )
+    ingestor.ensure_node_batch("Function", {"qualified_name": "pkg.mod.a"})
+    ingestor.ensure_node_batch("Function", {"qualified_name": "pkg.mod.b"})
+    for name in ("a", "b"):
+        ingestor.ensure_relationship_batch(
+            ("Module", "qualified_name", "pkg.mod"),
+            "DEFINES",
+            ("Function", "qualified_name", f"pkg.mod.{name}"),
+        )
+    ingestor.ensure_relationship_batch(
+        ("Function", "qualified_name", "pkg.mod.a"),
+        "CALLS",
+        ("Function", "qualified_name", "pkg.mod.missing"),
+    )
+    return ingestor
+
+
+class TestCountGraph:
+    def test_counts_per_label_and_type(self) -> None:
+        counts = count_graph(["Module", "Function", "Function"], ["CALLS"])
+
+        assert counts["total_nodes"] == 3
+        assert counts["total_relationships"] == 1
+        assert counts["node_labels"] == {"Module": 1, "Function": 2}
+        assert counts["relationship_types"] == {"CALLS": 1}
+
+
+class TestJsonIngestorSummary:
+    def test_empty_before_flush(self, tmp_path: Path) -> None:
+        summary = _ingest(tmp_path / "graph.json").summary()
+
+        assert summary["total_nodes"] == 0
+        assert summary["node_labels"] == {}
+
+    def test_matches_written_graph(self, tmp_path: Path) -> None:
+        output = tmp_path / "graph.json"
+        ingestor = _ingest(output)
+
+        ingestor.flush_all()
+        summary = ingestor.summary()
+        written = load_graph(str(output)).summary()
+
+        assert summary["total_nodes"] == written["total_nodes"] == 3
+        assert summary["total_relationships"] == written["total_relationships"] == 2
+        assert summary["node_labels"] == written["node_labels"]
+        assert summary["relationship_types"] == {"DEFINES": 2}
@@ -1,9 +1,13 @@
+import asyncio
+import threading
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from codebase_rag import constants as cs
 from codebase_rag.mcp.tools import MCPToolsRegistry
+from codebase_rag.types_defs import IndexProgress
 
 pytestmark = [pytest.mark.anyio]
 
@@ -419,3 +423,112 @@ class TestQueryAndIndexIntegration:
             )
             result = await mcp_registry.query_code_graph("Find all classes")
             assert len(result["results"]) == 1
+
+
+@pytest.fixture
+def blocking_updater() -> tuple[MagicMock, threading.Event, threading.Event]:
+    started = threading.Event()
+    release = threading.Event()
+    updater = MagicMock()
+    updater.progress = IndexProgress(cs.IndexPhase.DEFINITIONS, 3, 10)
+
+    def run() -> None:
+        started.set()
+        assert release.wait(timeout=10)
+
+    updater.run.side_effect = run
+    return updater, started, release
+
+
+async def _wait_for(event: threading.Event) -> None:
+    assert await asyncio.to_thread(event.wait, 10)
+
+
+class TestBackgroundIndexing:
+    async def test_status_is_idle_before_any_job(
+        self, mcp_registry: MCPToolsRegistry
+    ) -> None:
+        status = await mcp_registry.get_index_status()
+
+        assert status["state"] == cs.IndexJobState.IDLE
+
+    async def test_background_job_reports_progress_until_done(
+        self,
+        mcp_registry: MCPToolsRegistry,
+        blocking_updater: tuple[MagicMock, threading.Event, threading.Event],
+    ) -> None:
+        updater, started, release = blocking_updater
+        with patch("codebase_rag.mcp.tools.GraphUpdater", return_value=updater):
+            message = await mcp_registry.index_repository(background=True)
+            await _wait_for(started)
+
+            running = await mcp_registry.get_index_status()
+            release.set()
+            job = mcp_registry._index_job
+            assert job is not None and job.future is not None
+            await job.future
+
+        finished = await mcp_registry.get_index_status()
+        assert cs.MCPToolName.GET_INDEX_STATUS in message
+        assert running["state"] == cs.IndexJobState.RUNNING
+        assert running["phase"] == cs.IndexPhase.DEFINITIONS
+        assert (running["processed"], running["total"]) == (3, 10)
+        assert finished["state"] == cs.IndexJobState.SUCCEEDED
+        assert "Success" in finished["message"]
+
+    async def test_queries_are_served_while_indexing(
+        self,
+        mcp_registry: MCPToolsRegistry,
+        blocking_updater: tuple[MagicMock, threading.Event, threading.Event],
+    ) -> None:
+        updater, started, release = blocking_updater
+        mcp_registry._query_tool.function.return_value = MagicMock(  # ty: ignore[invalid-assignment]
+            model_dump=lambda: {"results": [{"name": "add"}], "summary": "ok"}
+        )
+        with patch("codebase_rag.mcp.tools.GraphUpdater", return_value=updater):
+            index_call = asyncio.create_task(mcp_registry.index_repository())
+            await _wait_for(started)
+
+            result = await asyncio.wait_for(
+                mcp_registry.query_code_graph("Find all functions"), timeout=5
+            )
+            assert not index_call.done()
+            release.set()
+            index_result = await index_call
+
+        assert result["results"] == [{"name": "add"}]
+        assert "Error:" not in index_result
+
+    async def test_second_index_while_running_is_rejected(
+        self,
+        mcp_registry: MCPToolsRegistry,
+        blocking_updater: tuple[MagicMock, threading.Event, threading.Event],
+    ) -> None:
+        updater, started, release = blocking_updater
+        with patch("codebase_rag.mcp.tools.GraphUpdater", return_value=updater):
+            await mcp_registry.index_repository(background=True)
+            await _wait_for(started)
+
+            second = await mcp_registry.index_repository()
+            release.set()
+            job = mcp_registry._index_job
+            assert job is not None and job.future is not None
+            await job.future
+
+        assert "Error:" in second
+        assert "already running" in second
+        assert updater.run.call_count == 1
+
+    async def test_failed_background_job_reports_error(
+        self, mcp_registry: MCPToolsRegistry
+    ) -> None:
+        with patch("codebase_rag.mcp.tools.GraphUpdater") as mock_updater_class:
+            mock_updater_class.return_value.run.side_effect = Exception("boom")
+            await mcp_registry.index_repository(background=True)
+            job = mcp_registry._index_job
+            assert job is not None and job.future is not None
+            await job.future
+
+        status = await mcp_registry.get_index_status()
+        assert status["state"] == cs.IndexJobState.FAILED
+        assert status["error"] == "boom"
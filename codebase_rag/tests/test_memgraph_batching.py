@@ -88,3 +88,67 @@ def test_relationship_batch_flushes_after_threshold_and_respects_node_flush() ->
     executed_query = cursor_mock.execute.call_args[0][0]
     assert "UNWIND $batch" in executed_query
     cursor_mock.close.assert_called()
+
+
+def test_relationship_batch_dedupes_identical_edges() -> None:
+    ingestor, cursor_mock = _create_ingestor_with_mocked_connection(batch_size=10)
+
+    for _ in range(3):
+        ingestor.ensure_relationship_batch(
+            ("Function", "qualified_name", "proj.a"),
+            "CALLS",
+            ("Function", "qualified_name", "proj.b"),
+        )
+    ingestor.ensure_relationship_batch(
+        ("Function", "qualified_name", "proj.a"),
+        "CALLS",
+        ("Function", "qualified_name", "proj.c"),
+    )
+    assert len(ingestor.relationship_buffer) == 2
+
+    ingestor.flush_relationships()
+
+    executed_query = cursor_mock.execute.call_args[0][0]
+    assert "SET r += row.props" not in executed_query
+    batch_rows = cursor_mock.execute.call_args[0][1]["batch"]
+    assert batch_rows == [
+        {"from_val": "proj.a", "to_val": "proj.b"},
+        {"from_val": "proj.a", "to_val": "proj.c"},
+    ]
+
+
+def test_relationship_batch_backfills_props_for_pattern() -> None:
+    ingestor, cursor_mock = _create_ingestor_with_mocked_connection(batch_size=10)
+
+    ingestor.ensure_relationship_batch(
+        ("Module", "qualified_name", "proj.m"),
+        "DEPENDS_ON_EXTERNAL",
+        ("ExternalPackage", "name", "requests"),
+    )
+    ingestor.ensure_relationship_batch(
+        ("Module", "qualified_name", "proj.m"),
+        "DEPENDS_ON_EXTERNAL",
+        ("ExternalPackage", "name", "rich"),
+        {"version_spec": ">=13"},
+    )
+    ingestor.ensure_relationship_batch(
+        ("Module", "qualified_name", "proj.m"),
+        "DEPENDS_ON_EXTERNAL",
+        ("ExternalPackage", "name", "rich"),
+        {"extra": "cli"},
+    )
+
+    ingestor.flush_relationships()
+
+    executed_query = cursor_mock.execute.call_args[0][0]
+    assert "SET r += row.props" in executed_query
+    batch_rows = cursor_mock.execute.call_args[0][1]["batch"]
+    assert batch_rows == [
+        {"from_val": "proj.m", "to_val": "requests", "props": {}},
+        {
+            "from_val": "proj.m",
+            "to_val": "rich",
+            "props": {"version_spec": ">=13", "extra": "cli"},
+        },
+    ]
+    assert len(ingestor.relationship_buffer) == 0
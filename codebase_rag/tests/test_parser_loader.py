@@ -0,0 +1,140 @@
+import subprocess
+import sys
+from collections.abc import Iterator
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from codebase_rag import constants as cs
+from codebase_rag import parser_loader
+from codebase_rag.parser_loader import GrammarCache, load_parsers
+from codebase_rag.tools.file_editor import FileEditor
+from codebase_rag.types_defs import LanguageQueries
+
+pytest.importorskip("tree_sitter_python")
+
+
+@pytest.fixture
+def grammar_cache() -> Iterator[GrammarCache]:
+    cache = GrammarCache()
+    with patch.object(parser_loader, "GRAMMAR_CACHE", cache):
+        yield cache
+
+
+class TestLazyLoading:
+    def test_import_does_not_load_grammars(self) -> None:
+        result = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import sys, codebase_rag.parser_loader; "
+                "print(any(m.startswith('tree_sitter_') for m in sys.modules))",
+            ],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        assert result.stdout.strip() == "False"
+
+    def test_load_parsers_compiles_nothing_up_front(
+        self, grammar_cache: GrammarCache
+    ) -> None:
+        parsers, queries = load_parsers()
+
+        assert cs.SupportedLanguage.PYTHON in queries
+        assert list(parsers) == list(queries)
+        assert len(parsers) == len(queries)
+        assert len(grammar_cache) == 0
+
+    def test_config_access_does_not_load_grammar(
+        self, grammar_cache: GrammarCache
+    ) -> None:
+        _, queries = load_parsers()
+
+        configs = [entry[cs.QUERY_CONFIG] for entry in queries.values()]
+
+        assert all(config.file_extensions for config in configs)
+        assert len(grammar_cache) == 0
+
+    def test_first_use_loads_only_that_language(
+        self, grammar_cache: GrammarCache
+    ) -> None:
+        parsers, queries = load_parsers()
+
+        assert cs.SupportedLanguage.PYTHON in parsers
+        assert queries[cs.SupportedLanguage.PYTHON][cs.QUERY_FUNCTIONS] is not None
+        assert cs.SupportedLanguage.PYTHON in grammar_cache
+        assert len(grammar_cache) == 1
+
+    def test_query_keys_are_known_before_loading(
+        self, grammar_cache: GrammarCache
+    ) -> None:
+        _, queries = load_parsers()
+        entry = queries[cs.SupportedLanguage.PYTHON]
+
+        assert set(entry) == set(LanguageQueries.__annotations__)
+        assert len(entry) == len(LanguageQueries.__annotations__)
+        assert len(grammar_cache) == 0
+        assert all(key in entry for key in list(entry))
+
+    def test_query_access_builds_parser(self, grammar_cache: GrammarCache) -> None:
+        parsers, queries = load_parsers()
+
+        parser = queries[cs.SupportedLanguage.PYTHON]["parser"]
+
+        assert parsers[cs.SupportedLanguage.PYTHON] is parser
+
+    def test_unavailable_language_is_not_contained(
+        self, grammar_cache: GrammarCache
+    ) -> None:
+        parsers, _ = load_parsers()
+
+        assert "not-a-language" not in parsers
+        assert parsers.get("not-a-language") is None
+        with pytest.raises(KeyError):
+            parsers["not-a-language"]
+
+
+class TestProcessWideMemo:
+    def test_grammar_compiled_once_across_calls(
+        self, grammar_cache: GrammarCache
+    ) -> None:
+        with patch.object(
+            parser_loader,
+            "_compile_grammar",
+            wraps=parser_loader._compile_grammar,
+        ) as compile_grammar:
+            first_parsers, first_queries = load_parsers()
+            second_parsers, second_queries = load_parsers()
+            first_parsers.get(cs.SupportedLanguage.PYTHON)
+            second_parsers.get(cs.SupportedLanguage.PYTHON)
+
+        assert compile_grammar.call_count == 1
+        python = cs.SupportedLanguage.PYTHON
+        first_functions = first_queries[python][cs.QUERY_FUNCTIONS]
+        assert first_functions is second_queries[python][cs.QUERY_FUNCTIONS]
+        assert first_parsers[python] is not second_parsers[python]
+
+    def test_failed_grammar_is_not_retried(self, grammar_cache: GrammarCache) -> None:
+        with patch.object(
+            parser_loader, "_language_loader", return_value=None
+        ) as language_loader:
+            parsers, _ = load_parsers()
+            for _ in range(3):
+                assert cs.SupportedLanguage.PYTHON not in parsers
+
+        assert language_loader.call_count == 1
+        assert cs.SupportedLanguage.PYTHON not in list(parsers)
+        assert len(parsers) == sum(1 for _ in parsers)
+
+
+class TestParserReuse:
+    def test_file_editor_reuses_given_parsers(self, tmp_path: Path) -> None:
+        parsers, _ = load_parsers()
+
+        with patch("codebase_rag.tools.file_editor.load_parsers") as load:
+            editor = FileEditor(project_root=str(tmp_path), parsers=parsers)
+
+        load.assert_not_called()
+        assert editor.parsers is parsers
@@ -113,6 +113,31 @@ def test_protobuf_ingestor_joint_serialization_and_deserialization(
     assert rel.target_label == NodeType.METHOD
 
 
+def test_protobuf_ingestor_summary_counts_flushed_graph(tmp_path: Path) -> None:
+    ingestor = ProtobufFileIngestor(str(tmp_path / "out"))
+
+    for node_data in SAMPLE_NODES.values():
+        ingestor.ensure_node_batch(
+            str(node_data["label"]), cast(dict[str, Any], node_data["properties"])
+        )
+    for rel_data in SAMPLE_RELATIONSHIPS:
+        ingestor.ensure_relationship_batch(
+            cast(tuple[str, str, Any], rel_data["from_spec"]),
+            str(rel_data["rel_type"]),
+            cast(tuple[str, str, Any], rel_data["to_spec"]),
+        )
+
+    assert ingestor.summary()["total_nodes"] == 0
+
+    ingestor.flush_all()
+    summary = ingestor.summary()
+
+    assert summary["total_nodes"] == 3
+    assert summary["total_relationships"] == 1
+    assert summary["node_labels"] == {"Project": 1, "Class": 1, "Method": 1}
+    assert summary["relationship_types"] == {"DEFINES_METHOD": 1}
+
+
 def test_protobuf_ingestor_split_index_serialization_and_deserialization(
     tmp_path: Path,
 ) -> None:
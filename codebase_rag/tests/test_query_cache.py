@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from codebase_rag.cypher_queries import CYPHER_FIND_BY_QUALIFIED_NAME
+from codebase_rag.services import graph_service, query_cache
+from codebase_rag.services.graph_service import MemgraphIngestor
+from codebase_rag.services.query_cache import (
+    QueryResultCache,
+    bump_graph_generation,
+    is_read_only,
+)
+
+SCOPE = "localhost:7687"
+
+
+def _ingestor(cache: QueryResultCache) -> tuple[MemgraphIngestor, MagicMock]:
+    ingestor = MemgraphIngestor(host="localhost", port=7687, result_cache=cache)
+    execute = MagicMock(return_value=[{"name": "main"}])
+    ingestor._execute_query = execute  # type: ignore[method-assign]
+    return ingestor, execute
+
+
+class TestIsReadOnly:
+    @pytest.mark.parametrize(
+        "query",
+        [
+            CYPHER_FIND_BY_QUALIFIED_NAME,
+            "MATCH (n:Function) RETURN n.name AS offset LIMIT 5",
+        ],
+    )
+    def test_read_queries(self, query: str) -> None:
+        assert is_read_only(query)
+
+    @pytest.mark.parametrize(
+        "query",
+        [
+            "MATCH (n) DETACH DELETE n",
+            "match (n:Module {path: $path}) set n.name = 'x'",
+            "MERGE (n:Module {path: $path})",
+            "CALL db.clear()",
+        ],
+    )
+    def test_write_queries(self, query: str) -> None:
+        assert not is_read_only(query)
+
+
+class TestQueryResultCache:
+    def test_repeated_read_is_served_from_cache(self) -> None:
+        cache = QueryResultCache()
+        fetch = MagicMock(return_value=[{"n": 1}])
+
+        first = cache.fetch(SCOPE, "MATCH (n) RETURN n", {"a": 1}, fetch)
+        second = cache.fetch(SCOPE, "MATCH (n) RETURN n", {"a": 1}, fetch)
+
+        assert first == second == [{"n": 1}]
+        assert fetch.call_count == 1
+        assert cache.stats().hits == 1
+
+    def test_params_are_part_of_the_key(self) -> None:
+        cache = QueryResultCache()
+        fetch = MagicMock(return_value=[])
+
+        cache.fetch(SCOPE, "MATCH (n) RETURN n", {"a": 1}, fetch)
+        cache.fetch(SCOPE, "MATCH (n) RETURN n", {"a": 2}, fetch)
+
+        assert fetch.call_count == 2
+
+    def test_cached_rows_are_copies(self) -> None:
+        cache = QueryResultCache()
+        fetch = MagicMock(return_value=[{"n": 1}])
+
+        cache.fetch(SCOPE, "MATCH (n) RETURN n", None, fetch)[0]["n"] = 99
+
+        assert cache.fetch(SCOPE, "MATCH (n) RETURN n", None, fetch) == [{"n": 1}]
+
+    def test_generation_bump_invalidates(self) -> None:
+        cache = QueryResultCache()
+        fetch = MagicMock(return_value=[])
+
+        cache.fetch(SCOPE, "MATCH (n) RETURN n", None, fetch)
+        bump_graph_generation()
+        cache.fetch(SCOPE, "MATCH (n) RETURN n", None, fetch)
+
+        assert fetch.call_count == 2
+        assert cache.stats().invalidations == 1
+
+    def test_entries_expire_after_the_ttl(self) -> None:
+        cache = QueryResultCache(ttl=5.0)
+        fetch = MagicMock(return_value=[])
+
+        with patch("codebase_rag.services.query_cache.time.monotonic") as clock:
+            clock.return_value = 100.0
+            cache.fetch(SCOPE, "MATCH (n) RETURN n", None, fetch)
+            clock.return_value = 104.0
+            cache.fetch(SCOPE, "MATCH (n) RETURN n", None, fetch)
+            clock.return_value = 105.0
+            cache.fetch(SCOPE, "MATCH (n) RETURN n", None, fetch)
+
+        assert fetch.call_count == 2
+        assert cache.stats().hits == 1
+
+    def test_write_during_fetch_is_not_cached(self) -> None:
+        cache = QueryResultCache()
+
+        def racing_fetch() -> list[dict]:
+            bump_graph_generation()
+            return []
+
+        cache.fetch(SCOPE, "MATCH (n) RETURN n", None, racing_fetch)
+
+        assert len(cache) == 0
+
+    def test_write_queries_bypass(self) -> None:
+        cache = QueryResultCache()
+        fetch = MagicMock(return_value=[])
+
+        cache.fetch(SCOPE, "MATCH (n) SET n.x = 1", None, fetch)
+        cache.fetch(SCOPE, "MATCH (n) SET n.x = 1", None, fetch)
+
+        assert fetch.call_count == 2
+        assert cache.stats().bypassed == 2
+        assert len(cache) == 0
+
+    def test_least_recently_used_entry_is_evicted(self) -> None:
+        cache = QueryResultCache(max_entries=2)
+        fetch = MagicMock(return_value=[])
+
+        for query in ("MATCH (a) RETURN a", "MATCH (b) RETURN b"):
+            cache.fetch(SCOPE, query, None, fetch)
+        cache.fetch(SCOPE, "MATCH (a) RETURN a", None, fetch)
+        cache.fetch(SCOPE, "MATCH (c) RETURN c", None, fetch)
+        fetch.reset_mock()
+
+        cache.fetch(SCOPE, "MATCH (a) RETURN a", None, fetch)
+        cache.fetch(SCOPE, "MATCH (b) RETURN b", None, fetch)
+
+        assert fetch.call_count == 1
+
+    def test_large_results_are_not_cached(self) -> None:
+        cache = QueryResultCache(max_rows=2)
+        fetch = MagicMock(return_value=[{"n": i} for i in range(3)])
+
+        cache.fetch(SCOPE, "MATCH (n) RETURN n", None, fetch)
+
+        assert len(cache) == 0
+
+
+class TestIngestorInvalidation:
+    def test_fetch_all_is_cached(self) -> None:
+        ingestor, execute = _ingestor(QueryResultCache())
+
+        ingestor.fetch_all(CYPHER_FIND_BY_QUALIFIED_NAME, {"qn": "a.b"})
+        ingestor.fetch_all(CYPHER_FIND_BY_QUALIFIED_NAME, {"qn": "a.b"})
+
+        assert execute.call_count == 1
+
+    def test_execute_write_invalidates(self) -> None:
+        ingestor, execute = _ingestor(QueryResultCache())
+
+        ingestor.fetch_all(CYPHER_FIND_BY_QUALIFIED_NAME, {"qn": "a.b"})
+        ingestor.execute_write("MATCH (m:Module {path: $path}) DETACH DELETE m")
+        ingestor.fetch_all(CYPHER_FIND_BY_QUALIFIED_NAME, {"qn": "a.b"})
+
+        assert execute.call_count == 3
+
+    def test_flush_invalidates(self) -> None:
+        ingestor, execute = _ingestor(QueryResultCache())
+        ingestor.conn = MagicMock()
+
+        ingestor.fetch_all(CYPHER_FIND_BY_QUALIFIED_NAME, {"qn": "a.b"})
+        ingestor.ensure_node_batch("Module", {"qualified_name": "a", "path": "a.py"})
+        ingestor.flush_all()
+        ingestor.fetch_all(CYPHER_FIND_BY_QUALIFIED_NAME, {"qn": "a.b"})
+
+        assert execute.call_count == 2
+
+    def test_generated_write_query_invalidates(self) -> None:
+        ingestor, execute = _ingestor(QueryResultCache())
+
+        ingestor.fetch_all(CYPHER_FIND_BY_QUALIFIED_NAME, {"qn": "a.b"})
+        ingestor.fetch_all("MATCH (n:Function) SET n.seen = true RETURN n")
+        ingestor.fetch_all(CYPHER_FIND_BY_QUALIFIED_NAME, {"qn": "a.b"})
+
+        assert execute.call_count == 3
+
+    def test_cache_is_off_by_default(self) -> None:
+        with patch.object(query_cache, "_QUERY_CACHE", None):
+            assert query_cache.get_query_cache() is None
+
+    def test_shared_pool_carries_the_process_cache(self) -> None:
+        with (
+            patch.object(query_cache.settings, "QUERY_CACHE_ENABLED", True),
+            patch.object(query_cache, "_QUERY_CACHE", None),
+            patch.object(graph_service, "MemgraphConnectionPool") as pool_cls,
+            patch.dict(graph_service._POOLS, clear=True),
+        ):
+            graph_service.get_connection_pool("cache-host", 1)
+
+        assert isinstance(pool_cls.call_args.kwargs["result_cache"], QueryResultCache)
@@ -0,0 +1,88 @@
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+from tree_sitter import Language, Query
+
+from codebase_rag import constants as cs
+from codebase_rag import parser_loader
+from codebase_rag.parser_loader import QueryRegistry
+from codebase_rag.tests.conftest import run_updater
+
+tsjs = pytest.importorskip("tree_sitter_javascript")
+tsts = pytest.importorskip("tree_sitter_typescript")
+
+
+@pytest.fixture
+def registry() -> QueryRegistry:
+    return QueryRegistry()
+
+
+class TestQueryRegistry:
+    @pytest.mark.parametrize("name", list(cs.AuxiliaryQuery))
+    def test_every_query_compiles_for_js_and_ts(
+        self, registry: QueryRegistry, name: cs.AuxiliaryQuery
+    ) -> None:
+        for language in (
+            Language(tsjs.language()),
+            Language(tsts.language_typescript()),
+        ):
+            assert isinstance(registry.get(language, name), Query)
+
+    def test_query_is_shared_across_language_instances(
+        self, registry: QueryRegistry
+    ) -> None:
+        first = registry.get(
+            Language(tsjs.language()), cs.AuxiliaryQuery.PROTOTYPE_METHOD
+        )
+        second = registry.get(
+            Language(tsjs.language()), cs.AuxiliaryQuery.PROTOTYPE_METHOD
+        )
+
+        assert first is second
+        assert len(registry) == 1
+
+    def test_compile_failure_is_cached(self, registry: QueryRegistry) -> None:
+        language = Language(tsjs.language())
+        with patch.object(
+            parser_loader, "Query", side_effect=RuntimeError("bad pattern")
+        ) as query_cls:
+            for _ in range(3):
+                with pytest.raises(ValueError, match="bad pattern"):
+                    registry.get(language, cs.AuxiliaryQuery.OBJECT_ARROW)
+
+        assert query_cls.call_count == 1
+
+    def test_failed_compile_leaves_source_intact(self, registry: QueryRegistry) -> None:
+        tspy = pytest.importorskip("tree_sitter_python")
+        name = cs.AuxiliaryQuery.ES6_EXPORT_CONST
+        source = cs.AUXILIARY_QUERY_SOURCES[name]
+
+        with pytest.raises(ValueError):
+            registry.get(Language(tspy.language()), name)
+
+        assert "\x00" not in source
+        assert isinstance(registry.get(Language(tsjs.language()), name), Query)
+
+
+class TestRegistryDuringIndexing:
+    def test_queries_compile_once_across_files(
+        self, temp_repo: Path, mock_ingestor: MagicMock
+    ) -> None:
+        project = temp_repo / "many_js_files"
+        project.mkdir()
+        for i in range(5):
+            (project / f"mod{i}.js").write_text(
+                f"function Base{i}() {{}}\n"
+                f"Base{i}.prototype.run = function () {{ return {i}; }};\n"
+                f"module.exports.helper{i} = () => {i};\n"
+            )
+
+        parser_loader.QUERY_REGISTRY.clear()
+        with patch.object(
+            QueryRegistry, "_compile", wraps=QueryRegistry._compile
+        ) as compile_query:
+            run_updater(project, mock_ingestor)
+
+        assert compile_query.call_count == len(cs.AuxiliaryQuery)
+        assert len(parser_loader.QUERY_REGISTRY) == len(cs.AuxiliaryQuery)
@@ -0,0 +1,167 @@
+import os
+from collections.abc import Iterator
+from contextlib import AbstractContextManager
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from codebase_rag import constants as cs
+from codebase_rag.config import CGRIGNORE_FILENAME
+from codebase_rag.tests.conftest import create_and_run_updater, get_node_names
+from codebase_rag.utils import path_utils
+from codebase_rag.utils.path_utils import (
+    PathMatcher,
+    build_path_matcher,
+    should_skip_path,
+    walk_repository,
+)
+
+
+def _make_tree(root: Path) -> None:
+    for rel in (
+        "pkg/__init__.py",
+        "pkg/core.py",
+        "pkg/sub/deep.py",
+        "pkg/sub/data.json",
+        "node_modules/lib/index.js",
+        "node_modules/lib/keep/main.js",
+        ".git/objects/pack.txt",
+        "vendor/third.py",
+        "src/app.ts",
+        "src/cache.pyc",
+        "README.md",
+    ):
+        path = root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("x = 1\n")
+
+
+def _rglob_reference(
+    root: Path,
+    exclude_paths: frozenset[str] | None,
+    include_paths: frozenset[str] | None,
+) -> set[Path]:
+    return {
+        path
+        for path in root.rglob("*")
+        if (path.is_file() or path.is_dir())
+        and not should_skip_path(
+            path, root, exclude_paths=exclude_paths, include_paths=include_paths
+        )
+    }
+
+
+class TestWalkRepository:
+    @pytest.mark.parametrize(
+        ("exclude_paths", "include_paths"),
+        [
+            (None, None),
+            (frozenset({"vendor"}), None),
+            (None, frozenset({"node_modules"})),
+            (None, frozenset({os.path.join("node_modules", "lib", "keep")})),
+            (frozenset({"sub"}), frozenset({os.path.join("pkg", "sub", "deep.py")})),
+        ],
+    )
+    def test_matches_should_skip_path(
+        self,
+        temp_repo: Path,
+        exclude_paths: frozenset[str] | None,
+        include_paths: frozenset[str] | None,
+    ) -> None:
+        _make_tree(temp_repo)
+        matcher = PathMatcher(exclude_paths=exclude_paths, include_paths=include_paths)
+
+        walked = {entry.path for entry in walk_repository(temp_repo, matcher)}
+
+        assert walked == _rglob_reference(temp_repo, exclude_paths, include_paths)
+
+    def test_ignored_directories_are_not_entered(self, temp_repo: Path) -> None:
+        _make_tree(temp_repo)
+        scanned: list[str] = []
+        real_scandir = os.scandir
+
+        def recording_scandir(
+            path: str,
+        ) -> AbstractContextManager[Iterator[os.DirEntry[str]]]:
+            scanned.append(path)
+            return real_scandir(path)
+
+        with patch.object(path_utils.os, "scandir", side_effect=recording_scandir):
+            list(walk_repository(temp_repo, PathMatcher()))
+
+        scanned_names = {Path(path).name for path in scanned}
+        assert "pkg" in scanned_names
+        assert "node_modules" not in scanned_names
+        assert ".git" not in scanned_names
+
+    def test_include_below_excluded_directory_enters_only_that_branch(
+        self, temp_repo: Path
+    ) -> None:
+        _make_tree(temp_repo)
+        keep = os.path.join("node_modules", "lib", "keep")
+
+        walked = {
+            entry.path.relative_to(temp_repo).as_posix()
+            for entry in walk_repository(
+                temp_repo, PathMatcher(include_paths=frozenset({keep}))
+            )
+        }
+
+        assert "node_modules/lib/keep/main.js" in walked
+        assert "node_modules/lib/index.js" not in walked
+        assert "node_modules" not in walked
+
+    def test_entries_carry_language(self, temp_repo: Path) -> None:
+        _make_tree(temp_repo)
+
+        languages = {
+            entry.path.name: entry.language
+            for entry in walk_repository(temp_repo, PathMatcher())
+        }
+
+        assert languages["core.py"] == cs.SupportedLanguage.PYTHON
+        assert languages["app.ts"] == cs.SupportedLanguage.TS
+        assert languages["README.md"] is None
+        assert languages["pkg"] is None
+        assert "cache.pyc" not in languages
+
+    def test_symlinked_directory_is_listed_but_not_followed(
+        self, temp_repo: Path, tmp_path_factory: pytest.TempPathFactory
+    ) -> None:
+        outside = tmp_path_factory.mktemp("outside")
+        (outside / "external.py").write_text("y = 2\n")
+        (temp_repo / "linked").symlink_to(outside, target_is_directory=True)
+
+        walked = {entry.path for entry in walk_repository(temp_repo, PathMatcher())}
+
+        assert temp_repo / "linked" in walked
+        assert temp_repo / "linked" / "external.py" not in walked
+
+
+class TestCgrignore:
+    def test_matcher_includes_cgrignore_patterns(self, temp_repo: Path) -> None:
+        _make_tree(temp_repo)
+        (temp_repo / CGRIGNORE_FILENAME).write_text("vendor\n")
+
+        matcher = build_path_matcher(temp_repo)
+        walked = {entry.path for entry in walk_repository(temp_repo, matcher)}
+
+        assert "vendor" in matcher.excludes
+        assert temp_repo / "vendor" / "third.py" not in walked
+        assert temp_repo / "pkg" / "core.py" in walked
+
+    def test_updater_skips_cgrignored_directories(
+        self, temp_repo: Path, mock_ingestor: MagicMock
+    ) -> None:
+        project = temp_repo / "proj"
+        (project / "vendor").mkdir(parents=True)
+        (project / "app.py").write_text("def run():\n    return 1\n")
+        (project / "vendor" / "lib.py").write_text("def vendored():\n    return 2\n")
+        (project / CGRIGNORE_FILENAME).write_text("vendor\n")
+
+        create_and_run_updater(project, mock_ingestor)
+
+        functions = get_node_names(mock_ingestor, cs.NodeLabel.FUNCTION)
+        assert any(name.endswith(".run") for name in functions)
+        assert not any(name.endswith(".vendored") for name in functions)
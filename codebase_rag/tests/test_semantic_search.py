@@ -22,11 +22,9 @@ def mock_search_embeddings() -> MagicMock:
 
 
 @pytest.fixture
-def mock_ingestor() -> MagicMock:
+def mock_pool() -> MagicMock:
     mock = MagicMock()
-    mock.__enter__ = MagicMock(return_value=mock)
-    mock.__exit__ = MagicMock(return_value=False)
-    mock._execute_query.return_value = [
+    mock.fetch_all.return_value = [
         {
             "node_id": 1,
             "qualified_name": "project.module.func1",
@@ -65,7 +63,7 @@ def test_semantic_code_search_returns_empty_without_dependencies() -> None:
 def test_semantic_code_search_returns_formatted_results(
     mock_embed_code: MagicMock,
     mock_search_embeddings: MagicMock,
-    mock_ingestor: MagicMock,
+    mock_pool: MagicMock,
 ) -> None:
     from codebase_rag.tools.semantic_search import semantic_code_search
 
@@ -73,8 +71,8 @@ def test_semantic_code_search_returns_formatted_results(
         patch("codebase_rag.embedder.embed_code", mock_embed_code),
         patch("codebase_rag.vector_store.search_embeddings", mock_search_embeddings),
         patch(
-            "codebase_rag.services.graph_service.MemgraphIngestor",
-            return_value=mock_ingestor,
+            "codebase_rag.services.graph_service.get_connection_pool",
+            return_value=mock_pool,
         ),
     ):
         results = semantic_code_search("find authentication code", top_k=3)
@@ -92,7 +90,7 @@ def test_semantic_code_search_returns_formatted_results(
 def test_semantic_code_search_calls_embed_code_with_query(
     mock_embed_code: MagicMock,
     mock_search_embeddings: MagicMock,
-    mock_ingestor: MagicMock,
+    mock_pool: MagicMock,
 ) -> None:
     from codebase_rag.tools.semantic_search import semantic_code_search
 
@@ -100,8 +98,8 @@ def test_semantic_code_search_calls_embed_code_with_query(
         patch("codebase_rag.embedder.embed_code", mock_embed_code),
         patch("codebase_rag.vector_store.search_embeddings", mock_search_embeddings),
         patch(
-            "codebase_rag.services.graph_service.MemgraphIngestor",
-            return_value=mock_ingestor,
+            "codebase_rag.services.graph_service.get_connection_pool",
+            return_value=mock_pool,
         ),
     ):
         semantic_code_search("database operations")
@@ -115,7 +113,7 @@ def test_semantic_code_search_calls_embed_code_with_query(
 def test_semantic_code_search_passes_top_k_to_search(
     mock_embed_code: MagicMock,
     mock_search_embeddings: MagicMock,
-    mock_ingestor: MagicMock,
+    mock_pool: MagicMock,
 ) -> None:
     from codebase_rag.tools.semantic_search import semantic_code_search
 
@@ -123,8 +121,8 @@ def test_semantic_code_search_passes_top_k_to_search(
         patch("codebase_rag.embedder.embed_code", mock_embed_code),
         patch("codebase_rag.vector_store.search_embeddings", mock_search_embeddings),
         patch(
-            "codebase_rag.services.graph_service.MemgraphIngestor",
-            return_value=mock_ingestor,
+            "codebase_rag.services.graph_service.get_connection_pool",
+            return_value=mock_pool,
         ),
     ):
         semantic_code_search("file handling", top_k=10)
@@ -170,7 +168,7 @@ def test_semantic_code_search_handles_exception(mock_embed_code: MagicMock) -> N
 )
 def test_semantic_code_search_preserves_score_order(
     mock_embed_code: MagicMock,
-    mock_ingestor: MagicMock,
+    mock_pool: MagicMock,
 ) -> None:
     from codebase_rag.tools.semantic_search import semantic_code_search
 
@@ -180,8 +178,8 @@ def test_semantic_code_search_preserves_score_order(
         patch("codebase_rag.embedder.embed_code", mock_embed_code),
         patch("codebase_rag.vector_store.search_embeddings", mock_search),
         patch(
-            "codebase_rag.services.graph_service.MemgraphIngestor",
-            return_value=mock_ingestor,
+            "codebase_rag.services.graph_service.get_connection_pool",
+            return_value=mock_pool,
         ),
     ):
         results = semantic_code_search("test query")
@@ -195,10 +193,10 @@ def test_semantic_code_search_preserves_score_order(
 @pytest.mark.skipif(
     not has_semantic_dependencies(), reason="semantic dependencies not installed"
 )
-def test_get_function_source_code_returns_source(mock_ingestor: MagicMock) -> None:
+def test_get_function_source_code_returns_source(mock_pool: MagicMock) -> None:
     from codebase_rag.tools.semantic_search import get_function_source_code
 
-    mock_ingestor._execute_query.return_value = [
+    mock_pool.fetch_all.return_value = [
         {
             "qualified_name": "project.module.func",
             "start_line": 10,
@@ -212,8 +210,8 @@ def test_get_function_source_code_returns_source(mock_ingestor: MagicMock) -> No
 
     with (
         patch(
-            "codebase_rag.services.graph_service.MemgraphIngestor",
-            return_value=mock_ingestor,
+            "codebase_rag.services.graph_service.get_connection_pool",
+            return_value=mock_pool,
         ),
         patch(
             "codebase_rag.utils.source_extraction.validate_source_location",
@@ -232,15 +230,15 @@ def test_get_function_source_code_returns_source(mock_ingestor: MagicMock) -> No
     not has_semantic_dependencies(), reason="semantic dependencies not installed"
 )
 def test_get_function_source_code_returns_none_when_not_found(
-    mock_ingestor: MagicMock,
+    mock_pool: MagicMock,
 ) -> None:
     from codebase_rag.tools.semantic_search import get_function_source_code
 
-    mock_ingestor._execute_query.return_value = []
+    mock_pool.fetch_all.return_value = []
 
     with patch(
-        "codebase_rag.services.graph_service.MemgraphIngestor",
-        return_value=mock_ingestor,
+        "codebase_rag.services.graph_service.get_connection_pool",
+        return_value=mock_pool,
     ):
         result = get_function_source_code(999)
 
@@ -251,11 +249,11 @@ def test_get_function_source_code_returns_none_when_not_found(
     not has_semantic_dependencies(), reason="semantic dependencies not installed"
 )
 def test_get_function_source_code_returns_none_on_invalid_location(
-    mock_ingestor: MagicMock,
+    mock_pool: MagicMock,
 ) -> None:
     from codebase_rag.tools.semantic_search import get_function_source_code
 
-    mock_ingestor._execute_query.return_value = [
+    mock_pool.fetch_all.return_value = [
         {
             "qualified_name": "project.module.func",
             "start_line": None,
@@ -268,8 +266,8 @@ def test_get_function_source_code_returns_none_on_invalid_location(
 
     with (
         patch(
-            "codebase_rag.services.graph_service.MemgraphIngestor",
-            return_value=mock_ingestor,
+            "codebase_rag.services.graph_service.get_connection_pool",
+            return_value=mock_pool,
         ),
         patch(
             "codebase_rag.utils.source_extraction.validate_source_location",
@@ -284,14 +282,14 @@ def test_get_function_source_code_returns_none_on_invalid_location(
 @pytest.mark.skipif(
     not has_semantic_dependencies(), reason="semantic dependencies not installed"
 )
-def test_get_function_source_code_handles_exception(mock_ingestor: MagicMock) -> None:
+def test_get_function_source_code_handles_exception(mock_pool: MagicMock) -> None:
     from codebase_rag.tools.semantic_search import get_function_source_code
 
-    mock_ingestor._execute_query.side_effect = Exception("Database error")
+    mock_pool.fetch_all.side_effect = Exception("Database error")
 
     with patch(
-        "codebase_rag.services.graph_service.MemgraphIngestor",
-        return_value=mock_ingestor,
+        "codebase_rag.services.graph_service.get_connection_pool",
+        return_value=mock_pool,
     ):
         result = get_function_source_code(123)
 
@@ -335,7 +333,7 @@ def test_create_get_function_source_tool_returns_tool() -> None:
 async def test_semantic_search_tool_formats_results(
     mock_embed_code: MagicMock,
     mock_search_embeddings: MagicMock,
-    mock_ingestor: MagicMock,
+    mock_pool: MagicMock,
 ) -> None:
     from codebase_rag.tools.semantic_search import create_semantic_search_tool
 
@@ -345,8 +343,8 @@ async def test_semantic_search_tool_formats_results(
         patch("codebase_rag.embedder.embed_code", mock_embed_code),
         patch("codebase_rag.vector_store.search_embeddings", mock_search_embeddings),
         patch(
-            "codebase_rag.services.graph_service.MemgraphIngestor",
-            return_value=mock_ingestor,
+            "codebase_rag.services.graph_service.get_connection_pool",
+            return_value=mock_pool,
         ),
     ):
         result = await tool.function("find handlers")
@@ -383,11 +381,11 @@ async def test_semantic_search_tool_handles_no_results(
 )
 @pytest.mark.asyncio
 async def test_get_function_source_tool_returns_source(
-    mock_ingestor: MagicMock,
+    mock_pool: MagicMock,
 ) -> None:
     from codebase_rag.tools.semantic_search import create_get_function_source_tool
 
-    mock_ingestor._execute_query.return_value = [
+    mock_pool.fetch_all.return_value = [
         {
             "qualified_name": "project.func",
             "start_line": 1,
@@ -403,8 +401,8 @@ async def test_get_function_source_tool_returns_source(
 
     with (
         patch(
-            "codebase_rag.services.graph_service.MemgraphIngestor",
-            return_value=mock_ingestor,
+            "codebase_rag.services.graph_service.get_connection_pool",
+            return_value=mock_pool,
         ),
         patch(
             "codebase_rag.utils.source_extraction.validate_source_location",
@@ -425,17 +423,17 @@ async def test_get_function_source_tool_returns_source(
 )
 @pytest.mark.asyncio
 async def test_get_function_source_tool_handles_not_found(
-    mock_ingestor: MagicMock,
+    mock_pool: MagicMock,
 ) -> None:
     from codebase_rag.tools.semantic_search import create_get_function_source_tool
 
-    mock_ingestor._execute_query.return_value = []
+    mock_pool.fetch_all.return_value = []
 
     tool = create_get_function_source_tool()
 
     with patch(
-        "codebase_rag.services.graph_service.MemgraphIngestor",
-        return_value=mock_ingestor,
+        "codebase_rag.services.graph_service.get_connection_pool",
+        return_value=mock_pool,
     ):
         result = await tool.function(999)
 
@@ -1,4 +1,10 @@
+import os
+import queue
+import sqlite3
+import sys
 import time
+from collections.abc import Generator
+from contextlib import closing
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -6,26 +12,37 @@ import pytest
 
 from codebase_rag import constants as cs
 from codebase_rag.parsers import stdlib_extractor as se
+from codebase_rag.parsers import stdlib_workers as sw
 from codebase_rag.parsers.stdlib_extractor import StdlibExtractor
+from codebase_rag.parsers.stdlib_workers import IntrospectionPool
 
 
 @pytest.fixture(autouse=True)
-def reset_caches() -> None:
-    se._STDLIB_CACHE.clear()
-    se._CACHE_TIMESTAMPS.clear()
-    se._EXTERNAL_TOOLS.clear()
+def reset_caches(tmp_path: Path) -> Generator[None, None, None]:
+    store = se.StdlibCacheStore(tmp_path / cs.IMPORT_CACHE_DIR / cs.IMPORT_CACHE_FILE)
+    pool = IntrospectionPool()
+    with (
+        patch.object(se, "_STDLIB_STORE", store),
+        patch.object(se, "_INTROSPECTION_POOL", (os.getpid(), pool)),
+    ):
+        se._EXTERNAL_TOOLS.clear()
+        yield
+    pool.close()
+    store.close()
+
+
+def _cache_db(tmp_path: Path) -> Path:
+    return tmp_path / ".cache" / "codebase_rag" / "stdlib_cache.sqlite3"
 
 
 class TestCacheHelpers:
     def test_cache_stdlib_result_creates_entry(self) -> None:
         se._cache_stdlib_result("python", "collections.Counter", "collections")
 
-        assert "python:collections.Counter" in se._STDLIB_CACHE
         assert (
-            se._STDLIB_CACHE["python:collections.Counter"]["collections.Counter"]
+            se._get_cached_stdlib_result("python", "collections.Counter")
             == "collections"
         )
-        assert "python:collections.Counter" in se._CACHE_TIMESTAMPS
 
     def test_get_cached_stdlib_result_returns_cached_value(self) -> None:
         se._cache_stdlib_result("python", "json.loads", "json")
@@ -40,15 +57,81 @@ class TestCacheHelpers:
         assert result is None
 
     def test_cache_ttl_expiration(self) -> None:
-        se._cache_stdlib_result("python", "os.path", "os")
-        cache_key = "python:os.path"
-        se._CACHE_TIMESTAMPS[cache_key] = time.time() - (cs.IMPORT_CACHE_TTL + 100)
+        expired_at = time.time() - (cs.IMPORT_CACHE_TTL + 100)
+        with patch.object(time, "time", return_value=expired_at):
+            se._cache_stdlib_result("python", "os.path", "os")
+        se.flush_stdlib_cache()
 
         result = se._get_cached_stdlib_result("python", "os.path")
 
         assert result is None
-        assert cache_key not in se._STDLIB_CACHE
-        assert cache_key not in se._CACHE_TIMESTAMPS
+        assert se.get_stdlib_cache_stats()["cache_entries"] == 0
+
+    def test_languages_are_kept_apart(self) -> None:
+        se._cache_stdlib_result("python", "path.join", "os.path")
+        se._cache_stdlib_result("javascript", "path.join", "path")
+
+        assert se._get_cached_stdlib_result("python", "path.join") == "os.path"
+        assert se._get_cached_stdlib_result("javascript", "path.join") == "path"
+        assert se._get_cached_stdlib_result("go", "path.join") is None
+
+
+class TestStdlibCacheStore:
+    def test_writes_are_batched(self, tmp_path: Path) -> None:
+        db_path = tmp_path / "cache.sqlite3"
+        store = se.StdlibCacheStore(db_path)
+        with patch.object(cs, "IMPORT_CACHE_WRITE_BATCH_SIZE", 3):
+            store.put("python", "a.x", "a")
+            store.put("python", "b.x", "b")
+            assert se.StdlibCacheStore(db_path).get("python", "a.x") is None
+
+            store.put("python", "c.x", "c")
+            reader = se.StdlibCacheStore(db_path)
+            assert reader.get("python", "a.x") == "a"
+            assert reader.get("python", "c.x") == "c"
+        store.close()
+        reader.close()
+
+    def test_reads_are_per_key(self, tmp_path: Path) -> None:
+        db_path = tmp_path / "cache.sqlite3"
+        writer = se.StdlibCacheStore(db_path)
+        for i in range(50):
+            writer.put("python", f"mod{i}.func", f"mod{i}")
+        writer.close()
+
+        reader = se.StdlibCacheStore(db_path)
+        assert reader.get("python", "mod7.func") == "mod7"
+        assert list(reader._memo) == [("python", "mod7.func")]
+        reader.close()
+
+    def test_table_per_language(self, tmp_path: Path) -> None:
+        db_path = tmp_path / "cache.sqlite3"
+        store = se.StdlibCacheStore(db_path)
+        store.put("python", "json.loads", "json")
+        store.put("c-sharp", "System.Console", "System")
+        store.close()
+
+        with closing(sqlite3.connect(db_path)) as conn:
+            tables = {
+                row[0]
+                for row in conn.execute(
+                    "SELECT name FROM sqlite_master WHERE type = 'table'"
+                )
+            }
+            journal_mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+        assert {"stdlib_python", "stdlib_c_sharp"} <= tables
+        assert journal_mode == "wal"
+
+    def test_unavailable_database_falls_back_to_memory(self, tmp_path: Path) -> None:
+        blocker = tmp_path / "blocker"
+        blocker.write_text("")
+        store = se.StdlibCacheStore(blocker / "cache.sqlite3")
+
+        store.put("python", "json.loads", "json")
+        store.flush()
+
+        assert store.get("python", "json.loads") == "json"
+        assert store.stats() == (1, ["python"], 1)
 
 
 class TestToolAvailability:
@@ -81,38 +164,44 @@ class TestToolAvailability:
 
 class TestCachePersistence:
     def test_save_and_load_persistent_cache(self, tmp_path: Path) -> None:
-        cache_dir = tmp_path / ".cache" / "codebase_rag"
-
         with patch.object(Path, "home", return_value=tmp_path):
+            se.load_persistent_cache()
             se._cache_stdlib_result("python", "pathlib.Path", "pathlib")
             se._cache_stdlib_result("javascript", "fs.readFile", "fs")
 
             se.save_persistent_cache()
 
-            assert (cache_dir / "stdlib_cache.json").exists()
+            assert _cache_db(tmp_path).exists()
 
-            se._STDLIB_CACHE.clear()
-            se._CACHE_TIMESTAMPS.clear()
+            se._STDLIB_STORE = None
+            se.load_persistent_cache()
+
+            assert se._get_cached_stdlib_result("python", "pathlib.Path") == "pathlib"
+            assert se._get_cached_stdlib_result("javascript", "fs.readFile") == "fs"
+
+    def test_load_persistent_cache_rebinds_to_current_home(
+        self, tmp_path: Path
+    ) -> None:
+        other_home = tmp_path / "other"
+        se._cache_stdlib_result("python", "json.loads", "json")
 
+        with patch.object(Path, "home", return_value=other_home):
             se.load_persistent_cache()
 
-            assert "python:pathlib.Path" in se._STDLIB_CACHE
-            assert "javascript:fs.readFile" in se._STDLIB_CACHE
+        assert se._STDLIB_STORE is not None
+        assert se._STDLIB_STORE.db_path == _cache_db(other_home)
+        assert se._get_cached_stdlib_result("python", "json.loads") is None
 
     def test_clear_stdlib_cache(self, tmp_path: Path) -> None:
         with patch.object(Path, "home", return_value=tmp_path):
-            cache_dir = tmp_path / ".cache" / "codebase_rag"
-            cache_dir.mkdir(parents=True, exist_ok=True)
-            cache_file = cache_dir / "stdlib_cache.json"
-            cache_file.write_text("{}")
-
             se._cache_stdlib_result("python", "test.module", "test")
+            se.flush_stdlib_cache()
+            assert _cache_db(tmp_path).exists()
 
             se.clear_stdlib_cache()
 
-            assert len(se._STDLIB_CACHE) == 0
-            assert len(se._CACHE_TIMESTAMPS) == 0
-            assert not cache_file.exists()
+            assert se._get_cached_stdlib_result("python", "test.module") is None
+            assert se.get_stdlib_cache_stats()["cache_entries"] == 0
 
     def test_flush_stdlib_cache_calls_save(self, tmp_path: Path) -> None:
         with patch.object(Path, "home", return_value=tmp_path):
@@ -120,8 +209,11 @@ class TestCachePersistence:
 
             se.flush_stdlib_cache()
 
-            cache_file = tmp_path / ".cache" / "codebase_rag" / "stdlib_cache.json"
-            assert cache_file.exists()
+            with closing(sqlite3.connect(_cache_db(tmp_path))) as conn:
+                rows = conn.execute(
+                    "SELECT qualified_name, module_path FROM stdlib_python"
+                ).fetchall()
+            assert rows == [("test.func", "test")]
 
 
 class TestGetStdlibCacheStats:
@@ -135,7 +227,7 @@ class TestGetStdlibCacheStats:
         stats = se.get_stdlib_cache_stats()
 
         assert stats["cache_entries"] == 3
-        assert "python:json.loads" in stats["cache_languages"]
+        assert stats["cache_languages"] == ["javascript", "python"]
         assert stats["total_cached_results"] == 3
         assert stats["external_tools_checked"]["node"] is True
         assert stats["external_tools_checked"]["go"] is False
@@ -371,29 +463,30 @@ class TestEdgeCases:
 
 
 class TestCachePersistenceErrorHandling:
-    def test_load_persistent_cache_handles_json_decode_error(
+    def test_load_persistent_cache_handles_corrupt_database(
         self, tmp_path: Path
     ) -> None:
         with patch.object(Path, "home", return_value=tmp_path):
-            cache_dir = tmp_path / ".cache" / "codebase_rag"
-            cache_dir.mkdir(parents=True, exist_ok=True)
-            cache_file = cache_dir / "stdlib_cache.json"
-            cache_file.write_text("invalid json {{{")
-
-            se._cache_stdlib_result("python", "existing.module", "existing")
+            _cache_db(tmp_path).parent.mkdir(parents=True, exist_ok=True)
+            _cache_db(tmp_path).write_text("invalid database {{{")
+            se._STDLIB_STORE = None
 
             se.load_persistent_cache()
+            se._cache_stdlib_result("python", "existing.module", "existing")
 
-            assert "python:existing.module" in se._STDLIB_CACHE
+            assert (
+                se._get_cached_stdlib_result("python", "existing.module") == "existing"
+            )
 
     def test_load_persistent_cache_handles_missing_file(self, tmp_path: Path) -> None:
         with patch.object(Path, "home", return_value=tmp_path):
             se.load_persistent_cache()
 
-            assert len(se._STDLIB_CACHE) == 0
+            assert se.get_stdlib_cache_stats()["cache_entries"] == 0
 
     def test_save_persistent_cache_handles_os_error(self, tmp_path: Path) -> None:
         with patch.object(Path, "home", return_value=tmp_path):
+            se._STDLIB_STORE = None
             with patch.object(Path, "mkdir", side_effect=OSError("Permission denied")):
                 se._cache_stdlib_result("python", "test.func", "test")
 
@@ -401,335 +494,402 @@ class TestCachePersistenceErrorHandling:
 
     def test_clear_stdlib_cache_handles_unlink_error(self, tmp_path: Path) -> None:
         with patch.object(Path, "home", return_value=tmp_path):
-            cache_dir = tmp_path / ".cache" / "codebase_rag"
-            cache_dir.mkdir(parents=True, exist_ok=True)
-            cache_file = cache_dir / "stdlib_cache.json"
-            cache_file.write_text("{}")
-
             se._cache_stdlib_result("python", "test.module", "test")
+            se.flush_stdlib_cache()
 
             with patch.object(Path, "unlink", side_effect=OSError("Permission denied")):
                 se.clear_stdlib_cache()
 
-            assert len(se._STDLIB_CACHE) == 0
+            assert se._get_cached_stdlib_result("python", "test.module") is None
+
+
+@pytest.fixture
+def pool_query() -> Generator[MagicMock, None, None]:
+    with (
+        patch.object(se._introspection_pool(), "query") as query,
+        patch.object(se, "_is_tool_available", return_value=True),
+    ):
+        yield query
 
 
-class TestGoExtractorWithMockedSubprocess:
+class TestGoExtractorWithWorker:
     @pytest.fixture
     def extractor(self) -> StdlibExtractor:
         return StdlibExtractor(function_registry=None)
 
     def test_go_extractor_returns_package_on_successful_introspection(
-        self, extractor: StdlibExtractor
+        self, extractor: StdlibExtractor, pool_query: MagicMock
     ) -> None:
-        mock_list_result = MagicMock()
-        mock_list_result.returncode = 0
-        mock_list_result.stdout = "/usr/local/go/src/fmt"
-
-        mock_popen = MagicMock()
-        mock_popen.__enter__ = MagicMock(return_value=mock_popen)
-        mock_popen.__exit__ = MagicMock(return_value=False)
-        mock_popen.returncode = 0
-        mock_popen.communicate.return_value = (
-            '{"hasEntity": true, "entityType": "function"}',
-            "",
-        )
+        pool_query.return_value = [True]
 
-        with (
-            patch("subprocess.run", return_value=mock_list_result),
-            patch("subprocess.Popen", return_value=mock_popen),
-        ):
-            result = extractor.extract_module_path(
-                "fmt/Println", cs.SupportedLanguage.GO
-            )
+        result = extractor.extract_module_path(
+            "net/http/handle", cs.SupportedLanguage.GO
+        )
 
-            assert result == "fmt"
+        assert result == "net/http"
+        pool_query.assert_called_once_with(
+            cs.SupportedLanguage.GO, [("net/http", "handle")]
+        )
 
-    def test_go_extractor_fallback_on_go_list_failure(
-        self, extractor: StdlibExtractor
+    def test_go_extractor_fallback_when_worker_unavailable(
+        self, extractor: StdlibExtractor, pool_query: MagicMock
     ) -> None:
-        mock_result = MagicMock()
-        mock_result.returncode = 1
-        mock_result.stdout = ""
-
-        with patch("subprocess.run", return_value=mock_result):
-            result = extractor.extract_module_path(
-                "fmt/Println", cs.SupportedLanguage.GO
-            )
-
-            assert result == "fmt"
-
-    def test_go_extractor_fallback_on_timeout(self, extractor: StdlibExtractor) -> None:
-        import subprocess
+        pool_query.return_value = None
 
-        with patch("subprocess.run", side_effect=subprocess.TimeoutExpired("go", 5)):
-            result = extractor.extract_module_path(
-                "fmt/Println", cs.SupportedLanguage.GO
-            )
+        result = extractor.extract_module_path("fmt/Println", cs.SupportedLanguage.GO)
 
-            assert result == "fmt"
+        assert result == "fmt"
 
     def test_go_extractor_lowercase_entity_returns_unchanged(
-        self, extractor: StdlibExtractor
+        self, extractor: StdlibExtractor, pool_query: MagicMock
     ) -> None:
-        mock_result = MagicMock()
-        mock_result.returncode = 1
+        pool_query.return_value = [False]
 
-        with patch("subprocess.run", return_value=mock_result):
-            result = extractor.extract_module_path(
-                "fmt/lowercase", cs.SupportedLanguage.GO
-            )
+        result = extractor.extract_module_path("fmt/lowercase", cs.SupportedLanguage.GO)
 
-            assert result == "fmt/lowercase"
+        assert result == "fmt/lowercase"
 
 
-class TestJavaExtractorWithMockedSubprocess:
+class TestJavaExtractorWithWorker:
     @pytest.fixture
     def extractor(self) -> StdlibExtractor:
         return StdlibExtractor(function_registry=None)
 
-    def test_java_extractor_fallback_on_compile_failure(
-        self, extractor: StdlibExtractor
+    def test_java_extractor_uses_package_for_lookup(
+        self, extractor: StdlibExtractor, pool_query: MagicMock
     ) -> None:
-        mock_compile = MagicMock()
-        mock_compile.returncode = 1
+        pool_query.return_value = [True]
 
-        with patch("subprocess.run", return_value=mock_compile):
-            result = extractor.extract_module_path(
-                "java.util.ArrayList", cs.SupportedLanguage.JAVA
-            )
+        result = extractor.extract_module_path(
+            "java.util.stream.of", cs.SupportedLanguage.JAVA
+        )
 
-            assert result == "java.util"
+        assert result == "java.util.stream"
+        pool_query.assert_called_once_with(
+            cs.SupportedLanguage.JAVA, [("java.util.stream", "of")]
+        )
 
-    def test_java_extractor_fallback_on_timeout(
-        self, extractor: StdlibExtractor
+    def test_java_extractor_fallback_when_worker_unavailable(
+        self, extractor: StdlibExtractor, pool_query: MagicMock
     ) -> None:
-        import subprocess
+        pool_query.return_value = None
 
-        with patch(
-            "subprocess.run", side_effect=subprocess.TimeoutExpired("javac", 10)
-        ):
-            result = extractor.extract_module_path(
-                "java.util.HashMap", cs.SupportedLanguage.JAVA
-            )
+        result = extractor.extract_module_path(
+            "java.util.HashMap", cs.SupportedLanguage.JAVA
+        )
 
-            assert result == "java.util"
+        assert result == "java.util"
 
-    def test_java_extractor_fallback_on_file_not_found(
-        self, extractor: StdlibExtractor
+    def test_java_extractor_builder_suffix(
+        self, extractor: StdlibExtractor, pool_query: MagicMock
     ) -> None:
-        with patch("subprocess.run", side_effect=FileNotFoundError):
-            result = extractor.extract_module_path(
-                "java.lang.String", cs.SupportedLanguage.JAVA
-            )
+        pool_query.return_value = [False]
 
-            assert result == "java.lang"
+        result = extractor.extract_module_path(
+            "java.lang.StringBuilder", cs.SupportedLanguage.JAVA
+        )
 
-    def test_java_extractor_builder_suffix(self, extractor: StdlibExtractor) -> None:
-        with patch("subprocess.run", side_effect=FileNotFoundError):
-            result = extractor.extract_module_path(
-                "java.lang.StringBuilder", cs.SupportedLanguage.JAVA
-            )
+        assert result == "java.lang"
 
-            assert result == "java.lang"
+    def test_java_extractor_error_suffix(
+        self, extractor: StdlibExtractor, pool_query: MagicMock
+    ) -> None:
+        pool_query.return_value = [False]
 
-    def test_java_extractor_error_suffix(self, extractor: StdlibExtractor) -> None:
-        with patch("subprocess.run", side_effect=FileNotFoundError):
-            result = extractor.extract_module_path(
-                "java.lang.OutOfMemoryError", cs.SupportedLanguage.JAVA
-            )
+        result = extractor.extract_module_path(
+            "java.lang.OutOfMemoryError", cs.SupportedLanguage.JAVA
+        )
 
-            assert result == "java.lang"
+        assert result == "java.lang"
 
 
-class TestLuaExtractorWithMockedSubprocess:
+class TestLuaExtractorWithWorker:
     @pytest.fixture
     def extractor(self) -> StdlibExtractor:
         return StdlibExtractor(function_registry=None)
 
     def test_lua_extractor_returns_module_on_successful_introspection(
-        self, extractor: StdlibExtractor
+        self, extractor: StdlibExtractor, pool_query: MagicMock
     ) -> None:
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = "hasEntity=true"
+        pool_query.return_value = [True]
 
-        with patch("subprocess.run", return_value=mock_result):
-            result = extractor.extract_module_path(
-                "string.upper", cs.SupportedLanguage.LUA
-            )
+        result = extractor.extract_module_path("string.upper", cs.SupportedLanguage.LUA)
 
-            assert result == "string"
+        assert result == "string"
 
     def test_lua_extractor_fallback_on_entity_not_found(
-        self, extractor: StdlibExtractor
+        self, extractor: StdlibExtractor, pool_query: MagicMock
     ) -> None:
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = "hasEntity=false"
+        pool_query.return_value = [False]
 
-        with patch("subprocess.run", return_value=mock_result):
-            result = extractor.extract_module_path(
-                "string.nonexistent", cs.SupportedLanguage.LUA
-            )
+        result = extractor.extract_module_path(
+            "string.nonexistent", cs.SupportedLanguage.LUA
+        )
 
-            assert result == "string.nonexistent"
+        assert result == "string.nonexistent"
 
-    def test_lua_extractor_fallback_on_timeout(
+    def test_lua_extractor_fallback_when_lua_missing(
         self, extractor: StdlibExtractor
     ) -> None:
-        import subprocess
-
-        with patch("subprocess.run", side_effect=subprocess.TimeoutExpired("lua", 5)):
-            result = extractor.extract_module_path(
-                "math.floor", cs.SupportedLanguage.LUA
+        with patch.object(se, "_is_tool_available", return_value=False):
+            assert (
+                extractor.extract_module_path("table.insert", cs.SupportedLanguage.LUA)
+                == "table.insert"
+            )
+            assert (
+                extractor.extract_module_path("custom.string", cs.SupportedLanguage.LUA)
+                == "custom"
             )
 
-            assert result == "math.floor"
 
-    def test_lua_extractor_fallback_on_lua_not_found(
-        self, extractor: StdlibExtractor
+class TestPythonExtractorWithWorker:
+    @pytest.fixture
+    def extractor(self) -> StdlibExtractor:
+        return StdlibExtractor(function_registry=None)
+
+    def test_python_names_are_resolved_in_one_batch(
+        self, extractor: StdlibExtractor, pool_query: MagicMock
     ) -> None:
-        with patch("subprocess.run", side_effect=FileNotFoundError):
-            result = extractor.extract_module_path(
-                "table.insert", cs.SupportedLanguage.LUA
-            )
+        pool_query.return_value = [True, False, False]
+
+        result = extractor.extract_module_paths(
+            [
+                "json.loads",
+                "pkg.missing_func",
+                "pkg.MissingClass",
+                "json.loads",
+                "os",
+            ],
+            cs.SupportedLanguage.PYTHON,
+        )
+
+        assert result == {
+            "json.loads": "json",
+            "pkg.missing_func": "pkg.missing_func",
+            "pkg.MissingClass": "pkg",
+            "os": "os",
+        }
+        pool_query.assert_called_once_with(
+            cs.SupportedLanguage.PYTHON,
+            [("json", "loads"), ("pkg", "missing_func"), ("pkg", "MissingClass")],
+        )
 
-            assert result == "table.insert"
+    def test_cached_names_skip_the_worker(
+        self, extractor: StdlibExtractor, pool_query: MagicMock
+    ) -> None:
+        se._cache_stdlib_result("python", "json.loads", "json")
 
-    def test_lua_extractor_stdlib_module_in_set(
+        result = extractor.extract_module_path(
+            "json.loads", cs.SupportedLanguage.PYTHON
+        )
+
+        assert result == "json"
+        pool_query.assert_not_called()
+
+    def test_introspection_does_not_import_in_process(
         self, extractor: StdlibExtractor
     ) -> None:
-        with patch("subprocess.run", side_effect=FileNotFoundError):
+        with patch("importlib.import_module") as import_module:
             result = extractor.extract_module_path(
-                "custom.string", cs.SupportedLanguage.LUA
+                "json.loads", cs.SupportedLanguage.PYTHON
             )
 
-            assert result == "custom"
+        assert result == "json"
+        import_module.assert_not_called()
 
 
-class TestPythonExtractorEdgeCases:
+class TestJsExtractorWithWorker:
     @pytest.fixture
     def extractor(self) -> StdlibExtractor:
         return StdlibExtractor(function_registry=None)
 
-    def test_python_lowercase_entity_with_import_failure(
-        self, extractor: StdlibExtractor
+    def test_js_extractor_returns_module_on_successful_introspection(
+        self, extractor: StdlibExtractor, pool_query: MagicMock
     ) -> None:
-        with patch("importlib.import_module", side_effect=ImportError):
-            result = extractor.extract_module_path(
-                "nonexistent_module.lowercase_func", cs.SupportedLanguage.PYTHON
-            )
+        pool_query.return_value = [True]
 
-            assert result == "nonexistent_module.lowercase_func"
+        result = extractor.extract_module_path("fs.readFile", cs.SupportedLanguage.JS)
 
-    def test_python_uppercase_entity_with_import_failure(
-        self, extractor: StdlibExtractor
+        assert result == "fs"
+
+    def test_ts_shares_js_worker(
+        self, extractor: StdlibExtractor, pool_query: MagicMock
     ) -> None:
-        with patch("importlib.import_module", side_effect=ImportError):
-            result = extractor.extract_module_path(
-                "nonexistent_module.UppercaseClass", cs.SupportedLanguage.PYTHON
-            )
+        pool_query.return_value = [True]
 
-            assert result == "nonexistent_module"
+        result = extractor.extract_module_path("path.join", cs.SupportedLanguage.TS)
 
-    def test_python_entity_not_found_in_module(
-        self, extractor: StdlibExtractor
+        assert result == "path"
+        pool_query.assert_called_once_with(cs.SupportedLanguage.JS, [("path", "join")])
+
+    def test_js_extractor_fallback_when_worker_unavailable(
+        self, extractor: StdlibExtractor, pool_query: MagicMock
     ) -> None:
-        mock_module = MagicMock(spec=[])
+        pool_query.return_value = None
 
-        with patch("importlib.import_module", return_value=mock_module):
-            result = extractor.extract_module_path(
-                "real_module.NonexistentClass", cs.SupportedLanguage.PYTHON
+        result = extractor.extract_module_path(
+            "http.createServer", cs.SupportedLanguage.JS
+        )
+
+        assert result == "http.createServer"
+
+
+class TestIntrospectionPool:
+    def test_python_worker_answers_batches(self) -> None:
+        pool = IntrospectionPool()
+        try:
+            found = pool.query(
+                cs.SupportedLanguage.PYTHON,
+                [
+                    ("collections", "OrderedDict"),
+                    ("os", "path"),
+                    ("json", "not_there"),
+                    ("no_such_module_xyz", "thing"),
+                    ("bad\nname", "x"),
+                ],
             )
+        finally:
+            pool.close()
 
-            assert result == "real_module"
+        assert found == [True, False, False, False, False]
 
-    def test_python_entity_is_module_not_class(
-        self, extractor: StdlibExtractor
-    ) -> None:
-        import types
+    def test_large_requests_are_split_into_batches(self) -> None:
+        pool = IntrospectionPool()
+        worker = MagicMock()
+        worker.query.side_effect = lambda batch: [True] * len(batch)
+        pool._workers[cs.SupportedLanguage.PYTHON] = worker
+
+        with patch.object(cs, "STDLIB_WORKER_BATCH_SIZE", 2):
+            found = pool.query(
+                cs.SupportedLanguage.PYTHON, [("m", str(i)) for i in range(5)]
+            )
 
-        mock_module = MagicMock()
-        mock_submodule = types.ModuleType("submodule")
-        mock_module.submodule = mock_submodule
+        assert found == [True] * 5
+        assert worker.query.call_count == 3
 
-        with (
-            patch("importlib.import_module", return_value=mock_module),
-            patch("inspect.ismodule", return_value=True),
-            patch("inspect.isclass", return_value=False),
-            patch("inspect.isfunction", return_value=False),
+    def test_failed_worker_is_restarted_then_disabled(self) -> None:
+        pool = IntrospectionPool()
+        workers: list[MagicMock] = []
+
+        def start_failing_worker() -> MagicMock:
+            workers.append(MagicMock(answered=True))
+            workers[-1].query.return_value = None
+            return workers[-1]
+
+        with patch.dict(
+            sw._WORKER_FACTORIES,
+            {cs.SupportedLanguage.PYTHON: start_failing_worker},
         ):
-            result = extractor.extract_module_path(
-                "parent.submodule", cs.SupportedLanguage.PYTHON
+            assert pool.query(cs.SupportedLanguage.PYTHON, [("os", "sep")]) is None
+            assert pool.query(cs.SupportedLanguage.PYTHON, [("os", "sep")]) is None
+
+        assert len(workers) == 1 + cs.STDLIB_WORKER_MAX_RESTARTS
+        for worker in workers:
+            worker.close.assert_called_once()
+            assert worker.query.call_count == 1
+
+    def test_restarted_worker_answers_the_failed_batch(self) -> None:
+        pool = IntrospectionPool()
+        hung = MagicMock(answered=True)
+        hung.query.return_value = None
+        fresh = MagicMock()
+        fresh.query.side_effect = lambda batch: [True] * len(batch)
+        pool._workers[cs.SupportedLanguage.PYTHON] = hung
+
+        with patch.dict(
+            sw._WORKER_FACTORIES, {cs.SupportedLanguage.PYTHON: lambda: fresh}
+        ):
+            found = pool.query(cs.SupportedLanguage.PYTHON, [("os", "sep")])
+
+        assert found == [True]
+        hung.close.assert_called_once()
+        fresh.query.assert_called_once_with([("os", "sep")])
+
+    def test_python_worker_ignores_output_on_fd_1(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        (tmp_path / "noisy_ext.py").write_text(
+            "import os\nos.write(1, b'noise from C\\n')\nprint('noise')\nVALUE = 1\n"
+        )
+        monkeypatch.setenv("PYTHONPATH", str(tmp_path))
+        pool = IntrospectionPool()
+        try:
+            found = pool.query(
+                cs.SupportedLanguage.PYTHON,
+                [("noisy_ext", "VALUE"), ("json", "loads")],
             )
+        finally:
+            pool.close()
 
-            assert result == "parent.submodule"
+        assert found == [True, True]
 
+    def test_timeout_grows_with_batch_size_up_to_a_cap(self) -> None:
+        worker = sw.IntrospectionWorker(
+            [sys.executable, "-c", "import time; time.sleep(60)"]
+        )
+        try:
+            with patch.object(worker._lines, "get", side_effect=queue.Empty) as get:
+                assert worker.query([("m", "e")] * 10) is None
+                assert worker.query([("m", "e")] * cs.STDLIB_WORKER_BATCH_SIZE) is None
+        finally:
+            worker.close()
+
+        small, full = (c.kwargs["timeout"] for c in get.call_args_list)
+        assert small == pytest.approx(
+            cs.STDLIB_WORKER_REPLY_TIMEOUT + 10 * cs.STDLIB_WORKER_TIMEOUT_PER_NAME
+        )
+        assert small < full == cs.STDLIB_WORKER_MAX_REPLY_TIMEOUT
 
-class TestJsExtractorWithMockedNode:
-    @pytest.fixture
-    def extractor(self) -> StdlibExtractor:
-        return StdlibExtractor(function_registry=None)
+    def test_worker_that_never_answered_is_not_restarted(self) -> None:
+        pool = IntrospectionPool()
+        workers: list[MagicMock] = []
 
-    def test_js_extractor_returns_module_on_successful_introspection(
-        self, extractor: StdlibExtractor
-    ) -> None:
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = '{"hasEntity": true, "entityType": "function"}'
+        def start_dead_worker() -> MagicMock:
+            workers.append(MagicMock(answered=False))
+            workers[-1].query.return_value = None
+            return workers[-1]
 
-        with (
-            patch.object(se, "_is_tool_available", return_value=True),
-            patch("subprocess.run", return_value=mock_result),
+        with patch.dict(
+            sw._WORKER_FACTORIES, {cs.SupportedLanguage.GO: start_dead_worker}
         ):
-            result = extractor.extract_module_path(
-                "fs.readFile", cs.SupportedLanguage.JS
-            )
+            assert pool.query(cs.SupportedLanguage.GO, [("fmt", "Println")]) is None
+            assert pool.query(cs.SupportedLanguage.GO, [("fmt", "Println")]) is None
 
-            assert result == "fs"
+        assert len(workers) == 1
+        workers[0].close.assert_called_once()
 
-    def test_js_extractor_fallback_on_entity_not_found(
-        self, extractor: StdlibExtractor
-    ) -> None:
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = '{"hasEntity": false, "entityType": null}'
+    def test_forked_child_gets_its_own_pool(self) -> None:
+        parent_pool = se._introspection_pool()
 
-        with (
-            patch.object(se, "_is_tool_available", return_value=True),
-            patch("subprocess.run", return_value=mock_result),
-        ):
-            result = extractor.extract_module_path(
-                "fs.nonexistent", cs.SupportedLanguage.JS
-            )
+        with patch.object(se.os, "getpid", return_value=-1):
+            child_pool = se._introspection_pool()
 
-            assert result == "fs.nonexistent"
+        assert child_pool is not parent_pool
 
-    def test_js_extractor_fallback_on_json_decode_error(
-        self, extractor: StdlibExtractor
-    ) -> None:
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = "invalid json"
+    def test_forked_child_does_not_close_parent_workers(self) -> None:
+        pool = IntrospectionPool()
+        worker = MagicMock()
+        pool._workers[cs.SupportedLanguage.PYTHON] = worker
 
-        with (
-            patch.object(se, "_is_tool_available", return_value=True),
-            patch("subprocess.run", return_value=mock_result),
-        ):
-            result = extractor.extract_module_path("path.join", cs.SupportedLanguage.JS)
+        with patch.object(sw.os, "getpid", return_value=-1):
+            pool.close()
+        worker.close.assert_not_called()
 
-            assert result == "path.join"
+        pool.close()
+        worker.close.assert_called_once()
 
-    def test_js_extractor_fallback_on_timeout(self, extractor: StdlibExtractor) -> None:
-        import subprocess
+    def test_missing_toolchain_disables_language(self) -> None:
+        pool = IntrospectionPool()
+        with patch(
+            "codebase_rag.parsers.stdlib_workers.subprocess.Popen",
+            side_effect=FileNotFoundError,
+        ) as popen:
+            assert pool.query(cs.SupportedLanguage.LUA, [("string", "upper")]) is None
+            assert pool.query(cs.SupportedLanguage.LUA, [("string", "upper")]) is None
 
-        with (
-            patch.object(se, "_is_tool_available", return_value=True),
-            patch("subprocess.run", side_effect=subprocess.TimeoutExpired("node", 5)),
-        ):
-            result = extractor.extract_module_path(
-                "http.createServer", cs.SupportedLanguage.JS
-            )
+        assert popen.call_count == 1
+
+    def test_unsupported_language_returns_none(self) -> None:
+        pool = IntrospectionPool()
 
-            assert result == "http.createServer"
+        assert pool.query(cs.SupportedLanguage.RUST, [("std", "fmt")]) is None
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from pathlib import Path
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -511,3 +511,73 @@ class TestMultipleLanguages:
         ]
         qualified_names = {c[0][1]["qualified_name"] for c in package_calls}
         assert qualified_names == {"multi_lang.pypkg", "multi_lang.rustpkg"}
+
+
+class TestPackageDetectionFromWalk:
+    def test_indicators_are_not_stat_per_directory(
+        self, temp_repo: Path, processor: StructureProcessor, mock_ingestor: MagicMock
+    ) -> None:
+        for i in range(5):
+            pkg = temp_repo / f"pkg{i}"
+            pkg.mkdir()
+            (pkg / "__init__.py").touch()
+        (temp_repo / "plain").mkdir()
+
+        with patch.object(Path, "exists", side_effect=AssertionError("stat")):
+            processor.identify_structure()
+
+        package_names = {
+            c[0][1]["qualified_name"]
+            for c in mock_ingestor.ensure_node_batch.call_args_list
+            if c[0][0] == "Package"
+        }
+        assert package_names == {f"test_project.pkg{i}" for i in range(5)}
+
+    def test_symlinked_package_is_still_detected(
+        self,
+        temp_repo: Path,
+        processor: StructureProcessor,
+        mock_ingestor: MagicMock,
+        tmp_path_factory: pytest.TempPathFactory,
+    ) -> None:
+        outside = tmp_path_factory.mktemp("outside_pkg")
+        (outside / "__init__.py").touch()
+        (temp_repo / "linked").symlink_to(outside, target_is_directory=True)
+
+        processor.identify_structure()
+
+        package_names = {
+            c[0][1]["qualified_name"]
+            for c in mock_ingestor.ensure_node_batch.call_args_list
+            if c[0][0] == "Package"
+        }
+        assert package_names == {"test_project.linked"}
+
+    def test_relative_repo_path_detects_nested_packages(
+        self,
+        temp_repo: Path,
+        mock_ingestor: MagicMock,
+        mock_language_queries: dict[
+            SupportedLanguage, dict[str, MagicMock | LanguageSpec | None]
+        ],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        (temp_repo / "outer" / "inner").mkdir(parents=True)
+        (temp_repo / "outer" / "__init__.py").touch()
+        (temp_repo / "outer" / "inner" / "__init__.py").touch()
+        monkeypatch.chdir(temp_repo)
+        processor = StructureProcessor(
+            ingestor=mock_ingestor,
+            repo_path=Path("."),
+            project_name="test_project",
+            queries=mock_language_queries,
+        )
+
+        processor.identify_structure()
+
+        package_names = {
+            c[0][1]["qualified_name"]
+            for c in mock_ingestor.ensure_node_batch.call_args_list
+            if c[0][0] == "Package"
+        }
+        assert package_names == {"test_project.outer", "test_project.outer.inner"}
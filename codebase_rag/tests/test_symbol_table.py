@@ -0,0 +1,72 @@
+from pathlib import Path
+from unittest.mock import MagicMock
+
+from codebase_rag.parsers.symbol_table import SymbolTable
+from codebase_rag.tests.conftest import create_and_run_updater, get_relationships
+
+
+class TestSymbolTable:
+    def test_intern_returns_first_instance(self) -> None:
+        table = SymbolTable()
+        first = table.intern("".join(["proj.", "mod.func"]))
+        second = table.intern("".join(["proj.mod.", "func"]))
+        assert first == second
+        assert first is second
+
+    def test_each_name_is_stored_once(self) -> None:
+        table = SymbolTable()
+        for qn in ("a.b", "a.c", "a.b", "a.d"):
+            table.intern(qn)
+        assert len(table) == 3
+
+    def test_contains(self) -> None:
+        table = SymbolTable()
+        table.intern("proj.mod")
+        assert "proj.mod" in table
+        assert "proj.other" not in table
+
+    def test_parts_are_cached_and_interned(self) -> None:
+        table = SymbolTable()
+        parts = table.parts("proj.utils.get")
+        assert parts == ("proj", "utils", "get")
+        assert table.parts("proj.utils.get") is parts
+        assert table.parts("proj.models.get")[-1] is parts[-1]
+
+    def test_intern_mapping(self) -> None:
+        table = SymbolTable()
+        canonical = table.intern("pkg.mod.Helper")
+        mapping = table.intern_mapping({"Helper": "".join(["pkg.mod.", "Helper"])})
+        assert mapping == {"Helper": "pkg.mod.Helper"}
+        assert mapping["Helper"] is canonical
+
+
+class TestSymbolTableSharing:
+    def test_registry_lookup_and_call_edges_share_strings(
+        self, temp_repo: Path, mock_ingestor: MagicMock
+    ) -> None:
+        project = temp_repo / "proj"
+        project.mkdir()
+        (project / "helpers.py").write_text(
+            "def helper():\n    return 1\n", encoding="utf-8"
+        )
+        (project / "main.py").write_text(
+            "from helpers import helper\n\n\ndef run():\n    return helper()\n",
+            encoding="utf-8",
+        )
+
+        updater = create_and_run_updater(project, mock_ingestor)
+
+        registry_qn = next(
+            qn for qn in updater.function_registry.keys() if qn.endswith(".helper")
+        )
+        (lookup_qn,) = updater.simple_name_lookup["helper"]
+        assert lookup_qn is registry_qn
+        assert updater.symbol_table.intern(registry_qn) is registry_qn
+
+        call_targets = [
+            call.args[2][2]
+            for call in get_relationships(mock_ingestor, "CALLS")
+            if call.args[2][2] == registry_qn
+        ]
+        assert call_targets
+        assert all(target is registry_qn for target in call_targets)
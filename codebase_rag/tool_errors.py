@@ -63,6 +63,10 @@ MCP_TOOL_RETURNED_NONE = "Tool returned None"
 MCP_INVALID_RESPONSE = "Code snippet tool returned an invalid response"
 MCP_PATH_NOT_EXISTS = "Target repository path does not exist: {path}"
 MCP_PATH_NOT_DIR = "Target repository path is not a directory: {path}"
+MCP_INDEX_ALREADY_RUNNING = (
+    "An indexing job for {path} is already running. "
+    "Call {status_tool} to follow its progress."
+)
 
 # (H) CLI validation errors
 INVALID_POSITIVE_INT = "{value!r} is not a valid positive integer"
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from pathlib import Path
 
 from loguru import logger
@@ -8,7 +9,10 @@ from pydantic_ai import Tool
 from .. import logs as ls
 from .. import tool_errors as te
 from ..constants import ENCODING_UTF8
-from ..cypher_queries import CYPHER_FIND_BY_QUALIFIED_NAME
+from ..cypher_queries import (
+    CYPHER_FIND_BY_QUALIFIED_NAME,
+    CYPHER_FIND_DEFINING_MODULE_PATH,
+)
 from ..schemas import CodeSnippet
 from ..services import QueryProtocol
 from . import tool_descriptions as td
@@ -20,12 +24,19 @@ class CodeRetriever:
         self.ingestor = ingestor
         logger.info(ls.CODE_RETRIEVER_INIT.format(root=self.project_root))
 
+    def _defining_module_path(self, params: dict[str, str]) -> str | None:
+        rows = self.ingestor.fetch_all(CYPHER_FIND_DEFINING_MODULE_PATH, params)
+        path = rows[0].get("path") if rows else None
+        return path if isinstance(path, str) else None
+
     async def find_code_snippet(self, qualified_name: str) -> CodeSnippet:
         logger.info(ls.CODE_RETRIEVER_SEARCH.format(name=qualified_name))
 
         params = {"qn": qualified_name}
         try:
-            results = self.ingestor.fetch_all(CYPHER_FIND_BY_QUALIFIED_NAME, params)
+            results = await asyncio.to_thread(
+                self.ingestor.fetch_all, CYPHER_FIND_BY_QUALIFIED_NAME, params
+            )
 
             if not results:
                 return CodeSnippet(
@@ -42,6 +53,10 @@ class CodeRetriever:
             file_path_str = res.get("path")
             start_line = res.get("start")
             end_line = res.get("end")
+            if not file_path_str and start_line and end_line:
+                file_path_str = await asyncio.to_thread(
+                    self._defining_module_path, params
+                )
 
             if not all([file_path_str, start_line, end_line]):
                 return CodeSnippet(
@@ -55,8 +70,7 @@ class CodeRetriever:
                 )
 
             full_path = self.project_root / file_path_str
-            with full_path.open("r", encoding=ENCODING_UTF8) as f:
-                all_lines = f.readlines()
+            all_lines = await asyncio.to_thread(self._read_lines, full_path)
 
             snippet_lines = all_lines[start_line - 1 : end_line]
             source_code = "".join(snippet_lines)
@@ -81,6 +95,11 @@ class CodeRetriever:
                 error_message=str(e),
             )
 
+    @staticmethod
+    def _read_lines(full_path: Path) -> list[str]:
+        with full_path.open("r", encoding=ENCODING_UTF8) as f:
+            return f.readlines()
+
 
 def create_code_retrieval_tool(code_retriever: CodeRetriever) -> Tool:
     async def get_code_snippet(qualified_name: str) -> CodeSnippet:
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+import asyncio
 import difflib
+import threading
+from collections.abc import Mapping
 from pathlib import Path
 
 import diff_match_patch
@@ -20,10 +23,17 @@ from . import tool_descriptions as td
 
 
 class FileEditor:
-    def __init__(self, project_root: str = ".") -> None:
+    def __init__(
+        self,
+        project_root: str = ".",
+        parsers: Mapping[cs.SupportedLanguage, Parser] | None = None,
+    ) -> None:
         self.project_root = Path(project_root).resolve()
         self.dmp = diff_match_patch.diff_match_patch()
-        self.parsers, _ = load_parsers()
+        self.parsers = parsers if parsers is not None else load_parsers()[0]
+        # (H) Edits may arrive on several worker threads; a Parser is not
+        # (H) safe to drive from more than one at a time
+        self._parse_lock = threading.Lock()
         logger.info(ls.FILE_EDITOR_INIT.format(root=self.project_root))
 
     def _get_real_extension(self, file_path_obj: Path) -> str:
@@ -50,7 +60,8 @@ class FileEditor:
         with open(file_path, "rb") as f:
             content = f.read()
 
-        tree = parser.parse(content)
+        with self._parse_lock:
+            tree = parser.parse(content)
         return tree.root_node
 
     def get_function_source_code(
@@ -280,8 +291,8 @@ def create_file_editor_tool(file_editor: FileEditor) -> Tool:
     async def replace_code_surgically(
         file_path: str, target_code: str, replacement_code: str
     ) -> str:
-        success = file_editor.replace_code_block(
-            file_path, target_code, replacement_code
+        success = await asyncio.to_thread(
+            file_editor.replace_code_block, file_path, target_code, replacement_code
         )
         if success:
             return cs.MSG_SURGICAL_SUCCESS.format(path=file_path)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from pathlib import Path
 
 from loguru import logger
@@ -36,7 +37,9 @@ class FileReader:
                 return FileReadResult(file_path=str(file_path), error_message=error_msg)
 
             try:
-                content = file_path.read_text(encoding=cs.ENCODING_UTF8)
+                content = await asyncio.to_thread(
+                    file_path.read_text, encoding=cs.ENCODING_UTF8
+                )
                 logger.info(ls.TOOL_FILE_READ_SUCCESS.format(path=file_path))
                 return FileReadResult(file_path=str(file_path), content=content)
             except UnicodeDecodeError:
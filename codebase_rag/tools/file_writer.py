@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from pathlib import Path
 
 from loguru import logger
@@ -27,8 +28,7 @@ class FileWriter:
         self, file_path: Path, content: str
     ) -> FileCreationResult:
         try:
-            file_path.parent.mkdir(parents=True, exist_ok=True)
-            file_path.write_text(content, encoding=cs.ENCODING_UTF8)
+            await asyncio.to_thread(self._write, file_path, content)
             logger.info(
                 ls.FILE_WRITER_SUCCESS.format(chars=len(content), path=file_path)
             )
@@ -38,6 +38,11 @@ class FileWriter:
             logger.error(err_msg)
             return FileCreationResult(file_path=str(file_path), error_message=err_msg)
 
+    @staticmethod
+    def _write(file_path: Path, content: str) -> None:
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path.write_text(content, encoding=cs.ENCODING_UTF8)
+
 
 def create_file_writer_tool(file_writer: FileWriter) -> Tool:
     async def create_new_file(file_path: str, content: str) -> FileCreationResult:
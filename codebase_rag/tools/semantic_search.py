@@ -21,9 +21,8 @@ def semantic_code_search(query: str, top_k: int = 5) -> list[SemanticSearchResul
         return []
 
     try:
-        from ..config import settings
         from ..embedder import embed_code
-        from ..services.graph_service import MemgraphIngestor
+        from ..services.graph_service import get_connection_pool
         from ..vector_store import search_embeddings
 
         query_embedding = embed_code(query)
@@ -36,41 +35,34 @@ def semantic_code_search(query: str, top_k: int = 5) -> list[SemanticSearchResul
 
         node_ids = [node_id for node_id, _ in search_results]
 
-        with MemgraphIngestor(
-            host=settings.MEMGRAPH_HOST,
-            port=settings.MEMGRAPH_PORT,
-            batch_size=cs.SEMANTIC_BATCH_SIZE,
-        ) as ingestor:
-            cypher_query = build_nodes_by_ids_query(node_ids)
-            params = {str(i): node_id for i, node_id in enumerate(node_ids)}
-            results = ingestor._execute_query(cypher_query, params)
-
-            results_map = {res["node_id"]: res for res in results}
-
-            formatted_results: list[SemanticSearchResult] = []
-            for node_id, score in search_results:
-                if node_id in results_map:
-                    result = results_map[node_id]
-                    result_type = result["type"]
-                    type_str = (
-                        result_type[0]
-                        if isinstance(result_type, list) and result_type
-                        else cs.SEMANTIC_TYPE_UNKNOWN
-                    )
-                    formatted_results.append(
-                        SemanticSearchResult(
-                            node_id=node_id,
-                            qualified_name=str(result["qualified_name"]),
-                            name=str(result["name"]),
-                            type=type_str,
-                            score=round(score, 3),
-                        )
+        cypher_query = build_nodes_by_ids_query(node_ids)
+        params = {str(i): node_id for i, node_id in enumerate(node_ids)}
+        results = get_connection_pool().fetch_all(cypher_query, params)
+
+        results_map = {res["node_id"]: res for res in results}
+
+        formatted_results: list[SemanticSearchResult] = []
+        for node_id, score in search_results:
+            if node_id in results_map:
+                result = results_map[node_id]
+                result_type = result["type"]
+                type_str = (
+                    result_type[0]
+                    if isinstance(result_type, list) and result_type
+                    else cs.SEMANTIC_TYPE_UNKNOWN
+                )
+                formatted_results.append(
+                    SemanticSearchResult(
+                        node_id=node_id,
+                        qualified_name=str(result["qualified_name"]),
+                        name=str(result["name"]),
+                        type=type_str,
+                        score=round(score, 3),
                     )
+                )
 
-            logger.info(
-                ls.SEMANTIC_FOUND.format(count=len(formatted_results), query=query)
-            )
-            return formatted_results
+        logger.info(ls.SEMANTIC_FOUND.format(count=len(formatted_results), query=query))
+        return formatted_results
 
     except Exception as e:
         logger.error(ls.SEMANTIC_FAILED.format(query=query, error=e))
@@ -79,39 +71,33 @@ def semantic_code_search(query: str, top_k: int = 5) -> list[SemanticSearchResul
 
 def get_function_source_code(node_id: int) -> str | None:
     try:
-        from ..config import settings
-        from ..services.graph_service import MemgraphIngestor
+        from ..services.graph_service import get_connection_pool
         from ..utils.source_extraction import (
             extract_source_lines,
             validate_source_location,
         )
 
-        with MemgraphIngestor(
-            host=settings.MEMGRAPH_HOST,
-            port=settings.MEMGRAPH_PORT,
-            batch_size=cs.SEMANTIC_BATCH_SIZE,
-        ) as ingestor:
-            results = ingestor._execute_query(
-                CYPHER_GET_FUNCTION_SOURCE_LOCATION, {"node_id": node_id}
-            )
+        results = get_connection_pool().fetch_all(
+            CYPHER_GET_FUNCTION_SOURCE_LOCATION, {"node_id": node_id}
+        )
 
-            if not results:
-                logger.warning(ls.SEMANTIC_NODE_NOT_FOUND.format(id=node_id))
-                return None
+        if not results:
+            logger.warning(ls.SEMANTIC_NODE_NOT_FOUND.format(id=node_id))
+            return None
 
-            result = results[0]
-            file_path = result.get("path")
-            start_line = result.get("start_line")
-            end_line = result.get("end_line")
+        result = results[0]
+        file_path = result.get("path")
+        start_line = result.get("start_line")
+        end_line = result.get("end_line")
 
-            is_valid, file_path_obj = validate_source_location(
-                file_path, start_line, end_line
-            )
-            if not is_valid or file_path_obj is None:
-                logger.warning(ls.SEMANTIC_INVALID_LOCATION.format(id=node_id))
-                return None
+        is_valid, file_path_obj = validate_source_location(
+            file_path, start_line, end_line
+        )
+        if not is_valid or file_path_obj is None:
+            logger.warning(ls.SEMANTIC_INVALID_LOCATION.format(id=node_id))
+            return None
 
-            return extract_source_lines(file_path_obj, start_line, end_line)
+        return extract_source_lines(file_path_obj, start_line, end_line)
 
     except Exception as e:
         logger.error(ls.SEMANTIC_SOURCE_FAILED.format(id=node_id, error=e))
@@ -73,7 +73,13 @@ FILE_EDITOR = (
 # (H) MCP tool descriptions
 MCP_INDEX_REPOSITORY = (
     "Parse and ingest the repository into the Memgraph knowledge graph. "
-    "This builds a comprehensive graph of functions, classes, dependencies, and relationships."
+    "This builds a comprehensive graph of functions, classes, dependencies, and relationships. "
+    "Set background to true to return immediately and poll get_index_status."
+)
+
+MCP_GET_INDEX_STATUS = (
+    "Report the state of the current or most recent indexing job, "
+    "including the phase, items processed so far and elapsed time."
 )
 
 MCP_QUERY_CODE_GRAPH = (
@@ -111,6 +117,9 @@ MCP_PARAM_OFFSET = "Line number to start reading from (0-based, optional)"
 MCP_PARAM_LIMIT = "Maximum number of lines to read (optional)"
 MCP_PARAM_CONTENT = "Content to write to the file"
 MCP_PARAM_DIRECTORY_PATH = "Relative path to directory from project root (default: '.')"
+MCP_PARAM_BACKGROUND = (
+    "Run indexing as a background job and return immediately (default: false)"
+)
 
 
 MCP_TOOLS: dict[MCPToolName, str] = {
@@ -121,6 +130,7 @@ MCP_TOOLS: dict[MCPToolName, str] = {
     MCPToolName.READ_FILE: MCP_READ_FILE,
     MCPToolName.WRITE_FILE: MCP_WRITE_FILE,
     MCPToolName.LIST_DIRECTORY: MCP_LIST_DIRECTORY,
+    MCPToolName.GET_INDEX_STATUS: MCP_GET_INDEX_STATUS,
 }
 
 AGENTIC_TOOLS: dict[AgenticToolName, str] = {
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
+import os
 from collections import defaultdict
 from collections.abc import Awaitable, Callable, ItemsView, KeysView, Sequence
 from dataclasses import dataclass
 from enum import StrEnum
 from pathlib import Path
-from typing import TYPE_CHECKING, NamedTuple, Protocol, TypedDict
+from typing import TYPE_CHECKING, NamedTuple, NotRequired, Protocol, TypedDict
 
 from prompt_toolkit.styles import Style
 
@@ -42,7 +43,7 @@ class NodeBatchRow(TypedDict):
 class RelBatchRow(TypedDict):
     from_val: PropertyValue
     to_val: PropertyValue
-    props: PropertyDict
+    props: NotRequired[PropertyDict]
 
 
 BatchParams = NodeBatchRow | RelBatchRow | PropertyDict
@@ -174,11 +175,14 @@ class GraphData(TypedDict):
     metadata: GraphMetadata
 
 
-class GraphSummary(TypedDict):
+class GraphCounts(TypedDict):
     total_nodes: int
     total_relationships: int
     node_labels: dict[str, int]
     relationship_types: dict[str, int]
+
+
+class GraphSummary(GraphCounts):
     metadata: GraphMetadata
 
 
@@ -266,6 +270,12 @@ CHAT_LOOP_UI = AgentLoopUI(
 )
 
 
+class RepoEntry(NamedTuple):
+    path: Path
+    entry: os.DirEntry[str]
+    language: SupportedLanguage | None
+
+
 class LanguageImport(NamedTuple):
     lang_key: SupportedLanguage
     module_path: str
@@ -316,6 +326,15 @@ class RawToolArgs:
 ToolArgs = ReplaceCodeArgs | CreateFileArgs | ShellCommandArgs
 
 
+class CompiledGrammar(NamedTuple):
+    language: Language
+    functions: Query | None
+    classes: Query | None
+    calls: Query | None
+    imports: Query | None
+    locals: Query | None
+
+
 class LanguageQueries(TypedDict):
     functions: Query | None
     classes: Query | None
@@ -378,7 +397,43 @@ class CodeSnippetResultDict(TypedDict, total=False):
     error: str
 
 
-MCPResultType = str | QueryResultDict | CodeSnippetResultDict
+class IndexJobStatusDict(TypedDict, total=False):
+    state: str
+    project_root: str
+    phase: str
+    processed: int
+    total: int
+    elapsed_seconds: float
+    message: str
+    error: str
+
+
+class QueryCacheStats(NamedTuple):
+    hits: int
+    misses: int
+    bypassed: int
+    invalidations: int
+    entries: int
+
+
+class CypherCacheStats(NamedTuple):
+    exact_hits: int
+    similar_hits: int
+    template_hits: int
+    misses: int
+    stores: int
+    evictions: int
+    entries: int
+    templates: int
+
+
+class IndexProgress(NamedTuple):
+    phase: str
+    processed: int
+    total: int
+
+
+MCPResultType = str | QueryResultDict | CodeSnippetResultDict | IndexJobStatusDict
 MCPHandlerType = Callable[..., Awaitable[MCPResultType]]
 
 
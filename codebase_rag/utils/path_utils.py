@@ -1,6 +1,11 @@
+import os
+from collections.abc import Iterator
 from pathlib import Path
 
 from .. import constants as cs
+from ..config import load_cgrignore_patterns
+from ..language_spec import get_language_for_extension
+from ..types_defs import RepoEntry
 
 
 def should_skip_path(
@@ -21,3 +26,78 @@ def should_skip_path(
     dir_parts = rel_path.parent.parts if path.is_file() else rel_path.parts
     all_excludes = cs.IGNORE_PATTERNS | (exclude_paths or frozenset())
     return any(part in all_excludes for part in dir_parts)
+
+
+class PathMatcher:
+    def __init__(
+        self,
+        exclude_paths: frozenset[str] | None = None,
+        include_paths: frozenset[str] | None = None,
+    ) -> None:
+        self.excludes = cs.IGNORE_PATTERNS | (exclude_paths or frozenset())
+        self.includes = include_paths or frozenset()
+        # (H) Excluded directories that still have to be entered because an
+        # (H) include path lies somewhere beneath them
+        self.include_ancestors = frozenset(
+            str(parent) for include in self.includes for parent in Path(include).parents
+        )
+
+
+def build_path_matcher(
+    repo_path: Path,
+    exclude_paths: frozenset[str] | None = None,
+    include_paths: frozenset[str] | None = None,
+) -> PathMatcher:
+    excludes = (exclude_paths or frozenset()) | load_cgrignore_patterns(repo_path)
+    return PathMatcher(exclude_paths=excludes, include_paths=include_paths)
+
+
+def walk_repository(repo_path: Path, matcher: PathMatcher) -> Iterator[RepoEntry]:
+    # (H) Same verdicts as should_skip_path, but decided once per directory from
+    # (H) flags inherited down the walk; skipped directories are never entered
+    root_included = cs.PATH_CURRENT_DIR in matcher.includes
+    stack: list[tuple[str, str, bool, bool]] = [
+        (str(repo_path), "", root_included, False)
+    ]
+    while stack:
+        dir_path, rel_dir, included, excluded = stack.pop()
+        try:
+            with os.scandir(dir_path) as it:
+                entries = list(it)
+        except OSError:
+            continue
+
+        subdirs: list[tuple[str, str, bool, bool]] = []
+        for entry in entries:
+            rel_path = f"{rel_dir}{os.sep}{entry.name}" if rel_dir else entry.name
+            try:
+                is_real_dir = entry.is_dir(follow_symlinks=False)
+                is_dir = is_real_dir or entry.is_dir()
+                is_file = not is_dir and entry.is_file()
+            except OSError:
+                continue
+
+            if is_dir:
+                child_included = included or rel_path in matcher.includes
+                child_excluded = excluded or entry.name in matcher.excludes
+                if child_included or not child_excluded:
+                    yield RepoEntry(Path(entry.path), entry, None)
+                elif rel_path not in matcher.include_ancestors:
+                    continue
+                # (H) Symlinked directories are listed but not followed, as rglob did
+                if is_real_dir:
+                    subdirs.append(
+                        (entry.path, rel_path, child_included, child_excluded)
+                    )
+                continue
+
+            if not is_file:
+                continue
+            path = Path(entry.path)
+            if path.suffix in cs.IGNORE_SUFFIXES:
+                continue
+            if excluded and not (included or rel_path in matcher.includes):
+                continue
+            yield RepoEntry(path, entry, get_language_for_extension(path.suffix))
+
+        stack.extend(reversed(subdirs))
@@ -100,6 +100,7 @@ class CodeChangeEventHandler(FileSystemEventHandler):
                 ):
                     root_node, language = result
                     self.updater.ast_cache[path] = (root_node, language)
+                    self.updater.factory.import_processor.flush_import_relationships()
 
         # (H) Step 4
         logger.info(logs.RECALC_CALLS)
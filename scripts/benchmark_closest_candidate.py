@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+import argparse
+import tempfile
+import time
+from pathlib import Path
+from unittest.mock import MagicMock
+
+from loguru import logger
+
+from codebase_rag.graph_updater import GraphUpdater
+from codebase_rag.parser_loader import load_parsers
+from codebase_rag.parsers.call_resolver import CallResolver
+
+
+def make_candidates(count: int, packages: int, modules: int) -> list[str]:
+    return [f"proj.pkg{i % packages}.mod{i % modules}.Cls{i}.get" for i in range(count)]
+
+
+def sorted_head(resolver: CallResolver, candidates: list[str], module_qn: str) -> str:
+    # (H) The original fallback: stable sort by import distance, take the first
+    return sorted(
+        candidates,
+        key=lambda qn: resolver._calculate_import_distance(qn, module_qn),
+    )[0]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Time the trie-fallback closest-candidate ranking against a full sort"
+    )
+    parser.add_argument("--candidates", type=int, default=100_000)
+    parser.add_argument("--packages", type=int, default=50)
+    parser.add_argument("--modules", type=int, default=400)
+    parser.add_argument("--callers", type=int, default=5)
+    args = parser.parse_args()
+
+    logger.remove()
+    parsers, queries = load_parsers()
+    with tempfile.TemporaryDirectory() as tmp:
+        updater = GraphUpdater(
+            ingestor=MagicMock(),
+            repo_path=Path(tmp),
+            parsers=parsers,
+            queries=queries,
+        )
+        resolver = updater.factory.call_processor._resolver
+
+        candidates = make_candidates(args.candidates, args.packages, args.modules)
+        callers = [f"proj.pkg{i % args.packages}.mod{i}" for i in range(args.callers)]
+
+        start = time.perf_counter()
+        expected = [sorted_head(resolver, candidates, qn) for qn in callers]
+        sort_elapsed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        actual = [resolver._find_closest_candidate(candidates, qn) for qn in callers]
+        ranked_elapsed = time.perf_counter() - start
+
+    print(f"candidates: {len(candidates)}  callers: {len(callers)}")
+    print(f"stable sort     {sort_elapsed:7.3f}s")
+    print(f"single pass     {ranked_elapsed:7.3f}s")
+    print(f"same results    {actual == expected}")
+
+
+if __name__ == "__main__":
+    main()
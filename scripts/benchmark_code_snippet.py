@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+import argparse
+import asyncio
+import statistics
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest.mock import MagicMock
+
+from loguru import logger
+
+from codebase_rag.config import settings
+from codebase_rag.graph_updater import GraphUpdater
+from codebase_rag.mcp.tools import MCPToolsRegistry
+from codebase_rag.parser_loader import load_parsers
+from codebase_rag.services.graph_service import (
+    MemgraphConnectionPool,
+    MemgraphIngestor,
+)
+
+
+def make_repo(root: Path, files: int) -> tuple[Path, list[str]]:
+    repo = root / "snippet_bench"
+    package = repo / "pkg"
+    package.mkdir(parents=True)
+    (package / "__init__.py").write_text("")
+    for i in range(files):
+        (package / f"mod_{i}.py").write_text(
+            f"def helper_{i}(value):\n    return value + {i}\n"
+        )
+    names = [f"{repo.name}.pkg.mod_{i}.helper_{i}" for i in range(files)]
+    return repo, names
+
+
+def percentile(samples: list[float], fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+async def measure(
+    registry: MCPToolsRegistry, names: list[str], requests: int, concurrency: int
+) -> list[float]:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+
+    async def one(name: str) -> None:
+        async with semaphore:
+            start = time.perf_counter()
+            result = await registry.get_code_snippet(name)
+            latencies.append(time.perf_counter() - start)
+            assert result.get("found"), result
+
+    await asyncio.gather(*(one(names[i % len(names)]) for i in range(requests)))
+    return latencies
+
+
+def run(
+    label: str,
+    repo: Path,
+    names: list[str],
+    pool: MemgraphConnectionPool | None,
+    args: argparse.Namespace,
+) -> None:
+    with MemgraphIngestor(
+        host=settings.MEMGRAPH_HOST, port=settings.MEMGRAPH_PORT, pool=pool
+    ) as ingestor:
+        registry = MCPToolsRegistry(
+            project_root=str(repo), ingestor=ingestor, cypher_gen=MagicMock()
+        )
+
+        async def main() -> list[float]:
+            asyncio.get_running_loop().set_default_executor(
+                ThreadPoolExecutor(max_workers=args.concurrency)
+            )
+            return await measure(registry, names, args.requests, args.concurrency)
+
+        latencies = asyncio.run(main())
+
+    print(
+        f"{label:<18} p50 {percentile(latencies, 0.5) * 1000:7.2f}ms  "
+        f"p99 {percentile(latencies, 0.99) * 1000:7.2f}ms  "
+        f"mean {statistics.fmean(latencies) * 1000:7.2f}ms  n {len(latencies)}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Measure get_code_snippet latency under concurrent load "
+        "against a running Memgraph (the database is cleared)"
+    )
+    parser.add_argument("--files", type=int, default=200)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--pool-size", type=int, default=settings.MEMGRAPH_POOL_SIZE)
+    args = parser.parse_args()
+
+    logger.remove()
+    with tempfile.TemporaryDirectory() as tmp:
+        repo, names = make_repo(Path(tmp), args.files)
+        with MemgraphIngestor(
+            host=settings.MEMGRAPH_HOST, port=settings.MEMGRAPH_PORT
+        ) as ingestor:
+            ingestor.clean_database()
+            ingestor.ensure_constraints()
+            parsers, queries = load_parsers()
+            GraphUpdater(ingestor, repo, parsers, queries).run()
+
+        print(f"concurrency {args.concurrency}  requests {args.requests}")
+        run("single connection", repo, names, None, args)
+        pool = MemgraphConnectionPool(
+            settings.MEMGRAPH_HOST, settings.MEMGRAPH_PORT, max_size=args.pool_size
+        )
+        try:
+            run(f"pool of {args.pool_size}", repo, names, pool, args)
+        finally:
+            pool.close()
+
+
+if __name__ == "__main__":
+    main()
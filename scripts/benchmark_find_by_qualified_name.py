@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+import argparse
+import random
+import statistics
+import time
+
+from loguru import logger
+
+from codebase_rag.config import settings
+from codebase_rag.cypher_queries import CYPHER_FIND_BY_QUALIFIED_NAME
+from codebase_rag.services.graph_service import MemgraphIngestor
+
+# (H) The lookup as it was before definitions carried their own path
+LEGACY_FIND_BY_QUALIFIED_NAME = """
+MATCH (n) WHERE n.qualified_name = $qn
+OPTIONAL MATCH (m:Module)-[*]-(n)
+RETURN n.name AS name, n.start_line AS start, n.end_line AS end, m.path AS path, n.docstring AS docstring
+LIMIT 1
+"""
+
+
+def build_graph(
+    ingestor: MemgraphIngestor, modules: int, classes: int, methods: int, calls: int
+) -> list[str]:
+    # (H) Modules define classes which define methods; random CALLS edges make
+    # (H) the graph dense enough for undirected expansion to fan out
+    rng = random.Random(0)
+    names: list[str] = []
+    for m in range(modules):
+        module_qn = f"bench.mod_{m}"
+        path = f"bench/mod_{m}.py"
+        ingestor.ensure_node_batch(
+            "Module", {"qualified_name": module_qn, "name": f"mod_{m}", "path": path}
+        )
+        for c in range(classes):
+            class_qn = f"{module_qn}.Class{c}"
+            ingestor.ensure_node_batch(
+                "Class",
+                {
+                    "qualified_name": class_qn,
+                    "name": f"Class{c}",
+                    "start_line": 1,
+                    "end_line": 50,
+                    "path": path,
+                },
+            )
+            ingestor.ensure_relationship_batch(
+                ("Module", "qualified_name", module_qn),
+                "DEFINES",
+                ("Class", "qualified_name", class_qn),
+            )
+            for i in range(methods):
+                method_qn = f"{class_qn}.method_{i}"
+                names.append(method_qn)
+                ingestor.ensure_node_batch(
+                    "Method",
+                    {
+                        "qualified_name": method_qn,
+                        "name": f"method_{i}",
+                        "start_line": 2 + i,
+                        "end_line": 3 + i,
+                        "path": path,
+                    },
+                )
+                ingestor.ensure_relationship_batch(
+                    ("Class", "qualified_name", class_qn),
+                    "DEFINES_METHOD",
+                    ("Method", "qualified_name", method_qn),
+                )
+    for caller in names:
+        for callee in rng.sample(names, min(calls, len(names))):
+            ingestor.ensure_relationship_batch(
+                ("Method", "qualified_name", caller),
+                "CALLS",
+                ("Method", "qualified_name", callee),
+            )
+    ingestor.flush_all()
+    return names
+
+
+def measure(
+    ingestor: MemgraphIngestor, query: str, names: list[str], lookups: int
+) -> list[float]:
+    latencies: list[float] = []
+    for name in names[:lookups]:
+        start = time.perf_counter()
+        rows = ingestor.fetch_all(query, {"qn": name})
+        latencies.append(time.perf_counter() - start)
+        assert rows and rows[0]["path"], rows
+    return latencies
+
+
+def report(label: str, latencies: list[float]) -> None:
+    ordered = sorted(latencies)
+    p99 = ordered[min(len(ordered) - 1, int(0.99 * len(ordered)))]
+    print(
+        f"{label:<18} p50 {statistics.median(ordered) * 1000:9.2f}ms  "
+        f"p99 {p99 * 1000:9.2f}ms  n {len(ordered)}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compare qualified-name lookup latency before and after "
+        "definitions carried their path, against a running Memgraph "
+        "(the database is cleared)"
+    )
+    parser.add_argument("--modules", type=int, default=200)
+    parser.add_argument("--classes", type=int, default=5)
+    parser.add_argument("--methods", type=int, default=10)
+    parser.add_argument("--calls", type=int, default=5)
+    parser.add_argument("--lookups", type=int, default=50)
+    args = parser.parse_args()
+
+    logger.remove()
+    with MemgraphIngestor(
+        host=settings.MEMGRAPH_HOST, port=settings.MEMGRAPH_PORT
+    ) as ingestor:
+        ingestor.clean_database()
+        ingestor.ensure_constraints()
+        names = build_graph(
+            ingestor, args.modules, args.classes, args.methods, args.calls
+        )
+        random.Random(1).shuffle(names)
+        print(f"methods {len(names)}  calls per method {args.calls}")
+        report(
+            "indexed lookup",
+            measure(ingestor, CYPHER_FIND_BY_QUALIFIED_NAME, names, args.lookups),
+        )
+        report(
+            "path expansion",
+            measure(ingestor, LEGACY_FIND_BY_QUALIFIED_NAME, names, args.lookups),
+        )
+
+
+if __name__ == "__main__":
+    main()
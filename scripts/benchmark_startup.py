@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+import argparse
+import os
+import selectors
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+MCP_READY_MARKER = "Services initialized successfully"
+
+
+def cgr_command() -> list[str]:
+    if cgr := shutil.which("cgr"):
+        return [cgr]
+    return [sys.executable, "-m", "codebase_rag.cli"]
+
+
+def make_python_repo(root: Path, files: int) -> Path:
+    repo = root / "single_language_repo"
+    package = repo / "pkg"
+    package.mkdir(parents=True)
+    (package / "__init__.py").write_text("")
+    for i in range(files):
+        (package / f"mod_{i}.py").write_text(
+            f"import os\n\n\n"
+            f"class Service{i}:\n"
+            f"    def run(self, value):\n"
+            f"        return helper_{i}(value)\n\n\n"
+            f"def helper_{i}(value):\n"
+            f"    return os.path.join(str(value), 'x')\n"
+        )
+    return repo
+
+
+def time_to_exit(command: list[str], env: dict[str, str]) -> float:
+    start = time.perf_counter()
+    subprocess.run(
+        command,
+        env=env,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        check=False,
+    )
+    return time.perf_counter() - start
+
+
+def time_to_mcp_ready(
+    command: list[str], env: dict[str, str], timeout: float
+) -> float | None:
+    # (H) The server never exits on its own, so the clock stops at the log line
+    # (H) emitted once the tool registry is built
+    start = time.perf_counter()
+    proc = subprocess.Popen(
+        command,
+        env=env,
+        stdin=subprocess.PIPE,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    assert proc.stderr is not None
+    selector = selectors.DefaultSelector()
+    selector.register(proc.stderr, selectors.EVENT_READ)
+    try:
+        while time.perf_counter() - start < timeout:
+            if not selector.select(timeout=0.1):
+                continue
+            line = proc.stderr.readline()
+            if not line:
+                return None
+            if MCP_READY_MARKER in line:
+                return time.perf_counter() - start
+        return None
+    finally:
+        proc.kill()
+        proc.wait()
+
+
+def summarize(name: str, samples: list[float]) -> None:
+    if not samples:
+        print(f"{name:<12} did not start (is Memgraph/LLM config available?)")
+        return
+    print(
+        f"{name:<12} min {min(samples):6.3f}s  "
+        f"median {statistics.median(samples):6.3f}s  runs {len(samples)}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Measure cgr startup time on a single-language repository"
+    )
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--files", type=int, default=50)
+    parser.add_argument("--mcp-timeout", type=float, default=60.0)
+    args = parser.parse_args()
+
+    cgr = cgr_command()
+    with tempfile.TemporaryDirectory() as tmp:
+        repo = make_python_repo(Path(tmp), args.files)
+        out_dir = Path(tmp) / "proto"
+        env = {**os.environ, "TARGET_REPO_PATH": str(repo)}
+
+        help_samples = [time_to_exit([*cgr, "--help"], env) for _ in range(args.runs)]
+        index_samples = [
+            time_to_exit(
+                [
+                    *cgr,
+                    "index",
+                    "--repo-path",
+                    str(repo),
+                    "--output-proto-dir",
+                    str(out_dir),
+                ],
+                env,
+            )
+            for _ in range(args.runs)
+        ]
+        mcp_samples = [
+            sample
+            for _ in range(args.runs)
+            if (
+                sample := time_to_mcp_ready([*cgr, "mcp-server"], env, args.mcp_timeout)
+            )
+            is not None
+        ]
+
+    print(f"command: {' '.join(cgr)}  repo: {args.files} python files")
+    summarize("--help", help_samples)
+    summarize("index", index_samples)
+    summarize("mcp-server", mcp_samples)
+
+
+if __name__ == "__main__":
+    main()
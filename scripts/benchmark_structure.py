@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+import argparse
+import os
+import tempfile
+import time
+from collections import defaultdict
+from pathlib import Path
+
+from loguru import logger
+
+from codebase_rag.parser_loader import load_parsers
+from codebase_rag.parsers.structure_processor import StructureProcessor
+from codebase_rag.types_defs import RepoEntry
+from codebase_rag.utils.path_utils import PathMatcher, walk_repository
+
+
+def make_tree(root: Path, directories: int, fanout: int) -> None:
+    # (H) A shallow forest of packages and plain folders, one source file each
+    for i in range(directories):
+        directory = root / f"group_{i // fanout}" / f"dir_{i}"
+        directory.mkdir(parents=True)
+        (directory / "module.py").touch()
+        if i % 2 == 0:
+            (directory / "__init__.py").touch()
+
+
+def per_indicator_stat(
+    entries: list[RepoEntry], indicators: frozenset[str]
+) -> tuple[int, float]:
+    start = time.perf_counter()
+    packages = sum(
+        any((entry.path / indicator).exists() for indicator in indicators)
+        for entry in entries
+        if entry.entry.is_dir()
+    )
+    return packages, time.perf_counter() - start
+
+
+def listing_intersection(
+    entries: list[RepoEntry], indicators: frozenset[str]
+) -> tuple[int, float]:
+    start = time.perf_counter()
+    child_names: defaultdict[str, set[str]] = defaultdict(set)
+    directories = []
+    for entry in entries:
+        child_names[os.path.dirname(entry.entry.path)].add(entry.entry.name)
+        if entry.entry.is_dir():
+            directories.append(entry.path)
+    packages = sum(
+        not indicators.isdisjoint(child_names[str(directory)])
+        for directory in directories
+    )
+    return packages, time.perf_counter() - start
+
+
+class NullIngestor:
+    # (H) Discards writes so the timing covers detection, not ingestion
+    def ensure_node_batch(self, label: str, properties: dict) -> None:
+        pass
+
+    def ensure_relationship_batch(
+        self, from_spec: tuple, rel_type: str, to_spec: tuple
+    ) -> None:
+        pass
+
+
+def walk_listing(root: Path, queries: dict) -> tuple[int, float]:
+    ingestor = NullIngestor()
+    processor = StructureProcessor(
+        ingestor=ingestor, repo_path=root, project_name="bench", queries=queries
+    )
+    start = time.perf_counter()
+    processor.identify_structure()
+    elapsed = time.perf_counter() - start
+    packages = sum(
+        1 for qualified_name in processor.structural_elements.values() if qualified_name
+    )
+    return packages, elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Time package detection on a synthetic directory tree"
+    )
+    parser.add_argument("--directories", type=int, default=50_000)
+    parser.add_argument("--fanout", type=int, default=500)
+    args = parser.parse_args()
+
+    logger.remove()
+    _, queries = load_parsers()
+    indicators = frozenset(
+        indicator
+        for lang_queries in queries.values()
+        for indicator in lang_queries["config"].package_indicators
+    )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        make_tree(root, args.directories, args.fanout)
+
+        entries = list(walk_repository(root, PathMatcher()))
+        stat_packages, stat_time = per_indicator_stat(entries, indicators)
+        listing_packages, listing_time = listing_intersection(entries, indicators)
+        walk_packages, walk_time = walk_listing(root, queries)
+
+    print(f"directories: {args.directories}  indicators: {len(indicators)}")
+    print(f"stat per indicator          {stat_time:7.2f}s  packages {stat_packages}")
+    print(
+        f"walk listing intersection   {listing_time:7.2f}s  packages {listing_packages}"
+    )
+    print(f"identify_structure          {walk_time:7.2f}s  packages {walk_packages}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+import argparse
+import gc
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from unittest.mock import patch
+
+from loguru import logger
+
+from codebase_rag import constants as cs
+from codebase_rag.graph_updater import GraphUpdater
+from codebase_rag.parser_loader import load_parsers
+from codebase_rag.parsers.symbol_table import SymbolTable
+
+
+def make_repo(root: Path, modules: int, functions: int) -> Path:
+    # (H) Every function calls one function in each of the previous two modules,
+    # (H) so QNs recur across the registry, import maps and CALLS buffers
+    repo = root / "symbols_bench"
+    package = repo / "pkg"
+    package.mkdir(parents=True)
+    (package / "__init__.py").write_text("")
+    for m in range(modules):
+        imports = [f"from pkg.mod_{d} import *" for d in range(max(0, m - 2), m)]
+        body = []
+        for f in range(functions):
+            calls = [f"    f_{d}_{f}(value)" for d in range(max(0, m - 2), m)]
+            body += [f"def f_{m}_{f}(value):", *calls, "    return value", ""]
+        (package / f"mod_{m}.py").write_text("\n".join([*imports, "", *body]))
+    return repo
+
+
+class KeepingIngestor:
+    # (H) Holds every node and edge like a batching ingestor between flushes
+    def __init__(self) -> None:
+        self.nodes: list[tuple] = []
+        self.relationships: list[tuple] = []
+
+    def ensure_node_batch(self, label: str, properties: dict) -> None:
+        self.nodes.append((label, properties))
+
+    def ensure_relationship_batch(
+        self, from_spec: tuple, rel_type: str, to_spec: tuple, properties=None
+    ) -> None:
+        self.relationships.append((from_spec, rel_type, to_spec, properties))
+
+    def __getattr__(self, name: str):
+        return lambda *args, **kwargs: None
+
+
+class PassThroughTable(SymbolTable):
+    # (H) Same interface, but every caller keeps its own string and re-splits
+    def intern(self, qualified_name: str) -> str:
+        return qualified_name
+
+    def parts(self, qualified_name: str) -> tuple[str, ...]:
+        return tuple(qualified_name.split(cs.SEPARATOR_DOT))
+
+    def intern_mapping(self, mapping: dict[str, str]) -> dict[str, str]:
+        return dict(mapping)
+
+
+def measure(repo: Path, table_type: type[SymbolTable]) -> tuple[int, int, float]:
+    parsers, queries = load_parsers()
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    with patch("codebase_rag.graph_updater.SymbolTable", table_type):
+        ingestor = KeepingIngestor()
+        updater = GraphUpdater(
+            ingestor=ingestor, repo_path=repo, parsers=parsers, queries=queries
+        )
+        updater.run()
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del updater, ingestor
+    return retained, peak, elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Memory retained by indexing with and without QN interning"
+    )
+    parser.add_argument("--modules", type=int, default=200)
+    parser.add_argument("--functions", type=int, default=50)
+    args = parser.parse_args()
+
+    logger.remove()
+    with tempfile.TemporaryDirectory() as tmp:
+        repo = make_repo(Path(tmp), args.modules, args.functions)
+        # (H) A throwaway first run keeps one-off parser warm-up out of both numbers
+        measure(repo, SymbolTable)
+        results = {
+            "pass-through": measure(repo, PassThroughTable),
+            "interned": measure(repo, SymbolTable),
+        }
+
+    print(f"modules: {args.modules}  functions/module: {args.functions}")
+    for label, (retained, peak, elapsed) in results.items():
+        print(
+            f"{label:<13} retained {retained / 2**20:7.1f} MiB  "
+            f"peak {peak / 2**20:7.1f} MiB  {elapsed:6.2f}s"
+        )
+    saved = results["pass-through"][0] - results["interned"][0]
+    print(f"retained delta {saved / 2**20:.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()